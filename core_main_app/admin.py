@@ -18,6 +18,10 @@ from core_main_app.components.blob_processing_module.models import (
 )
 from core_main_app.components.data.admin_site import CustomDataAdmin
 from core_main_app.components.data.models import Data
+from core_main_app.components.data_migration.admin_site import (
+    CustomMigrationRunAdmin,
+)
+from core_main_app.components.data_migration.models import MigrationRun
 from core_main_app.components.data_processing_module.admin_site import (
     DataProcessingModuleAdmin,
 )
@@ -207,6 +211,7 @@ admin.site.register(XslTransformation, CustomXslTransformationAdmin)
 admin.site.register(TemplateXslRendering, CustomTemplateXslRenderingAdmin)
 admin.site.register(TemplateHtmlRendering)
 admin.site.register(DatabaseLockObject, CustomDatabaseLockAdmin)
+admin.site.register(MigrationRun, CustomMigrationRunAdmin)
 admin.site.register(UserPreferences, CustomUserPreferencesAdmin)
 
 # Admin models for processing modules
@@ -22,6 +22,7 @@ def init_app(sender, **kwargs):
 
     discover.init_rules(sender.apps)
     discover.create_public_workspace()
+    discover.init_periodic_tasks()
 
 
 class InitApp(AppConfig):
@@ -40,12 +41,17 @@ class InitApp(AppConfig):
         )
         from core_main_app.permissions import discover
 
+        # register celery tasks
+        from core_main_app.components.lock import tasks  # noqa: F401
+
         _check_settings()
         check_ssl_certificates_dir_setting(SSL_CERTIFICATES_DIR)
         post_migrate.connect(init_app, sender=self)
         discover.init_mongo_indexing()
         _init_blob_modules_signals()
         _init_data_modules_signals()
+        _init_permissions_signals()
+        _init_rendering_cache_signals()
 
 
 def _check_settings():
@@ -55,6 +61,15 @@ def _check_settings():
 
     """
     from core_main_app.commons.exceptions import CoreError
+    from core_main_app.utils.databases.json_indexes import get_indexed_paths
+
+    # check indexed paths settings
+    try:
+        get_indexed_paths()
+    except ValueError as exception:
+        raise CoreError(
+            f"Invalid DATA_INDEXED_PATHS setting: {str(exception)}"
+        )
 
     # check celery settings
     if (
@@ -130,6 +145,29 @@ def _init_data_modules_signals():
         data_signals.connect()
 
 
+def _init_permissions_signals():
+    """Initialize signals invalidating the workspace permissions cache
+
+    Returns:
+
+    """
+    from core_main_app.permissions import signals as permissions_signals
+
+    permissions_signals.connect()
+
+
+def _init_rendering_cache_signals():
+    """Initialize signals invalidating the rendered HTML cache
+
+    Returns:
+
+    """
+    from core_main_app.utils import rendering_cache
+
+    if main_settings.RENDERED_HTML_CACHE_TTL:
+        rendering_cache.connect()
+
+
 def _init_allauth_signals():
     from core_main_app.utils.allauth.signals import sync_user_saml_groups
 
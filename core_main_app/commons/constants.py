@@ -12,6 +12,9 @@ UNKNOWN_ERROR = "An unknown error occurred, please contact your administrator fo
 
 DATA_JSON_FIELD = "dict_content"
 
+# Large fields of the data, not loaded from the database when listing data
+DATA_LIST_DEFERRED_FIELDS = [DATA_JSON_FIELD, "file_history", "vector_column"]
+
 DATA_FILE_EXTENSION_FOR_TEMPLATE_FORMAT = {"JSON": ".json", "XSD": ".xml"}
 
 DATA_FORMAT_FOR_TEMPLATE_FORMAT = {"JSON": "JSON", "XSD": "XML"}
@@ -1,7 +1,9 @@
 """Abstract Data model"""
 
 from abc import abstractmethod
+from io import BytesIO
 
+from django.conf import settings
 from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import RegexValidator
 from django.db import models, IntegrityError
@@ -12,11 +14,17 @@ from core_main_app.settings import (
     CHECKSUM_ALGORITHM,
 )
 from core_main_app.utils.checksum import compute_checksum
+from core_main_app.utils.databases.backend import uses_postgresql_backend
+from core_main_app.utils.databases.search_vector import get_search_vector
 from core_main_app.utils.datetime import datetime_now
 from core_main_app.utils.storage.storage import (
     core_file_storage,
+    is_file_saved,
+    open_file,
+    read_file,
     user_directory_path,
 )
+from core_main_app.utils.xml import build_xml_data_tree
 
 
 class AbstractData(models.Model):
@@ -54,6 +62,10 @@ class AbstractData(models.Model):
         blank=True, default=None, null=True
     )
     _content = None
+    # content encoded and parsed once, shared by the validation and the
+    # conversions of the content (file, dict, checksum)
+    _encoded_content = None
+    _xml_tree = None
 
     class Meta:
         """Meta"""
@@ -70,15 +82,7 @@ class AbstractData(models.Model):
         # private field content not set yet, and reference to file to read is set
         if self._content is None and self.file.name:
             # read xml file into content field
-            file_content = self.file.read()
-            try:
-                self._content = (
-                    file_content.decode("utf-8")
-                    if file_content
-                    else file_content
-                )
-            except AttributeError:
-                self._content = file_content
+            self._content = read_file(self.file)
         # return content
         return self._content
 
@@ -96,6 +100,65 @@ class AbstractData(models.Model):
         self.last_modification_date = datetime_now()
         # update content
         self._content = value
+        self._encoded_content = None
+        self._xml_tree = None
+
+    @property
+    def content_loaded(self):
+        """Check if the content is in memory: read, set, or not saved in the
+        storage yet
+
+        Returns:
+
+        """
+        return (
+            self._content is not None
+            or self.pk is None
+            or not is_file_saved(self.file)
+        )
+
+    def open_content(self):
+        """Open the content as a binary file-like object, to read it chunk by
+        chunk: the saved file is read from the storage, without loading the
+        whole content in memory, unless the content was already loaded or
+        set. The caller closes it.
+
+        Returns:
+
+        """
+        if not self.content_loaded:
+            return open_file(self.file)
+        content = self.content
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return BytesIO(content or b"")
+
+    def encode_content(self):
+        """Get the content encoded in UTF-8, encoded once.
+
+        Returns:
+
+        """
+        if self._encoded_content is None:
+            content = self.content
+            if isinstance(content, bytes):
+                self._encoded_content = content
+            else:
+                try:
+                    self._encoded_content = content.encode("utf-8")
+                except UnicodeEncodeError:
+                    self._encoded_content = content
+        return self._encoded_content
+
+    def get_xml_tree(self):
+        """Get the XML tree of the content, parsed once.
+
+        Returns:
+
+        """
+        if self._xml_tree is None:
+            self._xml_tree = build_xml_data_tree(self.encode_content())
+        return self._xml_tree
 
     @property
     def xml_content(self):
@@ -160,12 +223,45 @@ class AbstractData(models.Model):
                 self.creation_date = now
                 # initialize when first saved, then only updates when content is updated
                 self.last_modification_date = now
-            if self.content and CHECKSUM_ALGORITHM:
-                self.checksum = compute_checksum(
-                    str(self.content).encode(), CHECKSUM_ALGORITHM
-                )
+            if CHECKSUM_ALGORITHM:
+                self.checksum = self.compute_content_checksum()
             self.save()
+            if uses_postgresql_backend() and not settings.MONGODB_INDEXING:
+                self.update_search_vector()
         except IntegrityError as exception:
             raise exceptions.NotUniqueError(str(exception))
         except Exception as ex:
             raise exceptions.ModelError(str(ex))
+
+    def compute_content_checksum(self):
+        """Compute the checksum of the content, chunk by chunk: from the saved
+        file if the content was not loaded, without encoding the whole
+        content otherwise.
+
+        Returns:
+
+        """
+        if not self.content_loaded:
+            with open_file(self.file) as file:
+                return compute_checksum(file, CHECKSUM_ALGORITHM)
+        content = self.content
+        if not content:
+            return self.checksum
+        if isinstance(content, str) and self._encoded_content is not None:
+            # content already encoded for the file
+            return compute_checksum(self._encoded_content, CHECKSUM_ALGORITHM)
+        return compute_checksum(
+            content if isinstance(content, str) else str(content).encode(),
+            CHECKSUM_ALGORITHM,
+        )
+
+    def update_search_vector(self):
+        """Update the full text search vector from the title and the values of
+        the dict content (in database, without saving the object).
+
+        Returns:
+
+        """
+        type(self).objects.filter(pk=self.pk).update(
+            vector_column=get_search_vector(getattr(self, "template_id", None))
+        )
@@ -54,6 +54,9 @@ class Blob(models.Model):
     class Meta:
         ordering = ["-creation_date"]
 
+    # owner name resolved in bulk for lists (see user_api.set_owner_names)
+    _owner_name = None
+
     @property
     def owner_name(self):
         """Get owner name
@@ -61,7 +64,9 @@ class Blob(models.Model):
         Returns:
 
         """
-        return User.objects.get(pk=self.user_id).username
+        if self._owner_name is None:
+            self._owner_name = User.objects.get(pk=self.user_id).username
+        return self._owner_name
 
     def metadata(self, user):
         """Get blob metadata
@@ -4,6 +4,7 @@ from django.conf import settings
 from django.contrib import admin
 from django.contrib import messages
 from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.views.main import ChangeList
 from django.forms import ChoiceField
 from django.http import (
     HttpResponseRedirect,
@@ -158,6 +159,22 @@ def update_data_list(model_admin, request, queryset):
         model_admin.message_user(request, str(ex), messages.ERROR)
 
 
+class DataChangeList(ChangeList):
+    """Data change list, resolving the owner names of a page at once"""
+
+    def get_results(self, request):
+        """Get the results of the page and their owner names
+
+        Args:
+            request:
+
+        Returns:
+
+        """
+        super().get_results(request)
+        user_api.set_owner_names(self.result_list)
+
+
 class CustomDataAdmin(get_base_model_admin_class("Data")):
     """Custom Data Admin"""
 
@@ -182,6 +199,18 @@ class CustomDataAdmin(get_base_model_admin_class("Data")):
         """Prevent from manually adding data"""
         return False
 
+    def get_changelist(self, request, **kwargs):
+        """Return the change list class of the data
+
+        Args:
+            request:
+            **kwargs:
+
+        Returns:
+
+        """
+        return DataChangeList
+
     @admin.display(description="File")
     def file_display(self, obj):
         """Display file field
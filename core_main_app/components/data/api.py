@@ -1,6 +1,7 @@
 """Data API"""
 
 from django.conf import settings
+from django.db.models import QuerySet
 
 import core_main_app.access_control.api
 import core_main_app.components.workspace.access_control
@@ -11,6 +12,7 @@ from core_main_app.access_control.api import (
 )
 from core_main_app.access_control.decorators import access_control
 from core_main_app.commons import exceptions as exceptions
+from core_main_app.commons.constants import DATA_LIST_DEFERRED_FIELDS
 from core_main_app.commons.exceptions import CoreError
 from core_main_app.components.data import (
     access_control as data_api_access_control,
@@ -20,19 +22,21 @@ from core_main_app.components.data.tasks import (
     async_migration_task,
     async_template_migration_task,
 )
+from core_main_app.components.template import api as template_api
 from core_main_app.components.template.models import Template
 from core_main_app.components.workspace import api as workspace_api
 from core_main_app.settings import (
     DATA_SORTING_FIELDS,
     ENABLE_JSON_SCHEMA_SUPPORT,
+    XERCES_VALIDATION,
 )
 from core_main_app.utils.datetime import datetime_now
 from core_main_app.utils.json_utils import validate_json_data, load_json_string
-from core_main_app.utils.query.mongo.prepare import (
-    convert_to_django,
-    get_access_filters_from_query,
+from core_main_app.utils.query.mongo.prepare import get_query_plan
+from core_main_app.utils.xml import (
+    validate_xml_data,
+    validate_xml_data_with_schema,
 )
-from core_main_app.utils.xml import validate_xml_data
 from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 
@@ -195,14 +199,20 @@ def check_xml_file_is_valid(data, request=None):
     template = data.template
 
     try:
-        xml_tree = XSDTree.build_tree(data.xml_content)
+        # parsed once, the tree is reused to convert the data to dict
+        xml_tree = data.get_xml_tree()
     except Exception as exception:
         raise exceptions.XMLError(str(exception))
-    try:
-        xsd_tree = XSDTree.build_tree(template.content)
-    except Exception as exception:
-        raise exceptions.XSDError(str(exception))
-    error = validate_xml_data(xsd_tree, xml_tree, request=request)
+    if XERCES_VALIDATION:
+        try:
+            xsd_tree = XSDTree.build_tree(template.content)
+        except Exception as exception:
+            raise exceptions.XSDError(str(exception))
+        error = validate_xml_data(xsd_tree, xml_tree, request=request)
+    else:
+        # use the compiled schema cached for the template
+        xml_schema = template_api.get_xml_schema(template, request=request)
+        error = validate_xml_data_with_schema(xml_schema, xml_tree)
     if error is not None:
         raise exceptions.XMLError(error)
 
@@ -235,13 +245,8 @@ def execute_json_query(json_query, user, order_by_field=DATA_SORTING_FIELDS):
     Returns:
 
     """
-    # get workspace and user filters from JSON query
-    workspace_filter, user_filter = get_access_filters_from_query(
-        query_dict=json_query
-    )
-
-    # convert JSON query to Django syntax
-    query = convert_to_django(query_dict=json_query)
+    # get workspace and user filters, and query in Django syntax, from JSON query
+    workspace_filter, user_filter, query = get_query_plan(json_query)
 
     # execute mongo query and return results
     if settings.MONGODB_INDEXING:
@@ -394,3 +399,68 @@ def migrate_template_list(
         template_id_list, xslt_id, str(target_template_id), user.id, migrate
     )
     return task.task_id
+
+
+# fields loaded from the database for each data field returned to the client
+_DATA_FIELDS = {"content": ["file"], "xml_content": ["file"]}
+# content of mongo data is loaded from the SQL data
+_MONGO_DATA_FIELDS = {
+    "id": ["data_id"],
+    "template": ["_template_id"],
+    "workspace": ["_workspace_id"],
+    "content": [],
+    "xml_content": [],
+}
+
+
+def project(data_list, fields=None):
+    """Select the fields of a list of data loaded from the database: only
+    the fields needed to return the given data fields, or all the fields
+    except the large ones (DATA_LIST_DEFERRED_FIELDS) by default.
+
+    Args:
+        data_list: queryset of Data or MongoData
+        fields: names of the data fields returned to the client (id, title,
+            template, content...), None for all the data fields
+
+    Returns:
+        queryset
+
+    """
+    if isinstance(data_list, QuerySet):
+        if fields is None:
+            return data_list.defer(*DATA_LIST_DEFERRED_FIELDS)
+        return data_list.only(*_get_projection_fields(fields, _DATA_FIELDS))
+
+    if not hasattr(data_list, "_document"):
+        # not a queryset (e.g. list of data)
+        return data_list
+
+    # mongoengine queryset
+    if fields is None:
+        return data_list.exclude(
+            *[
+                field
+                for field in DATA_LIST_DEFERRED_FIELDS
+                if field in data_list._document._fields
+            ]
+        )
+    return data_list.only(*_get_projection_fields(fields, _MONGO_DATA_FIELDS))
+
+
+def _get_projection_fields(fields, field_mapping):
+    """Return the fields to load from the database to return data fields.
+
+    Args:
+        fields:
+        field_mapping:
+
+    Returns:
+
+    """
+    projection_fields = []
+    for field in ["id"] + list(fields):
+        for projection_field in field_mapping.get(field, [field]):
+            if projection_field not in projection_fields:
+                projection_fields.append(projection_field)
+    return projection_fields
@@ -69,6 +69,9 @@ class Data(AbstractData):
             GinIndex(fields=["vector_column"]),
         ]
 
+    # owner name resolved in bulk for lists (see user_api.set_owner_names)
+    _owner_name = None
+
     def convert_to_dict(self):
         """Convert the xml contained in content into a dictionary.
 
@@ -84,13 +87,17 @@ class Data(AbstractData):
             self.dict_content = load_json_string(self.content)
 
         elif self.template.format == Template.XSD:
-            # transform xml content into a dictionary.
+            # transform xml content into a dictionary (from the tree if the
+            # content was parsed by the validation)
             self.dict_content = xml_utils.raw_xml_to_dict(
                 self.content,
                 postprocessor=XML_POST_PROCESSOR,
                 force_list=XML_FORCE_LIST,
                 list_limit=SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+                xml_tree=self._xml_tree,
             )
+            # the tree is not needed anymore
+            self._xml_tree = None
         else:
             raise ModelError("Unrecognized file format.")
 
@@ -109,10 +116,7 @@ class Data(AbstractData):
             self.template.format
         ]
         # Get content
-        try:
-            content = self.content.encode("utf-8")
-        except UnicodeEncodeError:
-            content = self.content
+        content = self.encode_content()
 
         save_file_history(self, model="data")
         self.file = SimpleUploadedFile(
@@ -128,7 +132,9 @@ class Data(AbstractData):
         Returns:
 
         """
-        return User.objects.get(pk=self.user_id).username
+        if self._owner_name is None:
+            self._owner_name = User.objects.get(pk=self.user_id).username
+        return self._owner_name
 
     @access_control(can_read_blob)
     def blob(self, user):
@@ -154,6 +160,45 @@ class Data(AbstractData):
             return MongoData.objects.get(pk=self.id).dict_content
         return self.dict_content
 
+    @staticmethod
+    def get_dict_contents(data_list):
+        """Get dict_content of a list of data, from the objects or from
+        MongoDB in a single query
+
+        Args:
+            data_list:
+
+        Returns:
+            list: dict_content of each data, in the order of the list
+
+        """
+        if settings.MONGODB_INDEXING:
+            from core_main_app.components.mongo.models import MongoData
+
+            # mongo data already have their dict_content
+            data_ids = [
+                data.id for data in data_list if isinstance(data, Data)
+            ]
+            dict_contents = (
+                {
+                    mongo_data.pk: mongo_data.dict_content
+                    for mongo_data in MongoData.objects(pk__in=data_ids).only(
+                        "dict_content"
+                    )
+                }
+                if data_ids
+                else {}
+            )
+            return [
+                (
+                    dict_contents.get(data.id)
+                    if isinstance(data, Data)
+                    else data.get_dict_content()
+                )
+                for data in data_list
+            ]
+        return [data.get_dict_content() for data in data_list]
+
     @staticmethod
     def get_all(order_by_field):
         """Get all data.
@@ -2,25 +2,51 @@
 
 import logging
 
-from celery import shared_task
+from celery import chord, group, shared_task, states
+from celery.exceptions import Ignore
 from celery.result import AsyncResult
+from celery.utils import uuid
 
 from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.components.data import api as data_api
+from core_main_app.components.data_migration import (
+    api as data_migration_api,
+)
 from core_main_app.components.template.models import Template
+from core_main_app.components.template_html_rendering import (
+    api as template_html_rendering_api,
+)
 from core_main_app.components.user import api as user_api
 from core_main_app.components.xsl_transformation import (
     api as xsl_transformation_api,
 )
+from core_main_app.settings import (
+    DATA_MIGRATION_CHUNK_MAX_RETRIES,
+    DATA_MIGRATION_CHUNK_SIZE,
+    MONGODB_BULK_BATCH_SIZE,
+    RENDERED_HTML_CACHE_TTL,
+)
 from core_main_app.system import api as system_api
+from core_main_app.utils import xml as xml_utils
 
 logger = logging.getLogger(__name__)
 
+# Number of data migrated between two updates of the progress of a migration
+MIGRATION_PROGRESS_INTERVAL = 10
 
-@shared_task
-def async_migration_task(data_list, xslt_id, template_id, user_id, migrate):
+
+@shared_task(bind=True)
+def async_migration_task(
+    self, data_list, xslt_id, template_id, user_id, migrate
+):
     """Async task which perform a migration / validation of the data list for the given target template id
 
+    When run by a worker, the data list is split in chunks of
+    DATA_MIGRATION_CHUNK_SIZE data, migrated in parallel by a chord of
+    migrate_data_chunk_task. The task is replaced by the chord, whose result
+    is stored on the id of this task.
+
     Args:
         data_list:
         xslt_id:
@@ -29,77 +55,66 @@ def async_migration_task(data_list, xslt_id, template_id, user_id, migrate):
         migrate: (boolean) Perform the migration
 
     Return:
-        {"valid": ["id"...], "wrong": ["id"...]}
+        {"valid_count": <number>, "wrong_count": <number>} if the results
+        are saved in a migration run (task executed by a worker),
+        {"valid": ["id"...], "wrong": ["id"...]} otherwise
     """
-    success = []
-    errors = []
-    current_progress = 0
-    total_data = len(data_list)
+    progress = {"current": 0, "total": len(data_list)}
 
     try:
-        user = user_api.get_user_by_id(user_id)
-        # check user status
-        if not (user.is_staff or user.is_superuser):
-            raise AccessControlError("Only admin user can migrate data.")
-
+        user = _get_admin_user(user_id)
         target_template = system_api.get_template_by_id(template_id)
+        xslt_transform = _get_xslt_transform(xslt_id)
+        migration_run = _create_migration_run(
+            self, user_id, target_template, migrate
+        )
 
-        # get xsl transformation if selected
-        if xslt_id is not None:
-            xslt = xsl_transformation_api.get_by_id(str(xslt_id))
-
-        for data_id in data_list:
-            data = data_api.get_by_id(data_id, user=user)
-            # modify the data temporarily with the new targeted template
-            data.template = target_template
-
-            if xslt_id is not None:
-                # modify the xml content temporarily with the transformed data content
-                data.xml_content = xsl_transformation_api.xsl_transform(
-                    data.xml_content, xslt.name
-                )
-
-            try:
-                # save the new template for the data if the migration is True
-                if migrate:
-                    system_api.upsert_data(data)
-                else:
-                    # check if the data is valid
-                    if data.template.format == Template.XSD:
-                        data_api.check_xml_file_is_valid(data)
-                    elif data.template.format == Template.JSON:
-                        data_api.check_json_file_is_valid(data)
-                    else:
-                        raise NotImplementedError(
-                            "Migration not available for this format"
-                        )
-
-                success.append(str(data.id))
-            except Exception:
-                errors.append(str(data.id))
-            finally:
-                # increase the current progress and update the task state
-                current_progress += 1
-                async_migration_task.update_state(
-                    state="PROGRESS",
-                    meta={"current": current_progress, "total": total_data},
+        chunks = _split_in_chunks(data_list)
+        if len(chunks) > 1 and not _is_called_directly(self):
+            progress["chunks"] = []
+            chunk_tasks = []
+            for chunk in chunks:
+                chunk_task = _get_chunk_task(
+                    chunk, xslt_id, template_id, user_id, migrate, self
                 )
-    except Exception as exception:
-        async_migration_task.update_state(
-            state="ABORT",
-            meta={"current": current_progress, "total": total_data},
+                progress["chunks"].append([chunk_task.id, len(chunk), None])
+                chunk_tasks.append(chunk_task)
+            raise _fan_out(self, chunk_tasks, progress)
+
+        def update_progress(results):
+            _check_not_cancelled(self)
+            progress["current"] = _count_results(results)
+            self.update_state(state="PROGRESS", meta=progress)
+            return True
+
+        results = _migrate_data_list(
+            (data_api.get_by_id(data_id, user=user) for data_id in data_list),
+            target_template,
+            xslt_transform,
+            migrate,
+            migration_run=migration_run,
+            on_progress=update_progress,
         )
+        return migration_run.get_summary() if migration_run else results
+    except Ignore:
+        raise
+    except Exception as exception:
+        progress.pop("chunks", None)
+        self.update_state(state="ABORT", meta=progress)
         raise Exception(f"Something went wrong: {str(exception)}")
 
-    return {"valid": success, "wrong": errors}
-
 
-@shared_task
+@shared_task(bind=True)
 def async_template_migration_task(
-    templates, xslt_id, target_template_id, user_id, migrate
+    self, templates, xslt_id, target_template_id, user_id, migrate
 ):
     """Async task which perform a migration / validation of all the data which belong to the given template id list
 
+    When run by a worker, the data of each template are split in chunks of
+    DATA_MIGRATION_CHUNK_SIZE data, migrated in parallel by a chord of
+    migrate_data_chunk_task. The task is replaced by the chord, whose result
+    is stored on the id of this task.
+
     Args:
         templates:
         xslt_id:
@@ -108,112 +123,256 @@ def async_template_migration_task(
         migrate: (boolean) Perform the migration
 
     Return:
-        {"valid": <number>, "wrong": <number>}
+        {"valid_count": <number>, "wrong_count": <number>} if the results
+        are saved in a migration run (task executed by a worker),
+        {"valid": ["id"...], "wrong": ["id"...]} otherwise
     """
-    # get the data list to check
-    current_data_progress = 0
-    current_template_progress = -1
-    total_data = 0
-    total_template = len(templates)
-    success = []
-    error = []
+    progress = {
+        "template_current": -1,
+        "template_total": len(templates),
+        "data_current": 0,
+        "data_total": 0,
+    }
     try:
-        if target_template_id and total_template > 0:
-            # get the user
-            user = user_api.get_user_by_id(user_id)
-            # check user status
-            if not (user.is_staff or user.is_superuser):
-                raise AccessControlError("Only admin user can migrate data.")
-            # get the target template
-            target_template = system_api.get_template_by_id(target_template_id)
-            # get xsl transformation if selected
-            if xslt_id is not None:
-                xslt = xsl_transformation_api.get_by_id(str(xslt_id))
-
-            for template_id in templates:
-
-                # increase the number of processed template
-                current_template_progress += 1
-                # rest de number of data
-                current_data_progress = 0
-
-                # get a QuerySet of all the data with the given template
-                data_list = system_api.get_all_by_template(template_id)
-
-                total_data = data_list.count()
-
-                for data in data_list.all():
-                    # modify the data temporarily with the new targeted template
-                    data.template = target_template
-
-                    if xslt_id is not None:
-                        # modify the xml content temporarily with the transformed data content
-                        data.xml_content = (
-                            xsl_transformation_api.xsl_transform(
-                                data.xml_content, xslt.name
-                            )
-                        )
-
-                    # check if the data is valid
-                    try:
-                        # save the new template for the data if the migration is True
-                        if migrate:
-                            system_api.upsert_data(data)
-                        else:
-                            # check if the data is valid
-                            if data.template.format == Template.XSD:
-                                data_api.check_xml_file_is_valid(data)
-                            elif data.template.format == Template.JSON:
-                                data_api.check_json_file_is_valid(data)
-                            else:
-                                raise NotImplementedError(
-                                    "Migration not available for this format"
-                                )
-
-                        success.append(str(data.id))
-                    except Exception:
-                        error.append(str(data.id))
-                    finally:
-                        # increase the current progress and update the task state
-                        current_data_progress += 1
-                        async_template_migration_task.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "template_current": current_template_progress,
-                                "template_total": total_template,
-                                "data_current": current_data_progress,
-                                "data_total": total_data,
-                            },
-                        )
-
-            return {"valid": success, "wrong": error}
-
-        else:
-            async_template_migration_task.update_state(
-                state="ABORT",
-                meta={
-                    "template_current": current_template_progress,
-                    "template_total": total_template,
-                    "data_current": current_data_progress,
-                    "data_total": total_data,
-                },
-            )
+        if not target_template_id or not templates:
             raise Exception(
                 "Wrong template id."
                 if not target_template_id
                 else "Please provide template id."
             )
+
+        _get_admin_user(user_id)
+        target_template = system_api.get_template_by_id(target_template_id)
+        xslt_transform = _get_xslt_transform(xslt_id)
+        migration_run = _create_migration_run(
+            self, user_id, target_template, migrate
+        )
+
+        if not _is_called_directly(self):
+            progress["chunks"] = []
+            chunk_tasks = []
+            for template_index, template_id in enumerate(templates):
+                data_ids = system_api.get_all_by_template(
+                    template_id
+                ).values_list("id", flat=True)
+                for chunk in _split_in_chunks([str(pk) for pk in data_ids]):
+                    chunk_task = _get_chunk_task(
+                        chunk,
+                        xslt_id,
+                        target_template_id,
+                        user_id,
+                        migrate,
+                        self,
+                        check_access=False,
+                    )
+                    progress["chunks"].append(
+                        [chunk_task.id, len(chunk), template_index]
+                    )
+                    chunk_tasks.append(chunk_task)
+            if len(chunk_tasks) > 1:
+                progress["data_total"] = sum(
+                    chunk[1] for chunk in progress["chunks"]
+                )
+                raise _fan_out(self, chunk_tasks, progress)
+            progress.pop("chunks")
+
+        results = {"valid": [], "wrong": []}
+
+        def update_progress(template_results):
+            _check_not_cancelled(self)
+            progress["data_current"] = _count_results(template_results)
+            self.update_state(state="PROGRESS", meta=progress)
+            return True
+
+        for template_id in templates:
+            # get a QuerySet of all the data with the given template
+            data_list = system_api.get_all_by_template(template_id)
+
+            progress["template_current"] += 1
+            progress["data_current"] = 0
+            progress["data_total"] = data_list.count()
+
+            template_results = _migrate_data_list(
+                data_list.all(),
+                target_template,
+                xslt_transform,
+                migrate,
+                migration_run=migration_run,
+                on_progress=update_progress,
+            )
+            results["valid"].extend(template_results["valid"])
+            results["wrong"].extend(template_results["wrong"])
+
+        return migration_run.get_summary() if migration_run else results
+    except Ignore:
+        raise
     except Exception as exception:
-        async_template_migration_task.update_state(
-            state="ABORT",
+        progress.pop("chunks", None)
+        self.update_state(state="ABORT", meta=progress)
+        raise Exception(f"Something went wrong: {str(exception)}")
+
+
+@shared_task(
+    bind=True,
+    max_retries=DATA_MIGRATION_CHUNK_MAX_RETRIES,
+    default_retry_delay=10,
+)
+def migrate_data_chunk_task(
+    self,
+    data_ids,
+    xslt_id,
+    template_id,
+    user_id,
+    migrate,
+    parent_task_id=None,
+    check_access=True,
+    results=None,
+):
+    """Async task which perform a migration / validation of a chunk of data,
+    part of a migration task. If an error occurs, the task is retried with
+    the data not processed yet. The task stops when the migration task is
+    cancelled. Results are saved in the migration run of the migration task.
+
+    Args:
+        data_ids:
+        xslt_id:
+        template_id:
+        user_id:
+        migrate: (boolean) Perform the migration
+        parent_task_id: id of the migration task
+        check_access: get the data with the access control of the user
+        results: results of the previous attempts
+
+    Return:
+        {"valid_count": <number>, "wrong_count": <number>} if the results
+        are saved in a migration run, {"valid": ["id"...], "wrong": ["id"...]}
+        otherwise
+    """
+    results = results or {"valid": [], "wrong": []}
+    processed_ids = set(results["valid"]) | set(results["wrong"])
+    remaining_ids = [
+        data_id for data_id in data_ids if str(data_id) not in processed_ids
+    ]
+
+    def update_progress(chunk_results):
+        self.update_state(
+            state="PROGRESS",
             meta={
-                "template_current": current_template_progress,
-                "template_total": total_data,
-                "data_current": current_data_progress,
-                "data_total": total_data,
+                "current": _count_results(chunk_results),
+                "total": len(data_ids),
             },
         )
-        raise Exception(f"Something went wrong: {str(exception)}")
+        return not is_task_cancelled(parent_task_id)
+
+    try:
+        migration_run = _get_migration_run(parent_task_id)
+        if not remaining_ids or is_task_cancelled(parent_task_id):
+            return _get_chunk_result(results, migration_run)
+
+        user = _get_admin_user(user_id)
+        target_template = system_api.get_template_by_id(template_id)
+        xslt_transform = _get_xslt_transform(xslt_id)
+        if check_access:
+            data_list = (
+                data_api.get_by_id(data_id, user=user)
+                for data_id in remaining_ids
+            )
+        else:
+            data_list = system_api.get_all_data_by_id_list(remaining_ids)
+
+        results = _migrate_data_list(
+            data_list,
+            target_template,
+            xslt_transform,
+            migrate,
+            results=results,
+            migration_run=migration_run,
+            on_progress=update_progress,
+        )
+        return _get_chunk_result(results, migration_run)
+    except Exception as exception:
+        logger.warning(
+            "Migration of data chunk failed (%d/%d data processed): %s",
+            _count_results(results),
+            len(data_ids),
+            str(exception),
+        )
+        raise self.retry(
+            exc=exception, kwargs={**self.request.kwargs, "results": results}
+        )
+
+
+@shared_task(bind=True)
+def merge_migration_results(self, chunk_results):
+    """Merge the results of the chunks of a migration task
+
+    Args:
+        chunk_results:
+
+    Return:
+        {"valid_count": <number>, "wrong_count": <number>} if the results
+        are saved in a migration run, {"valid": ["id"...], "wrong": ["id"...]}
+        otherwise
+    """
+    if is_task_cancelled(self.request.id):
+        # keep the cancelled state of the migration task
+        raise Ignore()
+
+    migration_run = _get_migration_run(self.request.id)
+    if migration_run:
+        return migration_run.get_summary()
+
+    return {
+        "valid": [
+            data_id
+            for results in chunk_results
+            for data_id in results["valid"]
+        ],
+        "wrong": [
+            data_id
+            for results in chunk_results
+            for data_id in results["wrong"]
+        ],
+    }
+
+
+def cancel_task(task_id):
+    """Cancel a migration / validation task and its chunks. Chunks not
+    started yet are not executed, running chunks stop after their current
+    data.
+
+    Args:
+        task_id:
+
+    Return:
+    """
+    result = AsyncResult(task_id)
+    if result.state in states.READY_STATES:
+        return
+
+    chunk_ids = [
+        chunk[0]
+        for chunk in (
+            result.info.get("chunks", [])
+            if isinstance(result.info, dict)
+            else []
+        )
+    ]
+    result.app.control.revoke([task_id] + chunk_ids)
+    result.backend.mark_as_revoked(task_id, reason="cancelled")
+
+
+def is_task_cancelled(task_id):
+    """Check if a migration / validation task has been cancelled
+
+    Args:
+        task_id:
+
+    Return:
+    """
+    if task_id is None:
+        return False
+    return AsyncResult(task_id).state == states.REVOKED
 
 
 def get_task_progress(task_id):
@@ -224,14 +383,19 @@ def get_task_progress(task_id):
 
     Return:
         {
-            'state': PENDING | PROGRESS | SUCCESS,
+            'state': PENDING | PROGRESS | SUCCESS | REVOKED,
             'details': result (for SUCCESS) | null (for PENDING) | { PROGRESS info }
         }
     """
     result = AsyncResult(task_id)
+    details = result.info
+    if isinstance(details, dict) and "chunks" in details:
+        details = _get_chunks_progress(details)
+    elif isinstance(details, Exception):
+        details = str(details)
     response_data = {
         "state": result.state,
-        "details": result.info,
+        "details": details,
     }
     return response_data
 
@@ -248,9 +412,335 @@ def get_task_result(task_id):
             }
     """
     result = AsyncResult(task_id).result
+    if isinstance(result, dict) and "valid_count" in result:
+        # results saved in the migration run of the task
+        migration_run = data_migration_api.get_by_task_id(task_id)
+        return {
+            "valid": data_migration_api.get_data_ids(migration_run, True),
+            "wrong": data_migration_api.get_data_ids(migration_run, False),
+        }
     return result
 
 
+def _migrate_data_list(
+    data_list,
+    target_template,
+    xslt_transform,
+    migrate,
+    results=None,
+    migration_run=None,
+    on_progress=None,
+):
+    """Migrate / validate a list of data, using the same target template and
+    compiled XSLT for all data (XML schemas are compiled once per template,
+    see template_api.get_xml_schema). Results are saved in the migration run
+    every MIGRATION_PROGRESS_INTERVAL data.
+
+    Args:
+        data_list:
+        target_template:
+        xslt_transform: compiled XSLT, None if no transformation
+        migrate: (boolean) Perform the migration
+        results: results to complete
+        migration_run: migration run saving the results, None to not save
+            them
+        on_progress: function called with the results every
+            MIGRATION_PROGRESS_INTERVAL data, stops the migration if it
+            returns False
+
+    Return:
+        {"valid": ["id"...], "wrong": ["id"...]}
+    """
+    results = results if results is not None else {"valid": [], "wrong": []}
+    # results not saved in the migration run yet: (data id, valid, error)
+    pending_results = []
+
+    try:
+        for data in data_list:
+            # modify the data temporarily with the new targeted template
+            data.template = target_template
+
+            if xslt_transform is not None:
+                # modify the xml content temporarily with the transformed data content
+                data.xml_content = xml_utils.apply_xslt_transform(
+                    data.xml_content, xslt_transform
+                )
+
+            error = None
+            try:
+                # save the new template for the data if the migration is True
+                if migrate:
+                    system_api.upsert_data(data)
+                else:
+                    # check if the data is valid
+                    if data.template.format == Template.XSD:
+                        data_api.check_xml_file_is_valid(data)
+                    elif data.template.format == Template.JSON:
+                        data_api.check_json_file_is_valid(data)
+                    else:
+                        raise NotImplementedError(
+                            "Migration not available for this format"
+                        )
+
+                results["valid"].append(str(data.id))
+            except Exception as exception:
+                error = str(exception)
+                results["wrong"].append(str(data.id))
+
+            if migration_run is not None:
+                pending_results.append((str(data.id), error is None, error))
+
+            if _count_results(results) % MIGRATION_PROGRESS_INTERVAL == 0:
+                _save_results(migration_run, pending_results)
+                if on_progress is not None and not on_progress(results):
+                    break
+    finally:
+        _save_results(migration_run, pending_results)
+
+    return results
+
+
+def _check_not_cancelled(task):
+    """Stop a migration task executed by a worker if it has been cancelled,
+    keeping its cancelled state.
+
+    Args:
+        task:
+
+    Return:
+    """
+    if is_task_cancelled(task.request.id):
+        raise Ignore()
+
+
+def _create_migration_run(task, user_id, target_template, migrate):
+    """Create the migration run saving the results of a migration task
+    executed by a worker
+
+    Args:
+        task: migration task
+        user_id:
+        target_template:
+        migrate:
+
+    Return:
+        MigrationRun, None if the task is not executed by a worker
+    """
+    if _is_called_directly(task):
+        return None
+    return data_migration_api.get_or_create(
+        task.request.id, user_id, target_template.id, migrate
+    )
+
+
+def _get_migration_run(task_id):
+    """Get the migration run of a migration task
+
+    Args:
+        task_id:
+
+    Return:
+        MigrationRun, None if the results of the task are not saved
+    """
+    if task_id is None:
+        return None
+    try:
+        return data_migration_api.get_by_task_id(task_id)
+    except DoesNotExist:
+        return None
+
+
+def _save_results(migration_run, pending_results):
+    """Save the pending results in the migration run
+
+    Args:
+        migration_run:
+        pending_results: list of (data id, valid, error), emptied
+
+    Return:
+    """
+    if migration_run is not None and pending_results:
+        data_migration_api.add_results(migration_run, pending_results)
+    pending_results.clear()
+
+
+def _get_chunk_result(results, migration_run):
+    """Get the result of a chunk task: number of valid and wrong data if the
+    results are saved in the migration run, lists of ids otherwise.
+
+    Args:
+        results:
+        migration_run:
+
+    Return:
+    """
+    if migration_run is None:
+        return results
+    return {
+        "valid_count": len(results["valid"]),
+        "wrong_count": len(results["wrong"]),
+    }
+
+
+def _get_admin_user(user_id):
+    """Get a user allowed to migrate data
+
+    Args:
+        user_id:
+
+    Return:
+    """
+    user = user_api.get_user_by_id(user_id)
+    # check user status
+    if not (user.is_staff or user.is_superuser):
+        raise AccessControlError("Only admin user can migrate data.")
+    return user
+
+
+def _get_xslt_transform(xslt_id):
+    """Get the compiled XSLT of the migration
+
+    Args:
+        xslt_id:
+
+    Return:
+        etree.XSLT, None if no XSLT selected
+    """
+    if xslt_id is None:
+        return None
+    return xsl_transformation_api.get_xslt_transform(
+        xsl_transformation_api.get_by_id(str(xslt_id))
+    )
+
+
+def _split_in_chunks(data_ids):
+    """Split a list of data ids in chunks of DATA_MIGRATION_CHUNK_SIZE
+
+    Args:
+        data_ids:
+
+    Return:
+    """
+    data_ids = list(data_ids)
+    chunks = []
+    for start in range(0, len(data_ids), DATA_MIGRATION_CHUNK_SIZE):
+        end = start + DATA_MIGRATION_CHUNK_SIZE
+        chunks.append(data_ids[start:end])
+    return chunks
+
+
+def _is_called_directly(task):
+    """Check if a task is executed in the current process (called directly
+    or applied eagerly), and not by a worker.
+
+    Args:
+        task:
+
+    Return:
+    """
+    return task.request.called_directly or task.request.is_eager
+
+
+def _get_chunk_task(
+    chunk, xslt_id, template_id, user_id, migrate, task, check_access=True
+):
+    """Get the signature of the task migrating a chunk of data, with its id
+
+    Args:
+        chunk:
+        xslt_id:
+        template_id:
+        user_id:
+        migrate:
+        task: migration task
+        check_access:
+
+    Return:
+    """
+    return migrate_data_chunk_task.s(
+        data_ids=chunk,
+        xslt_id=xslt_id,
+        template_id=template_id,
+        user_id=user_id,
+        migrate=migrate,
+        parent_task_id=task.request.id,
+        check_access=check_access,
+    ).set(task_id=uuid())
+
+
+def _fan_out(task, chunk_tasks, progress):
+    """Replace a migration task by a chord migrating its chunks in parallel
+
+    Args:
+        task: migration task
+        chunk_tasks: signatures of the chunk tasks
+        progress: progress of the migration task, with the chunks
+
+    Return:
+    """
+    task.update_state(state="PROGRESS", meta=progress)
+    return task.replace(chord(group(chunk_tasks), merge_migration_results.s()))
+
+
+def _count_results(results):
+    """Count the data processed
+
+    Args:
+        results: lists of ids or numbers of valid and wrong data
+
+    Return:
+    """
+    if "valid_count" in results:
+        return results["valid_count"] + results["wrong_count"]
+    return len(results["valid"]) + len(results["wrong"])
+
+
+def _get_chunks_progress(progress):
+    """Aggregate the progress of the chunks of a migration task
+
+    Args:
+        progress: progress of the migration task, with the chunks
+
+    Return:
+    """
+    progress_by_template = {}
+    for chunk_id, chunk_total, template_index in progress["chunks"]:
+        chunk_result = AsyncResult(chunk_id)
+        if chunk_result.state == states.SUCCESS:
+            chunk_current = _count_results(chunk_result.result)
+        elif chunk_result.state == "PROGRESS":
+            chunk_current = chunk_result.info["current"]
+        else:
+            chunk_current = 0
+        template_progress = progress_by_template.setdefault(
+            template_index, [0, 0]
+        )
+        template_progress[0] += chunk_current
+        template_progress[1] += chunk_total
+
+    if "template_total" not in progress:
+        return {
+            "current": sum(
+                current for current, _ in progress_by_template.values()
+            ),
+            "total": progress["total"],
+        }
+
+    # report the templates not fully processed yet as the current template
+    templates_in_progress = [
+        template_progress
+        for template_progress in progress_by_template.values()
+        if template_progress[0] < template_progress[1]
+    ]
+    return {
+        "template_current": progress["template_total"]
+        - len(templates_in_progress),
+        "template_total": progress["template_total"],
+        "data_current": sum(current for current, _ in templates_in_progress),
+        "data_total": sum(total for _, total in templates_in_progress),
+    }
+
+
 @shared_task
 def index_mongo_data(data_id):
     """Index a data in MongoDB"""
@@ -271,6 +761,30 @@ def index_mongo_data(data_id):
         )
 
 
+@shared_task
+def index_mongo_data_list(data_ids):
+    """Index a list of data in MongoDB, using bulk operations
+
+    Args:
+        data_ids:
+
+    Returns:
+
+    """
+    try:
+        from core_main_app.components.mongo.models import MongoData
+
+        data_ids = list(data_ids)
+        for start in range(0, len(data_ids), MONGODB_BULK_BATCH_SIZE):
+            end = start + MONGODB_BULK_BATCH_SIZE
+            data_list = system_api.get_all_data_by_id_list(data_ids[start:end])
+            MongoData.bulk_upsert(MongoData.init_mongo_data_list(data_list))
+    except Exception as exception:
+        logger.error(
+            f"ERROR : An error occurred while indexing data : {str(exception)}"
+        )
+
+
 @shared_task
 def update_mongo_data_user(data_ids, user_id):
     """Update user id of all data in list
@@ -285,10 +799,7 @@ def update_mongo_data_user(data_ids, user_id):
     try:
         from core_main_app.components.mongo.models import MongoData
 
-        for data_id in data_ids:
-            mongo_data = MongoData.objects.get(pk=data_id)
-            mongo_data.user_id = user_id
-            mongo_data.save()
+        MongoData.bulk_update_fields(data_ids, user_id=user_id)
     except Exception as exception:
         logger.error(
             f"ERROR : An error occurred while updating data owner : {str(exception)}"
@@ -309,10 +820,7 @@ def update_mongo_data_workspace(data_ids, workspace_id):
     try:
         from core_main_app.components.mongo.models import MongoData
 
-        for data_id in data_ids:
-            mongo_data = MongoData.objects.get(pk=data_id)
-            mongo_data._workspace_id = workspace_id
-            mongo_data.save()
+        MongoData.bulk_update_fields(data_ids, _workspace_id=workspace_id)
     except Exception as exception:
         logger.error(
             f"ERROR : An error occurred while updating data workspace : {str(exception)}"
@@ -336,3 +844,70 @@ def delete_mongo_data(data_id):
         logger.error(
             f"ERROR : An error occurred while deleting data : {str(exception)}"
         )
+
+
+@shared_task
+def warm_rendered_html_cache(data_ids):
+    """Render a list of data and cache their detail and list HTML renderings
+    (e.g. after a bulk ingestion)
+
+    Args:
+        data_ids:
+
+    Returns:
+
+    """
+    if not RENDERED_HTML_CACHE_TTL:
+        return
+
+    from core_main_app.templatetags.xsl_transform_tag import (
+        render_xml_as_html_detail,
+    )
+
+    data_by_template = {}
+    try:
+        for data in system_api.get_all_data_by_id_list(list(data_ids)):
+            data_by_template.setdefault(data.template_id, []).append(data)
+        for template_id, data_list in data_by_template.items():
+            try:
+                template_html_rendering = (
+                    template_html_rendering_api.get_by_template_id(template_id)
+                )
+            except DoesNotExist:
+                template_html_rendering = None
+            if template_html_rendering:
+                # render all data of the template with one compiled template
+                for rendering in ("list_rendering", "detail_rendering"):
+                    if getattr(template_html_rendering, rendering):
+                        try:
+                            template_html_rendering_api.render_many(
+                                template_html_rendering, data_list, rendering
+                            )
+                        except Exception as exception:
+                            logger.error(
+                                "ERROR : An error occurred while rendering "
+                                f"data of template {template_id}: "
+                                f"{str(exception)}"
+                            )
+            if (
+                template_html_rendering
+                and template_html_rendering.detail_rendering
+            ):
+                continue
+            for data in data_list:
+                try:
+                    if data.template.format == Template.XSD:
+                        render_xml_as_html_detail(
+                            xml_content=data.content,
+                            template_id=template_id,
+                            data=data,
+                        )
+                except Exception as exception:
+                    logger.error(
+                        f"ERROR : An error occurred while rendering data {data.id}: "
+                        f"{str(exception)}"
+                    )
+    except Exception as exception:
+        logger.error(
+            f"ERROR : An error occurred while rendering data : {str(exception)}"
+        )
@@ -0,0 +1,20 @@
+"""Custom admin site for the Migration Run model"""
+
+from django.contrib import admin
+
+
+class CustomMigrationRunAdmin(admin.ModelAdmin):
+    """CustomMigrationRunAdmin"""
+
+    list_display = ["task_id", "target_template", "migrate", "creation_date"]
+    readonly_fields = [
+        "task_id",
+        "user_id",
+        "target_template",
+        "migrate",
+        "creation_date",
+    ]
+
+    def has_add_permission(self, request, obj=None):
+        """Prevent from manually adding Migration Runs"""
+        return False
@@ -0,0 +1,107 @@
+"""Data migration API"""
+
+from core_main_app.components.data_migration.models import (
+    MigrationResult,
+    MigrationRun,
+)
+
+
+def get_or_create(task_id, user_id, target_template_id, migrate):
+    """Get the migration run of a task, create it if it does not exist.
+
+    Args:
+        task_id:
+        user_id:
+        target_template_id:
+        migrate:
+
+    Returns:
+        MigrationRun
+
+    """
+    migration_run, _ = MigrationRun.objects.get_or_create(
+        task_id=task_id,
+        defaults={
+            "user_id": str(user_id),
+            "target_template_id": target_template_id,
+            "migrate": migrate,
+        },
+    )
+    return migration_run
+
+
+def get_by_task_id(task_id):
+    """Get the migration run of a task.
+
+    Args:
+        task_id:
+
+    Returns:
+        MigrationRun
+
+    """
+    return MigrationRun.get_by_task_id(task_id)
+
+
+def add_results(migration_run, results):
+    """Save the results of a list of data in a single query.
+
+    Args:
+        migration_run:
+        results: list of (data id, valid, error message)
+
+    Returns:
+
+    """
+    MigrationResult.objects.bulk_create(
+        [
+            MigrationResult(
+                migration_run=migration_run,
+                data_id=data_id,
+                valid=valid,
+                error=error or "",
+            )
+            for data_id, valid, error in results
+        ]
+    )
+
+
+def get_results(migration_run, valid=None, data_id=None, error=None):
+    """Get the results of a migration run.
+
+    Args:
+        migration_run:
+        valid: only valid (True) or wrong (False) data if set
+        data_id: only the result of this data if set
+        error: only errors containing this text if set
+
+    Returns:
+        QuerySet of MigrationResult
+
+    """
+    results = migration_run.results.all()
+    if valid is not None:
+        results = results.filter(valid=valid)
+    if data_id:
+        results = results.filter(data_id=data_id)
+    if error:
+        results = results.filter(error__icontains=error)
+    return results
+
+
+def get_data_ids(migration_run, valid):
+    """Get the ids of the valid or wrong data of a migration run.
+
+    Args:
+        migration_run:
+        valid:
+
+    Returns:
+        list
+
+    """
+    return list(
+        get_results(migration_run, valid=valid).values_list(
+            "data_id", flat=True
+        )
+    )
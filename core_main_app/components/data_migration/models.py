@@ -0,0 +1,88 @@
+"""Data migration models"""
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.db.models import Count, Q
+
+from core_main_app.commons import exceptions
+from core_main_app.components.template.models import Template
+
+
+class MigrationRun(models.Model):
+    """Migration / validation of data to a target template, executed by an
+    async task"""
+
+    task_id = models.CharField(max_length=255, unique=True)
+    user_id = models.CharField(blank=False, max_length=200)
+    target_template = models.ForeignKey(
+        Template, blank=True, null=True, on_delete=models.SET_NULL
+    )
+    migrate = models.BooleanField(default=False)
+    creation_date = models.DateTimeField(auto_now_add=True)
+
+    @staticmethod
+    def get_by_task_id(task_id):
+        """Return the migration run of a task.
+
+        Args:
+            task_id:
+
+        Returns:
+
+        """
+        try:
+            return MigrationRun.objects.get(task_id=task_id)
+        except ObjectDoesNotExist as exception:
+            raise exceptions.DoesNotExist(str(exception))
+        except Exception as exception:
+            raise exceptions.ModelError(str(exception))
+
+    def get_summary(self):
+        """Return the number of valid and wrong data of the migration run.
+
+        Returns:
+            dict: valid_count, wrong_count
+
+        """
+        return self.results.aggregate(
+            valid_count=Count("id", filter=Q(valid=True)),
+            wrong_count=Count("id", filter=Q(valid=False)),
+        )
+
+    def __str__(self):
+        """Migration run as string
+
+        Returns:
+
+        """
+        return self.task_id
+
+
+class MigrationResult(models.Model):
+    """Result of the migration / validation of a data"""
+
+    migration_run = models.ForeignKey(
+        MigrationRun, on_delete=models.CASCADE, related_name="results"
+    )
+    data_id = models.CharField(blank=False, max_length=200)
+    valid = models.BooleanField()
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        """Meta"""
+
+        ordering = ["id"]
+        indexes = [
+            models.Index(
+                fields=["migration_run", "valid"],
+                name="core_migration_result_valid",
+            )
+        ]
+
+    def __str__(self):
+        """Migration result as string
+
+        Returns:
+
+        """
+        return self.data_id
@@ -5,7 +5,7 @@ Lock API
 import logging
 
 from core_main_app.commons.exceptions import LockError
-from core_main_app.components.lock.models import Lock
+from core_main_app.components.lock.models import DatabaseLockObject, Lock
 from core_main_app.settings import LOCK_OBJECT_TTL
 from core_main_app.utils.datetime import datetime_now
 
@@ -20,13 +20,10 @@ def is_object_locked(object, user):
     Returns:
     """
     try:
-        lock = Lock.acquire()
-        _check_object_locked(object, user, lock)
+        _check_object_locked(object, user, Lock.acquire())
         return False
     except LockError:
         return True
-    finally:
-        Lock.release()
 
 
 def set_lock_object(object, user):
@@ -37,12 +34,7 @@ def set_lock_object(object, user):
         user:
     Returns:
     """
-    try:
-        lock = Lock.acquire()
-        if not _check_object_locked(object, user, lock):
-            lock.set_lock(object, user)
-    finally:
-        Lock.release()
+    Lock.acquire().set_lock(object, user, LOCK_OBJECT_TTL)
 
 
 def remove_lock_on_object(object, user):
@@ -63,8 +55,15 @@ def remove_lock_on_object(object, user):
         logger.warning(
             "remove_lock_on_object threw an exception: %s", str(exception)
         )
-    finally:
-        Lock.release()
+
+
+def delete_expired_locks():
+    """Delete all expired locks.
+
+    Returns:
+        number of deleted locks
+    """
+    return DatabaseLockObject.delete_expired(LOCK_OBJECT_TTL)
 
 
 def _check_object_locked(object, user, lock):
@@ -72,6 +71,7 @@ def _check_object_locked(object, user, lock):
         If there is no lock on object, return false.
         If there is a lock but owned by the user, return true.
         If there is a lock no owned by the user, raise LockError exception.
+        Expired locks are ignored (and deleted by a periodic task).
 
     Args:
         object:
@@ -88,7 +88,6 @@ def _check_object_locked(object, user, lock):
     # Check if lock has expired
     date = database_lock_object.lock_date
     if (datetime_now() - date).total_seconds() > LOCK_OBJECT_TTL:
-        lock.remove_lock(database_lock_object)
         return False
 
     # If the user who requested the object is the same as the one who locked the object
@@ -5,19 +5,20 @@ Lock model
 import threading
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import IntegrityError, models, transaction
 
 from core_main_app.commons import exceptions
 from core_main_app.components.data.models import Data
-from core_main_app.utils.datetime import datetime_now
-
-sem = threading.Semaphore()
+from core_main_app.utils.datetime import datetime_now, datetime_timedelta
 
 
 class Lock:
     """
-    Class Lock. Singleton thread safe.
+    Class Lock. Singleton.
     Only this object should be called to be used for an action regarding locking a Document.
+    Mutual exclusion between processes is provided by the database: lock rows
+    are unique per object, read with SELECT ... FOR UPDATE where supported,
+    and expired locks are taken over with a compare-and-set update.
     """
 
     __singleton_lock = threading.Lock()
@@ -36,34 +37,71 @@ class Lock:
             with cls.__singleton_lock:
                 if not cls.__singleton_instance:
                     cls.__singleton_instance = cls()
-        sem.acquire()
         return cls.__singleton_instance
 
     @classmethod
     def release(cls):
-        """release.
+        """release. Kept for backward compatibility, locking is done by the database.
 
         Args:
             cls:
 
         Returns:
         """
-        sem.release()
 
-    def set_lock(self, object, user):
-        """Set lock on a Document.
+    def set_lock(self, object, user, ttl):
+        """Set lock on a Document, if not locked by another user.
 
         Args:
             object:
             user:
+            ttl: lock duration, in seconds
 
         Returns:
         """
-        database_lock_object = DatabaseLockObject()
-        database_lock_object.object = object
-        database_lock_object.user_id = str(user.id)
-        database_lock_object.lock_date = datetime_now()
-        database_lock_object.save()
+        user_id = str(user.id)
+        now = datetime_now()
+        with transaction.atomic():
+            try:
+                database_lock_object = (
+                    DatabaseLockObject.objects.select_for_update().get(
+                        object=object
+                    )
+                )
+            except ObjectDoesNotExist:
+                try:
+                    with transaction.atomic():
+                        DatabaseLockObject.objects.create(
+                            object=object, user_id=user_id, lock_date=now
+                        )
+                    return
+                except IntegrityError:
+                    # lock created concurrently by another request
+                    database_lock_object = (
+                        DatabaseLockObject.objects.select_for_update().get(
+                            object=object
+                        )
+                    )
+
+            if database_lock_object.lock_date >= now - datetime_timedelta(
+                seconds=ttl
+            ):
+                if database_lock_object.user_id == user_id:
+                    return
+                raise exceptions.LockError(
+                    "The object is used by another user and is locked."
+                )
+
+            # Take over (or renew, for the same user) the expired lock, if it
+            # did not change in the meantime
+            if not DatabaseLockObject.objects.filter(
+                pk=database_lock_object.pk,
+                user_id=database_lock_object.user_id,
+                lock_date=database_lock_object.lock_date,
+            ).update(user_id=user_id, lock_date=now):
+                raise exceptions.LockError(
+                    "The object is used by another user and is locked."
+                )
 
     def remove_lock(self, database_lock_object):
         """Remove a lock.
@@ -99,6 +137,15 @@ class DatabaseLockObject(models.Model):
     user_id = models.CharField(blank=False, max_length=200)
     lock_date = models.DateTimeField(blank=False)
 
+    class Meta:
+        """Meta"""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["object"], name="unique_lock_per_object"
+            )
+        ]
+
     @staticmethod
     def get_lock_by_object(obj):
         """Get lock relative to the given object.
@@ -111,6 +158,22 @@ class DatabaseLockObject(models.Model):
         """
         return DatabaseLockObject.objects.get(object=obj)
 
+    @staticmethod
+    def delete_expired(ttl):
+        """Delete all locks older than the given duration.
+
+        Args:
+            ttl: lock duration, in seconds
+
+        Returns:
+            number of deleted locks
+
+        """
+        deleted, _ = DatabaseLockObject.objects.filter(
+            lock_date__lt=datetime_now() - datetime_timedelta(seconds=ttl)
+        ).delete()
+        return deleted
+
     def __str__(self):
         """Database Lock as string
 
@@ -0,0 +1,25 @@
+"""Lock tasks"""
+
+import logging
+
+from celery import shared_task
+
+from core_main_app.components.lock import api as lock_api
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def delete_expired_locks():
+    """Delete all expired locks
+
+    Returns:
+
+    """
+    try:
+        deleted = lock_api.delete_expired_locks()
+        logger.info(f"{deleted} expired locks deleted.")
+    except Exception as exception:
+        logger.error(
+            f"ERROR : An error occurred while deleting expired locks : {str(exception)}"
+        )
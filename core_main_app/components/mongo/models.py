@@ -1,13 +1,17 @@
 """Mongoengine Data model"""
 
 import logging
+import threading
+from functools import partial
 
 from django.conf import settings
+from django.db import transaction
 
+from core_main_app.commons.constants import DATA_LIST_DEFERRED_FIELDS
 from core_main_app.commons.exceptions import CoreError
 from core_main_app.components.data.models import Data
 from core_main_app.components.data.tasks import (
-    index_mongo_data,
+    index_mongo_data_list,
     delete_mongo_data,
     update_mongo_data_user,
     update_mongo_data_workspace,
@@ -15,20 +19,103 @@ from core_main_app.components.data.tasks import (
 from core_main_app.components.template.models import Template
 from core_main_app.components.workspace.models import Workspace
 from core_main_app.settings import (
+    MONGODB_BULK_BATCH_SIZE,
     SEARCHABLE_DATA_OCCURRENCES_LIMIT,
     XML_POST_PROCESSOR,
     XML_FORCE_LIST,
 )
 from core_main_app.utils import xml as xml_utils
+from core_main_app.utils.databases.mongo import indexes as mongo_indexes
 from core_main_app.utils.json_utils import load_json_string
 
 logger = logging.getLogger(__name__)
 
+# data saved in the current thread, waiting to be indexed
+_pending_indexing = threading.local()
+
+
+def start_indexing_batch(sender, **kwargs):
+    """Start batching the indexing of data saved while handling a request.
+    Connected to the request_started signal.
+
+    Args:
+        sender:
+        **kwargs:
+
+    Returns:
+
+    """
+    _pending_indexing.in_request = True
+    _pending_indexing.data_ids = []
+
+
+def end_indexing_batch(sender, **kwargs):
+    """Index the data saved while handling a request in a single task.
+    Connected to the request_finished signal.
+
+    Args:
+        sender:
+        **kwargs:
+
+    Returns:
+
+    """
+    _pending_indexing.in_request = False
+    _flush_indexing()
+
+
+def _schedule_indexing(data_id):
+    """Index data once the current transaction is committed. Callbacks of
+    rolled back transactions are discarded, so their data are never indexed.
+
+    Args:
+        data_id:
+
+    Returns:
+
+    """
+    transaction.on_commit(partial(_add_pending_indexing, data_id))
+
+
+def _add_pending_indexing(data_id):
+    """Add committed data to the indexing batch. The batch is sent at the
+    end of the request, or right away outside of a request.
+
+    Args:
+        data_id:
+
+    Returns:
+
+    """
+    if not hasattr(_pending_indexing, "data_ids"):
+        _pending_indexing.data_ids = []
+    _pending_indexing.data_ids.append(data_id)
+    if (
+        not getattr(_pending_indexing, "in_request", False)
+        or len(_pending_indexing.data_ids) >= MONGODB_BULK_BATCH_SIZE
+    ):
+        _flush_indexing()
+
+
+def _flush_indexing():
+    """Send the data waiting to be indexed to a single indexing task
+
+    Returns:
+
+    """
+    data_ids = getattr(_pending_indexing, "data_ids", None)
+    if not data_ids:
+        return
+    _pending_indexing.data_ids = []
+    index_mongo_data_list.apply_async((list(dict.fromkeys(data_ids)),))
+
+
 try:
     if settings.MONGODB_INDEXING:
         from bson import ObjectId
         from mongoengine import Document, DoesNotExist
         from mongoengine import fields as mongo_fields
+        from pymongo import ReplaceOne
 
         class AbstractMongoData(Document):
             """Data object stored in MongoDB"""
@@ -88,6 +175,10 @@ try:
             user_id = mongo_fields.IntField()
             _workspace_id = mongo_fields.IntField(db_field="workspace")
             _content = None
+            # objects loaded from the database (see prefetch_related)
+            _sql_data = None
+            _template_object = None
+            _workspace_object = None
 
             meta = {
                 "indexes": [
@@ -105,7 +196,11 @@ try:
                 Returns:
 
                 """
-                return Template.get_by_id(self._template_id)
+                if self._template_object is None:
+                    self._template_object = Template.get_by_id(
+                        self._template_id
+                    )
+                return self._template_object
 
             @property
             def _blob(self):
@@ -115,7 +210,7 @@ try:
 
                 """
                 try:
-                    return Data.get_by_id(self.data_id)._blob
+                    return self._get_sql_data()._blob
                 except Exception:
                     logger.error("Unable to get MongoData._blob")
                     return None
@@ -129,7 +224,7 @@ try:
                 Returns:
 
                 """
-                return Data.get_by_id(self.data_id).blob(user)
+                return self._get_sql_data().blob(user)
 
             @property
             def template_id(self):
@@ -147,11 +242,11 @@ try:
                 Returns:
 
                 """
-                return (
-                    Workspace.get_by_id(self._workspace_id)
-                    if self._workspace_id
-                    else None
-                )
+                if self._workspace_object is None and self._workspace_id:
+                    self._workspace_object = Workspace.get_by_id(
+                        self._workspace_id
+                    )
+                return self._workspace_object
 
             @property
             def content(self):
@@ -161,7 +256,7 @@ try:
 
                 """
                 if not self._content:
-                    self._content = Data.get_by_id(self.data_id).content
+                    self._content = self._get_sql_data().content
                 return self._content
 
             @content.setter
@@ -186,6 +281,75 @@ try:
                 """Set content - backward compatibility"""
                 self.content = value
 
+            def _get_sql_data(self):
+                """Return the data object stored in the database
+
+                Returns:
+
+                """
+                if self._sql_data is None:
+                    self._sql_data = Data.get_by_id(self.data_id)
+                return self._sql_data
+
+            @staticmethod
+            def prefetch_related(
+                mongo_data_list, data=True, templates=True, workspaces=True
+            ):
+                """Load the objects related to a list of mongo data (data
+                stored in the database with their blob, templates,
+                workspaces), with one query per type of object, so accessing
+                content, _blob, template or workspace does not run a query for
+                each mongo data.
+
+                Args:
+                    mongo_data_list:
+                    data: load data (content, blob)
+                    templates: load templates
+                    workspaces: load workspaces
+
+                Returns:
+                    list: mongo data
+
+                """
+                mongo_data_list = list(mongo_data_list)
+                if data:
+                    sql_data = (
+                        Data.objects.select_related("_blob")
+                        .defer(*DATA_LIST_DEFERRED_FIELDS)
+                        .in_bulk(
+                            [
+                                mongo_data.data_id
+                                for mongo_data in mongo_data_list
+                            ]
+                        )
+                    )
+                    for mongo_data in mongo_data_list:
+                        mongo_data._sql_data = sql_data.get(mongo_data.data_id)
+                if templates:
+                    template_objects = Template.objects.in_bulk(
+                        {
+                            mongo_data._template_id
+                            for mongo_data in mongo_data_list
+                        }
+                    )
+                    for mongo_data in mongo_data_list:
+                        mongo_data._template_object = template_objects.get(
+                            mongo_data._template_id
+                        )
+                if workspaces:
+                    workspace_objects = Workspace.objects.in_bulk(
+                        {
+                            mongo_data._workspace_id
+                            for mongo_data in mongo_data_list
+                            if mongo_data._workspace_id
+                        }
+                    )
+                    for mongo_data in mongo_data_list:
+                        mongo_data._workspace_object = workspace_objects.get(
+                            mongo_data._workspace_id
+                        )
+                return mongo_data_list
+
             @staticmethod
             def execute_query(query, order_by_field):
                 """Execute a query.
@@ -230,6 +394,72 @@ try:
                     # create new mongo data otherwise
                     mongo_data = MongoData()
                     mongo_data.mongo_id = ObjectId()
+                return MongoData._set_fields_from_data(mongo_data, data)
+
+            @staticmethod
+            def init_mongo_data_list(data_list):
+                """Initialize mongo data from a list of data, fetching
+                existing mongo data in a single query
+
+                Args:
+                    data_list:
+
+                Returns:
+
+                """
+                data_list = list(data_list)
+                mongo_ids = MongoData.get_mongo_ids(
+                    [data.id for data in data_list]
+                )
+                return [
+                    MongoData.from_data(data, mongo_ids.get(data.id))
+                    for data in data_list
+                ]
+
+            @staticmethod
+            def from_data(data, mongo_id=None):
+                """Initialize mongo data from data, without querying MongoDB
+
+                Args:
+                    data:
+                    mongo_id: mongo id to keep (new id generated if None)
+
+                Returns:
+
+                """
+                mongo_data = MongoData()
+                mongo_data.mongo_id = mongo_id or ObjectId()
+                return MongoData._set_fields_from_data(mongo_data, data)
+
+            @staticmethod
+            def get_mongo_ids(data_ids):
+                """Return the mongo ids of the mongo data in list
+
+                Args:
+                    data_ids:
+
+                Returns:
+                    dict: mongo id by data id
+
+                """
+                return {
+                    document["_id"]: document.get("mongo_id")
+                    for document in MongoData._get_collection().find(
+                        {"_id": {"$in": list(data_ids)}}, {"mongo_id": 1}
+                    )
+                }
+
+            @staticmethod
+            def _set_fields_from_data(mongo_data, data):
+                """Set mongo data fields from data
+
+                Args:
+                    mongo_data:
+                    data:
+
+                Returns:
+
+                """
                 # Get template
                 data_template = data.template
                 # Initialize mongo data fields
@@ -259,6 +489,105 @@ try:
                 mongo_data.last_change_date = data.last_change_date
                 return mongo_data
 
+            @staticmethod
+            def bulk_upsert(
+                mongo_data_list, batch_size=MONGODB_BULK_BATCH_SIZE
+            ):
+                """Insert or replace a list of mongo data, using bulk writes
+
+                Args:
+                    mongo_data_list:
+                    batch_size:
+
+                Returns:
+
+                """
+                documents = []
+                for mongo_data in mongo_data_list:
+                    mongo_data.validate()
+                    documents.append(mongo_data.to_mongo().to_dict())
+                MongoData.bulk_upsert_documents(
+                    documents, batch_size=batch_size
+                )
+
+            @staticmethod
+            def bulk_upsert_documents(
+                documents, collection=None, batch_size=MONGODB_BULK_BATCH_SIZE
+            ):
+                """Insert or replace a list of raw mongo documents, using bulk writes
+
+                Args:
+                    documents:
+                    collection: target collection (MongoData collection if None)
+                    batch_size:
+
+                Returns:
+
+                """
+                if collection is None:
+                    collection = MongoData._get_collection()
+                for start in range(0, len(documents), batch_size):
+                    end = start + batch_size
+                    requests = [
+                        ReplaceOne(
+                            {"_id": document["_id"]}, document, upsert=True
+                        )
+                        for document in documents[start:end]
+                    ]
+                    if requests:
+                        collection.bulk_write(requests, ordered=False)
+
+            @staticmethod
+            def create_indexes(collection):
+                """Create the indexes declared by MongoData, and the indexes
+                on the data content configured in the settings, on a collection
+
+                Args:
+                    collection:
+
+                Returns:
+
+                """
+                index_opts = MongoData._meta.get("index_opts") or {}
+                for spec in MongoData._meta["index_specs"]:
+                    opts = index_opts.copy()
+                    opts.update(spec)
+                    fields = opts.pop("fields")
+                    opts.pop("cls", None)
+                    collection.create_index(fields, **opts)
+                mongo_indexes.create_indexes(collection)
+
+            @staticmethod
+            def bulk_update_fields(
+                data_ids, batch_size=MONGODB_BULK_BATCH_SIZE, **fields
+            ):
+                """Set fields of all mongo data in list, using batched update_many
+
+                Args:
+                    data_ids:
+                    batch_size:
+                    **fields: field names and values to set
+
+                Returns:
+
+                """
+                update = {
+                    MongoData._fields[name].db_field: (
+                        MongoData._fields[name].to_mongo(value)
+                        if value is not None
+                        else None
+                    )
+                    for name, value in fields.items()
+                }
+                data_ids = [int(data_id) for data_id in data_ids]
+                collection = MongoData._get_collection()
+                for start in range(0, len(data_ids), batch_size):
+                    end = start + batch_size
+                    collection.update_many(
+                        {"_id": {"$in": data_ids[start:end]}},
+                        {"$set": update},
+                    )
+
             @staticmethod
             def update_user_id_from_queryset(data_queryset, user_id):
                 """Update user id of all data in queryset
@@ -279,10 +608,7 @@ try:
                         )
                     )
                 else:
-                    for data_id in data_ids:
-                        mongo_data = MongoData.objects.get(pk=data_id)
-                        mongo_data.user_id = user_id
-                        mongo_data.save()
+                    MongoData.bulk_update_fields(data_ids, user_id=user_id)
 
             @staticmethod
             def update_workspace_id_from_queryset(data_queryset, workspace_id):
@@ -304,10 +630,9 @@ try:
                         )
                     )
                 else:
-                    for data_id in data_ids:
-                        mongo_data = MongoData.objects.get(pk=data_id)
-                        mongo_data._workspace_id = workspace_id
-                        mongo_data.save()
+                    MongoData.bulk_update_fields(
+                        data_ids, _workspace_id=workspace_id
+                    )
 
             @staticmethod
             def post_save_data(sender, instance, **kwargs):
@@ -319,7 +644,7 @@ try:
 
                 """
                 if settings.MONGODB_ASYNC_SAVE:
-                    index_mongo_data.apply_async((str(instance.id),))
+                    _schedule_indexing(instance.id)
                 else:
                     mongo_data = MongoData.init_mongo_data(instance)
                     mongo_data.save()
@@ -21,6 +21,7 @@ from core_main_app.settings import ENABLE_JSON_SCHEMA_SUPPORT
 from core_main_app.utils import json_utils as main_json_utils
 from core_main_app.utils import xml as main_xml_utils
 from core_main_app.utils.file import get_file_extension
+from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 logger = logging.getLogger(__name__)
 
@@ -43,10 +44,14 @@ def upsert(template, request):
     ):
         # Set format
         template.format = Template.XSD
-        # Check if schema is valid
-        main_xml_utils.is_schema_valid(template.content, request=request)
+        # Check if schema is valid (the schema is parsed once for all steps)
+        xsd_tree = main_xml_utils.is_schema_valid(
+            template.content, request=request
+        )
         # Set custom XSD hash
-        template.hash = main_xml_utils.get_hash(template.content)
+        template.hash = main_xml_utils.get_hash(
+            template.content, xml_tree=xsd_tree
+        )
     elif (
         template_extension
         == TEMPLATE_FILE_EXTENSION_FOR_TEMPLATE_FORMAT[Template.JSON]
@@ -63,7 +68,11 @@ def upsert(template, request):
     template.save_template()
     if template.format == Template.XSD:
         # Register local imports/includes for XSD templates
-        _register_local_dependencies(template, request=request)
+        _register_local_dependencies(
+            template, request=request, xsd_tree=xsd_tree
+        )
+        # Compiled versions of the template and its dependents are outdated
+        _clear_xml_schema_cache(template)
     # Return template
     return template
 
@@ -192,14 +201,99 @@ def delete(template, request):
     Returns:
 
     """
+    _clear_xml_schema_cache(template)
     template.delete()
 
 
-def _register_local_dependencies(template, request):
+def get_xml_schema(template, request=None):
+    """Get the compiled XML schema of a template, from the cache if possible.
+
+    Dependencies are resolved with the permissions of the user: schemas with
+    imports or includes are cached by user, other schemas are shared.
+
+    Args:
+        template:
+        request:
+
+    Returns:
+        etree.XMLSchema
+
+    """
+    shared_cache_key = (template.id, template.hash, None)
+    user_cache_key = (
+        template.id,
+        template.hash,
+        _get_xml_schema_cache_scope(request),
+    )
+    if template.id is not None:
+        for cache_key in (shared_cache_key, user_cache_key):
+            xml_schema = main_xml_utils.xml_schema_cache.get(cache_key)
+            if xml_schema is not None:
+                return xml_schema
+
+    try:
+        xsd_tree = XSDTree.build_tree(template.content)
+    except Exception as exception:
+        raise exceptions.XSDError(str(exception))
+    imports, includes = main_xml_utils.get_imports_and_includes(
+        None, xsd_tree=xsd_tree
+    )
+    try:
+        xml_schema = main_xml_utils.build_xml_schema(xsd_tree, request=request)
+    except Exception as exception:
+        raise exceptions.XMLError(str(exception))
+
+    if template.id is not None:
+        main_xml_utils.xml_schema_cache.set(
+            user_cache_key if imports or includes else shared_cache_key,
+            xml_schema,
+            weight=len(template.content),
+        )
+    return xml_schema
+
+
+def _get_xml_schema_cache_scope(request):
+    """Get the scope of the schemas compiled for a request: id of the
+    authenticated user, None for anonymous users.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user.id
+
+
+def _clear_xml_schema_cache(template):
+    """Remove compiled schemas of a template and of the templates depending on it
+    from the cache.
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    if template.id is None or not len(main_xml_utils.xml_schema_cache):
+        return
+    template_ids = Template.get_all_dependent_id_list(template.id)
+    template_ids.add(template.id)
+    main_xml_utils.xml_schema_cache.delete_if(
+        lambda key: key[0] in template_ids
+    )
+
+
+def _register_local_dependencies(template, request, xsd_tree=None):
     """Register local dependencies for the given template.
 
     Args:
         template: Template instance.
+        request:
+        xsd_tree: template content already parsed (optional)
 
     Returns:
 
@@ -208,7 +302,7 @@ def _register_local_dependencies(template, request):
     template.dependencies.clear()
     # Get local dependencies
     local_dependencies = main_xml_utils.get_local_dependencies(
-        template.content
+        template.content, xsd_tree=xsd_tree
     )
     if not local_dependencies:
         return
@@ -22,6 +22,7 @@ from core_main_app.utils.file import (
 )
 from core_main_app.utils.storage.storage import (
     core_file_storage,
+    read_file,
     user_directory_path,
 )
 from core_main_app.utils.validation.regex_validation import (
@@ -95,7 +96,7 @@ class Template(Version):
 
         """
         if not self._content:
-            self._content = self.file.read().decode("utf-8")
+            self._content = read_file(self.file)
         return self._content
 
     @content.setter
@@ -231,6 +232,31 @@ class Template(Version):
             ).all()
         return Template.objects.filter(pk__in=template_id_list).all()
 
+    @staticmethod
+    def get_all_dependent_id_list(template_id):
+        """Return ids of templates depending, directly or not, on a template.
+
+        Args:
+            template_id:
+
+        Returns:
+            set of template ids
+
+        """
+        dependent_ids = set()
+        template_ids = {template_id}
+        while template_ids:
+            template_ids = (
+                set(
+                    Template.objects.filter(
+                        dependencies__in=template_ids
+                    ).values_list("pk", flat=True)
+                )
+                - dependent_ids
+            )
+            dependent_ids |= template_ids
+        return dependent_ids
+
     @property
     def display_name(self):
         """Return template name to display.
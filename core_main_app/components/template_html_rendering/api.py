@@ -1,10 +1,22 @@
 """Template HTML rendering API"""
 
+import hashlib
+import logging
+
+from core_main_app.components.data.models import Data
 from core_main_app.components.template_html_rendering.models import (
     TemplateHtmlRendering,
 )
+from core_main_app.settings import HTML_RENDERING_CACHE_MAX_SIZE
+from core_main_app.utils import rendering_cache
+from core_main_app.utils.cache import LRUCache
 from django.template import Template as DjangoTemplate, Context
 
+logger = logging.getLogger(__name__)
+
+# compiled Django templates, by template HTML rendering and content hash
+html_rendering_cache = LRUCache(max_size=HTML_RENDERING_CACHE_MAX_SIZE)
+
 
 def get_by_template_id(template_id):
     """Get TemplateHtmlRendering by its template id.
@@ -42,6 +54,7 @@ def upsert(template_html_rendering):
 
     """
     template_html_rendering.save()
+    _clear_html_rendering_cache(template_html_rendering)
     return template_html_rendering
 
 
@@ -72,6 +85,7 @@ def delete(template_html_rendering):
     Returns:
 
     """
+    _clear_html_rendering_cache(template_html_rendering)
     template_html_rendering.delete()
 
 
@@ -86,10 +100,124 @@ def render_data(template_html_rendering, data, rendering):
     Returns:
 
     """
-    template_rendering = DjangoTemplate(
-        getattr(template_html_rendering, rendering)
+
+    def _render():
+        template_rendering = get_django_template(
+            template_html_rendering, rendering
+        )
+
+        # Render the template with the context
+        context = Context({"dict_content": data.get_dict_content()})
+        return template_rendering.render(context)
+
+    return rendering_cache.get_rendered_html(
+        data,
+        rendering_cache.get_html_rendering_key(
+            template_html_rendering.template_id, rendering
+        ),
+        _render,
+    )
+
+
+def render_many(template_html_rendering, data_list, rendering):
+    """Render a list of data with the same compiled template, fetching the
+    dict contents of the data not found in the rendered HTML cache at once.
+
+    Args:
+        template_html_rendering:
+        data_list:
+        rendering:
+
+    Returns:
+        list: HTML renderings, in the order of the list (None if the data
+            could not be rendered)
+
+    """
+
+    def _render_many(data_to_render):
+        template_rendering = get_django_template(
+            template_html_rendering, rendering
+        )
+        html_list = []
+        for data, dict_content in zip(
+            data_to_render, Data.get_dict_contents(data_to_render)
+        ):
+            try:
+                html_list.append(
+                    template_rendering.render(
+                        Context({"dict_content": dict_content})
+                    )
+                )
+            except Exception as exception:
+                logger.error(
+                    f"ERROR : An error occurred while rendering data {data.id}: "
+                    f"{str(exception)}"
+                )
+                html_list.append(None)
+        return html_list
+
+    return rendering_cache.get_many_rendered_html(
+        list(data_list),
+        rendering_cache.get_html_rendering_key(
+            template_html_rendering.template_id, rendering
+        ),
+        _render_many,
     )
 
-    # Render the template with the context
-    context = Context({"dict_content": data.get_dict_content()})
-    return template_rendering.render(context)
+
+def get_django_template(template_html_rendering, rendering):
+    """Get the compiled Django template of a rendering, from the cache if
+    possible.
+
+    Args:
+        template_html_rendering:
+        rendering: list_rendering or detail_rendering
+
+    Returns:
+        django.template.Template
+
+    """
+    return get_django_template_from_string(
+        getattr(template_html_rendering, rendering),
+        cache_key_prefix=(
+            "template_html_rendering",
+            template_html_rendering.id,
+            rendering,
+        ),
+    )
+
+
+def get_django_template_from_string(html_rendering, cache_key_prefix=None):
+    """Get a compiled Django template from the cache, compile it if not found.
+
+    Args:
+        html_rendering: content of the template
+        cache_key_prefix: key identifying the rendering (content only if None)
+
+    Returns:
+        django.template.Template
+
+    """
+    cache_key = (cache_key_prefix or ("content",)) + (
+        hashlib.sha256(html_rendering.encode()).hexdigest(),
+    )
+    django_template = html_rendering_cache.get(cache_key)
+    if django_template is None:
+        django_template = DjangoTemplate(html_rendering)
+        html_rendering_cache.set(cache_key, django_template)
+    return django_template
+
+
+def _clear_html_rendering_cache(template_html_rendering):
+    """Remove compiled versions of a TemplateHtmlRendering from the cache.
+
+    Args:
+        template_html_rendering: TemplateHtmlRendering.
+
+    Returns:
+
+    """
+    html_rendering_cache.delete_if(
+        lambda key: key[0] == "template_html_rendering"
+        and key[1] == template_html_rendering.id
+    )
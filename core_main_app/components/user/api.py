@@ -129,3 +129,25 @@ def get_id_username_dict(list_user):
 
     """
     return dict((str(x.id), x.username) for x in list_user)
+
+
+def set_owner_names(object_list):
+    """Resolve the owner names of a list of objects (data, blobs) with a
+    single query, instead of one query per object.
+
+    Args:
+        object_list: objects with a user_id and an owner_name
+
+    Returns:
+
+    """
+    object_list = [obj for obj in object_list if obj._owner_name is None]
+    user_ids = {
+        str(obj.user_id) for obj in object_list if str(obj.user_id).isdigit()
+    }
+    if not user_ids:
+        return
+    usernames = get_id_username_dict(get_all_users_by_list_id(user_ids))
+    for obj in object_list:
+        if str(obj.user_id) in usernames:
+            obj._owner_name = usernames[str(obj.user_id)]
@@ -55,6 +55,7 @@ def upsert(xsl_transformation):
         )
     else:
         xsl_transformation.save_object()
+        _clear_xslt_transform_cache(xsl_transformation)
         return xsl_transformation
 
 
@@ -65,6 +66,7 @@ def delete(xsl_transformation):
         xsl_transformation: XslTransformation to delete.
 
     """
+    _clear_xslt_transform_cache(xsl_transformation)
     xsl_transformation.delete()
 
 
@@ -88,6 +90,49 @@ def xsl_transform(xml_content, xslt_name):
         )
 
 
+def get_xslt_transform(xsl_transformation):
+    """Get the compiled XSLT of an XslTransformation, from the cache if possible.
+
+    The content of the XslTransformation is only read if not found in the cache.
+
+    Args:
+        xsl_transformation: XslTransformation.
+
+    Returns:
+        etree.XSLT
+
+    """
+    if not xsl_transformation.checksum:
+        # without checksum, use the content hash to detect changes
+        return xml.get_xslt_transform(xsl_transformation.content)
+
+    cache_key = (
+        "xsl_transformation",
+        xsl_transformation.id,
+        xsl_transformation.checksum,
+    )
+    transform = xml.xslt_cache.get(cache_key)
+    if transform is None:
+        transform = xml.build_xslt_transform(xsl_transformation.content)
+        xml.xslt_cache.set(cache_key, transform)
+    return transform
+
+
+def _clear_xslt_transform_cache(xsl_transformation):
+    """Remove compiled versions of an XslTransformation from the cache.
+
+    Args:
+        xsl_transformation: XslTransformation.
+
+    Returns:
+
+    """
+    xml.xslt_cache.delete_if(
+        lambda key: key[0] == "xsl_transformation"
+        and key[1] == xsl_transformation.id
+    )
+
+
 def get_by_id_list(list_data_id):
     """Return a list of xsl_transformation object with the given list id.
 
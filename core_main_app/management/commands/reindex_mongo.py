@@ -0,0 +1,511 @@
+"""Reindex MongoDB command"""
+
+import datetime
+import logging
+import os
+import time
+from argparse import BooleanOptionalAction
+from multiprocessing import Pool
+
+from django.conf import settings as conf_settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connections
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import is_aware, is_naive, make_aware
+
+from core_main_app.components.data.models import Data
+from core_main_app.settings import MONGODB_BULK_BATCH_SIZE
+from core_main_app.system import api as system_api
+from core_main_app.utils.databases.mongo.pymongo_database import (
+    create_text_index,
+)
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the collection built with the shadow option
+SHADOW_COLLECTION_SUFFIX = "_reindex"
+
+# Maximum number of passes syncing the shadow collection before replacing
+SHADOW_SYNC_MAX_PASSES = 3
+
+
+class Command(BaseCommand):
+    """Rebuild the MongoDB index from the data stored in the database"""
+
+    help = "Rebuild MongoDB data from the data stored in the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--template",
+            default=None,
+            type=int,
+            help="Only reindex data of this template",
+        )
+        parser.add_argument(
+            "--workspace",
+            default=None,
+            type=int,
+            help="Only reindex data of this workspace",
+        )
+        parser.add_argument(
+            "--since",
+            default=None,
+            type=str,
+            help="Only reindex data changed since this date (ISO 8601)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=MONGODB_BULK_BATCH_SIZE,
+            type=int,
+            help="Number of data converted and written at once",
+        )
+        parser.add_argument(
+            "--workers",
+            default=1,
+            type=int,
+            help="Number of processes used to convert data",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            type=str,
+            help="Path to a checkpoint file storing the last reindexed data id "
+            "(created if missing, resumes after the stored id, removed once completed)",
+        )
+        parser.add_argument(
+            "--shadow",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Build the index in a separate collection, then atomically replace "
+            "the current collection with it",
+        )
+
+    def handle(self, *args, **options):
+        """Rebuild MongoDB data from the data stored in the database.
+
+        Data are read in primary key order, converted (in a pool of processes
+        if workers > 1) and written to MongoDB in bulk.
+        With the shadow option, the index is built in a separate collection
+        that replaces the current collection once completed, so queries never
+        see a partially built index. Data created, updated or deleted during
+        the build are synced to the separate collection before replacing the
+        current collection (changes made during the final sync pass and the
+        rename may still be missed: stop writes to get an exact index).
+
+        Parameters:
+            "template": integer,
+            "workspace": integer,
+            "since": string,
+            "batch-size": integer,
+            "workers": integer,
+            "checkpoint": string,
+            "shadow": boolean
+
+        Examples:
+            reindex_mongo
+            reindex_mongo --template 1 --since 2024-01-01
+            reindex_mongo --shadow --workers 8 --batch-size 1000 --checkpoint reindex.checkpoint
+
+        Args:
+            args:
+            options:
+
+        """
+        template_id = options["template"]
+        workspace_id = options["workspace"]
+        since = options["since"]
+        batch_size = options["batch_size"]
+        workers = options["workers"]
+        checkpoint_path = options["checkpoint"]
+        shadow = options["shadow"]
+
+        if not conf_settings.MONGODB_INDEXING:
+            raise CommandError("MongoDB indexing is disabled.")
+
+        if batch_size < 1:
+            raise CommandError("The batch size should be >= 1.")
+
+        if workers < 1:
+            raise CommandError("The number of workers should be >= 1.")
+
+        if shadow and (template_id or workspace_id or since):
+            raise CommandError(
+                "The shadow option rebuilds the whole index and can not be "
+                "used with --template, --workspace or --since."
+            )
+
+        from core_main_app.components.mongo.models import MongoData
+
+        queryset = Data.objects.all()
+        if template_id:
+            queryset = queryset.filter(template_id=template_id)
+        if workspace_id:
+            queryset = queryset.filter(workspace_id=workspace_id)
+        if since:
+            queryset = queryset.filter(
+                last_change_date__gte=_parse_since(since)
+            )
+
+        last_pk = _read_checkpoint(checkpoint_path)
+        if last_pk is not None:
+            self.stdout.write(f"Resuming after data id: {last_pk}")
+            queryset = queryset.filter(pk__gt=last_pk)
+
+        collection = MongoData._get_collection()
+        target = collection
+        if shadow:
+            target = collection.database[
+                collection.name + SHADOW_COLLECTION_SUFFIX
+            ]
+            if last_pk is None:
+                # start from an empty shadow collection
+                target.drop()
+            MongoData.create_indexes(target)
+            create_text_index(target)
+            self.stdout.write(f"Building index in collection: {target.name}")
+
+        total = queryset.count()
+        self.stdout.write(f"{total} data will be reindexed.")
+
+        start_time = time.perf_counter()
+        nb_indexed = nb_failures = 0
+        failed_ids = set()
+        for chunk_last_pk, documents, errors in _convert_chunks(
+            _iter_chunks(queryset, batch_size), workers
+        ):
+            MongoData.bulk_upsert_documents(
+                documents, collection=target, batch_size=batch_size
+            )
+            _write_checkpoint(checkpoint_path, chunk_last_pk)
+            for data_id, error in errors:
+                self.stderr.write(
+                    f"ERROR: Unable to reindex data {data_id}: {error}"
+                )
+                failed_ids.add(data_id)
+            nb_indexed += len(documents)
+            nb_failures += len(errors)
+            elapsed_time = max(time.perf_counter() - start_time, 1e-6)
+            self.stdout.write(
+                f"Reindexed {nb_indexed + nb_failures}/{total} data "
+                f"({nb_failures} failures): "
+                f"{(nb_indexed + nb_failures) / elapsed_time:.2f} docs/s."
+            )
+
+        if shadow:
+            self._sync_shadow_collection(target, batch_size, failed_ids)
+            # rename is atomic: queries switch from the old to the new index
+            target.rename(collection.name, dropTarget=True)
+            self.stdout.write(f"Collection {collection.name} replaced.")
+
+        if checkpoint_path and os.path.isfile(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Command completed: {nb_indexed} data reindexed, "
+                f"{nb_failures} failures."
+            )
+        )
+
+    def _sync_shadow_collection(self, target, batch_size, failed_ids):
+        """Sync the shadow collection with data changed during the build
+
+        Args:
+            target: shadow collection
+            batch_size:
+            failed_ids: ids of the data that could not be reindexed
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        for _ in range(SHADOW_SYNC_MAX_PASSES):
+            to_reindex, to_delete = _get_out_of_sync_ids(
+                target, batch_size, failed_ids
+            )
+            if not to_reindex and not to_delete:
+                return
+            self.stdout.write(
+                f"Syncing data changed during the build: {len(to_reindex)} "
+                f"to reindex, {len(to_delete)} to delete."
+            )
+            for start in range(0, len(to_reindex), batch_size):
+                end = start + batch_size
+                data_ids = to_reindex[start:end]
+                _, documents, errors = _convert_chunk(
+                    data_ids, MongoData.get_mongo_ids(data_ids)
+                )
+                MongoData.bulk_upsert_documents(
+                    documents, collection=target, batch_size=batch_size
+                )
+                for data_id, error in errors:
+                    self.stderr.write(
+                        f"ERROR: Unable to reindex data {data_id}: {error}"
+                    )
+                    failed_ids.add(data_id)
+            for start in range(0, len(to_delete), batch_size):
+                end = start + batch_size
+                target.delete_many({"_id": {"$in": to_delete[start:end]}})
+        self.stderr.write(
+            "WARNING: Data are still changing, the index may miss the "
+            "latest changes."
+        )
+
+
+def _get_sync_key(user_id, workspace_id, template_id, last_change_date):
+    """Return the values compared to detect out of sync mongo documents
+
+    Args:
+        user_id:
+        workspace_id:
+        template_id:
+        last_change_date:
+
+    Returns:
+
+    """
+    if last_change_date is not None:
+        if is_aware(last_change_date):
+            last_change_date = last_change_date.astimezone(
+                datetime.timezone.utc
+            ).replace(tzinfo=None)
+        # MongoDB stores dates with a millisecond precision
+        last_change_date = last_change_date.replace(
+            microsecond=last_change_date.microsecond // 1000 * 1000
+        )
+    return (
+        str(user_id) if user_id not in (None, "") else None,
+        workspace_id,
+        template_id,
+        last_change_date,
+    )
+
+
+def _get_out_of_sync_ids(collection, batch_size, failed_ids):
+    """Compare data with the documents of a collection, both read in primary
+    key order.
+
+    Args:
+        collection:
+        batch_size:
+        failed_ids: ids of the data that could not be reindexed
+
+    Returns:
+        (ids of the data to reindex, ids of the documents to delete)
+
+    """
+    to_reindex = []
+    to_delete = []
+    documents = iter(
+        collection.find(
+            {},
+            {
+                "user_id": 1,
+                "workspace": 1,
+                "template": 1,
+                "last_change_date": 1,
+            },
+        )
+        .sort("_id", 1)
+        .batch_size(batch_size)
+    )
+    document = next(documents, None)
+    for data_id, *values in (
+        Data.objects.order_by("pk")
+        .values_list(
+            "pk", "user_id", "workspace_id", "template_id", "last_change_date"
+        )
+        .iterator(chunk_size=batch_size)
+    ):
+        while document is not None and document["_id"] < data_id:
+            to_delete.append(document["_id"])
+            document = next(documents, None)
+        if document is not None and document["_id"] == data_id:
+            if _get_sync_key(*values) != _get_sync_key(
+                document.get("user_id"),
+                document.get("workspace"),
+                document.get("template"),
+                document.get("last_change_date"),
+            ):
+                to_reindex.append(data_id)
+            document = next(documents, None)
+        elif data_id not in failed_ids:
+            to_reindex.append(data_id)
+    while document is not None:
+        to_delete.append(document["_id"])
+        document = next(documents, None)
+    return to_reindex, to_delete
+
+
+def _parse_since(since):
+    """Parse the since option to an aware datetime
+
+    Args:
+        since:
+
+    Returns:
+
+    """
+    value = parse_datetime(since)
+    if value is None:
+        date = parse_date(since)
+        if date is None:
+            raise CommandError(f"Invalid date: {since}")
+        value = parse_datetime(date.isoformat() + "T00:00:00")
+    if conf_settings.USE_TZ and is_naive(value):
+        value = make_aware(value)
+    return value
+
+
+def _iter_chunks(queryset, batch_size):
+    """Stream data ids in primary key order, by chunks
+
+    Args:
+        queryset:
+        batch_size:
+
+    Returns:
+        generator of lists of data ids
+
+    """
+    chunk = []
+    for data_id in (
+        queryset.order_by("pk")
+        .values_list("pk", flat=True)
+        .iterator(chunk_size=batch_size)
+    ):
+        chunk.append(data_id)
+        if len(chunk) == batch_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _convert_chunk(data_ids, mongo_ids):
+    """Convert a chunk of data to mongo documents
+
+    Args:
+        data_ids:
+        mongo_ids: existing mongo ids by data id
+
+    Returns:
+        (last data id of the chunk, documents, list of (data id, error))
+
+    """
+    from core_main_app.components.mongo.models import MongoData
+
+    documents = []
+    errors = []
+    for data in system_api.get_all_data_by_id_list(data_ids):
+        try:
+            mongo_data = MongoData.from_data(data, mongo_ids.get(data.id))
+            mongo_data.validate()
+            documents.append(mongo_data.to_mongo().to_dict())
+        except Exception as exception:
+            errors.append((data.id, str(exception)))
+    return data_ids[-1], documents, errors
+
+
+def _init_worker():
+    """Initialize a worker process
+
+    Returns:
+
+    """
+    import django
+
+    # needed when processes are spawned instead of forked
+    django.setup()
+
+
+def _convert_chunk_in_worker(args):
+    """Convert a chunk of data in a worker process
+
+    Args:
+        args: (data ids, mongo ids)
+
+    Returns:
+
+    """
+    return _convert_chunk(*args)
+
+
+def _convert_chunks(chunks, workers):
+    """Convert chunks of data, in a pool of processes if workers > 1.
+
+    Existing mongo ids are read by the main process, so workers only access
+    the database. Chunks are sent to the pool by windows, to keep the number
+    of converted documents waiting to be written bounded, and results are
+    returned in order so the checkpoint always points to a written chunk.
+
+    Args:
+        chunks:
+        workers:
+
+    Returns:
+        generator of (last data id of the chunk, documents, errors)
+
+    """
+    from core_main_app.components.mongo.models import MongoData
+
+    if workers == 1:
+        for data_ids in chunks:
+            yield _convert_chunk(data_ids, MongoData.get_mongo_ids(data_ids))
+        return
+
+    # database connections can not be shared with forked processes
+    connections.close_all()
+    window_size = workers * 2
+    with Pool(processes=workers, initializer=_init_worker) as pool:
+        window = []
+        for data_ids in chunks:
+            window.append((data_ids, MongoData.get_mongo_ids(data_ids)))
+            if len(window) == window_size:
+                yield from pool.imap(_convert_chunk_in_worker, window)
+                window = []
+        if window:
+            yield from pool.imap(_convert_chunk_in_worker, window)
+
+
+def _read_checkpoint(checkpoint_path):
+    """Read the last reindexed data id from a checkpoint file
+
+    Args:
+        checkpoint_path:
+
+    Returns:
+        last reindexed data id, None if no checkpoint
+
+    """
+    if not checkpoint_path or not os.path.isfile(checkpoint_path):
+        return None
+    with open(checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+        content = checkpoint_file.read().strip()
+    if not content:
+        return None
+    try:
+        return int(content)
+    except ValueError:
+        raise CommandError(f"Invalid checkpoint file: {checkpoint_path}")
+
+
+def _write_checkpoint(checkpoint_path, last_pk):
+    """Store the last reindexed data id in the checkpoint file
+
+    Args:
+        checkpoint_path:
+        last_pk:
+
+    Returns:
+
+    """
+    if not checkpoint_path:
+        return
+    tmp_path = f"{checkpoint_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as checkpoint_file:
+        checkpoint_file.write(f"{last_pk}\n")
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(tmp_path, checkpoint_path)
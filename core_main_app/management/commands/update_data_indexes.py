@@ -0,0 +1,72 @@
+"""Update data indexes command"""
+
+from django.conf import settings as conf_settings
+from django.core.management import BaseCommand, CommandError
+
+from core_main_app.commons.constants import DATA_JSON_FIELD
+from core_main_app.components.data.models import Data
+from core_main_app.utils.databases.backend import uses_postgresql_backend
+from core_main_app.utils.databases.json_indexes import update_indexes
+
+
+class Command(BaseCommand):
+    """Update the PostgreSQL indexes on the data content"""
+
+    help = (
+        "Create the PostgreSQL indexes on the data content configured in the "
+        "settings, and drop the indexes that are not configured anymore"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            default=False,
+            action="store_true",
+            help="Only print the statements",
+        )
+
+    def handle(self, *args, **options):
+        """Update the PostgreSQL indexes on the data content.
+
+        Indexes are created from the DATA_INDEXED_PATHS and
+        DATA_CONTENT_GIN_INDEX settings, concurrently so the data table is
+        not locked while indexes are built.
+
+        Parameters:
+            "dry-run": boolean
+
+        Examples:
+            update_data_indexes
+            update_data_indexes --dry-run
+
+        Args:
+            args:
+            options:
+
+        """
+        dry_run = options["dry_run"]
+
+        if not uses_postgresql_backend():
+            raise CommandError(
+                "Indexes on the data content are only available with PostgreSQL."
+            )
+
+        if conf_settings.MONGODB_INDEXING:
+            raise CommandError(
+                "MongoDB indexing is enabled: the data content is not stored in PostgreSQL."
+            )
+
+        try:
+            statements = update_indexes(Data, DATA_JSON_FIELD, dry_run=dry_run)
+        except ValueError as exception:
+            raise CommandError(str(exception))
+
+        for sql, params in statements:
+            self.stdout.write(f"{sql} {params}" if params else sql)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Command completed: {len(statements)} statements "
+                f"{'to execute' if dry_run else 'executed'}."
+            )
+        )
@@ -0,0 +1,173 @@
+"""Update MongoDB indexes command"""
+
+import threading
+
+from django.conf import settings as conf_settings
+from django.core.management import BaseCommand, CommandError
+
+from core_main_app.utils.databases.mongo import indexes as mongo_indexes
+
+
+class Command(BaseCommand):
+    """Update the MongoDB indexes on the data content"""
+
+    help = (
+        "Create the MongoDB indexes on the data content configured in the "
+        "settings, and drop the indexes that are not configured anymore"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            default=False,
+            action="store_true",
+            help="Only print the indexes to create and drop",
+        )
+        parser.add_argument(
+            "--drop-unused",
+            default=None,
+            type=int,
+            help="Also drop the configured indexes not used for this number "
+            "of days",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            default=5,
+            type=float,
+            help="Number of seconds between two reports of the index build "
+            "progress",
+        )
+
+    def handle(self, *args, **options):
+        """Update the MongoDB indexes on the data content.
+
+        Indexes are created in the background from the MONGODB_INDEXED_PATHS
+        setting, while the progress of the builds is reported. Indexes
+        removed from the setting, and optionally indexes not used for a number
+        of days, are dropped.
+
+        Parameters:
+            "dry-run": boolean,
+            "drop-unused": integer,
+            "poll-interval": float
+
+        Examples:
+            update_mongo_indexes
+            update_mongo_indexes --dry-run
+            update_mongo_indexes --drop-unused 30
+
+        Args:
+            args:
+            options:
+
+        """
+        dry_run = options["dry_run"]
+        drop_unused = options["drop_unused"]
+        poll_interval = options["poll_interval"]
+
+        if not conf_settings.MONGODB_INDEXING:
+            raise CommandError("MongoDB indexing is disabled.")
+
+        if drop_unused is not None and drop_unused < 1:
+            raise CommandError("The number of days should be >= 1.")
+
+        if poll_interval <= 0:
+            raise CommandError("The poll interval should be > 0.")
+
+        from core_main_app.components.mongo.models import MongoData
+
+        collection = MongoData._get_collection()
+        try:
+            index_names = set(mongo_indexes.get_index_models())
+        except (KeyError, TypeError, AttributeError) as exception:
+            raise CommandError(
+                f"Invalid MONGODB_INDEXED_PATHS setting: {str(exception)}"
+            )
+        existing_index_names = mongo_indexes.get_managed_index_names(
+            collection
+        )
+
+        dropped_index_names = existing_index_names - index_names
+        if drop_unused is not None:
+            unused_index_names = mongo_indexes.get_unused_index_names(
+                collection, drop_unused
+            )
+            for index_name in sorted(unused_index_names & index_names):
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Index {index_name} not used for {drop_unused} days: "
+                        "remove it from MONGODB_INDEXED_PATHS or it will be "
+                        "created again."
+                    )
+                )
+            dropped_index_names |= unused_index_names
+            index_names -= unused_index_names
+        created_index_names = index_names - existing_index_names
+
+        for index_name in sorted(dropped_index_names):
+            self.stdout.write(f"Drop index: {index_name}")
+            if not dry_run:
+                collection.drop_index(index_name)
+
+        for index_name in sorted(created_index_names):
+            self.stdout.write(f"Create index: {index_name}")
+        if created_index_names and not dry_run:
+            self._create_indexes(
+                collection, created_index_names, poll_interval
+            )
+
+        if not dry_run:
+            index_sizes = mongo_indexes.get_index_sizes(collection)
+            for index_name in sorted(
+                mongo_indexes.get_managed_index_names(collection)
+            ):
+                self.stdout.write(
+                    f"Index {index_name}: "
+                    f"{index_sizes.get(index_name, 0) / 1024 / 1024:.2f} MB"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Command completed: {len(created_index_names)} indexes "
+                f"{'to create' if dry_run else 'created'}, "
+                f"{len(dropped_index_names)} indexes "
+                f"{'to drop' if dry_run else 'dropped'}."
+            )
+        )
+
+    def _create_indexes(self, collection, index_names, poll_interval):
+        """Create indexes, and report the progress of the builds until they
+        are completed.
+
+        Args:
+            collection:
+            index_names:
+            poll_interval:
+
+        Returns:
+
+        """
+        errors = []
+
+        def _create():
+            try:
+                mongo_indexes.create_indexes(collection, index_names)
+            except Exception as exception:
+                errors.append(exception)
+
+        thread = threading.Thread(target=_create, daemon=True)
+        thread.start()
+        thread.join(poll_interval)
+        while thread.is_alive():
+            for build in mongo_indexes.get_index_builds(collection):
+                if build["total"]:
+                    self.stdout.write(
+                        f"{build['message']}: {build['done']}/{build['total']} "
+                        f"({100 * build['done'] / build['total']:.1f}%)"
+                    )
+                else:
+                    self.stdout.write(build["message"])
+            thread.join(poll_interval)
+
+        if errors:
+            raise CommandError(f"Unable to create indexes: {str(errors[0])}")
@@ -0,0 +1,86 @@
+"""Update search vectors command"""
+
+import time
+
+from django.conf import settings as conf_settings
+from django.core.management import BaseCommand, CommandError
+
+from core_main_app.components.data.models import Data
+from core_main_app.utils.databases.backend import uses_postgresql_backend
+from core_main_app.utils.databases.search_vector import update_search_vectors
+
+
+class Command(BaseCommand):
+    """Rebuild the full text search vectors of the data"""
+
+    help = "Rebuild the PostgreSQL full text search vectors of the data"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=1000,
+            type=int,
+            help="Number of data updated by each statement",
+        )
+        parser.add_argument(
+            "--start-after",
+            default=0,
+            type=int,
+            help="Only update data with an id greater than this id",
+        )
+
+    def handle(self, *args, **options):
+        """Rebuild the full text search vectors of the data.
+
+        Data are updated in primary key order, by chunks, each chunk with a
+        single UPDATE ... FROM statement computing the vectors in the
+        database.
+
+        Parameters:
+            "batch-size": integer,
+            "start-after": integer
+
+        Examples:
+            update_search_vectors
+            update_search_vectors --batch-size 5000 --start-after 120000
+
+        Args:
+            args:
+            options:
+
+        """
+        batch_size = options["batch_size"]
+        last_id = options["start_after"]
+
+        if not uses_postgresql_backend():
+            raise CommandError(
+                "Search vectors are only available with PostgreSQL."
+            )
+
+        if conf_settings.MONGODB_INDEXING:
+            raise CommandError(
+                "MongoDB indexing is enabled: search vectors are not used."
+            )
+
+        if batch_size < 1:
+            raise CommandError("The batch size should be >= 1.")
+
+        start_time = time.perf_counter()
+        nb_updated = 0
+        while True:
+            data_ids = update_search_vectors(Data, last_id, batch_size)
+            if not data_ids:
+                break
+            last_id = max(data_ids)
+            nb_updated += len(data_ids)
+            elapsed_time = max(time.perf_counter() - start_time, 1e-6)
+            self.stdout.write(
+                f"Updated {nb_updated} data (last id: {last_id}): "
+                f"{nb_updated / elapsed_time:.2f} docs/s."
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Command completed: {nb_updated} data updated."
+            )
+        )
@@ -2,25 +2,35 @@
 
 import logging
 import os
+import time
 from argparse import BooleanOptionalAction
 from glob import glob
+from multiprocessing import Pool
 
 from django.conf import settings as conf_settings
 from django.contrib.auth.models import User
 from django.core.files.storage import default_storage
 from django.core.management import BaseCommand, CommandError
+from django.db import connections
 
 from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.components.data import api as data_api
+from core_main_app.components.data import tasks as data_tasks
 from core_main_app.components.data.models import Data
 from core_main_app.components.template.models import Template
 from core_main_app.components.workspace.models import Workspace
-from core_main_app.settings import XML_POST_PROCESSOR, XML_FORCE_LIST
+from core_main_app.settings import (
+    XERCES_VALIDATION,
+    XML_POST_PROCESSOR,
+    XML_FORCE_LIST,
+)
 from core_main_app.utils import xml as main_xml_utils
 from core_main_app.utils.datetime import datetime_now
 from core_main_app.utils.json_utils import (
     load_json_string,
+    validate_json_data,
 )
+from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +92,26 @@ class Command(BaseCommand):
             action=BooleanOptionalAction,
             help="Dry run",
         )
+        parser.add_argument(
+            "--workers",
+            default=1,
+            type=int,
+            help="Number of processes used to validate and convert documents",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            type=str,
+            help="Path to a checkpoint file listing loaded files (created if missing, "
+            "files already listed are skipped, failed files are retried)",
+        )
+        parser.add_argument(
+            "--warm-cache",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Render the loaded data in background tasks to fill the "
+            "rendered HTML cache",
+        )
 
     def handle(self, *args, **options):
         """Bulk upload files at a given path.
@@ -99,13 +129,19 @@ class Command(BaseCommand):
             "no-validation": boolean,
             "clean-title": boolean,
             "bulk": boolean,
-            "dry-run": boolean
+            "dry-run": boolean,
+            "workers": integer,
+            "checkpoint": string,
+            "warm-cache": boolean
 
         Examples:
             uploaddata --path dataset/*json --template 1 --user 1 --workspace 1
             uploaddata --path dataset/*json --template 1 --user 1 --workspace 1 --dry-run
             uploaddata --path dataset/*json --template 1 --user 1 --workspace 1 --bulk --batch-size 10
             uploaddata --path dataset/*json --template 1 --user 1 --workspace 1 --no-validation --clean-title
+            uploaddata --path dataset/*xml --template 1 --user 1 --bulk --batch-size 1000 --workers 8 \
+                --checkpoint dataset.checkpoint
+            uploaddata --path dataset/*xml --template 1 --user 1 --bulk --batch-size 1000 --warm-cache
 
         Args:
             args:
@@ -122,6 +158,9 @@ class Command(BaseCommand):
             validate = not options["no_validation"]
             clean_title = options["clean_title"]
             dry_run = options["dry_run"]
+            workers = options["workers"]
+            checkpoint_path = options["checkpoint"]
+            warm_cache = options["warm_cache"]
 
             if dry_run:
                 self.stdout.write("Dry run: no data will be saved.")
@@ -134,6 +173,9 @@ class Command(BaseCommand):
             if ".." in path:
                 raise CommandError("Unsupported path.")
 
+            if workers < 1:
+                raise CommandError("The number of workers should be >= 1.")
+
             if bulk:
                 self.stdout.write(
                     "Post-save operations will not be triggered with bulk option."
@@ -158,6 +200,16 @@ class Command(BaseCommand):
             if not file_list:
                 raise CommandError("No data found.")
 
+            if checkpoint_path:
+                processed_files = _read_checkpoint(checkpoint_path)
+                if processed_files:
+                    self.stdout.write(
+                        f"Skipping {len(processed_files)} files listed in checkpoint: {checkpoint_path}"
+                    )
+                    file_list = [
+                        f for f in file_list if f not in processed_files
+                    ]
+
             # Get User
             user = User.objects.get(id=user_id)
             self.stdout.write(
@@ -180,80 +232,68 @@ class Command(BaseCommand):
             self.stdout.write("The following files will be loaded:")
             self.stdout.write("\n".join(file_list))
 
+            start_time = time.perf_counter()
+            nb_loaded = nb_failures = total_size = 0
             data_list = list()
-            for data_file in file_list:
-                try:
-                    # initialize times
-                    now = datetime_now()
-                    # Create data
-                    instance = Data(
-                        template_id=template_id,
-                        workspace_id=workspace_id,
-                        user_id=user.id,
-                        last_change_date=now,
-                        creation_date=now,
-                        last_modification_date=now,
+            batch_files = list()
+            if workers > 1:
+                results = _load_files_in_pool(
+                    file_list, template, validate, workers, batch_size
+                )
+            else:
+                results = _load_files(
+                    file_list, template, template_id, validate
+                )
+            for data_file, dict_content, file_size, error in results:
+                total_size += file_size
+                if error:
+                    nb_failures += 1
+                    self.stderr.write(
+                        f"ERROR: Unable to create {data_file}: {error}"
                     )
-                    # Set title
-                    filename = os.path.split(data_file)[
-                        1
-                    ]  # [0] head, [1] tail (filename)
-                    instance.title = (
-                        filename.replace("_", " ")
-                        .replace(".xml", "")
-                        .replace(".json", "")
-                        if clean_title
-                        else data_file
+                else:
+                    nb_loaded += 1
+                    instance = _create_data(
+                        data_file, template_id, workspace_id, user, clean_title
                     )
-                    # Set file
-                    instance.file.name = data_file
-                    # Validate file
-                    if validate:
-                        if template.format == Template.XSD:
-                            data_api.check_xml_file_is_valid(instance)
-                        elif template.format == Template.JSON:
-                            data_api.check_json_file_is_valid(instance)
-                        else:
-                            raise CommandError(
-                                "Unable to validate: unsupported template format."
-                            )
-                    # Convert to JSON
-                    with open(
-                        os.path.join(conf_settings.MEDIA_ROOT, data_file),
-                        "rb",
-                    ) as _file:
-                        if template.format == Template.XSD:
-                            instance.dict_content = (
-                                main_xml_utils.raw_xml_to_dict(
-                                    _file,
-                                    postprocessor=XML_POST_PROCESSOR,
-                                    force_list=XML_FORCE_LIST,
-                                )
-                            )
-                        elif template.format == Template.JSON:
-                            instance.dict_content = load_json_string(
-                                _file.read()
-                            )
-                        else:
-                            raise CommandError(
-                                "Unable to convert: unsupported template format."
-                            )
+                    instance.dict_content = dict_content
                     # Add data to list
                     data_list.append(instance)
-                except Exception as exception:
-                    self.stderr.write(
-                        f"ERROR: Unable to create {data_file}: {str(exception)}"
-                    )
+                    batch_files.append(data_file)
                 # If data list reaches batch size
                 if len(data_list) == batch_size:
                     # Bulk insert list of data
                     if not dry_run:
-                        _bulk_create(data_list, bulk)
+                        saved_list = _bulk_create(data_list, bulk)
+                        _write_checkpoint(
+                            checkpoint_path,
+                            _get_saved_files(
+                                batch_files, data_list, saved_list
+                            ),
+                        )
+                        if warm_cache:
+                            _warm_cache(saved_list)
                     # Clear list of data
                     data_list = list()
+                    batch_files = list()
             # insert the last batch
-            if not dry_run and len(data_list):
-                _bulk_create(data_list, bulk)
+            if not dry_run:
+                if len(data_list):
+                    saved_list = _bulk_create(data_list, bulk)
+                    _write_checkpoint(
+                        checkpoint_path,
+                        _get_saved_files(batch_files, data_list, saved_list),
+                    )
+                    if warm_cache:
+                        _warm_cache(saved_list)
+
+            elapsed_time = max(time.perf_counter() - start_time, 1e-6)
+            self.stdout.write(
+                f"Processed {nb_loaded + nb_failures} documents "
+                f"({nb_failures} failures) in {elapsed_time:.2f}s: "
+                f"{(nb_loaded + nb_failures) / elapsed_time:.2f} docs/s, "
+                f"{total_size / (1024 * 1024) / elapsed_time:.2f} MB/s."
+            )
 
             self.stdout.write(
                 self.style.SUCCESS("Command completed. Check logs for errors.")
@@ -264,6 +304,277 @@ class Command(BaseCommand):
             raise CommandError(f"{str(api_exception)}")
 
 
+def _load_files(file_list, template, template_id, validate):
+    """Validate and convert files one at a time.
+
+    Args:
+        file_list:
+        template:
+        template_id:
+        validate:
+
+    Returns:
+        generator of (file, dict content, file size, error)
+
+    """
+    for data_file in file_list:
+        try:
+            with open(
+                os.path.join(conf_settings.MEDIA_ROOT, data_file),
+                "rb",
+            ) as _file:
+                xml_tree = None
+                # Validate file
+                if validate:
+                    instance = Data(template_id=template_id)
+                    instance.file.name = data_file
+                    if template.format == Template.XSD:
+                        # read and parse the file once, the tree is
+                        # validated and converted
+                        instance.content = _file.read()
+                        data_api.check_xml_file_is_valid(instance)
+                        xml_tree = instance.get_xml_tree()
+                        _file.seek(0)
+                    elif template.format == Template.JSON:
+                        data_api.check_json_file_is_valid(instance)
+                    else:
+                        raise CommandError(
+                            "Unable to validate: unsupported template format."
+                        )
+                # Convert to JSON
+                dict_content = _convert_file(
+                    _file, template.format, xml_tree=xml_tree
+                )
+            yield data_file, dict_content, _get_file_size(data_file), None
+        except Exception as exception:
+            yield data_file, None, _get_file_size(data_file), str(exception)
+
+
+def _create_data(data_file, template_id, workspace_id, user, clean_title):
+    """Create a data for a file
+
+    Args:
+        data_file:
+        template_id:
+        workspace_id:
+        user:
+        clean_title:
+
+    Returns:
+
+    """
+    # initialize times
+    now = datetime_now()
+    # Create data
+    instance = Data(
+        template_id=template_id,
+        workspace_id=workspace_id,
+        user_id=user.id,
+        last_change_date=now,
+        creation_date=now,
+        last_modification_date=now,
+    )
+    # Set title
+    filename = os.path.split(data_file)[1]  # [0] head, [1] tail (filename)
+    instance.title = (
+        filename.replace("_", " ").replace(".xml", "").replace(".json", "")
+        if clean_title
+        else data_file
+    )
+    # Set file
+    instance.file.name = data_file
+    return instance
+
+
+def _convert_file(data_file, template_format, xml_tree=None):
+    """Convert an opened file to a dictionary
+
+    Args:
+        data_file:
+        template_format:
+        xml_tree: XML file already parsed (optional)
+
+    Returns:
+
+    """
+    if template_format == Template.XSD:
+        return main_xml_utils.raw_xml_to_dict(
+            data_file,
+            postprocessor=XML_POST_PROCESSOR,
+            force_list=XML_FORCE_LIST,
+            xml_tree=xml_tree,
+        )
+    if template_format == Template.JSON:
+        return load_json_string(data_file.read())
+    raise CommandError("Unable to convert: unsupported template format.")
+
+
+def _get_file_size(data_file):
+    """Return the size of a file from the MEDIA_ROOT folder (0 if unknown)
+
+    Args:
+        data_file:
+
+    Returns:
+
+    """
+    try:
+        return os.path.getsize(
+            os.path.join(conf_settings.MEDIA_ROOT, data_file)
+        )
+    except OSError:
+        return 0
+
+
+# State of pool workers, set by _init_worker
+_worker_state = {}
+
+
+def _init_worker(template_format, template_content, validate):
+    """Initialize a worker process: compile the schema once per worker
+
+    Args:
+        template_format:
+        template_content:
+        validate:
+
+    Returns:
+
+    """
+    import django
+
+    # needed when processes are spawned instead of forked
+    django.setup()
+
+    _worker_state["format"] = template_format
+    _worker_state["schema"] = None
+    if validate:
+        if template_format == Template.XSD:
+            xsd_tree = XSDTree.build_tree(template_content)
+            # same validation switch as data_api.check_xml_file_is_valid
+            _worker_state["schema"] = (
+                xsd_tree
+                if XERCES_VALIDATION
+                else main_xml_utils.build_xml_schema(xsd_tree)
+            )
+        elif template_format == Template.JSON:
+            _worker_state["schema"] = template_content
+
+
+def _load_file_in_worker(data_file):
+    """Validate and convert a file in a worker process
+
+    Args:
+        data_file:
+
+    Returns:
+        (file, dict content, file size, error)
+
+    """
+    template_format = _worker_state["format"]
+    schema = _worker_state["schema"]
+    file_size = _get_file_size(data_file)
+    try:
+        with open(
+            os.path.join(conf_settings.MEDIA_ROOT, data_file), "rb"
+        ) as _file:
+            xml_tree = None
+            if schema is not None:
+                if template_format == Template.XSD:
+                    # parsed once, the tree is reused to convert the data
+                    xml_tree = main_xml_utils.build_xml_data_tree(_file.read())
+                    if XERCES_VALIDATION:
+                        error = main_xml_utils.validate_xml_data(
+                            schema, xml_tree
+                        )
+                    else:
+                        error = main_xml_utils.validate_xml_data_with_schema(
+                            schema, xml_tree
+                        )
+                    if error is not None:
+                        raise CommandError(error)
+                else:
+                    validate_json_data(load_json_string(_file.read()), schema)
+                _file.seek(0)
+            dict_content = _convert_file(
+                _file, template_format, xml_tree=xml_tree
+            )
+        return data_file, dict_content, file_size, None
+    except Exception as exception:
+        return data_file, None, file_size, str(exception)
+
+
+def _load_files_in_pool(file_list, template, validate, workers, batch_size):
+    """Validate and convert files in a pool of processes.
+
+    Files are sent to the pool by windows, to keep the number of results
+    waiting to be saved bounded.
+
+    Args:
+        file_list:
+        template:
+        validate:
+        workers:
+        batch_size:
+
+    Returns:
+        generator of (file, dict content, file size, error)
+
+    """
+    if validate and template.format not in (Template.XSD, Template.JSON):
+        raise CommandError("Unable to validate: unsupported template format.")
+
+    window_size = max(batch_size, 1) * workers * 2
+    # database connections can not be shared with forked processes
+    connections.close_all()
+    with Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(template.format, template.content, validate),
+    ) as pool:
+        for start in range(0, len(file_list), window_size):
+            end = start + window_size
+            yield from pool.imap_unordered(
+                _load_file_in_worker,
+                file_list[start:end],
+                chunksize=max(1, min(batch_size, 100)),
+            )
+
+
+def _read_checkpoint(checkpoint_path):
+    """Read the list of processed files from a checkpoint file
+
+    Args:
+        checkpoint_path:
+
+    Returns:
+        set of processed files
+
+    """
+    if not os.path.isfile(checkpoint_path):
+        return set()
+    with open(checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+        return {line.rstrip("\n") for line in checkpoint_file if line.strip()}
+
+
+def _write_checkpoint(checkpoint_path, file_list):
+    """Append loaded files to the checkpoint file
+
+    Args:
+        checkpoint_path:
+        file_list:
+
+    Returns:
+
+    """
+    if not checkpoint_path or not file_list:
+        return
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint_file:
+        checkpoint_file.writelines(f"{data_file}\n" for data_file in file_list)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+
+
 def _save_list(data_list):
     """Save a list of data
 
@@ -271,13 +582,17 @@ def _save_list(data_list):
         data_list:
 
     Returns:
+        list of saved data
 
     """
+    saved_list = list()
     for data in data_list:
         try:
             data.save()
+            saved_list.append(data)
         except Exception as e:
             logger.error(f"Loading failed for: {data.title}. Error: {str(e)}")
+    return saved_list
 
 
 def _bulk_create(data_list, bulk):
@@ -287,18 +602,52 @@ def _bulk_create(data_list, bulk):
         data_list:
 
     Returns:
+        list of saved data
 
     """
     if not bulk:
-        _save_list(data_list)
-        return
+        return _save_list(data_list)
 
     try:
         # Bulk insert list of data
         Data.objects.bulk_create(data_list)
+        return data_list
     except Exception as exception:
         # Log errors that occurred during bulk insert
         logger.error("Bulk upload failed.")
         logger.error(str(exception))
         # try inserting each data of the batch individually
-        _save_list(data_list)
+        return _save_list(data_list)
+
+
+def _get_saved_files(file_list, data_list, saved_list):
+    """Return the files of the saved data of a batch
+
+    Args:
+        file_list: files of the data of the batch
+        data_list: data of the batch
+        saved_list: saved data of the batch
+
+    Returns:
+
+    """
+    saved_ids = {id(data) for data in saved_list}
+    return [
+        data_file
+        for data_file, data in zip(file_list, data_list)
+        if id(data) in saved_ids
+    ]
+
+
+def _warm_cache(data_list):
+    """Send the saved data of a batch to a task filling the rendered HTML cache
+
+    Args:
+        data_list:
+
+    Returns:
+
+    """
+    data_ids = [data.pk for data in data_list if data.pk]
+    if data_ids:
+        data_tasks.warm_rendered_html_cache.apply_async((data_ids,))
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:50
+
+from django.db import migrations, models
+
+
+def delete_duplicate_locks(apps, schema_editor):
+    """Keep only the most recent lock of each object
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    database_lock_object = apps.get_model(
+        "core_main_app", "DatabaseLockObject"
+    )
+    seen_objects = set()
+    for lock in database_lock_object.objects.order_by(
+        "object_id", "-lock_date", "-id"
+    ):
+        if lock.object_id in seen_objects:
+            lock.delete()
+        else:
+            seen_objects.add(lock.object_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_main_app", "0014_data_processing_module"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicate_locks, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="databaselockobject",
+            constraint=models.UniqueConstraint(
+                fields=("object",), name="unique_lock_per_object"
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.8 on 2026-10-18 03:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core_main_app", "0015_databaselockobject_unique_object"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MigrationRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("task_id", models.CharField(max_length=255, unique=True)),
+                ("user_id", models.CharField(max_length=200)),
+                ("migrate", models.BooleanField(default=False)),
+                ("creation_date", models.DateTimeField(auto_now_add=True)),
+                (
+                    "target_template",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="core_main_app.template",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="MigrationResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("data_id", models.CharField(max_length=200)),
+                ("valid", models.BooleanField()),
+                ("error", models.TextField(blank=True, default="")),
+                (
+                    "migration_run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="results",
+                        to="core_main_app.migrationrun",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["migration_run", "valid"],
+                        name="core_migration_result_valid",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -5,6 +5,7 @@ Permissions API
 import logging
 
 from django.contrib.auth.models import Permission, ContentType
+from django.core.cache import cache
 from django.db import IntegrityError
 from django.db.models import Q
 
@@ -17,9 +18,19 @@ from core_main_app.permissions.rights import (
     CAN_WRITE_NAME,
     CAN_WRITE_CODENAME,
 )
+from core_main_app.settings import WORKSPACE_PERMISSIONS_CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
+# Attribute memoizing workspace permissions on a user object (one per request)
+_USER_WORKSPACE_PERMISSIONS_ATTRIBUTE = "_workspace_permissions_cache"
+# Cache key of the generation of cached workspace permissions
+_WORKSPACE_PERMISSIONS_GENERATION_KEY = (
+    "core_main_app:workspace_permissions:generation"
+)
+# Generation of workspace permissions memoized by this process
+_workspace_permissions_generation = 0
+
 
 def _title_to_codename(title):
     """Change the title to a codename.
@@ -172,6 +183,100 @@ def get_all_workspace_permissions_user_can_write(user):
 
     Return:
 
+    """
+    return _get_cached_workspace_permissions(
+        user, CAN_WRITE_CODENAME, _query_workspace_permissions_user_can_write
+    )
+
+
+def get_all_workspace_permissions_user_can_read(user):
+    """Get a list of permission ids of workspaces that the user has read access.
+
+    Args:
+        user
+
+    Return:
+    """
+    return _get_cached_workspace_permissions(
+        user, CAN_READ_CODENAME, _query_workspace_permissions_user_can_read
+    )
+
+
+def clear_workspace_permissions_cache():
+    """Invalidate the workspace permissions cached for all users.
+
+    Return:
+    """
+    global _workspace_permissions_generation
+    _workspace_permissions_generation += 1
+    if WORKSPACE_PERMISSIONS_CACHE_TTL:
+        try:
+            cache.incr(_WORKSPACE_PERMISSIONS_GENERATION_KEY)
+        except ValueError:
+            cache.set(_WORKSPACE_PERMISSIONS_GENERATION_KEY, 1, None)
+
+
+def _get_cached_workspace_permissions(user, codename, query_function):
+    """Get workspace permissions of a user, memoized on the user object for the
+    duration of the request, and cached across requests if enabled.
+
+    Args:
+        user:
+        codename:
+        query_function:
+
+    Return:
+    """
+    memo = getattr(user, _USER_WORKSPACE_PERMISSIONS_ATTRIBUTE, None)
+    if (
+        not isinstance(memo, dict)
+        or memo.get("generation") != _workspace_permissions_generation
+    ):
+        memo = {"generation": _workspace_permissions_generation}
+        setattr(user, _USER_WORKSPACE_PERMISSIONS_ATTRIBUTE, memo)
+
+    if codename not in memo:
+        if WORKSPACE_PERMISSIONS_CACHE_TTL:
+            key = _get_workspace_permissions_cache_key(user, codename)
+            permissions = cache.get(key)
+            if permissions is None:
+                permissions = query_function(user)
+                cache.set(key, permissions, WORKSPACE_PERMISSIONS_CACHE_TTL)
+        else:
+            permissions = query_function(user)
+        memo[codename] = permissions
+    return list(memo[codename])
+
+
+def _get_workspace_permissions_cache_key(user, codename):
+    """Get the cache key of workspace permissions of a user.
+
+    Args:
+        user:
+        codename:
+
+    Return:
+    """
+    generation = cache.get_or_set(
+        _WORKSPACE_PERMISSIONS_GENERATION_KEY, 0, None
+    )
+    if user.is_superuser:
+        user_key = "superuser"
+    elif user.is_anonymous:
+        user_key = "anonymous"
+    else:
+        user_key = str(user.id)
+    return f"core_main_app:workspace_permissions:{generation}:{codename}:{user_key}"
+
+
+def _query_workspace_permissions_user_can_write(user):
+    """Get a list of permission ids of workspaces that the user has write access.
+
+    Args:
+        user
+
+    Return:
+
     """
     # TODO: fix the super user case
     if user.is_superuser:
@@ -195,7 +300,7 @@ def get_all_workspace_permissions_user_can_write(user):
     ]
 
 
-def get_all_workspace_permissions_user_can_read(user):
+def _query_workspace_permissions_user_can_read(user):
     """Get a list of permission ids of workspaces that the user has read access.
 
     Args:
@@ -253,6 +358,7 @@ def delete_permission(permission_id):
     try:
         perm = get_by_id(permission_id)
         perm.delete()
+        clear_workspace_permissions_cache()
     except Exception as exception:
         logger.warning(
             "delete_permission threw an exception: %s", str(exception)
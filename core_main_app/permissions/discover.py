@@ -3,11 +3,13 @@
 import logging
 
 from django.conf import settings
+from django.core.signals import request_finished, request_started
 from django.db.models.signals import post_save, post_delete, pre_delete
 
 from core_main_app.components.data.models import Data
 from core_main_app.components.workspace.models import Workspace
 from core_main_app.permissions import rights
+from core_main_app.settings import LOCK_OBJECT_CLEANUP_INTERVAL
 
 logger = logging.getLogger(__name__)
 
@@ -86,10 +88,47 @@ def create_public_workspace():
     logger.info("FINISH create public workspace.")
 
 
+def init_periodic_tasks():
+    """Register periodic tasks in the celery beat database scheduler
+
+    Returns:
+
+    """
+    from django.apps import apps
+
+    if not apps.is_installed("django_celery_beat"):
+        return
+
+    from django_celery_beat.models import IntervalSchedule, PeriodicTask
+
+    logger.info("START init periodic tasks.")
+
+    try:
+        schedule, _ = IntervalSchedule.objects.get_or_create(
+            every=LOCK_OBJECT_CLEANUP_INTERVAL,
+            period=IntervalSchedule.SECONDS,
+        )
+        PeriodicTask.objects.update_or_create(
+            name="core_main_app: delete expired locks",
+            defaults={
+                "task": "core_main_app.components.lock.tasks.delete_expired_locks",
+                "interval": schedule,
+            },
+        )
+    except Exception as exception:
+        logger.error("Impossible to init periodic tasks: %s", str(exception))
+
+    logger.info("FINISH init periodic tasks.")
+
+
 def init_mongo_indexing():
     """Initialize mongo indexing if needed"""
     if settings.MONGODB_INDEXING:
-        from core_main_app.components.mongo.models import MongoData
+        from core_main_app.components.mongo.models import (
+            MongoData,
+            start_indexing_batch,
+            end_indexing_batch,
+        )
         from core_main_app.utils.databases.mongo.pymongo_database import (
             init_text_index,
         )
@@ -100,3 +139,7 @@ def init_mongo_indexing():
         post_save.connect(MongoData.post_save_data, sender=Data)
         post_delete.connect(MongoData.post_delete_data, sender=Data)
         pre_delete.connect(MongoData.pre_delete_workspace, sender=Workspace)
+        if settings.MONGODB_ASYNC_SAVE:
+            # Index data saved while handling a request in a single task
+            request_started.connect(start_indexing_batch)
+            request_finished.connect(end_indexing_batch)
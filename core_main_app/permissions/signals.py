@@ -0,0 +1,88 @@
+"""Signals invalidating the workspace permissions cache."""
+
+import logging
+
+from django.contrib.auth.models import Group, Permission, User
+from django.db.models import signals as models_signals
+
+from core_main_app.permissions import api as permissions_api
+
+logger = logging.getLogger(__name__)
+
+
+def connect():
+    """Connect signals changing the workspace permissions of users"""
+    for sender in (
+        User.groups.through,
+        User.user_permissions.through,
+        Group.permissions.through,
+    ):
+        models_signals.m2m_changed.connect(
+            m2m_changed_permissions, sender=sender
+        )
+    models_signals.post_delete.connect(post_delete_group, sender=Group)
+    models_signals.post_save.connect(post_save_permission, sender=Permission)
+    models_signals.post_delete.connect(
+        post_delete_permission, sender=Permission
+    )
+    logger.info("Registered signals for workspace permissions cache")
+
+
+def m2m_changed_permissions(sender, action, **kwargs):
+    """Signal triggered after changing group memberships or permissions
+
+    Args:
+        sender:
+        action:
+        **kwargs:
+
+    Returns:
+
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        permissions_api.clear_workspace_permissions_cache()
+
+
+def post_delete_group(sender, instance, **kwargs):
+    """Signal triggered after deleting a group
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    permissions_api.clear_workspace_permissions_cache()
+
+
+def post_save_permission(sender, instance, created, **kwargs):
+    """Signal triggered after saving a permission (e.g. permissions of a new
+    workspace, returned to superusers)
+
+    Args:
+        sender:
+        instance:
+        created:
+        **kwargs:
+
+    Returns:
+
+    """
+    if created:
+        permissions_api.clear_workspace_permissions_cache()
+
+
+def post_delete_permission(sender, instance, **kwargs):
+    """Signal triggered after deleting a permission
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    permissions_api.clear_workspace_permissions_cache()
@@ -4,6 +4,7 @@ import json
 from abc import ABCMeta, abstractmethod
 
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -57,12 +58,7 @@ class AbstractExecuteLocalQueryView(APIView, metaclass=ABCMeta):
             if type(options) is str:
                 options = json.loads(options)
             title = self.request.data.get("title", None)
-            order_by_field = self.request.data.get("order_by_field", "")
-            order_by_field = (
-                order_by_field.split(",")
-                if order_by_field
-                else DATA_SORTING_FIELDS
-            )
+            order_by_field = self.get_order_by_field()
             if query is not None:
                 # prepare query
                 raw_query = self.build_query(
@@ -79,6 +75,9 @@ class AbstractExecuteLocalQueryView(APIView, metaclass=ABCMeta):
             else:
                 content = {"message": "Expected parameters not provided."}
                 return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except AccessControlError as acl_error:
             content = {"message": str(acl_error)}
             return Response(content, status=status.HTTP_403_FORBIDDEN)
@@ -88,6 +87,20 @@ class AbstractExecuteLocalQueryView(APIView, metaclass=ABCMeta):
                 content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def get_order_by_field(self):
+        """Return the sorting fields of the query
+
+        Returns:
+
+            List of sorting fields
+        """
+        order_by_field = self.request.data.get("order_by_field", "")
+        return (
+            order_by_field.split(",")
+            if order_by_field
+            else DATA_SORTING_FIELDS
+        )
+
     def build_query(
         self, query, workspaces=None, templates=None, options=None, title=None
     ):
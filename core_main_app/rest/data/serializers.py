@@ -6,9 +6,14 @@ from rest_framework.serializers import ModelSerializer
 
 from core_main_app.components.data import api as data_api
 from core_main_app.components.data.models import Data
+from core_main_app.components.data_migration.models import (
+    MigrationResult,
+    MigrationRun,
+)
 from core_main_app.components.template import api as template_api
 from core_main_app.rest.template.serializers import TemplateSerializer
 from core_main_app.settings import BACKWARD_COMPATIBILITY_DATA_XML_CONTENT
+from core_main_app.utils.drf.serializers import FieldsSerializerMixin
 
 
 class ContentField(serializers.Field):
@@ -37,7 +42,7 @@ class ContentField(serializers.Field):
         return data
 
 
-class DataSerializer(ModelSerializer):
+class DataSerializer(FieldsSerializerMixin, ModelSerializer):
     """Data serializer"""
 
     if BACKWARD_COMPATIBILITY_DATA_XML_CONTENT:
@@ -140,3 +145,31 @@ class DataWithTemplateInfoSerializer(ModelSerializer):
             fields.append("xml_content")
         else:
             fields.append("content")
+
+
+class MigrationRunSerializer(ModelSerializer):
+    """Migration run serializer"""
+
+    class Meta:
+        """Meta"""
+
+        model = MigrationRun
+        fields = [
+            "task_id",
+            "user_id",
+            "target_template",
+            "migrate",
+            "creation_date",
+        ]
+        read_only_fields = fields
+
+
+class MigrationResultSerializer(ModelSerializer):
+    """Migration result serializer"""
+
+    class Meta:
+        """Meta"""
+
+        model = MigrationResult
+        fields = ["data_id", "valid", "error"]
+        read_only_fields = fields
@@ -2,9 +2,10 @@
 
 import json
 import logging
+from itertools import islice
 
 from django.conf import settings as conf_settings
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from drf_spectacular.utils import (
     extend_schema,
     OpenApiParameter,
@@ -28,6 +29,9 @@ from core_main_app.commons import exceptions
 from core_main_app.commons.exceptions import XMLError
 from core_main_app.components.data import api as data_api
 from core_main_app.components.data import tasks as data_tasks
+from core_main_app.components.data_migration import (
+    api as data_migration_api,
+)
 from core_main_app.components.data_processing_module.models import (
     DataProcessingModule,
 )
@@ -41,6 +45,10 @@ from core_main_app.rest.data.abstract_views import AbstractMigrationView
 from core_main_app.rest.data.admin_serializers import AdminDataSerializer
 from core_main_app.rest.data.serializers import DataSerializer
 from core_main_app.rest.data.serializers import DataWithTemplateInfoSerializer
+from core_main_app.rest.data.serializers import (
+    MigrationResultSerializer,
+    MigrationRunSerializer,
+)
 from core_main_app.rest.mongo_data.serializers import MongoDataSerializer
 from core_main_app.rest.template_html_rendering.views import BaseDataHtmlRender
 from core_main_app.settings import MAX_DOCUMENT_LIST
@@ -48,15 +56,20 @@ from core_main_app.utils.boolean import to_bool
 from core_main_app.utils.databases.mongo.pymongo_database import (
     get_full_text_query,
 )
+from core_main_app.utils.drf.serializers import parse_fields
 from core_main_app.utils.file import (
     get_file_http_response,
     get_data_file_content_type_for_template_format,
     get_data_file_extension_for_template_format,
+    get_file_stream_http_response,
+    get_safe_file_name,
+    stream_zip,
 )
 from core_main_app.utils.json_utils import (
     format_content_json,
 )
 from core_main_app.utils.pagination.rest_framework_paginator.pagination import (
+    DataCursorPagination,
     StandardResultsSetPagination,
 )
 from core_main_app.utils.xml import get_content_by_xpath, format_content_xml
@@ -89,8 +102,18 @@ class DataList(APIView):
             /data?title=[document_title]
             /data?title=[document_title]&regex=true
             /data?template=[template_id]&title=[document_title]&page=3
+            /data?cursor=
+            /data?cursor=[cursor]&count=estimate
+            /data?fields=id,title,template
         """,
         parameters=[
+            OpenApiParameter(
+                name="fields",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Comma separated list of the fields to return "
+                "(e.g. id,title,template), all fields by default",
+            ),
             OpenApiParameter(
                 name="workspace",
                 type=OpenApiTypes.STR,
@@ -121,6 +144,19 @@ class DataList(APIView):
                 location=OpenApiParameter.QUERY,
                 description="Page number",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Use cursor pagination: empty for the first page, "
+                "then cursor of the next page link",
+            ),
+            OpenApiParameter(
+                name="count",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Total count with cursor pagination: none (default), exact or estimate",
+            ),
         ],
         responses={
             200: DataSerializer(many=True),
@@ -138,6 +174,9 @@ class DataList(APIView):
               content: Internal server error
         """
         try:
+            # Get fields to return
+            fields = parse_fields(self.request.query_params.get("fields"))
+            self.serializer.check_fields(fields)
             # Get object
             data_object_list = data_api.get_all_by_user(request.user)
             # Apply filters
@@ -156,14 +195,22 @@ class DataList(APIView):
                     else {"title": title}
                 )
                 data_object_list = data_object_list.filter(**title_filter)
+            # Only load the fields to return
+            data_object_list = data_api.project(data_object_list, fields)
             # Get paginator
-            paginator = StandardResultsSetPagination()
+            if DataCursorPagination.is_requested(self.request):
+                paginator = DataCursorPagination()
+            else:
+                paginator = StandardResultsSetPagination()
             # Get requested page from list of results
             page = paginator.paginate_queryset(data_object_list, self.request)
             # Serialize page
-            data_serializer = self.serializer(page, many=True)
+            data_serializer = self.serializer(page, many=True, fields=fields)
             # Return paginated response
             return paginator.get_paginated_response(data_serializer.data)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -264,8 +311,16 @@ class AdminDataList(DataList):
             /admin/data?title=[document_title]
             /admin/data?title=[document_title]&regex=true
             /admin/data?template=[template_id]&title=[document_title]&page=3
+            /admin/data?fields=id,title,template
         """,
         parameters=[
+            OpenApiParameter(
+                name="fields",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Comma separated list of the fields to return "
+                "(e.g. id,title,template), all fields by default",
+            ),
             OpenApiParameter(
                 name="user",
                 type=OpenApiTypes.STR,
@@ -333,6 +388,9 @@ class AdminDataList(DataList):
             content = {"message": "Only a superuser can use this feature."}
             return Response(content, status=status.HTTP_403_FORBIDDEN)
         try:
+            # Get fields to return
+            fields = parse_fields(self.request.query_params.get("fields"))
+            self.serializer.check_fields(fields)
             # Get object
             data_object_list = data_api.get_all(request.user)
             # Apply filters
@@ -354,10 +412,17 @@ class AdminDataList(DataList):
                     else {"title": title}
                 )
                 data_object_list = data_object_list.filter(**title_filter)
+            # Only load the fields to return
+            data_object_list = data_api.project(data_object_list, fields)
             # Serialize object
-            data_serializer = self.serializer(data_object_list, many=True)
+            data_serializer = self.serializer(
+                data_object_list, many=True, fields=fields
+            )
             # Return response
             return Response(data_serializer.data, status=status.HTTP_200_OK)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -806,12 +871,26 @@ class DataDownload(APIView):
         try:
             # Get object
             data_object = self.get_object(request, pk)
+            # get format bool
+            pretty_print = to_bool(
+                request.query_params.get("pretty_print", False)
+            )
+            if not pretty_print and not data_object.content_loaded:
+                # stream content from the storage
+                return get_file_stream_http_response(
+                    data_object.open_content(),
+                    data_object.title,
+                    content_type=get_data_file_content_type_for_template_format(
+                        data_object.template.format
+                    ),
+                    extension=get_data_file_extension_for_template_format(
+                        data_object.template.format
+                    ),
+                )
             # get xml content
             data_content = data_object.content
-            # get format bool
-            pretty_print = request.query_params.get("pretty_print", False)
             # format content
-            if to_bool(pretty_print):
+            if pretty_print:
                 # format XML
                 if data_object.template.format == Template.XSD:
                     data_content = format_content_xml(data_content)
@@ -892,6 +971,8 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
             {"query": {"root.element.value": 2}}
             # get values at xpath
             {"query": {}, "xpath": "/ns:root/@element", "namespaces": {"ns": "<namespace_url>"}}
+            # get only some fields of the records
+            {"query": {}, "fields": "id,title,template"}
             # get records using multiple options
             {"query": {"root.element.value": 2}, "workspaces": [{"id":"workspace_id"}] , "all": "true"}
             {"query": {"root.element.value": 2}, "templates": [{"id":"template_id"}] , "all": "true"}
@@ -905,6 +986,19 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
                 location=OpenApiParameter.QUERY,
                 description="Page number",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Use cursor pagination: empty for the first page, "
+                "then cursor of the next page link",
+            ),
+            OpenApiParameter(
+                name="count",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Total count with cursor pagination: none (default), exact or estimate",
+            ),
         ],
         request={
             "application/json": {
@@ -929,6 +1023,7 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
                     },
                     "xpath": {"type": "string"},
                     "namespaces": {"type": "object"},
+                    "fields": {"type": "string"},
                 },
             }
         },
@@ -988,6 +1083,10 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
         """
         xpath = self.request.data.get("xpath", None)
         namespaces = self.request.data.get("namespaces", None)
+        fields = parse_fields(self.request.data.get("fields", None))
+        self.serializer.check_fields(fields)
+        # Only load the fields to return
+        data_list = data_api.project(data_list, fields)
         if "all" in self.request.data and to_bool(self.request.data["all"]):
             if data_list.count() > MAX_DOCUMENT_LIST:
                 content = {"message": "Number of documents is over the limit."}
@@ -999,12 +1098,19 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
                         data_object.xml_content, xpath, namespaces=namespaces
                     )
             # Serialize data list
-            data_serializer = self.serializer(data_list, many=True)
+            data_serializer = self.serializer(
+                data_list, many=True, fields=fields
+            )
             # Return response
             return Response(data_serializer.data)
         else:
             # Get paginator
-            paginator = StandardResultsSetPagination()
+            if DataCursorPagination.is_requested(self.request):
+                paginator = DataCursorPagination(
+                    ordering=self.get_order_by_field()
+                )
+            else:
+                paginator = StandardResultsSetPagination()
             # Get requested page from list of results
             page = paginator.paginate_queryset(data_list, self.request)
             # Select values at xpath if provided
@@ -1014,11 +1120,197 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
                         data_object.xml_content, xpath, namespaces=namespaces
                     )
             # Serialize page
-            data_serializer = self.serializer(page, many=True)
+            data_serializer = self.serializer(page, many=True, fields=fields)
             # Return paginated response
             return paginator.get_paginated_response(data_serializer.data)
 
 
+@extend_schema(
+    tags=["Data"],
+    description="Export Local Query View",
+)
+class ExportLocalQueryView(ExecuteLocalQueryView):
+    """Export all results of a query, as a stream"""
+
+    # Number of results fetched at once from the database
+    chunk_size = 1000
+
+    @extend_schema(
+        summary="Export all records matching a list of selection criteria",
+        description="""Stream all records matching a JSON query and filtering parameters,
+            without limit on the number of records. Records are returned as
+            newline-delimited JSON (one serialized record per line), or as a ZIP
+            archive of the record files.
+
+            Examples:
+
+            # export all records as NDJSON
+            {"query": {}}
+            # export all records as a ZIP archive
+            {"query": {}, "format": "zip"}
+            # export records of a template, values at xpath
+            {"query": {}, "templates": [{"id":"[template_id]"}],
+            "xpath": "/ns:root/@element", "namespaces": {"ns": "<namespace_url>"}}
+        """,
+        request={
+            "application/json": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "object"},
+                    "format": {"type": "string", "enum": ["ndjson", "zip"]},
+                    "title": {"type": "string"},
+                    "workspaces": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {"id": {"type": "string"}},
+                        },
+                    },
+                    "templates": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {"id": {"type": "string"}},
+                        },
+                    },
+                    "xpath": {"type": "string"},
+                    "namespaces": {"type": "object"},
+                },
+            }
+        },
+        responses={
+            200: OpenApiResponse(description="Stream of records"),
+            400: OpenApiResponse(description="Bad Request"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def post(self, request):
+        """Export all results of a query
+
+        Args:
+            request: HTTP request
+        Returns:
+            - code: 200
+              content: Stream of data (NDJSON or ZIP)
+            - code: 400
+              content: Bad request
+            - code: 500
+              content: Internal server error
+        """
+        return super().post(request)
+
+    def build_response(self, data_list):
+        """Build the streaming response.
+        Args:
+            data_list: List of data
+        Returns:
+            The streaming response
+        """
+        export_format = self.request.data.get("format", "ndjson")
+        if export_format == "ndjson":
+            response = StreamingHttpResponse(
+                self._stream_ndjson(data_list),
+                content_type="application/x-ndjson",
+            )
+            file_name = "query_results.ndjson"
+        elif export_format == "zip":
+            if self.request.data.get("xpath", None):
+                content = {
+                    "message": "xpath is not supported with the zip format."
+                }
+                return Response(content, status=status.HTTP_400_BAD_REQUEST)
+            response = StreamingHttpResponse(
+                stream_zip(self._iter_files(data_list)),
+                content_type="application/zip",
+            )
+            file_name = "query_results.zip"
+        else:
+            content = {"message": "Unsupported export format."}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        response["Content-Disposition"] = f"attachment; filename={file_name}"
+        return response
+
+    def _iter_results(self, data_list):
+        """Iterate over query results with a server-side cursor, without
+        caching them in the queryset
+
+        Args:
+            data_list: List of data
+        Returns:
+        """
+        data_list = data_api.project(data_list)
+        if conf_settings.MONGODB_INDEXING:
+            return self._iter_mongo_results(
+                data_list.no_cache().timeout(False).batch_size(self.chunk_size)
+            )
+        return data_list.iterator(chunk_size=self.chunk_size)
+
+    def _iter_mongo_results(self, data_list):
+        """Iterate over mongo data by chunks, loading the content of the
+        data of each chunk in a single query
+
+        Args:
+            data_list: List of mongo data
+        Returns:
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        data_iterator = iter(data_list)
+        while True:
+            chunk = list(islice(data_iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield from MongoData.prefetch_related(
+                chunk, templates=False, workspaces=False
+            )
+
+    def _stream_ndjson(self, data_list):
+        """Serialize results one per line
+
+        Args:
+            data_list: List of data
+        Returns:
+        """
+        xpath = self.request.data.get("xpath", None)
+        namespaces = self.request.data.get("namespaces", None)
+        for data_object in self._iter_results(data_list):
+            if xpath:
+                data_object.xml_content = get_content_by_xpath(
+                    data_object.xml_content, xpath, namespaces=namespaces
+                )
+            yield json.dumps(self.serializer(data_object).data) + "\n"
+
+    def _iter_files(self, data_list):
+        """Iterate over the file names and contents of the results
+
+        Args:
+            data_list: List of data
+        Returns:
+        """
+        extensions = {}
+        file_names = set()
+        for data_object in self._iter_results(data_list):
+            template_id = data_object.template_id
+            if template_id not in extensions:
+                extensions[template_id] = (
+                    get_data_file_extension_for_template_format(
+                        Template.get_by_id(template_id).format
+                    )
+                )
+            extension = extensions[template_id]
+            # titles are user input: keep entries in the archive root
+            file_name = get_safe_file_name(
+                f"{data_object.id}_{data_object.title}"
+            ).removesuffix(extension)
+            unique_file_name = file_name
+            index = 1
+            while unique_file_name in file_names:
+                unique_file_name = f"{file_name}_{index}"
+                index += 1
+            file_names.add(unique_file_name)
+            yield unique_file_name + extension, data_object.content
+
+
 @extend_schema(
     tags=["Data"],
     description="Execute Local Keyword Query View",
@@ -1227,9 +1519,23 @@ class DataListByWorkspace(APIView):
                 location=OpenApiParameter.PATH,
                 description="Workspace ID",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Use cursor pagination: empty for the first page, "
+                "then cursor of the next page link",
+            ),
+            OpenApiParameter(
+                name="count",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Total count with cursor pagination: none (default), exact or estimate",
+            ),
         ],
         responses={
             200: DataSerializer(many=True),
+            400: OpenApiResponse(description="Validation error"),
             500: OpenApiResponse(description="Internal server error"),
         },
         examples=[
@@ -1251,18 +1557,29 @@ class DataListByWorkspace(APIView):
         Returns:
             - code: 200
               content: List of data
+            - code: 400
+              content: Validation error
             - code: 500
               content: Internal server error
         """
         try:
             # Get object
-            data_object_list = data_api.get_all_by_workspace(
-                workspace_id, request.user
+            data_object_list = data_api.project(
+                data_api.get_all_by_workspace(workspace_id, request.user)
             )
+            if DataCursorPagination.is_requested(request):
+                # Get requested page from list of results
+                paginator = DataCursorPagination()
+                page = paginator.paginate_queryset(data_object_list, request)
+                data_serializer = self.serializer(page, many=True)
+                return paginator.get_paginated_response(data_serializer.data)
             # Serialize object
             data_serializer = self.serializer(data_object_list, many=True)
             # Return response
             return Response(data_serializer.data, status=status.HTTP_200_OK)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -1665,6 +1982,206 @@ class GetTaskResult(APIView):
         return Response(result, content_type="application/json")
 
 
+@extend_schema(
+    tags=["Data Migration"],
+    description="Cancel the migration / validation async task",
+)
+class CancelTask(APIView):
+    """Cancel the migration / validation async task"""
+
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+        summary="Cancel task",
+        description="Cancel the migration / validation async task",
+        parameters=[
+            OpenApiParameter(
+                name="task_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Task ID",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Task progress"),
+        },
+    )
+    def post(self, request, task_id):
+        """Cancel the migration / validation async task
+        Args:
+            request:
+            task_id:
+        Return:
+            {
+              'state': REVOKED | SUCCESS | FAILURE,
+              'details': result (for SUCCESS) | error
+            }
+        """
+        data_tasks.cancel_task(task_id)
+        result = data_tasks.get_task_progress(task_id)
+        return Response(result, content_type="application/json")
+
+
+@extend_schema(
+    tags=["Data Migration"],
+    description="Get the summary of the results of a migration / validation async task",
+)
+class MigrationRunSummary(APIView):
+    """Get the summary of the results of a migration / validation async task"""
+
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+        summary="Get migration summary",
+        description="Get the summary of the results of a migration / validation async task",
+        parameters=[
+            OpenApiParameter(
+                name="task_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Task ID",
+            ),
+        ],
+        responses={
+            200: MigrationRunSerializer,
+            404: OpenApiResponse(description="Migration not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request, task_id):
+        """Get the summary of the results of a migration / validation async task
+
+        Args:
+            request:
+            task_id:
+
+        Returns:
+
+            - code: 200
+              content: Migration run, with the number of valid and wrong data
+            - code: 404
+              content: Migration not found
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            migration_run = data_migration_api.get_by_task_id(task_id)
+            content = MigrationRunSerializer(migration_run).data
+            content.update(migration_run.get_summary())
+            return Response(content, status=status.HTTP_200_OK)
+        except exceptions.DoesNotExist:
+            content = {"message": "Migration not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+@extend_schema(
+    tags=["Data Migration"],
+    description="Get the results of a migration / validation async task",
+)
+class MigrationResultList(APIView):
+    """Get the results of a migration / validation async task"""
+
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+        summary="Get migration results",
+        description="Get the results of a migration / validation async task, "
+        "by page",
+        parameters=[
+            OpenApiParameter(
+                name="task_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Task ID",
+            ),
+            OpenApiParameter(
+                name="valid",
+                type=OpenApiTypes.BOOL,
+                description="Only valid (true) or wrong (false) data",
+            ),
+            OpenApiParameter(
+                name="data_id",
+                type=OpenApiTypes.STR,
+                description="Data ID",
+            ),
+            OpenApiParameter(
+                name="error",
+                type=OpenApiTypes.STR,
+                description="Text contained in the error message",
+            ),
+            OpenApiParameter(
+                name="page",
+                type=OpenApiTypes.INT,
+                description="Page number",
+            ),
+        ],
+        responses={
+            200: MigrationResultSerializer(many=True),
+            400: OpenApiResponse(description="Validation error"),
+            404: OpenApiResponse(description="Migration not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request, task_id):
+        """Get the results of a migration / validation async task, by page
+
+        Url Parameters:
+
+            valid: true | false
+            data_id: data_id
+            error: text
+
+        Examples:
+
+            ../migration/task/[task_id]/results/?valid=false
+            ../migration/task/[task_id]/results/?error=[text]&page=2
+
+        Args:
+            request:
+            task_id:
+
+        Returns:
+
+            - code: 200
+              content: Page of migration results
+            - code: 400
+              content: Validation error
+            - code: 404
+              content: Migration not found
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            valid = self.request.query_params.get("valid", None)
+            migration_run = data_migration_api.get_by_task_id(task_id)
+            results = data_migration_api.get_results(
+                migration_run,
+                valid=to_bool(valid) if valid is not None else None,
+                data_id=self.request.query_params.get("data_id", None),
+                error=self.request.query_params.get("error", None),
+            )
+            paginator = StandardResultsSetPagination()
+            page = paginator.paginate_queryset(results, request)
+            serializer = MigrationResultSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
+        except ValueError as value_error:
+            content = {"message": str(value_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except exceptions.DoesNotExist:
+            content = {"message": "Migration not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 @extend_schema(
     tags=["Data"],
     description="Data Html Render",
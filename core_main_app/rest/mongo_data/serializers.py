@@ -1,13 +1,40 @@
 """MongoData Serializer"""
 
 from rest_framework import serializers
-from rest_framework.serializers import Serializer
+from rest_framework.serializers import ListSerializer, Serializer
 
 from core_main_app.rest.data.serializers import ContentField
 from core_main_app.settings import BACKWARD_COMPATIBILITY_DATA_XML_CONTENT
+from core_main_app.utils.drf.serializers import FieldsSerializerMixin
 
 
-class MongoDataSerializer(Serializer):
+class MongoDataListSerializer(ListSerializer):
+    """Mongo data list serializer, loading the data content of all mongo data
+    in a single query"""
+
+    def to_representation(self, data):
+        """Serialize a list of mongo data
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        # the SQL data are only needed for the content
+        return super().to_representation(
+            MongoData.prefetch_related(
+                data,
+                data=bool({"content", "xml_content"} & set(self.child.fields)),
+                templates=False,
+                workspaces=False,
+            )
+        )
+
+
+class MongoDataSerializer(FieldsSerializerMixin, Serializer):
     """Data serializer"""
 
     id = serializers.IntegerField(read_only=True)
@@ -27,6 +54,7 @@ class MongoDataSerializer(Serializer):
     class Meta:
         """Meta"""
 
+        list_serializer_class = MongoDataListSerializer
         fields = [
             "id",
             "template",
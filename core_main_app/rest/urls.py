@@ -162,6 +162,11 @@ urlpatterns = [
         data_views.ExecuteLocalQueryView.as_view(),
         name="core_main_app_rest_data_query",
     ),
+    re_path(
+        r"^data/query/export/$",
+        data_views.ExportLocalQueryView.as_view(),
+        name="core_main_app_rest_data_query_export",
+    ),
     re_path(
         r"^data/(?P<pk>\w+)/assign/(?P<workspace_id>\w+)$",
         data_views.DataAssign.as_view(),
@@ -197,6 +202,21 @@ urlpatterns = [
         data_views.GetTaskResult.as_view(),
         name="core_main_app_rest_data_migration_task_result",
     ),
+    re_path(
+        r"^data/migration/task/(?P<task_id>[\w-]+)/cancel/$",
+        data_views.CancelTask.as_view(),
+        name="core_main_app_rest_data_migration_task_cancel",
+    ),
+    re_path(
+        r"^data/migration/task/(?P<task_id>[\w-]+)/summary/$",
+        data_views.MigrationRunSummary.as_view(),
+        name="core_main_app_rest_data_migration_task_summary",
+    ),
+    re_path(
+        r"^data/migration/task/(?P<task_id>[\w-]+)/results/$",
+        data_views.MigrationResultList.as_view(),
+        name="core_main_app_rest_data_migration_task_results",
+    ),
     re_path(
         r"^data/(?P<data_id>\w+)/run/(?P<processing_module_id>\w+)$",
         data_views.DataRunProcessingModule.as_view(),
@@ -59,6 +59,17 @@ XERCES_VALIDATION = getattr(settings, "XERCES_VALIDATION", False)
 """ :py:class:`bool`: Enables Xerces validation (requires additional packages).
 """
 
+XML_SCHEMA_CACHE_MAX_SIZE = getattr(settings, "XML_SCHEMA_CACHE_MAX_SIZE", 32)
+""" :py:class:`int`: Maximum number of compiled XML schemas kept in memory by each process (0 to disable).
+"""
+
+XML_SCHEMA_CACHE_MAX_MEMORY = getattr(
+    settings, "XML_SCHEMA_CACHE_MAX_MEMORY", 64 * 1024 * 1024
+)
+""" :py:class:`int` | :py:attr:`None`: Maximum size (in bytes) of the schemas kept in the compiled XML schema cache.
+    The size of a compiled schema is estimated from the size of its XSD. No limit if None.
+"""
+
 # SMTP Configuration
 SEND_EMAIL_ASYNC = getattr(settings, "SEND_EMAIL_ASYNC", False)
 """ :py:class:`bool`: Send email asynchronously.
@@ -90,11 +101,55 @@ SEARCHABLE_DATA_OCCURRENCES_LIMIT = getattr(
 """ :py:class:`int` | :py:attr:`None`: Limit for number of occurent to be returned by a search.
 """
 
+SEARCH_VECTOR_WEIGHTS = getattr(
+    settings, "SEARCH_VECTOR_WEIGHTS", {"title": "A", "content": "B"}
+)
+""" :py:class:`dict`: Weights (A, B, C or D) of the title and of the content of the data in the PostgreSQL full text search vector.
+"""
+
+SEARCH_VECTOR_TEMPLATE_WEIGHTS = getattr(
+    settings, "SEARCH_VECTOR_TEMPLATE_WEIGHTS", {}
+)
+""" :py:class:`dict`: Weights of the full text search vector by template id, overriding SEARCH_VECTOR_WEIGHTS.
+"""
+
 # Lock
 LOCK_OBJECT_TTL = getattr(settings, "LOCK_OBJECT_TTL", 600)  # 10 min
 """ :py:class:`int`: Lock duration on files.
 """
 
+LOCK_OBJECT_CLEANUP_INTERVAL = getattr(
+    settings, "LOCK_OBJECT_CLEANUP_INTERVAL", 600
+)  # 10 min
+""" :py:class:`int`: Interval in seconds between two deletions of expired locks.
+"""
+
+# Duration in seconds workspace permissions of a user are cached across requests
+WORKSPACE_PERMISSIONS_CACHE_TTL = getattr(
+    settings, "WORKSPACE_PERMISSIONS_CACHE_TTL", 0
+)
+""" :py:class:`int`: Duration in seconds workspace permissions of a user are cached
+across requests, in the default Django cache (disabled if 0).
+"""
+
+# Duration in seconds the HTML renderings of data are cached
+RENDERED_HTML_CACHE_TTL = getattr(settings, "RENDERED_HTML_CACHE_TTL", 0)
+""" :py:class:`int`: Duration in seconds the HTML renderings of data (XSLT and
+template HTML renderings) are cached, in the default Django cache (disabled if 0).
+"""
+
+DATA_MIGRATION_CHUNK_SIZE = getattr(
+    settings, "DATA_MIGRATION_CHUNK_SIZE", 1000
+)
+""" :py:class:`int`: Number of data migrated / validated by each parallel task of a migration.
+"""
+
+DATA_MIGRATION_CHUNK_MAX_RETRIES = getattr(
+    settings, "DATA_MIGRATION_CHUNK_MAX_RETRIES", 3
+)
+""" :py:class:`int`: Number of retries of a chunk of a migration that failed.
+"""
+
 # Results per page for paginator
 RESULTS_PER_PAGE = getattr(settings, "RESULTS_PER_PAGE", 10)
 """ :py:class:`int`: Results per page.
@@ -114,6 +169,16 @@ DEFAULT_DATA_RENDERING_XSLT = getattr(
 """ :py:class:`str`: Path to default XSLT to render data.
 """
 
+XSLT_CACHE_MAX_SIZE = getattr(settings, "XSLT_CACHE_MAX_SIZE", 64)
+""" :py:class:`int`: Maximum number of compiled XSLT kept in memory by each process (0 to disable).
+"""
+
+HTML_RENDERING_CACHE_MAX_SIZE = getattr(
+    settings, "HTML_RENDERING_CACHE_MAX_SIZE", 64
+)
+""" :py:class:`int`: Maximum number of compiled template HTML renderings kept in memory by each process (0 to disable).
+"""
+
 # Can anonymous access public document
 CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT = getattr(
     settings, "CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT", False
@@ -149,7 +214,21 @@ SSL_CERTIFICATES_DIR = getattr(settings, "SSL_CERTIFICATES_DIR", True)
 """
 
 XSD_URI_RESOLVER = getattr(settings, "XSD_URI_RESOLVER", None)
-""" :py:class:`str`: XSD URI Resolver for lxml validation. Choose from:  None, 'REQUESTS_RESOLVER'.
+""" :py:class:`str`: XSD URI Resolver for lxml validation. Choose from:  None, 'REQUESTS_RESOLVER',
+    'CACHED_REQUESTS_RESOLVER'.
+"""
+
+XSD_DEPENDENCY_CACHE_MAX_SIZE = getattr(
+    settings, "XSD_DEPENDENCY_CACHE_MAX_SIZE", 128
+)
+""" :py:class:`int`: Maximum number of downloaded XSD dependencies kept in memory by each process (0 to disable).
+"""
+
+XSD_DEPENDENCY_CACHE_MAX_MEMORY = getattr(
+    settings, "XSD_DEPENDENCY_CACHE_MAX_MEMORY", 16 * 1024 * 1024
+)
+""" :py:class:`int` | :py:attr:`None`: Maximum size (in bytes) of the downloaded XSD dependencies kept in memory.
+    No limit if None.
 """
 
 XML_FORCE_LIST = getattr(settings, "XML_FORCE_LIST", False)
@@ -178,6 +257,21 @@ DATA_SORTING_FIELDS = getattr(settings, "DATA_SORTING_FIELDS", [])
     field must be delimited by "," (ex. ["-title","+name","+date"])
 """
 
+DATA_INDEXED_PATHS = getattr(settings, "DATA_INDEXED_PATHS", {})
+""" :py:class:`dict`: Paths of the data content indexed in PostgreSQL, by template id
+    (ex. {1: {"root.sample.temperature": "numeric", "root.sample.name": "text"}}).
+    Indexes are created with the update_data_indexes command.
+"""
+
+DATA_CONTENT_GIN_INDEX = getattr(settings, "DATA_CONTENT_GIN_INDEX", False)
+""" :py:class:`bool`: Index the data content in PostgreSQL with a GIN (jsonb_path_ops) index
+    and query equality on other paths with containment lookups.
+"""
+
+QUERY_PLAN_CACHE_MAX_SIZE = getattr(settings, "QUERY_PLAN_CACHE_MAX_SIZE", 256)
+""" :py:class:`int`: Maximum number of converted queries kept in memory by each process (0 to disable).
+"""
+
 AUTO_SET_PID = getattr(settings, "AUTO_SET_PID", False)
 """ :py:class:`bool`: Enable PID auto-setting from core_linked_records_app.
 """
@@ -208,6 +302,15 @@ MONGODB_ASYNC_SAVE = getattr(settings, "MONGODB_ASYNC_SAVE", True)
     If True, data are saved in MongoDB asynchronously.
 """
 
+MONGODB_BULK_BATCH_SIZE = getattr(settings, "MONGODB_BULK_BATCH_SIZE", 1000)
+""" :py:class:`int`: Number of documents sent to MongoDB in a single bulk operation.
+"""
+
+MONGODB_INDEXED_PATHS = getattr(settings, "MONGODB_INDEXED_PATHS", {})
+""" :py:class:`dict`: Indexes on the data content of each template in MongoDB.
+    Template id -> list of indexes ({"fields": [paths], "partial": bool}).
+"""
+
 MONGO_HOST = getattr(settings, "MONGO_HOST", "localhost")
 """ :py:class:`str`: MongoDB host.
 """
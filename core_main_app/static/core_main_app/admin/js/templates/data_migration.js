@@ -576,7 +576,7 @@ let actionButtonClicked = function(migrate) {
                             if (statusData && statusData.state === 'SUCCESS') {
                                 clearInterval(interval);
                             }
-                            displaySummary(statusData, migrate);
+                            displaySummary(statusData, migrate, taskId);
                         }, (taskResultError) => {
                             clearInterval(interval);
                             displaySummary(taskResultError, migrate);
@@ -643,8 +643,9 @@ let getTaskStatus = function(taskId, success, error) {
  * Parse the task status and dispay it on the UI
  * @param {object} taskData Task status object
  * @param {boolean} migrate If true the migration button has been clicked if not it is a validation
+ * @param {string} taskId Task id
  */
-let displaySummary = function(taskData, migrate) {
+let displaySummary = function(taskData, migrate, taskId) {
     if (taskData) {
         let summaryHtml = '';
         switch (taskData.state) {
@@ -700,14 +701,18 @@ let displaySummary = function(taskData, migrate) {
             case 'SUCCESS':
                 // 100% progressbar
                 $("#migration-progress-bar").css({ "width": "100%" });
+                // results saved by the task are counted, the failed data are loaded by page
+                let resultsSaved = taskData.details.valid_count !== undefined;
+                let validCount = resultsSaved ? taskData.details.valid_count : taskData.details.valid.length;
+                let wrongCount = resultsSaved ? taskData.details.wrong_count : taskData.details.wrong.length;
                 // show the summary
                 summaryHtml = '<p>Your task has been successfully executed ' +
-                        '<strong class="text-success">' + taskData.details.valid.length + ' data succeeded</strong>.';
+                        '<strong class="text-success">' + validCount + ' data succeeded</strong>.';
                 let failedButtonHtml = "";
                 // check if there is wrong migration
-                if (taskData.details.wrong.length > 0) {
+                if (wrongCount > 0) {
                     summaryHtml += " Some errors occurred during data validation: " +
-                        '<strong class="text-danger">' + taskData.details.wrong.length + ' data failed</strong>.' +
+                        '<strong class="text-danger">' + wrongCount + ' data failed</strong>.' +
                         " Data might not be valid for the selected target template. " +
                         "You can get more information by clicking on the button bellow.";
 
@@ -717,12 +722,16 @@ let displaySummary = function(taskData, migrate) {
                         '<div id="error-list" class="hidden"><h4>Failed data files:</h4>' +
                         '<ul class="error-container list-group list-group-flush">';
 
-                    taskData.details.wrong.forEach((dataId) => {
-                        failedButtonHtml += '<li class="list-group-item"><a href="/core-admin/data?id=' + dataId + '">' +
-                                'Data (' + dataId + ')</a></li>';
-                    });
+                    if (!resultsSaved) {
+                        taskData.details.wrong.forEach((dataId) => {
+                            failedButtonHtml += getFailedDataHtml(dataId);
+                        });
+                    }
 
-                    failedButtonHtml += '</ul></div>';
+                    failedButtonHtml += '</ul>' +
+                        '<button id="load-failed-data" class="btn btn-secondary hidden" type="button">' +
+                            'Show more' +
+                        '</button></div>';
                 } else if(migrate === false) {
                     summaryHtml += ' Start the migration by clicking on the "migrate" button below.';
                 }
@@ -739,9 +748,54 @@ let displaySummary = function(taskData, migrate) {
                 jqError.show();
         }
         $("#progress-text").html(summaryHtml);
+        if (taskData.state === 'SUCCESS' && taskData.details.valid_count !== undefined && taskData.details.wrong_count > 0) {
+            loadFailedData(migrationResultsUrlBase.replace("placeholder_id", taskId) + "?valid=false");
+        }
     }
 }
 
+/**
+ * Get the html of a failed data
+ * @param {string} dataId Data id
+ * @param {string} error Error message
+ */
+let getFailedDataHtml = function(dataId, error) {
+    return '<li class="list-group-item"><a href="/core-admin/data?id=' + dataId + '">' +
+            'Data (' + dataId + ')</a>' +
+            (error ? '<pre class="text-danger">' + $('<div>').text(error).html() + '</pre>' : '') +
+            '</li>';
+}
+
+/**
+ * Load a page of failed data and display it in the error list
+ * @param {string} url Url of the page of failed data
+ */
+let loadFailedData = function(url) {
+    $.ajax({
+        url: url,
+        type: "GET",
+        dataType: "json",
+        success: (data) => {
+            let jqErrorContainer = $("#error-list .error-container");
+            data.results.forEach((result) => {
+                jqErrorContainer.append(getFailedDataHtml(result.data_id, result.error));
+            });
+            let jqLoadButton = $("#load-failed-data");
+            jqLoadButton.off("click");
+            if (data.next) {
+                jqLoadButton.on("click", () => loadFailedData(data.next));
+                jqLoadButton.show();
+            } else {
+                jqLoadButton.hide();
+            }
+        },
+        error: (error) => {
+            jqError.html('Impossible to load the failed data: ' + JSON.stringify(error));
+            jqError.show();
+        }
+    });
+}
+
 let toggleError = function() {
     let jqErrorList = $("#error-list");
     showError = !showError;
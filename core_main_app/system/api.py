@@ -26,6 +26,19 @@ def get_data_by_id(data_id):
     return Data.get_by_id(data_id)
 
 
+def get_all_data_by_id_list(data_id_list):
+    """Return data objects with the given ids.
+
+    Parameters:
+        data_id_list:
+
+    Returns: data collection
+    """
+    return Data.objects.filter(pk__in=data_id_list).select_related(
+        "template", "workspace"
+    )
+
+
 def get_all_by_template(template):
     """Get all data belonging to the specified template.
 
@@ -11,6 +11,7 @@ from core_main_app.components.template.models import Template
 from core_main_app.components.template_html_rendering import (
     api as template_html_rendering_api,
 )
+from core_main_app.utils import rendering_cache
 from core_main_app.utils import xml as main_xml_utils
 
 register = django_template.Library()
@@ -28,8 +29,12 @@ def _render_data_html(html_rendering, dict_content):
     Returns:
 
     """
-    # load html with django template
-    django_template_obj = django_template.Template(html_rendering)
+    # load html with django template (compiled once per content)
+    django_template_obj = (
+        template_html_rendering_api.get_django_template_from_string(
+            html_rendering
+        )
+    )
     # render template
     return django_template_obj.render(
         context=django_template.Context({"dict_content": dict_content})
@@ -111,8 +116,8 @@ def data_detail_html(data):
     if isinstance(data, Data):
         # get template from data
         template_id = data.template
-        # get dict_content from data
-        data_content = data.get_dict_content()
+        # get dict_content from data (only if the rendering is not cached)
+        data_content = None
     # if data is dict
     elif isinstance(data, dict):
         # get template id from data["template"]["id"]
@@ -138,6 +143,18 @@ def data_detail_html(data):
         # if template html rendering not set, return None
         if not template_html_rendering:
             return None
+        # if data is a Data object, render the data from its dict content,
+        # and cache the rendering
+        if isinstance(data, Data):
+            return rendering_cache.get_rendered_html(
+                data,
+                rendering_cache.get_html_rendering_key(
+                    data.template_id, "detail_rendering"
+                ),
+                lambda: _render_data_html(
+                    template_html_rendering, data.get_dict_content()
+                ),
+            )
         # if the data content is not a dict (template context expects a dict)
         if not isinstance(data_content, dict):
             data_content = _data_content_to_dict(data_content, template_format)
@@ -11,8 +11,9 @@ from core_main_app.components.xsl_transformation import (
     api as xsl_transformation_api,
 )
 from core_main_app.settings import DEFAULT_DATA_RENDERING_XSLT
+from core_main_app.utils import rendering_cache
 from core_main_app.utils.file import read_file_content
-from core_main_app.utils.xml import xsl_transform
+from core_main_app.utils.xml import apply_xslt_transform, get_xslt_transform
 
 register = template.Library()
 
@@ -68,6 +69,8 @@ def _render_xml_as_html(xslt_type, *args, **kwargs):
     template_id = kwargs.get("template_id", None)
     template_hash = kwargs.get("template_hash", None)
     xsl_transform_id = kwargs.get("xslt_id", None)
+    # data object, to cache the rendering
+    data = kwargs.get("data", None)
 
     try:
         try:
@@ -104,12 +107,33 @@ def _render_xml_as_html(xslt_type, *args, **kwargs):
                     "No template information provided. Default xslt will be used."
                 )
 
-            xslt_string = xsl_transformation.content
-
         except (Exception, exceptions.DoesNotExist):
-            default_xslt_path = finders.find(DEFAULT_DATA_RENDERING_XSLT)
-            xslt_string = read_file_content(default_xslt_path)
+            xsl_transformation = None
+
+        def _render():
+            if xsl_transformation is not None:
+                xslt_transform = xsl_transformation_api.get_xslt_transform(
+                    xsl_transformation
+                )
+            else:
+                default_xslt_path = finders.find(DEFAULT_DATA_RENDERING_XSLT)
+                xslt_transform = get_xslt_transform(
+                    read_file_content(default_xslt_path)
+                )
 
-        return xsl_transform(xml_string, xslt_string)
+            return apply_xslt_transform(xml_string, xslt_transform)
+
+        return rendering_cache.get_rendered_html(
+            data,
+            rendering_cache.get_xslt_rendering_key(
+                xsl_transformation.id if xsl_transformation else None
+            ),
+            _render,
+            rendering_version=(
+                xsl_transformation.checksum
+                if xsl_transformation
+                else DEFAULT_DATA_RENDERING_XSLT
+            ),
+        )
     except Exception:
         return xml_string
@@ -0,0 +1,150 @@
+"""Process-local caches"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe, size-bounded, least recently used cache.
+
+    Entries can be given a weight (e.g. an estimated memory size) to bound
+    the total weight of the cache in addition to its number of entries.
+    Keeps track of hits and misses to help monitoring its efficiency.
+    """
+
+    def __init__(self, max_size=128, max_weight=None):
+        """Initialize the cache.
+
+        Args:
+            max_size: maximum number of entries (cache disabled if 0 or None)
+            max_weight: maximum total weight of the entries (no limit if None)
+        """
+        self.max_size = max_size or 0
+        self.max_weight = max_weight
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._weights = {}
+        self._total_weight = 0
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        """Get an entry from the cache.
+
+        Args:
+            key:
+            default: value returned if the key is not found
+
+        Returns:
+
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, weight=1):
+        """Add an entry to the cache, evict the least recently used entries
+        if the cache is full.
+
+        Args:
+            key:
+            value:
+            weight:
+
+        Returns:
+
+        """
+        if self.max_size <= 0:
+            return
+        if self.max_weight is not None and weight > self.max_weight:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = value
+            self._weights[key] = weight
+            self._total_weight += weight
+            while len(self._entries) > self.max_size or (
+                self.max_weight is not None
+                and self._total_weight > self.max_weight
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        """Remove an entry from the cache.
+
+        Args:
+            key:
+
+        Returns:
+
+        """
+        with self._lock:
+            self._remove(key)
+
+    def delete_if(self, predicate):
+        """Remove all entries with a key matching the predicate.
+
+        Args:
+            predicate: callable taking a key and returning a boolean
+
+        Returns:
+
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all entries and reset counters.
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self._total_weight = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return cache statistics.
+
+        Returns:
+            dict: size, weight, limits, hits and misses
+
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "weight": self._total_weight,
+                "max_weight": self.max_weight,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _remove(self, key):
+        """Remove an entry, lock must be held by the caller.
+
+        Args:
+            key:
+
+        Returns:
+
+        """
+        if key in self._entries:
+            del self._entries[key]
+            self._total_weight -= self._weights.pop(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
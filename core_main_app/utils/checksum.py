@@ -13,7 +13,7 @@ CHECKSUM_ALGORITHMS = {
 
 
 def compute_checksum(file, checksum_algorithm, block_size=4096):
-    """Compute checksum for a file content (bytes)
+    """Compute checksum for a file content (bytes, string or file)
 
     Args:
         file:
@@ -39,6 +39,13 @@ def compute_checksum(file, checksum_algorithm, block_size=4096):
         # Return hash
         return hasher.hexdigest()
 
+    # If param is a string, encode and hash it chunk by chunk
+    if isinstance(file, str):
+        for start in range(0, len(file), block_size):
+            end = start + block_size
+            hasher.update(file[start:end].encode())
+        return hasher.hexdigest()
+
     # If file, read file, chunk by chunk
     for chunk in iter(lambda: file.read(block_size), b""):
         # Hash each chuck
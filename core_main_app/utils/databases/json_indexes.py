@@ -0,0 +1,171 @@
+"""Utils for PostgreSQL indexes on the JSON content of the data"""
+
+import hashlib
+
+from django.db import connection
+
+from core_main_app.settings import (
+    DATA_CONTENT_GIN_INDEX,
+    DATA_INDEXED_PATHS,
+)
+
+# Prefix of the names of the indexes managed from the settings
+INDEX_NAME_PREFIX = "core_data_json_"
+
+# Name of the GIN index on the JSON content
+GIN_INDEX_NAME = f"{INDEX_NAME_PREFIX}path_ops"
+
+# Types of indexed paths
+NUMERIC_PATH = "numeric"
+TEXT_PATH = "text"
+PATH_TYPES = (NUMERIC_PATH, TEXT_PATH)
+
+
+def get_indexed_paths():
+    """Return the indexed paths of all templates, with their types.
+
+    Returns:
+        dict: set of types by path
+
+    """
+    indexed_paths = {}
+    for template_paths in DATA_INDEXED_PATHS.values():
+        for path, path_type in template_paths.items():
+            if path_type not in PATH_TYPES:
+                raise ValueError(
+                    f"Unsupported type for indexed path {path}: {path_type}."
+                )
+            indexed_paths.setdefault(path, set()).add(path_type)
+    return indexed_paths
+
+
+def get_indexed_path_types(path):
+    """Return the types of an indexed path.
+
+    Args:
+        path: dot notation path in the data content (e.g. root.element)
+
+    Returns:
+        set: types of the path, empty if the path is not indexed
+
+    """
+    return get_indexed_paths().get(path, set())
+
+
+def get_index_name(path, path_type):
+    """Return the name of the index of a path.
+
+    Args:
+        path:
+        path_type:
+
+    Returns:
+
+    """
+    path_hash = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+    return f"{INDEX_NAME_PREFIX}{path_type}_{path_hash}"
+
+
+def get_index_definitions(table, column):
+    """Return the definitions of the indexes configured in the settings.
+    Expressions are the same as the ones generated by the JSON field lookups
+    of the ORM, so queries on the paths can use the indexes.
+
+    Args:
+        table: quoted table name
+        column: quoted JSON column name
+
+    Returns:
+        dict: (sql, params) by index name
+
+    """
+    definitions = {}
+    for path, path_types in get_indexed_paths().items():
+        keys = path.split(".")
+        if len(keys) > 1:
+            operators = {NUMERIC_PATH: "#>", TEXT_PATH: "#>>"}
+            key_param = keys
+        else:
+            operators = {NUMERIC_PATH: "->", TEXT_PATH: "->>"}
+            key_param = keys[0]
+        for path_type in path_types:
+            index_name = get_index_name(path, path_type)
+            expression = f"({column} {operators[path_type]} %s)"
+            if path_type == TEXT_PATH:
+                # supports equality and left-anchored regular expressions
+                expression = f"{expression} text_pattern_ops"
+            definitions[index_name] = (
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON {table} ({expression})",
+                [key_param],
+            )
+    if DATA_CONTENT_GIN_INDEX:
+        definitions[GIN_INDEX_NAME] = (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {GIN_INDEX_NAME} "
+            f"ON {table} USING GIN ({column} jsonb_path_ops)",
+            [],
+        )
+    return definitions
+
+
+def get_existing_indexes(table_name):
+    """Return the existing indexes managed from the settings.
+
+    Args:
+        table_name:
+
+    Returns:
+        dict: True if the index is valid, by index name
+
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT index_class.relname, pg_index.indisvalid FROM pg_index "
+            "JOIN pg_class AS index_class "
+            "ON index_class.oid = pg_index.indexrelid "
+            "JOIN pg_class AS table_class "
+            "ON table_class.oid = pg_index.indrelid "
+            "WHERE table_class.relname = %s "
+            "AND starts_with(index_class.relname, %s)",
+            [table_name, INDEX_NAME_PREFIX],
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+
+def update_indexes(model, field_name, dry_run=False):
+    """Create the indexes configured in the settings, drop the managed
+    indexes that are not configured anymore or invalid (interrupted
+    creation).
+
+    Args:
+        model:
+        field_name: name of the JSON field
+        dry_run: only return the statements
+
+    Returns:
+        list: executed statements, as (sql, params)
+
+    """
+    table_name = model._meta.db_table
+    definitions = get_index_definitions(
+        connection.ops.quote_name(table_name),
+        connection.ops.quote_name(model._meta.get_field(field_name).column),
+    )
+    existing_indexes = get_existing_indexes(table_name)
+    statements = [
+        (f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}", [])
+        for index_name, is_valid in sorted(existing_indexes.items())
+        if index_name not in definitions or not is_valid
+    ]
+    statements.extend(
+        definition
+        for index_name, definition in sorted(definitions.items())
+        if not existing_indexes.get(index_name)
+    )
+    if not dry_run:
+        # indexes are built concurrently: statements can not be executed in a
+        # transaction
+        with connection.cursor() as cursor:
+            for sql, params in statements:
+                cursor.execute(sql, params)
+    return statements
@@ -0,0 +1,200 @@
+"""Indexes of MongoDB data on the paths of the data content"""
+
+import hashlib
+import logging
+from datetime import timezone
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from core_main_app.settings import MONGODB_INDEXED_PATHS
+from core_main_app.utils.datetime import datetime_now, datetime_timedelta
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the names of the indexes managed from the settings
+INDEX_NAME_PREFIX = "core_dict_content_"
+
+# Names of the MongoDB fields of the template and of the data content
+TEMPLATE_FIELD = "template"
+DICT_CONTENT_FIELD = "dict_content"
+
+
+def get_index_models():
+    """Return the indexes on the data content configured in the settings.
+
+    Each index covers the data of a template: partial index filtered on the
+    template, or compound index starting with the template.
+
+    Returns:
+        dict: pymongo IndexModel by index name
+
+    """
+    index_models = {}
+    for template_id, indexes in MONGODB_INDEXED_PATHS.items():
+        for index in indexes:
+            keys = [
+                (
+                    (f"{DICT_CONTENT_FIELD}.{path[1:]}", DESCENDING)
+                    if path.startswith("-")
+                    else (f"{DICT_CONTENT_FIELD}.{path}", ASCENDING)
+                )
+                for path in index["fields"]
+            ]
+            options = {}
+            if index.get("partial", True):
+                options["partialFilterExpression"] = {
+                    TEMPLATE_FIELD: template_id
+                }
+            else:
+                keys.insert(0, (TEMPLATE_FIELD, ASCENDING))
+            index_name = get_index_name(template_id, keys, options)
+            index_models[index_name] = IndexModel(
+                keys, name=index_name, background=True, **options
+            )
+    return index_models
+
+
+def get_index_name(template_id, keys, options):
+    """Return the name of an index.
+
+    Args:
+        template_id:
+        keys:
+        options:
+
+    Returns:
+
+    """
+    index_hash = hashlib.sha1(
+        repr((keys, sorted(options))).encode("utf-8")
+    ).hexdigest()[:12]
+    return f"{INDEX_NAME_PREFIX}{template_id}_{index_hash}"
+
+
+def get_managed_index_names(collection):
+    """Return the names of the existing indexes managed from the settings.
+
+    Args:
+        collection:
+
+    Returns:
+        set
+
+    """
+    return {
+        index_name
+        for index_name in collection.index_information()
+        if index_name.startswith(INDEX_NAME_PREFIX)
+    }
+
+
+def create_indexes(collection, index_names=None):
+    """Create the indexes configured in the settings (blocks until the
+    indexes are built).
+
+    Args:
+        collection:
+        index_names: names of the indexes to create, all if None
+
+    Returns:
+        list: names of the created indexes
+
+    """
+    index_models = [
+        index_model
+        for index_name, index_model in get_index_models().items()
+        if index_names is None or index_name in index_names
+    ]
+    if not index_models:
+        return []
+    return collection.create_indexes(index_models)
+
+
+def get_index_builds(collection):
+    """Return the progress of the index builds in progress on a collection.
+
+    Args:
+        collection:
+
+    Returns:
+        list: dict with message, done and total
+
+    """
+    namespace = f"{collection.database.name}.{collection.name}"
+    try:
+        operations = collection.database.client.admin.aggregate(
+            [
+                {"$currentOp": {"allUsers": True}},
+                {
+                    "$match": {
+                        "ns": namespace,
+                        "command.createIndexes": {"$exists": True},
+                    }
+                },
+            ]
+        )
+        return [
+            {
+                "message": operation.get("msg", "Index build"),
+                "done": operation.get("progress", {}).get("done"),
+                "total": operation.get("progress", {}).get("total"),
+            }
+            for operation in operations
+        ]
+    except Exception as exception:
+        logger.warning("Unable to get index builds: %s", str(exception))
+        return []
+
+
+def get_index_sizes(collection):
+    """Return the sizes of the indexes of a collection.
+
+    Args:
+        collection:
+
+    Returns:
+        dict: size in bytes by index name
+
+    """
+    index_sizes = {}
+    for stats in collection.aggregate([{"$collStats": {"storageStats": {}}}]):
+        index_sizes.update(stats["storageStats"].get("indexSizes", {}))
+    return index_sizes
+
+
+def get_unused_index_names(collection, days):
+    """Return the managed indexes not used for a number of days, according
+    to $indexStats. Statistics are reset when the server restarts: indexes
+    are only considered unused if their statistics cover the whole period.
+
+    Args:
+        collection:
+        days:
+
+    Returns:
+        set
+
+    """
+    since = _to_naive_utc(datetime_now() - datetime_timedelta(days=days))
+    unused_index_names = set()
+    for stats in collection.aggregate([{"$indexStats": {}}]):
+        if not stats["name"].startswith(INDEX_NAME_PREFIX):
+            continue
+        accesses = stats["accesses"]
+        if accesses["ops"] == 0 and _to_naive_utc(accesses["since"]) <= since:
+            unused_index_names.add(stats["name"])
+    return unused_index_names
+
+
+def _to_naive_utc(value):
+    """Convert a datetime to a naive UTC datetime (as returned by pymongo)
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
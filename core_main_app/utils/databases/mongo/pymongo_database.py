@@ -29,7 +29,18 @@ def get_full_text_query(text):
 
 def init_text_index(document_object):
     """Create index for full text search."""
-    collection = document_object._get_collection()
+    create_text_index(document_object._get_collection())
+
+
+def create_text_index(collection):
+    """Create index for full text search on a collection.
+
+    Args:
+        collection:
+
+    Returns:
+
+    """
     collection.create_index(
         [("$**", "text")], default_language="en", language_override="en"
     )
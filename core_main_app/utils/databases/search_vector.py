@@ -0,0 +1,162 @@
+"""Utils for PostgreSQL full text search vectors"""
+
+from django.contrib.postgres.search import (
+    SearchVector,
+    SearchVectorCombinable,
+    SearchVectorField,
+)
+from django.db import connection
+from django.db.models import F, Func, Value
+
+from core_main_app.settings import (
+    SEARCH_VECTOR_WEIGHTS,
+    SEARCH_VECTOR_TEMPLATE_WEIGHTS,
+)
+
+# Types of the JSON values added to the search vector
+JSON_VALUE_TYPES = '["string", "numeric"]'
+
+# Update the search vectors of a chunk of rows, in primary key order.
+# Weights of each row are joined from the weights by template.
+UPDATE_SEARCH_VECTORS_SQL = """
+UPDATE {table} AS data
+SET vector_column =
+    setweight(
+        to_tsvector(COALESCE(data.title, '')),
+        chunk.title_weight::"char"
+    )
+    || setweight(
+        jsonb_to_tsvector(
+            COALESCE(data.dict_content, '{{}}'::jsonb),
+            '{json_value_types}'::jsonb
+        ),
+        chunk.content_weight::"char"
+    )
+FROM (
+    SELECT
+        item.id,
+        COALESCE(weights.title_weight, %s) AS title_weight,
+        COALESCE(weights.content_weight, %s) AS content_weight
+    FROM {table} AS item
+    LEFT JOIN (VALUES {weights}) AS weights (
+        template_id, title_weight, content_weight
+    ) ON item.template_id = weights.template_id
+    WHERE item.id > %s
+    ORDER BY item.id
+    LIMIT %s
+) AS chunk
+WHERE data.id = chunk.id
+RETURNING data.id
+"""
+
+
+class JSONValuesSearchVector(SearchVectorCombinable, Func):
+    """Search vector of the string and numeric values of a JSON field"""
+
+    function = "jsonb_to_tsvector"
+    template = (
+        "%(function)s(COALESCE(%(expressions)s, '{}'::jsonb), "
+        f"'{JSON_VALUE_TYPES}'::jsonb)"
+    )
+    output_field = SearchVectorField()
+
+    def __init__(self, expression, weight=None):
+        """Initialize the search vector.
+
+        Args:
+            expression: JSON field
+            weight: weight of the vector (A, B, C or D)
+        """
+        super().__init__(expression)
+        self.weight = weight
+
+    def as_sql(self, compiler, connection, **extra_context):
+        """Compile the search vector, set its weight.
+
+        Args:
+            compiler:
+            connection:
+            extra_context:
+
+        Returns:
+
+        """
+        sql, params = super().as_sql(compiler, connection, **extra_context)
+        if self.weight:
+            weight_sql, weight_params = compiler.compile(Value(self.weight))
+            sql = f"setweight({sql}, {weight_sql})"
+            params = (*params, *weight_params)
+        return sql, params
+
+
+def get_search_vector_weights(template_id=None):
+    """Return the weights of the title and of the content of the data of a
+    template.
+
+    Args:
+        template_id:
+
+    Returns:
+        (title weight, content weight)
+
+    """
+    weights = {
+        **SEARCH_VECTOR_WEIGHTS,
+        **SEARCH_VECTOR_TEMPLATE_WEIGHTS.get(template_id, {}),
+    }
+    return weights["title"], weights["content"]
+
+
+def get_search_vector(template_id=None):
+    """Return the search vector expression of a data: weighted title and
+    values of the dict content.
+
+    Args:
+        template_id:
+
+    Returns:
+
+    """
+    title_weight, content_weight = get_search_vector_weights(template_id)
+    return SearchVector("title", weight=title_weight) + JSONValuesSearchVector(
+        F("dict_content"), weight=content_weight
+    )
+
+
+def update_search_vectors(model, last_id, chunk_size):
+    """Update the search vectors of the next chunk of rows of a table, with
+    a single UPDATE ... FROM statement.
+
+    Args:
+        model: data model
+        last_id: id of the last updated row
+        chunk_size: number of rows updated
+
+    Returns:
+        list: ids of the updated rows
+
+    """
+    template_weights = [
+        (template_id, *get_search_vector_weights(template_id))
+        for template_id in SEARCH_VECTOR_TEMPLATE_WEIGHTS
+    ]
+    title_weight, content_weight = get_search_vector_weights()
+    params = [title_weight, content_weight]
+    if template_weights:
+        weights_sql = ", ".join(
+            ["(%s::bigint, %s::text, %s::text)"] * len(template_weights)
+        )
+        for weights in template_weights:
+            params.extend(weights)
+    else:
+        weights_sql = "(NULL::bigint, NULL::text, NULL::text)"
+    params.extend([last_id, chunk_size])
+
+    sql = UPDATE_SEARCH_VECTORS_SQL.format(
+        table=connection.ops.quote_name(model._meta.db_table),
+        json_value_types=JSON_VALUE_TYPES,
+        weights=weights_sql,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
@@ -0,0 +1,65 @@
+"""Django REST Framework serializer utils"""
+
+from rest_framework.exceptions import ValidationError
+
+
+def parse_fields(fields):
+    """Parse the fields requested by a client (comma separated string or
+    list).
+
+    Args:
+        fields:
+
+    Returns:
+        list: names of the fields, None if no fields requested
+
+    """
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return [field.strip() for field in fields if field.strip()]
+
+
+class FieldsSerializerMixin:
+    """Serializer mixin restricting the serialized fields to the ones passed
+    in the `fields` argument.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            self._check_fields(fields, self.fields)
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+    @classmethod
+    def check_fields(cls, fields):
+        """Check that the requested fields are fields of the serializer.
+
+        Args:
+            fields:
+
+        Returns:
+
+        """
+        if fields is not None:
+            cls._check_fields(fields, cls().fields)
+
+    @staticmethod
+    def _check_fields(fields, serializer_fields):
+        """Raise a validation error if a field is not a serializer field.
+
+        Args:
+            fields:
+            serializer_fields:
+
+        Returns:
+
+        """
+        unknown_fields = set(fields) - set(serializer_fields)
+        if unknown_fields:
+            raise ValidationError(
+                f"Invalid fields: {', '.join(sorted(unknown_fields))}."
+            )
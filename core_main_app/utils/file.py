@@ -3,10 +3,11 @@
 import base64
 import pathlib
 import re
+import zipfile
 from io import BytesIO
 from mimetypes import guess_type
 
-from django.http.response import HttpResponse
+from django.http.response import FileResponse, HttpResponse
 
 from core_main_app.commons.constants import (
     DATA_FILE_CONTENT_TYPE_FOR_TEMPLATE_FORMAT,
@@ -48,19 +49,80 @@ def get_file_http_response(
             content_type = guess_type(file_name)[0]
         # set file in http response
         response = HttpResponse(_file, content_type=content_type)
-        # set filename extension
-        if not file_name.endswith(extension):
-            if not extension.startswith("."):
-                extension = "." + extension
-            file_name += extension
         # set content disposition in response
-        response["Content-Disposition"] = "attachment; filename=" + file_name
+        response["Content-Disposition"] = (
+            "attachment; filename=" + _add_extension(file_name, extension)
+        )
         # return response
         return response
     except Exception:
         raise CoreError("An unexpected error occurred.")
 
 
+def get_file_stream_http_response(
+    file, file_name, content_type=None, extension=""
+):
+    """Return http response streaming a file to download, chunk by chunk
+
+    Args:
+        file: binary file-like object, closed when the response is sent
+        file_name:
+        content_type:
+        extension:
+
+    Returns:
+
+    """
+    try:
+        # guess file content type if not set
+        if content_type is None:
+            content_type = guess_type(file_name)[0]
+        # stream file in http response
+        response = FileResponse(file, content_type=content_type)
+        # set content disposition in response
+        response["Content-Disposition"] = (
+            "attachment; filename=" + _add_extension(file_name, extension)
+        )
+        # return response
+        return response
+    except Exception:
+        file.close()
+        raise CoreError("An unexpected error occurred.")
+
+
+def _add_extension(file_name, extension):
+    """Add extension to a file name, if missing
+
+    Args:
+        file_name:
+        extension:
+
+    Returns:
+
+    """
+    if not file_name.endswith(extension):
+        if not extension.startswith("."):
+            extension = "." + extension
+        file_name += extension
+    return file_name
+
+
+def get_safe_file_name(file_name, default="file"):
+    """Return a file name that can not escape its directory (e.g. in an
+    archive): path separators, control characters and ".." are replaced.
+
+    Args:
+        file_name:
+        default: file name returned if nothing is left
+
+    Returns:
+
+    """
+    file_name = re.sub(r"[\\/\x00-\x1f]", "_", file_name)
+    file_name = file_name.replace("..", "_").strip(" .")
+    return file_name or default
+
+
 def read_file_content(file_path):
     """Read the content of a file
 
@@ -191,3 +253,57 @@ def get_template_file_extension_for_template_format(template_format):
         return TEMPLATE_FILE_EXTENSION_FOR_TEMPLATE_FORMAT[template_format]
     except KeyError:
         return ""
+
+
+class _StreamBuffer:
+    """Write-only, non seekable buffer collecting bytes written by zipfile"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        """Collect written bytes
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        """Nothing to flush, bytes are collected by pop"""
+
+    def pop(self):
+        """Return and forget the bytes written since the last call
+
+        Returns:
+
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(files):
+    """Stream a zip archive built from an iterable of files, one file at a time
+
+    Args:
+        files: iterable of (file name, file content)
+
+    Returns:
+        generator of zip archive chunks (bytes)
+
+    """
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(
+        buffer, mode="w", compression=zipfile.ZIP_DEFLATED
+    ) as zip_file:
+        for file_name, file_content in files:
+            if isinstance(file_content, str):
+                file_content = file_content.encode("utf-8")
+            zip_file.writestr(file_name, file_content or b"")
+            yield buffer.pop()
+    yield buffer.pop()
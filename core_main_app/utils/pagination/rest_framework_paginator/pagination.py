@@ -1,13 +1,29 @@
 """Pagination configuration for rest_framework"""
 
+import base64
+import json
+from collections import OrderedDict
+from datetime import datetime
+
 from django.conf import settings
-from rest_framework.pagination import PageNumberPagination
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
-from core_main_app.settings import RESULTS_PER_PAGE
+from core_main_app.settings import DATA_SORTING_FIELDS, RESULTS_PER_PAGE
 from core_main_app.utils.pagination.mongoengine_paginator.paginator import (
     MongoenginePaginator,
 )
 
+# Total count modes of the cursor pagination
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+
 
 class StandardResultsSetPagination(PageNumberPagination):
     """Standard Results Set Pagination"""
@@ -15,3 +31,404 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = RESULTS_PER_PAGE
     if settings.MONGODB_INDEXING:
         django_paginator_class = MongoenginePaginator
+
+
+class DataCursorPagination(BasePagination):
+    """Keyset (cursor) pagination of Data and MongoData querysets.
+
+    Results are ordered by the sorting fields, then by primary key. The
+    cursor encodes the sorting values of the last result of the page, and the
+    next page is selected with a range condition on these values instead of
+    an offset, so deep pages cost the same as the first one. Null values are
+    sorted last in the database, and as the lowest values in MongoDB. Only
+    forward pagination is supported.
+
+    The total count is not computed by default (count=none). It can be
+    requested exactly (count=exact) or estimated from the collection
+    statistics (count=estimate, exact count if the results are filtered).
+
+    An invalid cursor or count mode raises a ValidationError.
+    """
+
+    page_size = RESULTS_PER_PAGE
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+
+    def __init__(self, ordering=None):
+        """Initialize the paginator.
+
+        Args:
+            ordering: list of sorting fields, prefixed by "+" or "-"
+        """
+        self.ordering = _parse_ordering(
+            DATA_SORTING_FIELDS if ordering is None else ordering
+        )
+        self.request = None
+        self.count = None
+        self.next_values = None
+
+    @classmethod
+    def is_requested(cls, request):
+        """Return True if the request asks for cursor pagination.
+
+        Args:
+            request:
+
+        Returns:
+
+        """
+        return cls.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return the page of results following the cursor of the request.
+
+        Args:
+            queryset:
+            request:
+            view:
+
+        Returns:
+
+        """
+        self.request = request
+        self.count = self._get_count(
+            queryset, request.query_params.get(self.count_query_param)
+        )
+        queryset = _load_sorting_fields(queryset, self.ordering)
+        nulls_last = isinstance(queryset, QuerySet)
+        nullable_fields = _get_nullable_fields(queryset, self.ordering)
+        queryset = queryset.order_by(
+            *_get_order_by(self.ordering, nullable_fields, nulls_last)
+        )
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(
+                _get_keyset_filter(
+                    _get_q_class(queryset),
+                    self.ordering,
+                    _decode_cursor(cursor, len(self.ordering)),
+                    nullable_fields,
+                    nulls_last,
+                )
+            )
+        page = list(queryset[: self.page_size + 1])
+        if len(page) > self.page_size:
+            page = page[: self.page_size]
+            self.next_values = [
+                getattr(page[-1], name)
+                for name in _get_attribute_names(queryset, self.ordering)
+            ]
+        return page
+
+    def get_next_link(self):
+        """Return the url of the next page, None if last page.
+
+        Returns:
+
+        """
+        if self.next_values is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            _encode_cursor(self.next_values),
+        )
+
+    def get_paginated_response(self, data):
+        """Return the paginated response.
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("next", self.get_next_link()),
+                    ("previous", None),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def _get_count(self, queryset, count_mode):
+        """Return the total count of results, according to the count mode.
+
+        Args:
+            queryset:
+            count_mode:
+
+        Returns:
+
+        """
+        if count_mode in (None, "", COUNT_NONE):
+            return None
+        if count_mode == COUNT_EXACT:
+            return queryset.count()
+        if count_mode == COUNT_ESTIMATE:
+            return _get_estimated_count(queryset)
+        raise ValidationError(f"Unsupported count mode: {count_mode}.")
+
+
+def _parse_ordering(ordering):
+    """Parse sorting fields to a list of (field name, descending), primary
+    key added as tiebreaker.
+
+    Args:
+        ordering:
+
+    Returns:
+
+    """
+    fields = [
+        (field.lstrip("+-"), field.startswith("-"))
+        for field in ordering
+        if field
+    ]
+    if not any(name == "pk" for name, _ in fields):
+        fields.append(("pk", False))
+    return fields
+
+
+def _get_q_class(queryset):
+    """Return the Q class of the queryset (Django or mongoengine)
+
+    Args:
+        queryset:
+
+    Returns:
+
+    """
+    if isinstance(queryset, QuerySet):
+        return Q
+
+    from mongoengine.queryset.visitor import Q as MongoQ
+
+    return MongoQ
+
+
+def _get_attribute_names(queryset, ordering):
+    """Return the names of the attributes storing the values of the sorting
+    fields (id of the related object for foreign keys).
+
+    Args:
+        queryset:
+        ordering:
+
+    Returns:
+
+    """
+    if not isinstance(queryset, QuerySet):
+        return [name for name, _ in ordering]
+
+    names = []
+    for name, _ in ordering:
+        try:
+            names.append(queryset.model._meta.get_field(name).attname)
+        except FieldDoesNotExist:
+            # pk or field of a related object
+            names.append(name)
+    return names
+
+
+def _load_sorting_fields(queryset, ordering):
+    """Make sure that the sorting fields are loaded by a queryset with a
+    projection, to read the values of the cursor.
+
+    Args:
+        queryset:
+        ordering:
+
+    Returns:
+
+    """
+    # primary key is always loaded
+    names = {name for name, _ in ordering if name != "pk"}
+    if isinstance(queryset, QuerySet):
+        field_names, defer = queryset.query.deferred_loading
+        if defer and field_names & names:
+            return queryset.defer(None).defer(*(field_names - names))
+        if not defer and field_names:
+            return queryset.only(*field_names, *names)
+        return queryset
+
+    from mongoengine.queryset.field_list import QueryFieldList
+
+    if names and queryset._loaded_fields.value is QueryFieldList.ONLY:
+        # only is chainable on mongoengine querysets
+        return queryset.only(*names)
+    return queryset
+
+
+def _get_nullable_fields(queryset, ordering):
+    """Return the names of the sorting fields that can contain null values
+
+    Args:
+        queryset:
+        ordering:
+
+    Returns:
+
+    """
+    names = {name for name, _ in ordering if name != "pk"}
+    if not isinstance(queryset, QuerySet):
+        # documents may not have the field
+        return names
+    nullable_fields = set()
+    for name in names:
+        try:
+            if queryset.model._meta.get_field(name).null:
+                nullable_fields.add(name)
+        except FieldDoesNotExist:
+            # field of a related object
+            nullable_fields.add(name)
+    return nullable_fields
+
+
+def _get_order_by(ordering, nullable_fields, nulls_last):
+    """Return the arguments of order_by for the sorting fields
+
+    Args:
+        ordering:
+        nullable_fields:
+        nulls_last: sort null values last (database), else null values are
+            the lowest values (MongoDB)
+
+    Returns:
+
+    """
+    order_by = []
+    for name, descending in ordering:
+        if nulls_last and name in nullable_fields:
+            field = F(name)
+            order_by.append(
+                field.desc(nulls_last=True)
+                if descending
+                else field.asc(nulls_last=True)
+            )
+        else:
+            order_by.append(f"-{name}" if descending else name)
+    return order_by
+
+
+def _get_keyset_filter(
+    q_class, ordering, values, nullable_fields=(), nulls_last=True
+):
+    """Build the filter selecting results after the given sorting values:
+    (f1 > v1) OR (f1 = v1 AND f2 > v2) OR ... (lower than for descending fields)
+
+    Null values follow the order of _get_order_by: after the other values if
+    nulls_last, else before them for ascending fields and after them for
+    descending fields.
+
+    Args:
+        q_class:
+        ordering:
+        values:
+        nullable_fields:
+        nulls_last:
+
+    Returns:
+
+    """
+    keyset_filter = None
+    for index, (name, descending) in enumerate(ordering):
+        value = values[index]
+        nulls_after = nulls_last or descending
+        if value is None:
+            if nulls_after:
+                # no value after null for this field
+                continue
+            condition = q_class(**{f"{name}__ne": None})
+        else:
+            lookup = "lt" if descending else "gt"
+            condition = q_class(**{f"{name}__{lookup}": value})
+            if nulls_after and name in nullable_fields:
+                condition |= q_class(**{name: None})
+        for previous_index, (previous_name, _) in enumerate(ordering[:index]):
+            condition &= q_class(**{previous_name: values[previous_index]})
+        keyset_filter = (
+            condition if keyset_filter is None else keyset_filter | condition
+        )
+    return keyset_filter
+
+
+def _get_estimated_count(queryset):
+    """Return an estimation of the total number of documents of the collection,
+    exact count if the queryset is filtered or no estimation is available.
+
+    Args:
+        queryset:
+
+    Returns:
+
+    """
+    if not isinstance(queryset, QuerySet):
+        if queryset._query:
+            return queryset.count()
+        return queryset._collection.estimated_document_count()
+
+    connection = connections[queryset.db]
+    if not queryset.query.where and connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 if the table was never analyzed
+        if row and row[0] >= 0:
+            return row[0]
+    return queryset.count()
+
+
+def _encode_cursor(values):
+    """Encode sorting values to a cursor
+
+    Args:
+        values:
+
+    Returns:
+
+    """
+    encoded_values = [
+        (
+            {"datetime": value.isoformat()}
+            if isinstance(value, datetime)
+            else value
+        )
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(
+        json.dumps(encoded_values).encode("utf-8")
+    ).decode("ascii")
+
+
+def _decode_cursor(cursor, nb_values):
+    """Decode sorting values from a cursor
+
+    Args:
+        cursor:
+        nb_values:
+
+    Returns:
+
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        values = [
+            (
+                datetime.fromisoformat(value["datetime"])
+                if isinstance(value, dict)
+                else value
+            )
+            for value in values
+        ]
+    except Exception:
+        raise ValidationError("Invalid cursor.")
+    if len(values) != nb_values:
+        raise ValidationError("Invalid cursor.")
+    return values
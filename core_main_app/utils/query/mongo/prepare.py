@@ -1,12 +1,27 @@
 """Mongo query builder tools"""
 
 import copy
+import hashlib
+import json
 import re
 
 from django.conf import settings
 
+from core_main_app.commons.constants import DATA_JSON_FIELD
 from core_main_app.commons.exceptions import QueryError
+from core_main_app.settings import (
+    DATA_CONTENT_GIN_INDEX,
+    QUERY_PLAN_CACHE_MAX_SIZE,
+)
+from core_main_app.utils.cache import LRUCache
 from core_main_app.utils.databases.backend import uses_postgresql_backend
+from core_main_app.utils.databases.json_indexes import (
+    TEXT_PATH,
+    get_indexed_paths,
+)
+
+# access filters and converted query, by query hash
+query_plan_cache = LRUCache(max_size=QUERY_PLAN_CACHE_MAX_SIZE)
 
 
 def _compile_regex(query):
@@ -54,18 +69,135 @@ def prepare_query(query_dict, regex=True, sub_document_root=None):
     Returns:
 
     """
-    # get a copy of the query
-    query = copy.deepcopy(query_dict)
+    # build a copy of the query, compile the regular expressions and add the
+    # sub document root in a single pass
+    return _prepare_query(query_dict, regex, sub_document_root)
+
+
+def _prepare_query(query, regex, sub_document_root):
+    """Return a prepared copy of the query (same result as a deep copy
+    followed by _compile_regex and _add_sub_document_root)
+
+    Args:
+        query:
+        regex:
+        sub_document_root:
+
+    Returns:
+
+    """
+    prepared_query = {}
+    criteria = {}
+    for key, value in query.items():
+        if key == "$and" or key == "$or":
+            value = [
+                _prepare_query(sub_value, regex, sub_document_root)
+                for sub_value in value
+            ]
+        else:
+            value = _prepare_value(value, regex)
+        if sub_document_root is not None and not key.startswith("$"):
+            # criteria with a sub document root are moved after operators
+            criteria[f"{sub_document_root}.{key}"] = value
+        else:
+            prepared_query[key] = value
+    prepared_query.update(criteria)
+    return prepared_query
+
+
+def _prepare_value(value, regex):
+    """Return a prepared copy of a value of the query
+
+    Args:
+        value:
+        regex:
+
+    Returns:
+
+    """
+    if isinstance(value, dict):
+        return _prepare_query(value, regex, None)
+    if isinstance(value, str):
+        if regex and len(value) >= 2 and value[0] == "/" and value[-1] == "/":
+            return re.compile(value[1:-1])
+        return value
+    if isinstance(value, list):
+        return copy.deepcopy(value)
+    return value
+
 
-    if regex:
-        # compile the regular expressions
-        _compile_regex(query)
+def get_query_plan(query_dict):
+    """Return the access filters and the ORM query of a query. Queries are
+    converted once, then read from a cache by hash of their JSON.
 
-    if sub_document_root is not None:
-        # add a sub document root
-        _add_sub_document_root(query, sub_document_root)
+    Args:
+        query_dict:
+
+    Returns:
+        workspace filter, user filter, query
 
-    return query
+    """
+    query_hash = _get_query_hash(query_dict)
+    query_plan = (
+        query_plan_cache.get(query_hash) if query_hash is not None else None
+    )
+    if query_plan is None:
+        workspace_filter, user_filter = get_access_filters_from_query(
+            query_dict=query_dict
+        )
+        query_plan = (
+            workspace_filter,
+            user_filter,
+            convert_to_django(query_dict=query_dict),
+        )
+        if query_hash is not None:
+            query_plan_cache.set(query_hash, query_plan)
+
+    workspace_filter, user_filter, query = query_plan
+    if settings.MONGODB_INDEXING:
+        # mongoengine simplifies Q objects in place when building the query
+        query = copy.deepcopy(query)
+    return list(workspace_filter), list(user_filter), query
+
+
+def _get_query_hash(query_dict):
+    """Return a hash of the query JSON and of the settings used to convert
+    it. Keys are not sorted: their order changes the converted query.
+
+    Args:
+        query_dict:
+
+    Returns:
+        hash, None if the query can not be serialized
+
+    """
+    try:
+        query_json = json.dumps(
+            [
+                settings.MONGODB_INDEXING,
+                uses_postgresql_backend(),
+                query_dict,
+            ],
+            separators=(",", ":"),
+            default=_encode_query_value,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(query_json.encode("utf-8")).hexdigest()
+
+
+def _encode_query_value(value):
+    """Encode values of a query that can not be serialized in JSON
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if isinstance(value, re.Pattern):
+        return {"$pattern": value.pattern, "$flags": value.flags}
+    raise TypeError(f"Unsupported type: {type(value)}")
 
 
 def get_access_filters_from_query(
@@ -146,6 +278,47 @@ def convert_to_django(query_dict):
 
     Returns:
 
+    """
+    # check $where operator
+    if _has_where_operator(query_dict):
+        raise QueryError("Unsupported operator found")
+
+    return _convert_to_django(query_dict, get_indexed_paths())
+
+
+def _has_where_operator(value):
+    """Return True if $where is found in a key or a value of the query
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if isinstance(value, dict):
+        return any(
+            _has_where_operator(key) or _has_where_operator(sub_value)
+            for key, sub_value in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return any(_has_where_operator(sub_value) for sub_value in value)
+    if isinstance(value, str):
+        return "$where" in value
+    if isinstance(value, re.Pattern):
+        return "$where" in str(value.pattern)
+    return False
+
+
+def _convert_to_django(query_dict, indexed_paths):
+    """Translate criteria of a mongodb query, without $where operator, to
+    django ORM
+
+    Args:
+        query_dict:
+        indexed_paths: types of the indexed paths, by path
+
+    Returns:
+
     """
     if settings.MONGODB_INDEXING:
         from mongoengine.queryset.visitor import Q
@@ -156,10 +329,6 @@ def convert_to_django(query_dict):
 
         template_key = "template"
 
-    # check $where operator
-    if "$where" in str(query_dict):
-        raise QueryError("Unsupported operator found")
-
     # create a query object
     q_list = Q()
     # iterate through query dict key/value pairs
@@ -324,7 +493,19 @@ def convert_to_django(query_dict):
                             f"Unsupported operator found: {value}"
                         )
                 # build query
-                query = Q(**{f"{key}__{operator}": sanitize_value(value)})
+                value = sanitize_value(value)
+                query = None
+                if (
+                    not negate
+                    and not settings.MONGODB_INDEXING
+                    and uses_postgresql_backend()
+                ):
+                    # use lookups matching the JSON indexes
+                    query = _get_json_index_query(
+                        key, operator, value, indexed_paths
+                    )
+                if query is None:
+                    query = Q(**{f"{key}__{operator}": value})
                 # invert django query if negate is true
                 query = (
                     ~query
@@ -340,13 +521,13 @@ def convert_to_django(query_dict):
                 # iterate though sub dict
                 for sub_value in value:
                     # add AND filters to the query
-                    q_list &= convert_to_django(sub_value)
+                    q_list &= _convert_to_django(sub_value, indexed_paths)
             # if operator or
             elif key == "$or":
                 # iterate through sub dict
                 for sub_value in value:
                     # add OR filters to the query
-                    q_list |= convert_to_django(sub_value)
+                    q_list |= _convert_to_django(sub_value, indexed_paths)
             # if operators text and search found
             elif key == "$text" and "$search" in value:
                 # get text query
@@ -378,6 +559,62 @@ def convert_to_django(query_dict):
     return q_list
 
 
+def _get_json_index_query(key, operator, value, indexed_paths):
+    """Return a query on the data content using the indexes configured in
+    the settings, None to use the default lookup.
+
+    Args:
+        key: django notation key (e.g. dict_content__root__element)
+        operator:
+        value:
+        indexed_paths: types of the indexed paths, by path
+
+    Returns:
+
+    """
+    from django.db.models import Q
+    from django.db.models.fields.json import KT
+    from django.db.models.lookups import Exact
+
+    prefix = f"{DATA_JSON_FIELD}__"
+    if not key.startswith(prefix) or operator != "exact":
+        return None
+    keys = key.removeprefix(prefix).split("__")
+    path_types = indexed_paths.get(".".join(keys), set())
+    if path_types:
+        if TEXT_PATH in path_types and isinstance(value, str):
+            # compare the text value of the path to use the text index
+            return Q(Exact(KT(key), value))
+        # default lookup uses the numeric index
+        return None
+    if (
+        DATA_CONTENT_GIN_INDEX
+        and isinstance(value, (str, int, float, bool))
+        and not any(_is_array_index(path_key) for path_key in keys)
+    ):
+        # containment lookup uses the GIN index
+        for path_key in reversed(keys):
+            value = {path_key: value}
+        return Q(**{f"{DATA_JSON_FIELD}__contains": value})
+    return None
+
+
+def _is_array_index(key):
+    """Return True if the key of a path can be an array index
+
+    Args:
+        key:
+
+    Returns:
+
+    """
+    try:
+        int(key)
+        return True
+    except ValueError:
+        return False
+
+
 def sanitize_number(value):
     """Sanitize number
 
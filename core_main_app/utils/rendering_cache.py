@@ -0,0 +1,285 @@
+"""Cache of the HTML renderings of data (XSLT and HTML templates)"""
+
+import logging
+
+from django.core.cache import cache
+from django.db.models import signals as models_signals
+
+from core_main_app.settings import RENDERED_HTML_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the cache keys of rendered HTML
+_CACHE_KEY_PREFIX = "core_main_app:rendered_html"
+
+
+def get_html_rendering_key(template_id, rendering):
+    """Get the rendering key of a template HTML rendering.
+
+    Args:
+        template_id:
+        rendering: list_rendering or detail_rendering
+
+    Returns:
+
+    """
+    return f"html:{template_id}:{rendering}"
+
+
+def get_xslt_rendering_key(xsl_transformation_id):
+    """Get the rendering key of an XSL transformation.
+
+    Args:
+        xsl_transformation_id: XslTransformation id, None for the default XSLT
+
+    Returns:
+
+    """
+    return f"xslt:{xsl_transformation_id or 'default'}"
+
+
+def get_rendered_html(data, rendering_key, render, rendering_version=None):
+    """Get the HTML rendering of a data from the cache, render and cache it
+    if not found.
+
+    Args:
+        data: Data
+        rendering_key: key of the rendering (template HTML rendering or XSLT)
+        render: function rendering the data, called if not cached
+        rendering_version: version of the rendering (e.g. XSLT checksum)
+
+    Returns:
+
+    """
+    if not RENDERED_HTML_CACHE_TTL or not getattr(data, "id", None):
+        return render()
+
+    key = _get_cache_key(data, rendering_key, rendering_version)
+    html = cache.get(key)
+    if html is None:
+        html = render()
+        if html is not None:
+            cache.set(key, html, RENDERED_HTML_CACHE_TTL)
+    return html
+
+
+def get_many_rendered_html(
+    data_list, rendering_key, render_many, rendering_version=None
+):
+    """Get the HTML renderings of a list of data from the cache, render and
+    cache the ones not found in a single call.
+
+    Args:
+        data_list: list of Data
+        rendering_key: key of the rendering (template HTML rendering or XSLT)
+        render_many: function rendering a list of data, called with the data
+            not cached
+        rendering_version: version of the rendering (e.g. XSLT checksum)
+
+    Returns:
+        list: HTML renderings, in the order of the list
+
+    """
+    if not RENDERED_HTML_CACHE_TTL:
+        return list(render_many(data_list))
+
+    keys = _get_cache_keys(data_list, rendering_key, rendering_version)
+    cached_html = cache.get_many([key for key in keys if key])
+    missing_indexes = [
+        index
+        for index, key in enumerate(keys)
+        if key is None or key not in cached_html
+    ]
+    html_list = [cached_html.get(key) for key in keys]
+    if missing_indexes:
+        rendered_html = render_many([data_list[i] for i in missing_indexes])
+        for index, html in zip(missing_indexes, rendered_html):
+            html_list[index] = html
+        cache.set_many(
+            {
+                keys[index]: html_list[index]
+                for index in missing_indexes
+                if keys[index] and html_list[index] is not None
+            },
+            RENDERED_HTML_CACHE_TTL,
+        )
+    return html_list
+
+
+def clear_data_cache(data_id):
+    """Invalidate the cached renderings of a data.
+
+    Args:
+        data_id:
+
+    Returns:
+
+    """
+    _increment_generation(_get_generation_key(f"data:{data_id}"))
+
+
+def clear_rendering_cache(rendering_key):
+    """Invalidate the cached renderings of all data for a rendering.
+
+    Args:
+        rendering_key:
+
+    Returns:
+
+    """
+    _increment_generation(_get_generation_key(rendering_key))
+
+
+def _get_cache_key(data, rendering_key, rendering_version):
+    """Get the cache key of the rendering of a data.
+
+    Args:
+        data:
+        rendering_key:
+        rendering_version:
+
+    Returns:
+
+    """
+    return _get_cache_keys([data], rendering_key, rendering_version)[0]
+
+
+def _get_cache_keys(data_list, rendering_key, rendering_version):
+    """Get the cache keys of the renderings of a list of data. Keys contain
+    the generations of the data and of the rendering, incremented when they
+    change, so updates invalidate all related keys at once.
+
+    Args:
+        data_list:
+        rendering_key:
+        rendering_version:
+
+    Returns:
+        list: cache key of each data, None for data without id
+
+    """
+    rendering_generation_key = _get_generation_key(rendering_key)
+    data_generation_keys = [
+        (
+            _get_generation_key(f"data:{data.id}")
+            if getattr(data, "id", None)
+            else None
+        )
+        for data in data_list
+    ]
+    generations = cache.get_many(
+        [rendering_generation_key]
+        + [key for key in data_generation_keys if key]
+    )
+    keys = []
+    for data, data_generation_key in zip(data_list, data_generation_keys):
+        if data_generation_key is None:
+            keys.append(None)
+            continue
+        last_modification_date = getattr(data, "last_modification_date", None)
+        data_version = getattr(data, "checksum", None) or (
+            last_modification_date.isoformat()
+            if last_modification_date
+            else ""
+        )
+        keys.append(
+            f"{_CACHE_KEY_PREFIX}:{data.id}:"
+            f"{generations.get(data_generation_key, 0)}:{data_version}:"
+            f"{rendering_key}:{generations.get(rendering_generation_key, 0)}:"
+            f"{rendering_version or ''}"
+        )
+    return keys
+
+
+def _get_generation_key(name):
+    """Get the cache key of a generation.
+
+    Args:
+        name:
+
+    Returns:
+
+    """
+    return f"{_CACHE_KEY_PREFIX}:generation:{name}"
+
+
+def _increment_generation(generation_key):
+    """Increment a generation in the cache.
+
+    Args:
+        generation_key:
+
+    Returns:
+
+    """
+    if not RENDERED_HTML_CACHE_TTL:
+        return
+    try:
+        cache.incr(generation_key)
+    except ValueError:
+        cache.set(generation_key, 1, None)
+
+
+def connect():
+    """Connect signals invalidating the rendered HTML cache"""
+    from core_main_app.components.data.models import Data
+    from core_main_app.components.template_html_rendering.models import (
+        TemplateHtmlRendering,
+    )
+    from core_main_app.components.xsl_transformation.models import (
+        XslTransformation,
+    )
+
+    for signal in (models_signals.post_save, models_signals.post_delete):
+        signal.connect(post_save_data, sender=Data)
+        signal.connect(
+            post_save_template_html_rendering, sender=TemplateHtmlRendering
+        )
+        signal.connect(post_save_xsl_transformation, sender=XslTransformation)
+    logger.info("Registered signals for rendered HTML cache")
+
+
+def post_save_data(sender, instance, **kwargs):
+    """Signal triggered after saving or deleting data
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    if not kwargs.get("created", False):
+        clear_data_cache(instance.pk)
+
+
+def post_save_template_html_rendering(sender, instance, **kwargs):
+    """Signal triggered after saving or deleting a template HTML rendering
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    for rendering in ("list_rendering", "detail_rendering"):
+        clear_rendering_cache(
+            get_html_rendering_key(instance.template_id, rendering)
+        )
+
+
+def post_save_xsl_transformation(sender, instance, **kwargs):
+    """Signal triggered after saving or deleting an XSL transformation
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    clear_rendering_cache(get_xslt_rendering_key(instance.pk))
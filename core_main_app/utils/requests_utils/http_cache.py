@@ -0,0 +1,145 @@
+"""Process-local HTTP cache of downloaded documents (e.g. XSD dependencies)"""
+
+import time
+
+from core_main_app.settings import (
+    XSD_DEPENDENCY_CACHE_MAX_MEMORY,
+    XSD_DEPENDENCY_CACHE_MAX_SIZE,
+)
+from core_main_app.utils.cache import LRUCache
+from core_main_app.utils.requests_utils.requests_utils import (
+    send_session_get_request,
+)
+
+# downloaded documents, by url
+http_cache = LRUCache(
+    max_size=XSD_DEPENDENCY_CACHE_MAX_SIZE,
+    max_weight=XSD_DEPENDENCY_CACHE_MAX_MEMORY,
+)
+
+
+class CachedDocument:
+    """Document downloaded and its HTTP caching information"""
+
+    def __init__(self, content, etag, last_modified, expires):
+        """Initialize the document
+
+        Args:
+            content:
+            etag: ETag header
+            last_modified: Last-Modified header
+            expires: time until the document is fresh, None to revalidate it
+        """
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+
+    def is_fresh(self):
+        """Check if the document can be used without revalidation.
+
+        Returns:
+
+        """
+        return self.expires is not None and self.expires > time.time()
+
+    def get_validation_headers(self):
+        """Return the headers of a conditional request revalidating the
+        document.
+
+        Returns:
+
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def get_document_content(url):
+    """Download a document, using the cache if the document is fresh or has
+    not been modified. Requests are sent without credentials, as the cache is
+    shared by all users.
+
+    Args:
+        url:
+
+    Returns:
+        bytes: content of the document
+
+    """
+    cached_document = http_cache.get(url)
+    if cached_document is not None and cached_document.is_fresh():
+        return cached_document.content
+
+    response = send_session_get_request(
+        url,
+        headers=(
+            cached_document.get_validation_headers()
+            if cached_document is not None
+            else None
+        ),
+    )
+    if response.status_code == 304 and cached_document is not None:
+        content = cached_document.content
+    elif response.status_code == 200:
+        content = response.content
+    else:
+        return response.content
+
+    document = _get_cached_document(content, response.headers)
+    if document is None:
+        http_cache.delete(url)
+    else:
+        http_cache.set(url, document, weight=len(content))
+    return content
+
+
+def _get_cached_document(content, headers):
+    """Return the document to cache according to the response headers, None
+    if the document should not be cached.
+
+    Args:
+        content:
+        headers:
+
+    Returns:
+
+    """
+    cache_control = _parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in cache_control:
+        return None
+
+    expires = None
+    if "no-cache" not in cache_control:
+        try:
+            expires = time.time() + int(cache_control["max-age"])
+        except (KeyError, TypeError, ValueError):
+            expires = None
+
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if expires is None and not etag and not last_modified:
+        # nothing to reuse the document without downloading it again
+        return None
+    return CachedDocument(content, etag, last_modified, expires)
+
+
+def _parse_cache_control(cache_control):
+    """Parse a Cache-Control header.
+
+    Args:
+        cache_control:
+
+    Returns:
+        dict: directive -> value (None if no value)
+
+    """
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
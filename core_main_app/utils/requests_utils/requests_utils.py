@@ -1,9 +1,28 @@
 """Utils for the python requests package"""
 
+import threading
+
 import requests
 
 from core_main_app.settings import SSL_CERTIFICATES_DIR
 
+# requests sessions (connection pools), one per thread
+_sessions = threading.local()
+
+
+def get_session():
+    """Return the requests session of the current thread, keeping
+    connections alive between requests.
+
+    Returns:
+        requests.Session
+
+    """
+    session = getattr(_sessions, "session", None)
+    if session is None:
+        session = _sessions.session = requests.Session()
+    return session
+
 
 def send_get_request(url, params=None, **kwargs):
     """Send a GET request using python requests.
@@ -21,6 +40,22 @@ def send_get_request(url, params=None, **kwargs):
     return requests.get(url, params, **kwargs)
 
 
+def send_session_get_request(url, params=None, **kwargs):
+    """Send a GET request using the requests session of the current thread.
+
+    Args:
+        url:
+        params:
+        **kwargs:
+
+    Returns:
+
+    """
+    if "verify" not in kwargs:
+        kwargs["verify"] = SSL_CERTIFICATES_DIR
+    return get_session().get(url, params=params, **kwargs)
+
+
 def send_post_request(url, data=None, json=None, **kwargs):
     """Send a POST request using python requests.
 
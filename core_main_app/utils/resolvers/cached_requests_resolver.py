@@ -0,0 +1,81 @@
+"""lxml URI resolver reading local templates and caching remote documents"""
+
+import logging
+
+from django.contrib.auth.models import AnonymousUser
+
+from core_main_app.utils.requests_utils.http_cache import (
+    get_document_content,
+)
+from core_main_app.utils.urls import get_template_id_from_url
+from xml_utils.xml_validation.resolvers.default_uri_resolver import (
+    DefaultURIResolver,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CachedRequestsResolver(DefaultURIResolver):
+    """URI Resolver for lxml reading the templates of this server from the
+    database, and downloading other documents with a pooled session and an
+    HTTP cache"""
+
+    session_id = None
+    request = None
+
+    def __init__(self, session_id=None, request=None):
+        super().__init__()
+        self.session_id = session_id
+        self.request = request
+
+    def resolve(self, url, id, context):
+        """Resolve the URI from the database or using the requests api
+
+        Args:
+            url:
+            id:
+            context:
+
+        Returns:
+
+        """
+        try:
+            template_id = get_template_id_from_url(url)
+            if template_id is not None:
+                content = self.get_template_content(template_id)
+            else:
+                content = get_document_content(url)
+            return self.resolve_string(content, context)
+        except Exception as exception:
+            # if an error occurs return None to use the next registered resolver (or lxml default resolver)
+            logger.error(
+                "An error occurred with the CachedRequestsResolver: %s",
+                str(exception),
+            )
+            return None
+
+    def get_template_content(self, template_id):
+        """Get the content of a template, if the user can read it (anonymous
+        user if no request).
+
+        Args:
+            template_id:
+
+        Returns:
+
+        """
+        # imported here: template models import the resolvers (validation)
+        from core_main_app.components.template import api as template_api
+        from core_main_app.components.template.access_control import (
+            check_can_read_template,
+        )
+        from core_main_app.system import api as system_api
+
+        if self.request is not None:
+            template = template_api.get_by_id(
+                template_id, request=self.request
+            )
+        else:
+            template = system_api.get_template_by_id(template_id)
+            check_can_read_template(template, AnonymousUser())
+        return template.content
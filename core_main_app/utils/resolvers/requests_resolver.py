@@ -15,7 +15,7 @@ class RequestsResolver(DefaultURIResolver):
 
     session_id = None
 
-    def __init__(self, session_id=None):
+    def __init__(self, session_id=None, request=None):
         super().__init__()
         self.session_id = session_id
 
@@ -1,7 +1,11 @@
 """List of available uri resolvers for lxml"""
 
+from core_main_app.utils.resolvers.cached_requests_resolver import (
+    CachedRequestsResolver,
+)
 from core_main_app.utils.resolvers.requests_resolver import RequestsResolver
 
 XSD_URI_RESOLVERS = {
     "REQUESTS_RESOLVER": RequestsResolver,
+    "CACHED_REQUESTS_RESOLVER": CachedRequestsResolver,
 }
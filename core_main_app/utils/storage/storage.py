@@ -1,5 +1,8 @@
 """Utils for CDCS file storage"""
 
+import mmap
+import os
+
 from django.core.files.storage import default_storage
 
 from core_main_app.commons.exceptions import CoreError
@@ -72,3 +75,78 @@ def core_file_storage(model):
 
     # if no storage settings, return default storage
     return default_storage
+
+
+def is_file_saved(file_field):
+    """Check if a file field refers to a file saved in its storage
+
+    Args:
+        file_field: FieldFile
+
+    Returns:
+
+    """
+    return (
+        bool(file_field.name)
+        and getattr(file_field, "_committed", False) is True
+    )
+
+
+def get_local_path(file_field):
+    """Return the local path of a file saved in a filesystem storage
+
+    Args:
+        file_field: FieldFile
+
+    Returns:
+        str: path of the file, None if not saved or not stored locally
+
+    """
+    if not is_file_saved(file_field):
+        return None
+    try:
+        return file_field.path
+    except NotImplementedError:
+        # storage without local files (e.g. GridFS)
+        return None
+
+
+def open_file(file_field):
+    """Open a file saved in a storage, to read it chunk by chunk (the caller
+    closes it)
+
+    Args:
+        file_field: FieldFile
+
+    Returns:
+        binary file-like object
+
+    """
+    return file_field.storage.open(file_field.name, "rb")
+
+
+def read_file(file_field, encoding="utf-8"):
+    """Read and decode the content of a file saved in a storage. Files of a
+    filesystem storage are memory-mapped, so their bytes are decoded without
+    being copied in memory first.
+
+    Args:
+        file_field: FieldFile
+        encoding:
+
+    Returns:
+        str: content of the file, bytes if the storage does not return bytes
+
+    """
+    path = get_local_path(file_field)
+    if path is not None and os.path.getsize(path) > 0:
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped_file:
+            return str(mapped_file, encoding)
+
+    file_content = file_field.read()
+    try:
+        return file_content.decode(encoding)
+    except AttributeError:
+        return file_content
@@ -0,0 +1,57 @@
+"""Count the database queries executed by a test."""
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+def count_queries(function, using=DEFAULT_DB_ALIAS):
+    """Execute a function and count the database queries it executed.
+
+    Args:
+        function: function to execute, without arguments.
+        using: database alias.
+
+    Returns:
+        tuple: result of the function, number of queries
+
+    """
+    with CaptureQueriesContext(connections[using]) as context:
+        result = function()
+    return result, len(context.captured_queries)
+
+
+class QueryCountTestMixin:
+    """Test case mixin checking that the number of database queries of an
+    action does not grow with the number of objects (e.g. list endpoints
+    should execute O(1) queries per page).
+    """
+
+    def assertConstantQueryCount(
+        self, create_objects, function, counts=(1, 5), using=DEFAULT_DB_ALIAS
+    ):
+        """Assert that a function executes the same number of queries,
+        whatever the number of objects.
+
+        Args:
+            create_objects: function creating a given number of new objects.
+            function: function to execute, without arguments.
+            counts: numbers of objects to test (cumulative).
+            using: database alias.
+
+        Returns:
+            int: number of queries executed by the function
+
+        """
+        query_counts = []
+        total = 0
+        for count in counts:
+            create_objects(count - total)
+            total = count
+            query_counts.append(count_queries(function, using)[1])
+        self.assertEqual(
+            len(set(query_counts)),
+            1,
+            f"Number of queries depends on the number of objects: "
+            f"{dict(zip(counts, query_counts))}",
+        )
+        return query_counts[0]
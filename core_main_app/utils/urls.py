@@ -1,6 +1,7 @@
 """Urls utils"""
 
 import re
+from urllib.parse import urlparse
 
 from django.conf import settings as conf_settings
 from django.contrib.auth import views as auth_views
@@ -30,6 +31,29 @@ def get_template_download_pattern():
     return pattern
 
 
+def get_template_id_from_url(url):
+    """Return the id of the template downloaded by an url of this server
+    (SERVER_URI), None if the url does not download a template.
+
+    Args:
+        url:
+
+    Returns:
+
+    """
+    server_uri = main_settings.SERVER_URI.rstrip("/")
+    if not url or not url.startswith(server_uri + "/"):
+        return None
+    pattern = get_template_download_pattern()
+    # match the path with and without the path of the server
+    server_path = urlparse(url.removeprefix(server_uri)).path
+    for url_path in (urlparse(url).path, server_path):
+        match = pattern.match(url_path)
+        if match:
+            return match.group("pk")
+    return None
+
+
 def get_blob_download_regex(xml_string):
     """Return regex pattern to match an url to download a blob.
 
@@ -1,14 +1,24 @@
 """Xml utils for the core applications"""
 
+import copy
+import hashlib
 import logging
 import re
 from urllib.parse import urlparse
 
 import xmltodict
 from django.urls import reverse
+from lxml import etree
 
 from core_main_app.commons import exceptions
-from core_main_app.settings import XERCES_VALIDATION, SERVER_URI
+from core_main_app.settings import (
+    XERCES_VALIDATION,
+    SERVER_URI,
+    XSLT_CACHE_MAX_SIZE,
+    XML_SCHEMA_CACHE_MAX_SIZE,
+    XML_SCHEMA_CACHE_MAX_MEMORY,
+)
+from core_main_app.utils.cache import LRUCache
 from core_main_app.utils.resolvers.resolver_utils import lmxl_uri_resolver
 from core_main_app.utils.urls import get_template_download_pattern
 from xml_utils import xpath as xml_utils_xpath
@@ -22,6 +32,16 @@ from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 logger = logging.getLogger(__name__)
 
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# compiled XSLT, by content hash or by XslTransformation id and checksum
+xslt_cache = LRUCache(max_size=XSLT_CACHE_MAX_SIZE)
+
+# compiled XML schemas, by template id, hash and user (if dependencies)
+xml_schema_cache = LRUCache(
+    max_size=XML_SCHEMA_CACHE_MAX_SIZE, max_weight=XML_SCHEMA_CACHE_MAX_MEMORY
+)
+
 
 def validate_xml_schema(xsd_tree, *args, **kwargs):
     """Check if XSD schema is valid, send XSD Schema to server to be validated if
@@ -73,6 +93,39 @@ def validate_xml_data(xsd_tree, xml_tree, *args, **kwargs):
     return error
 
 
+def build_xml_schema(xsd_tree, *args, **kwargs):
+    """Compile an XSD tree into an lxml XMLSchema, resolving imports and includes.
+
+    Args:
+        xsd_tree:
+
+    Returns:
+        etree.XMLSchema
+
+    """
+    uri_resolver = lmxl_uri_resolver(*args, **kwargs)
+    if uri_resolver:
+        xsd_tree.parser.resolvers.add(uri_resolver)
+    return etree.XMLSchema(xsd_tree)
+
+
+def validate_xml_data_with_schema(xml_schema, xml_tree):
+    """Check if XML data is valid against a compiled XML schema.
+
+    Args:
+        xml_schema:
+        xml_tree:
+
+    Returns: None if no errors, string otherwise
+
+    """
+    try:
+        xml_schema.assertValid(xml_tree)
+    except Exception as exception:
+        return str(exception)
+    return None
+
+
 def is_schema_valid(xsd_string, *args, **kwargs):
     """Test if the schema is valid to be uploaded.
 
@@ -80,23 +133,28 @@ def is_schema_valid(xsd_string, *args, **kwargs):
         xsd_string:
 
     Returns:
+        XSD tree, parsed once and reusable by the next upload steps (hash,
+        dependencies)
 
     """
-    if not is_well_formed_xml(xsd_string):
+    # is it a valid XML document?
+    try:
+        xsd_tree = XSDTree.build_tree(xsd_string)
+    except Exception:
         raise exceptions.XMLError("Uploaded file is not well formatted XML.")
 
     # Check schema support by the core
-    errors = _check_core_support(xsd_string)
+    errors = _check_core_support(xsd_tree)
     if len(errors) > 0:
         errors_str = ", ".join(errors)
         raise exceptions.CoreError(errors_str)
 
-    error = validate_xml_schema(
-        XSDTree.build_tree(xsd_string), *args, **kwargs
-    )
+    error = validate_xml_schema(xsd_tree, *args, **kwargs)
     if error is not None:
         raise exceptions.XSDError(error)
 
+    return xsd_tree
+
 
 def is_well_formed_xml(xml_string):
     """True if well formatted XML.
@@ -155,16 +213,39 @@ def has_xsl_namespace(xml_string):
     return has_namespace
 
 
+def build_xml_data_tree(xml_string):
+    """Build the tree of an XML document, keeping all the text (including
+    whitespace between elements) so it can be converted to dict like the raw
+    XML by raw_xml_to_dict.
+
+    Args:
+        xml_string:
+
+    Returns:
+
+    """
+    return XSDTree.build_tree(xml_string, parser=etree.XMLParser())
+
+
 def raw_xml_to_dict(
-    raw_xml, postprocessor=None, force_list=None, list_limit=None
+    raw_xml,
+    postprocessor=None,
+    force_list=None,
+    list_limit=None,
+    xml_tree=None,
 ):
     """Transform a raw xml to dict. Returns an empty dict if the parsing failed.
 
+    If a list limit is set, lists exceeding the limit are removed while
+    parsing, so their elements are not kept in memory.
+
     Args:
         raw_xml:
         postprocessor:
         force_list:
         list_limit:
+        xml_tree: raw xml already parsed with build_xml_data_tree (optional),
+            converted without parsing the raw xml again
 
     Returns:
 
@@ -181,6 +262,25 @@ def raw_xml_to_dict(
             if not callable(postprocessor):
                 raise exceptions.CoreError("postprocessor is not callable")
 
+        if xml_tree is not None:
+            try:
+                return _xml_tree_to_dict(
+                    xml_tree, postprocessor, force_list, list_limit
+                )
+            except _XmlTreeConversionError:
+                # convert the raw xml instead
+                pass
+
+        if list_limit:
+            try:
+                return _parse_xml_with_list_limit(
+                    raw_xml, postprocessor, force_list, list_limit
+                )
+            except _ListLimitConflict:
+                # removed lists were part of a list: parse the whole document
+                if hasattr(raw_xml, "seek"):
+                    raw_xml.seek(0)
+
         # convert xml to dict
         dict_raw = xmltodict.parse(
             raw_xml, postprocessor=postprocessor, force_list=force_list
@@ -195,6 +295,369 @@ def raw_xml_to_dict(
         )
 
 
+class _ListLimitConflict(Exception):
+    """Raised when a list removed while parsing was inside a list"""
+
+
+class _ListLimitFrame:
+    """Parsing state of an element"""
+
+    __slots__ = (
+        "name",
+        "in_list",
+        "keys",
+        "removed_keys",
+        "removed_names",
+        "pruned_keys",
+        "pruned",
+    )
+
+    def __init__(self, name, in_list):
+        """Initialize the frame.
+
+        Args:
+            name: element name
+            in_list: True if the element or one of its ancestors is in a list
+        """
+        self.name = name
+        self.in_list = in_list
+        # keys of the children, by element name
+        self.keys = {}
+        # keys of the children lists removed
+        self.removed_keys = set()
+        # names of the children skipped without being parsed
+        self.removed_names = set()
+        # keys of the children with removed lists in their subtree
+        self.pruned_keys = set()
+        # True if lists were removed in the subtree of the element
+        self.pruned = False
+
+
+class _ListLimitDictSAXHandler(xmltodict._DictSAXHandler):
+    """xmltodict handler removing the lists exceeding a size limit while
+    parsing, with the same result as remove_lists_from_xml_dict.
+
+    Lists are only removed outside other lists (remove_lists_from_xml_dict
+    does not look into lists). An element is assumed not to be in a list
+    until a sibling with the same key is found: if lists were already removed
+    from its subtree, _ListLimitConflict is raised.
+    """
+
+    def __init__(self, list_limit, **kwargs):
+        """Initialize the handler.
+
+        Args:
+            list_limit: maximum list size
+            kwargs: xmltodict options
+        """
+        super().__init__(**kwargs)
+        self.list_limit = list_limit
+        self.frames = [_ListLimitFrame(None, False)]
+        self.closing_frame = None
+        self.skip_depth = 0
+        # children with a removed key can be skipped if the key of an element
+        # does not depend on its value
+        self.skip_removed = (
+            self.postprocessor is None
+            or self.postprocessor in XML_POST_PROCESSORS.values()
+        )
+
+    def startElement(self, full_name, attrs):
+        if self.skip_depth:
+            self.skip_depth += 1
+            return
+        name = self._build_name(full_name)
+        parent = self.frames[-1]
+        if name in parent.removed_names:
+            self.skip_depth = 1
+            return
+        super().startElement(full_name, attrs)
+        self.frames.append(
+            _ListLimitFrame(name, parent.in_list or name in parent.keys)
+        )
+
+    def endElement(self, full_name):
+        if self.skip_depth:
+            self.skip_depth -= 1
+            return
+        self.closing_frame = self.frames.pop()
+        super().endElement(full_name)
+        self.closing_frame = None
+
+    def characters(self, data):
+        if self.skip_depth:
+            return
+        super().characters(data)
+
+    def push_data(self, item, key, data):
+        if item is not self.item:
+            # text of the closing element
+            return super().push_data(item, key, data)
+        frame = self.frames[-1]
+        child = self.closing_frame
+        self.closing_frame = None
+        if self.postprocessor is not None:
+            result = self.postprocessor(self.path, key, data)
+            if result is None:
+                return item
+            key, data = result
+        if child is not None:
+            frame.keys[child.name] = key
+        if key in frame.removed_keys:
+            return item
+        if item is None:
+            item = self.dict_constructor()
+        if key in item:
+            value = item[key]
+            if isinstance(value, list):
+                value.append(data)
+            else:
+                item[key] = [value, data]
+        elif self._should_force_list(key, data):
+            item[key] = [data]
+        else:
+            item[key] = data
+
+        value = item[key]
+        if isinstance(value, list):
+            if key in frame.pruned_keys or (
+                child is not None and child.pruned
+            ):
+                raise _ListLimitConflict
+            if len(value) > self.list_limit and not frame.in_list:
+                del item[key]
+                frame.removed_keys.add(key)
+                frame.pruned = True
+                if child is not None and self.skip_removed:
+                    frame.removed_names.add(child.name)
+        elif child is not None and child.pruned:
+            frame.pruned_keys.add(key)
+            frame.pruned = True
+        return item
+
+
+def _parse_xml_with_list_limit(raw_xml, postprocessor, force_list, list_limit):
+    """Transform a raw xml to dict, remove lists exceeding the limit size
+    while parsing.
+
+    Args:
+        raw_xml:
+        postprocessor:
+        force_list:
+        list_limit:
+
+    Returns:
+
+    """
+    handler = _ListLimitDictSAXHandler(
+        list_limit, postprocessor=postprocessor, force_list=force_list
+    )
+    encoding = None
+    if isinstance(raw_xml, str):
+        encoding = "utf-8"
+        raw_xml = raw_xml.encode(encoding)
+    parser = xmltodict.expat.ParserCreate(encoding, None)
+    parser.ordered_attributes = True
+    parser.StartElementHandler = handler.startElement
+    parser.EndElementHandler = handler.endElement
+    parser.CharacterDataHandler = handler.characters
+    parser.buffer_text = True
+
+    def _forbid_entities(*_args, **_kwargs):
+        raise ValueError("entities are disabled")
+
+    parser.EntityDeclHandler = _forbid_entities
+    if hasattr(raw_xml, "read"):
+        parser.ParseFile(raw_xml)
+    else:
+        parser.Parse(raw_xml, True)
+    return _get_list_limit_handler_result(handler, list_limit)
+
+
+def _get_list_limit_handler_result(handler, list_limit):
+    """Return the dict built by a _ListLimitDictSAXHandler.
+
+    Args:
+        handler:
+        list_limit:
+
+    Returns:
+
+    """
+    dict_raw = handler.item
+    if dict_raw and not handler.skip_removed:
+        # lists built by a custom postprocessor
+        remove_lists_from_xml_dict(dict_raw, list_limit)
+    return dict_raw
+
+
+class _XmlTreeConversionError(Exception):
+    """Raised when a tree can not be converted like its raw xml"""
+
+
+def _xml_tree_to_dict(xml_tree, postprocessor, force_list, list_limit):
+    """Transform a parsed xml to dict, with the same result as xmltodict
+    parsing the raw xml.
+
+    Args:
+        xml_tree:
+        postprocessor:
+        force_list:
+        list_limit:
+
+    Returns:
+
+    """
+    if list_limit:
+        try:
+            handler = _ListLimitDictSAXHandler(
+                list_limit, postprocessor=postprocessor, force_list=force_list
+            )
+            _send_xml_tree_events(xml_tree, handler)
+            return _get_list_limit_handler_result(handler, list_limit)
+        except _ListLimitConflict:
+            # removed lists were part of a list: convert the whole document
+            pass
+
+    handler = xmltodict._DictSAXHandler(
+        postprocessor=postprocessor, force_list=force_list
+    )
+    _send_xml_tree_events(xml_tree, handler)
+    dict_raw = handler.item
+    if list_limit:
+        # Remove lists which size exceed the limit size
+        remove_lists_from_xml_dict(dict_raw, list_limit)
+    return dict_raw
+
+
+def _send_xml_tree_events(xml_tree, handler):
+    """Send the events of a parsed xml to an xmltodict handler, as the expat
+    parser does for the raw xml: qualified names, namespace declarations as
+    attributes, text of an element split by its children.
+
+    Args:
+        xml_tree:
+        handler:
+
+    Returns:
+
+    """
+    if xml_tree.docinfo.doctype:
+        # entities and default attributes are not handled like expat does
+        raise _XmlTreeConversionError
+    # elements removed by the list limit are not walked
+    skip_removed = isinstance(handler, _ListLimitDictSAXHandler)
+    # qualified tags, by tag and prefix
+    qualified_tags = {}
+    # qualified tags of the open elements
+    names = []
+    # namespaces declared by the element about to start
+    declarations = []
+    # namespaces in scope (prefix -> uri), by element
+    scopes = [{}]
+    start_element = handler.startElement
+    end_element = handler.endElement
+    characters = handler.characters
+    walker = etree.iterwalk(
+        xml_tree, events=("start", "end", "start-ns", "comment", "pi")
+    )
+    for event, node in walker:
+        if event == "start":
+            name = node.tag
+            if name[0] == "{":
+                key = (name, node.prefix)
+                name = qualified_tags.get(key)
+                if name is None:
+                    name = qualified_tags[key] = _get_qualified_tag(*key)
+            scope = scopes[-1]
+            attrs = node.items()
+            if declarations or attrs:
+                if declarations:
+                    scope = dict(scope)
+                    scope.update(declarations)
+                attrs = _get_qualified_attributes(declarations, attrs, scope)
+                declarations = []
+            scopes.append(scope)
+            names.append(name)
+            start_element(name, attrs)
+            if skip_removed and handler.skip_depth:
+                walker.skip_subtree()
+            elif node.text:
+                characters(node.text)
+        elif event == "end":
+            scopes.pop()
+            end_element(names.pop())
+            if node.tail and names:
+                characters(node.tail)
+        elif event == "start-ns":
+            declarations.append(node)
+        elif node.tail and names:
+            # text following a comment or a processing instruction
+            characters(node.tail)
+
+
+def _get_qualified_attributes(declarations, attributes, scope):
+    """Return the attributes of an element as written in the raw xml,
+    namespace declarations first.
+
+    Args:
+        declarations: namespaces declared by the element (prefix, uri)
+        attributes: attributes of the element (name, value)
+        scope: namespaces in scope (prefix -> uri)
+
+    Returns:
+        dict
+
+    """
+    qualified_attributes = {
+        f"xmlns:{prefix}" if prefix else "xmlns": uri
+        for prefix, uri in declarations
+    }
+    for name, value in attributes:
+        if name[0] == "{":
+            name = _get_qualified_attribute_name(name, scope)
+        qualified_attributes[name] = value
+    return qualified_attributes
+
+
+def _get_qualified_tag(tag, prefix):
+    """Return the tag of an element as written in the raw xml.
+
+    Args:
+        tag:
+        prefix:
+
+    Returns:
+
+    """
+    local_name = etree.QName(tag).localname
+    return f"{prefix}:{local_name}" if prefix else local_name
+
+
+def _get_qualified_attribute_name(name, scope):
+    """Return the name of a namespaced attribute as written in the raw xml.
+
+    Args:
+        name:
+        scope: namespaces in scope (prefix -> uri)
+
+    Returns:
+
+    """
+    qname = etree.QName(name)
+    if qname.namespace == XML_NAMESPACE:
+        return f"xml:{qname.localname}"
+    prefixes = [
+        prefix
+        for prefix, uri in scope.items()
+        if prefix and uri == qname.namespace
+    ]
+    if len(prefixes) != 1:
+        # prefix of the attribute unknown
+        raise _XmlTreeConversionError
+    return f"{prefixes[0]}:{qname.localname}"
+
+
 def remove_lists_from_xml_dict(xml_dict, max_list_size=0):
     """Remove from dictionary the lists that exceed max list size.
 
@@ -262,16 +725,19 @@ def get_template_with_server_dependencies(
     return updated_xsd_string
 
 
-def get_hash(xml_string):
+def get_hash(xml_string, xml_tree=None):
     """Get the hash of an XML string.
 
     Args:
         xml_string:
+        xml_tree: XML string already parsed (optional)
 
     Returns:
 
     """
     try:
+        if xml_tree is not None:
+            return _get_hash_from_tree(xml_tree)
         return xsd_hash.get_hash(xml_string)
     except Exception:
         raise exceptions.XSDError(
@@ -279,6 +745,30 @@ def get_hash(xml_string):
         )
 
 
+def _get_hash_from_tree(xml_tree):
+    """Get the hash of a parsed XML string, same as xsd_hash.get_hash without
+    parsing the string again.
+
+    Args:
+        xml_tree:
+
+    Returns:
+
+    """
+    # xsd_hash parses without comments and processing instructions
+    xml_tree = copy.deepcopy(xml_tree)
+    etree.strip_tags(xml_tree, etree.Comment, etree.ProcessingInstruction)
+    # Remove all annotations
+    for annotation in xml_tree.findall(
+        f".//{xml_utils_constants.LXML_SCHEMA_NAMESPACE}annotation"
+    ):
+        annotation.getparent().remove(annotation)
+    xml_dict = xmltodict.parse(
+        XSDTree.tostring(xml_tree), dict_constructor=dict
+    )
+    return xsd_hash.hash_dict(xml_dict)
+
+
 def get_numeric_value(value):
     """Convert the value to the true type
 
@@ -339,16 +829,18 @@ XML_POST_PROCESSORS = {
 }
 
 
-def get_imports_and_includes(xsd_string):
+def get_imports_and_includes(xsd_string, xsd_tree=None):
     """Get a list of imports and includes in the file.
 
     Args:
         xsd_string:
+        xsd_tree: XSD string already parsed (optional)
 
     Returns: list of imports, list of includes
 
     """
-    xsd_tree = XSDTree.build_tree(xsd_string)
+    if xsd_tree is None:
+        xsd_tree = XSDTree.build_tree(xsd_string)
     # get the imports
     imports = xsd_tree.findall(
         f"{xml_utils_constants.LXML_SCHEMA_NAMESPACE}import"
@@ -396,11 +888,12 @@ def update_dependencies(xsd_string, dependencies):
     return xsd_tree
 
 
-def get_local_dependencies(xsd_string):
+def get_local_dependencies(xsd_string, xsd_tree=None):
     """Get local dependencies from an xsd.
 
     Args:
         xsd_string: XSD as string.
+        xsd_tree: XSD string already parsed (optional)
 
     Returns:
         Local dependencies
@@ -409,7 +902,7 @@ def get_local_dependencies(xsd_string):
     # declare list of dependencies
     dependencies = []
     # Get includes and imports
-    imports, includes = get_imports_and_includes(xsd_string)
+    imports, includes = get_imports_and_includes(xsd_string, xsd_tree=xsd_tree)
     # list of includes and imports
     xsd_includes_imports = imports + includes
 
@@ -433,11 +926,11 @@ def get_local_dependencies(xsd_string):
     return dependencies
 
 
-def _check_core_support(xsd_string):
+def _check_core_support(xsd_tree):
     """Check that the format of the schema is supported by the current version of the Core.
 
     Args:
-        xsd_string:
+        xsd_tree:
 
     Returns:
 
@@ -445,9 +938,6 @@ def _check_core_support(xsd_string):
     # list of errors
     errors = []
 
-    # build xsd tree
-    xsd_tree = XSDTree.build_tree(xsd_string)
-
     # get the imports
     imports = xsd_tree.findall(
         f"{xml_utils_constants.LXML_SCHEMA_NAMESPACE}import"
@@ -504,6 +994,56 @@ def _get_schema_location_uri(schema_id):
     return str(SERVER_URI) + url
 
 
+def build_xslt_transform(xslt_string):
+    """Compile an XSLT.
+
+    Args:
+        xslt_string:
+
+    Returns:
+        etree.XSLT
+
+    """
+    return XSDTree.transform_to_xslt(XSDTree.build_tree(xslt_string))
+
+
+def get_xslt_transform(xslt_string):
+    """Get a compiled XSLT from the cache, compile it if not found.
+
+    Args:
+        xslt_string:
+
+    Returns:
+        etree.XSLT
+
+    """
+    cache_key = ("content", hashlib.sha256(xslt_string.encode()).hexdigest())
+    transform = xslt_cache.get(cache_key)
+    if transform is None:
+        transform = build_xslt_transform(xslt_string)
+        xslt_cache.set(cache_key, transform)
+    return transform
+
+
+def apply_xslt_transform(xml_string, transform):
+    """Apply a compiled XSLT to xml.
+
+    Args:
+        xml_string:
+        transform:
+
+    Returns:
+
+    """
+    try:
+        transformed_tree = transform(XSDTree.build_tree(xml_string))
+        return str(transformed_tree)
+    except Exception:
+        raise exceptions.CoreError(
+            "An unexpected exception happened while transforming the XML"
+        )
+
+
 def xsl_transform(xml_string, xslt_string):
     """Apply transformation to xml.
 
@@ -515,18 +1055,12 @@ def xsl_transform(xml_string, xslt_string):
 
     """
     try:
-        # Build the XSD and XSLT tree
-        xslt_tree = XSDTree.build_tree(xslt_string)
-        xsd_tree = XSDTree.build_tree(xml_string)
-
-        # Get the XSLT transformation and transform the XSD
-        transform = XSDTree.transform_to_xslt(xslt_tree)
-        transformed_tree = transform(xsd_tree)
-        return str(transformed_tree)
+        transform = get_xslt_transform(xslt_string)
     except Exception:
         raise exceptions.CoreError(
             "An unexpected exception happened while transforming the XML"
         )
+    return apply_xslt_transform(xml_string, transform)
 
 
 def xpath_to_dot_notation(xpath, namespaces=None):
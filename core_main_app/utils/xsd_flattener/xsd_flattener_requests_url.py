@@ -1,6 +1,8 @@
 """XSD Flattener Requests URL Class"""
 
-from core_main_app.utils.requests_utils.requests_utils import send_get_request
+from core_main_app.utils.requests_utils.http_cache import (
+    get_document_content,
+)
 from xml_utils.xsd_flattener.xsd_flattener_url import XSDFlattenerURL
 
 
@@ -19,7 +21,8 @@ class XSDFlattenerRequestsURL(XSDFlattenerURL):
         )
 
     def get_dependency_content(self, uri):
-        """Get the content of the dependency from the URL using request util for HTTPS compliance
+        """Get the content of the dependency from the URL using request util for HTTPS compliance,
+        from the HTTP cache if possible
 
         Args:
             uri: Content URI
@@ -29,6 +32,5 @@ class XSDFlattenerRequestsURL(XSDFlattenerURL):
 
         """
         if self.download_enabled:
-            dependency_file = send_get_request(uri)
-            return dependency_file.content
+            return get_document_content(uri)
         return ""
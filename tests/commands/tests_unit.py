@@ -1,11 +1,17 @@
 """Command unit testing"""
 
+import datetime
+import os
+import shutil
+import sys
+import tempfile
 from io import StringIO
 from unittest.case import TestCase
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import call, patch, MagicMock, mock_open
 
 from django.contrib.auth.models import User
 from django.core.management import call_command, CommandError
+from django.test import override_settings
 
 from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.components.blob.models import Blob
@@ -1081,6 +1087,293 @@ class TestUploadDataCommand(TestCase):
         self.assertTrue(mock_data_objects.bulk_create.call_count == 0)
 
 
+class TestUploadDataCommandWithWorkers(TestCase):
+    """Test Upload Data command with a pool of workers and a checkpoint"""
+
+    def setUp(self):
+        """setUp"""
+        self.media_root = tempfile.mkdtemp()
+        for filename in ["data_1.json", "data_2.json", "data_3.json"]:
+            with open(
+                os.path.join(self.media_root, filename), "w", encoding="utf-8"
+            ) as data_file:
+                data_file.write('{"value": 1}')
+        self.checkpoint_path = os.path.join(self.media_root, "checkpoint")
+
+    def tearDown(self):
+        """tearDown"""
+        shutil.rmtree(self.media_root)
+
+    def _call_command(self, **kwargs):
+        """Call uploaddata command on the test files
+
+        Args:
+            kwargs:
+
+        Returns:
+            stdout, stderr
+
+        """
+        out = StringIO()
+        err = StringIO()
+        with override_settings(MEDIA_ROOT=self.media_root):
+            call_command(
+                "uploaddata",
+                path="*.json",
+                user=1,
+                template=1,
+                stdout=out,
+                stderr=err,
+                **kwargs,
+            )
+        return out.getvalue(), err.getvalue()
+
+    @patch.object(Data, "save")
+    @patch.object(Template, "objects")
+    @patch.object(User, "objects")
+    @patch("core_main_app.management.commands.uploaddata.default_storage")
+    def test_upload_data_with_workers_saves_all_data(
+        self,
+        mock_default_storage,
+        mock_user_objects,
+        mock_template_objects,
+        mock_data_save,
+    ):
+        """test_upload_data_with_workers_saves_all_data
+
+        Args:
+            mock_default_storage:
+            mock_user_objects:
+            mock_template_objects:
+            mock_data_save:
+
+        Returns:
+
+        """
+        mock_default_storage.exists.return_value = True
+        mock_user_objects.get.return_value = MagicMock()
+        mock_template_objects.get.return_value = MagicMock(
+            format="JSON", content='{"type": "object"}'
+        )
+
+        out, err = self._call_command(workers=2)
+
+        self.assertFalse(err)
+        self.assertEqual(mock_data_save.call_count, 3)
+        self.assertIn("Processed 3 documents (0 failures)", out)
+
+    @patch.object(Data, "save")
+    @patch.object(Template, "objects")
+    @patch.object(User, "objects")
+    @patch("core_main_app.management.commands.uploaddata.default_storage")
+    def test_upload_data_with_workers_reports_invalid_data(
+        self,
+        mock_default_storage,
+        mock_user_objects,
+        mock_template_objects,
+        mock_data_save,
+    ):
+        """test_upload_data_with_workers_reports_invalid_data
+
+        Args:
+            mock_default_storage:
+            mock_user_objects:
+            mock_template_objects:
+            mock_data_save:
+
+        Returns:
+
+        """
+        mock_default_storage.exists.return_value = True
+        mock_user_objects.get.return_value = MagicMock()
+        mock_template_objects.get.return_value = MagicMock(
+            format="JSON", content='{"type": "array"}'
+        )
+
+        out, err = self._call_command(workers=2)
+
+        self.assertIn("ERROR: Unable to create", err)
+        self.assertEqual(mock_data_save.call_count, 0)
+        self.assertIn("Processed 3 documents (3 failures)", out)
+
+    @patch.object(Data, "save")
+    @patch.object(Template, "objects")
+    @patch.object(User, "objects")
+    @patch("core_main_app.management.commands.uploaddata.default_storage")
+    def test_upload_data_skips_files_in_checkpoint_and_updates_it(
+        self,
+        mock_default_storage,
+        mock_user_objects,
+        mock_template_objects,
+        mock_data_save,
+    ):
+        """test_upload_data_skips_files_in_checkpoint_and_updates_it
+
+        Args:
+            mock_default_storage:
+            mock_user_objects:
+            mock_template_objects:
+            mock_data_save:
+
+        Returns:
+
+        """
+        mock_default_storage.exists.return_value = True
+        mock_user_objects.get.return_value = MagicMock()
+        mock_template_objects.get.return_value = MagicMock(format="JSON")
+        with open(
+            self.checkpoint_path, "w", encoding="utf-8"
+        ) as checkpoint_file:
+            checkpoint_file.write("data_1.json\n")
+
+        self._call_command(
+            no_validation=True, batch_size=1, checkpoint=self.checkpoint_path
+        )
+
+        self.assertEqual(mock_data_save.call_count, 2)
+        with open(
+            self.checkpoint_path, "r", encoding="utf-8"
+        ) as checkpoint_file:
+            self.assertEqual(
+                sorted(checkpoint_file.read().split()),
+                ["data_1.json", "data_2.json", "data_3.json"],
+            )
+
+    @patch.object(Data, "save")
+    @patch.object(Template, "objects")
+    @patch.object(User, "objects")
+    @patch("core_main_app.management.commands.uploaddata.default_storage")
+    def test_upload_data_retries_failed_files_listed_in_checkpoint(
+        self,
+        mock_default_storage,
+        mock_user_objects,
+        mock_template_objects,
+        mock_data_save,
+    ):
+        """test_upload_data_retries_failed_files_listed_in_checkpoint
+
+        Args:
+            mock_default_storage:
+            mock_user_objects:
+            mock_template_objects:
+            mock_data_save:
+
+        Returns:
+
+        """
+        mock_default_storage.exists.return_value = True
+        mock_user_objects.get.return_value = MagicMock()
+        mock_template_objects.get.return_value = MagicMock(
+            format="JSON", content='{"type": "array"}'
+        )
+
+        self._call_command(
+            workers=2, batch_size=1, checkpoint=self.checkpoint_path
+        )
+
+        self.assertEqual(mock_data_save.call_count, 0)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+        mock_template_objects.get.return_value = MagicMock(
+            format="JSON", content='{"type": "object"}'
+        )
+
+        _, err = self._call_command(
+            workers=2, batch_size=1, checkpoint=self.checkpoint_path
+        )
+
+        self.assertFalse(err)
+        self.assertEqual(mock_data_save.call_count, 3)
+        with open(
+            self.checkpoint_path, "r", encoding="utf-8"
+        ) as checkpoint_file:
+            self.assertEqual(
+                sorted(checkpoint_file.read().split()),
+                ["data_1.json", "data_2.json", "data_3.json"],
+            )
+
+    @patch.object(Data, "save")
+    @patch.object(Template, "objects")
+    @patch.object(User, "objects")
+    @patch("core_main_app.management.commands.uploaddata.default_storage")
+    def test_upload_data_dry_run_does_not_write_checkpoint(
+        self,
+        mock_default_storage,
+        mock_user_objects,
+        mock_template_objects,
+        mock_data_save,
+    ):
+        """test_upload_data_dry_run_does_not_write_checkpoint
+
+        Args:
+            mock_default_storage:
+            mock_user_objects:
+            mock_template_objects:
+            mock_data_save:
+
+        Returns:
+
+        """
+        mock_default_storage.exists.return_value = True
+        mock_user_objects.get.return_value = MagicMock()
+        mock_template_objects.get.return_value = MagicMock(format="JSON")
+
+        self._call_command(
+            no_validation=True, dry_run=True, checkpoint=self.checkpoint_path
+        )
+
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_upload_data_raises_command_error_if_workers_lower_than_one(
+        self,
+    ):
+        """test_upload_data_raises_command_error_if_workers_lower_than_one
+
+        Returns:
+
+        """
+        with self.assertRaises(CommandError):
+            self._call_command(workers=0)
+
+    @patch("core_main_app.management.commands.uploaddata.main_xml_utils")
+    @patch(
+        "core_main_app.management.commands.uploaddata.XERCES_VALIDATION", True
+    )
+    def test_upload_data_worker_validates_with_xerces_if_enabled(
+        self, mock_xml_utils
+    ):
+        """test_upload_data_worker_validates_with_xerces_if_enabled
+
+        Args:
+            mock_xml_utils:
+
+        Returns:
+
+        """
+        from core_main_app.management.commands import uploaddata
+
+        mock_xml_utils.validate_xml_data.return_value = None
+        with open(
+            os.path.join(self.media_root, "data.xml"), "w", encoding="utf-8"
+        ) as data_file:
+            data_file.write("<root/>")
+
+        uploaddata._init_worker(
+            Template.XSD,
+            '<schema xmlns="http://www.w3.org/2001/XMLSchema"/>',
+            True,
+        )
+        with override_settings(MEDIA_ROOT=self.media_root), patch(
+            "core_main_app.management.commands.uploaddata._convert_file"
+        ):
+            _, _, _, error = uploaddata._load_file_in_worker("data.xml")
+
+        self.assertIsNone(error)
+        mock_xml_utils.build_xml_schema.assert_not_called()
+        mock_xml_utils.validate_xml_data_with_schema.assert_not_called()
+        mock_xml_utils.validate_xml_data.assert_called_once()
+
+
 class TestUploadBlobCommand(TestCase):
     """Test Upload Blob command"""
 
@@ -1447,3 +1740,556 @@ class TestUploadBlobCommand(TestCase):
             "Command completed. Check logs for errors.", out.getvalue()
         )
         self.assertTrue(mock_blob_save.call_count == 2)
+
+
+class TestReindexMongoCommand(TestCase):
+    """Test Reindex Mongo command"""
+
+    def setUp(self):
+        """setUp"""
+        settings_override = override_settings(MONGODB_INDEXING=True)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.tmp_dir = tempfile.mkdtemp()
+        self.checkpoint_path = os.path.join(self.tmp_dir, "checkpoint")
+        self.mock_mongo_data = MagicMock()
+        self.mock_mongo_data.get_mongo_ids.return_value = {}
+        self.mock_mongo_data.from_data.side_effect = lambda data, mongo_id: (
+            MagicMock(
+                **{
+                    "to_mongo.return_value.to_dict.return_value": {
+                        "_id": data.id
+                    }
+                }
+            )
+        )
+        mock_module = MagicMock()
+        mock_module.MongoData = self.mock_mongo_data
+        patcher = patch.dict(
+            sys.modules,
+            {"core_main_app.components.mongo.models": mock_module},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "core_main_app.system.api.get_all_data_by_id_list",
+            side_effect=lambda data_ids: [
+                MagicMock(id=data_id) for data_id in data_ids
+            ],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """tearDown"""
+        shutil.rmtree(self.tmp_dir)
+
+    def _mock_queryset(self, mock_data, data_ids):
+        """Mock the queryset of data to reindex
+
+        Args:
+            mock_data:
+            data_ids:
+
+        Returns:
+
+        """
+        queryset = MagicMock()
+        queryset.filter.return_value = queryset
+        queryset.count.return_value = len(data_ids)
+        queryset.order_by.return_value.values_list.return_value.iterator.return_value = iter(
+            data_ids
+        )
+        mock_data.objects.all.return_value = queryset
+        return queryset
+
+    def test_reindex_mongo_raises_error_if_indexing_disabled(self):
+        """test_reindex_mongo_raises_error_if_indexing_disabled
+
+        Returns:
+
+        """
+        with override_settings(MONGODB_INDEXING=False), self.assertRaises(
+            CommandError
+        ):
+            call_command("reindex_mongo", stdout=StringIO())
+
+    def test_reindex_mongo_with_shadow_and_filter_raises_error(self):
+        """test_reindex_mongo_with_shadow_and_filter_raises_error
+
+        Returns:
+
+        """
+        with self.assertRaises(CommandError):
+            call_command(
+                "reindex_mongo", shadow=True, template=1, stdout=StringIO()
+            )
+
+    @patch("core_main_app.management.commands.reindex_mongo.Data")
+    def test_reindex_mongo_writes_data_in_batches(self, mock_data):
+        """test_reindex_mongo_writes_data_in_batches
+
+        Args:
+            mock_data:
+
+        Returns:
+
+        """
+        self._mock_queryset(mock_data, [1, 2, 3])
+
+        out = StringIO()
+        call_command("reindex_mongo", batch_size=2, stdout=out)
+
+        self.assertEqual(
+            [
+                call.args[0]
+                for call in self.mock_mongo_data.bulk_upsert_documents.call_args_list
+            ],
+            [[{"_id": 1}, {"_id": 2}], [{"_id": 3}]],
+        )
+        self.assertIn("3 data reindexed, 0 failures", out.getvalue())
+
+    @patch("core_main_app.management.commands.reindex_mongo.Data")
+    def test_reindex_mongo_logs_conversion_errors(self, mock_data):
+        """test_reindex_mongo_logs_conversion_errors
+
+        Args:
+            mock_data:
+
+        Returns:
+
+        """
+        self._mock_queryset(mock_data, [1])
+        self.mock_mongo_data.from_data.side_effect = Exception("error")
+
+        out = StringIO()
+        err = StringIO()
+        call_command("reindex_mongo", stdout=out, stderr=err)
+
+        self.assertIn("Unable to reindex data 1", err.getvalue())
+        self.assertIn("0 data reindexed, 1 failures", out.getvalue())
+
+    @patch("core_main_app.management.commands.reindex_mongo.Data")
+    def test_reindex_mongo_resumes_after_checkpoint(self, mock_data):
+        """test_reindex_mongo_resumes_after_checkpoint
+
+        Args:
+            mock_data:
+
+        Returns:
+
+        """
+        queryset = self._mock_queryset(mock_data, [3])
+        with open(self.checkpoint_path, "w", encoding="utf-8") as checkpoint:
+            checkpoint.write("2\n")
+
+        call_command(
+            "reindex_mongo", checkpoint=self.checkpoint_path, stdout=StringIO()
+        )
+
+        queryset.filter.assert_called_with(pk__gt=2)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    @patch("core_main_app.management.commands.reindex_mongo.Data")
+    def test_reindex_mongo_with_shadow_replaces_collection(self, mock_data):
+        """test_reindex_mongo_with_shadow_replaces_collection
+
+        Args:
+            mock_data:
+
+        Returns:
+
+        """
+        self._mock_queryset(mock_data, [1])
+        collection = self.mock_mongo_data._get_collection.return_value
+        collection.name = "mongo_data"
+        shadow_collection = collection.database.__getitem__.return_value
+
+        call_command("reindex_mongo", shadow=True, stdout=StringIO())
+
+        collection.database.__getitem__.assert_called_with(
+            "mongo_data_reindex"
+        )
+        shadow_collection.drop.assert_called_once()
+        self.assertEqual(
+            self.mock_mongo_data.bulk_upsert_documents.call_args.kwargs[
+                "collection"
+            ],
+            shadow_collection,
+        )
+        shadow_collection.rename.assert_called_once_with(
+            "mongo_data", dropTarget=True
+        )
+        shadow_collection.create_index.assert_called_once_with(
+            [("$**", "text")], default_language="en", language_override="en"
+        )
+
+    @patch("core_main_app.management.commands.reindex_mongo.Data")
+    def test_reindex_mongo_with_shadow_syncs_changes_before_replacing(
+        self, mock_data
+    ):
+        """test_reindex_mongo_with_shadow_syncs_changes_before_replacing
+
+        Args:
+            mock_data:
+
+        Returns:
+
+        """
+        last_change_date = datetime.datetime(2024, 1, 1, 12, 0, 0, 123456)
+        self._mock_queryset(mock_data, [1, 2, 3])
+        # data 2 updated and data 4 created during the build, data 3 deleted
+        mock_data.objects.order_by.return_value.values_list.return_value.iterator.side_effect = [
+            iter(
+                [
+                    (1, "1", None, 1, last_change_date),
+                    (2, "2", 1, 1, last_change_date),
+                    (4, "1", None, 1, last_change_date),
+                ]
+            ),
+            iter(
+                [
+                    (1, "1", None, 1, last_change_date),
+                    (2, "2", 1, 1, last_change_date),
+                    (4, "1", None, 1, last_change_date),
+                ]
+            ),
+        ]
+        collection = self.mock_mongo_data._get_collection.return_value
+        collection.name = "mongo_data"
+        shadow_collection = collection.database.__getitem__.return_value
+        indexed_date = last_change_date.replace(microsecond=123000)
+        shadow_collection.find.return_value.sort.return_value.batch_size.side_effect = [
+            [
+                {
+                    "_id": 1,
+                    "user_id": 1,
+                    "template": 1,
+                    "last_change_date": indexed_date,
+                },
+                {
+                    "_id": 2,
+                    "user_id": 1,
+                    "template": 1,
+                    "last_change_date": indexed_date,
+                },
+                {
+                    "_id": 3,
+                    "user_id": 1,
+                    "template": 1,
+                    "last_change_date": indexed_date,
+                },
+            ],
+            [
+                {
+                    "_id": 1,
+                    "user_id": 1,
+                    "template": 1,
+                    "last_change_date": indexed_date,
+                },
+                {
+                    "_id": 2,
+                    "user_id": 2,
+                    "workspace": 1,
+                    "template": 1,
+                    "last_change_date": indexed_date,
+                },
+                {
+                    "_id": 4,
+                    "user_id": 1,
+                    "template": 1,
+                    "last_change_date": indexed_date,
+                },
+            ],
+        ]
+        manager = MagicMock()
+        manager.attach_mock(shadow_collection.delete_many, "delete_many")
+        manager.attach_mock(shadow_collection.rename, "rename")
+
+        call_command("reindex_mongo", shadow=True, stdout=StringIO())
+
+        self.assertEqual(
+            self.mock_mongo_data.bulk_upsert_documents.call_args.args[0],
+            [{"_id": 2}, {"_id": 4}],
+        )
+        self.assertEqual(
+            manager.mock_calls,
+            [
+                call.delete_many({"_id": {"$in": [3]}}),
+                call.rename("mongo_data", dropTarget=True),
+            ],
+        )
+
+
+class TestUpdateSearchVectorsCommand(TestCase):
+    """Test Update Search Vectors command"""
+
+    def setUp(self):
+        """setUp"""
+        settings_override = override_settings(MONGODB_INDEXING=False)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @patch(
+        "core_main_app.management.commands.update_search_vectors.uses_postgresql_backend"
+    )
+    def test_update_search_vectors_raises_error_without_postgresql(
+        self, mock_postgresql
+    ):
+        """test_update_search_vectors_raises_error_without_postgresql
+
+        Args:
+            mock_postgresql:
+
+        Returns:
+
+        """
+        mock_postgresql.return_value = False
+        with self.assertRaises(CommandError):
+            call_command("update_search_vectors", stdout=StringIO())
+
+    @patch(
+        "core_main_app.management.commands.update_search_vectors.uses_postgresql_backend"
+    )
+    def test_update_search_vectors_raises_error_with_mongodb(
+        self, mock_postgresql
+    ):
+        """test_update_search_vectors_raises_error_with_mongodb
+
+        Args:
+            mock_postgresql:
+
+        Returns:
+
+        """
+        mock_postgresql.return_value = True
+        with override_settings(MONGODB_INDEXING=True), self.assertRaises(
+            CommandError
+        ):
+            call_command("update_search_vectors", stdout=StringIO())
+
+    @patch(
+        "core_main_app.management.commands.update_search_vectors.update_search_vectors"
+    )
+    @patch(
+        "core_main_app.management.commands.update_search_vectors.uses_postgresql_backend"
+    )
+    def test_update_search_vectors_updates_all_chunks(
+        self, mock_postgresql, mock_update
+    ):
+        """test_update_search_vectors_updates_all_chunks
+
+        Args:
+            mock_postgresql:
+            mock_update:
+
+        Returns:
+
+        """
+        mock_postgresql.return_value = True
+        mock_update.side_effect = [[1, 2], [3], []]
+        out = StringIO()
+        call_command("update_search_vectors", "--batch-size", "2", stdout=out)
+        self.assertEqual(
+            [call.args[1:] for call in mock_update.call_args_list],
+            [(0, 2), (2, 2), (3, 2)],
+        )
+        self.assertIn("3 data updated", out.getvalue())
+
+
+class TestUpdateDataIndexesCommand(TestCase):
+    """Test Update Data Indexes command"""
+
+    def setUp(self):
+        """setUp"""
+        settings_override = override_settings(MONGODB_INDEXING=False)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @patch(
+        "core_main_app.management.commands.update_data_indexes.uses_postgresql_backend"
+    )
+    def test_update_data_indexes_raises_error_without_postgresql(
+        self, mock_postgresql
+    ):
+        """test_update_data_indexes_raises_error_without_postgresql
+
+        Args:
+            mock_postgresql:
+
+        Returns:
+
+        """
+        mock_postgresql.return_value = False
+        with self.assertRaises(CommandError):
+            call_command("update_data_indexes", stdout=StringIO())
+
+    @patch(
+        "core_main_app.management.commands.update_data_indexes.update_indexes"
+    )
+    @patch(
+        "core_main_app.management.commands.update_data_indexes.uses_postgresql_backend"
+    )
+    def test_update_data_indexes_raises_error_with_invalid_settings(
+        self, mock_postgresql, mock_update_indexes
+    ):
+        """test_update_data_indexes_raises_error_with_invalid_settings
+
+        Args:
+            mock_postgresql:
+            mock_update_indexes:
+
+        Returns:
+
+        """
+        mock_postgresql.return_value = True
+        mock_update_indexes.side_effect = ValueError("Unsupported type")
+        with self.assertRaises(CommandError):
+            call_command("update_data_indexes", stdout=StringIO())
+
+    @patch(
+        "core_main_app.management.commands.update_data_indexes.update_indexes"
+    )
+    @patch(
+        "core_main_app.management.commands.update_data_indexes.uses_postgresql_backend"
+    )
+    def test_update_data_indexes_prints_statements(
+        self, mock_postgresql, mock_update_indexes
+    ):
+        """test_update_data_indexes_prints_statements
+
+        Args:
+            mock_postgresql:
+            mock_update_indexes:
+
+        Returns:
+
+        """
+        mock_postgresql.return_value = True
+        mock_update_indexes.return_value = [("DROP INDEX index_name", [])]
+        out = StringIO()
+        call_command("update_data_indexes", "--dry-run", stdout=out)
+        self.assertTrue(mock_update_indexes.call_args.kwargs["dry_run"])
+        self.assertIn("DROP INDEX index_name", out.getvalue())
+
+
+class TestUpdateMongoIndexesCommand(TestCase):
+    """Test Update Mongo Indexes command"""
+
+    def setUp(self):
+        """setUp"""
+        settings_override = override_settings(MONGODB_INDEXING=True)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.mock_collection = MagicMock()
+        mock_module = MagicMock()
+        mock_module.MongoData._get_collection.return_value = (
+            self.mock_collection
+        )
+        patcher = patch.dict(
+            sys.modules,
+            {"core_main_app.components.mongo.models": mock_module},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "core_main_app.utils.databases.mongo.indexes.get_index_models",
+            return_value={"index_1": MagicMock(), "index_2": MagicMock()},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "core_main_app.utils.databases.mongo.indexes.get_managed_index_names",
+            return_value={"index_2", "index_3"},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "core_main_app.utils.databases.mongo.indexes.get_index_sizes",
+            return_value={"index_2": 1024 * 1024},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "core_main_app.utils.databases.mongo.indexes.create_indexes"
+        )
+        self.mock_create_indexes = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_update_mongo_indexes_raises_error_if_indexing_disabled(self):
+        """test_update_mongo_indexes_raises_error_if_indexing_disabled
+
+        Returns:
+
+        """
+        with override_settings(MONGODB_INDEXING=False), self.assertRaises(
+            CommandError
+        ):
+            call_command("update_mongo_indexes", stdout=StringIO())
+
+    def test_update_mongo_indexes_creates_missing_and_drops_removed(self):
+        """test_update_mongo_indexes_creates_missing_and_drops_removed
+
+        Returns:
+
+        """
+        out = StringIO()
+        call_command("update_mongo_indexes", stdout=out)
+        self.mock_collection.drop_index.assert_called_once_with("index_3")
+        self.mock_create_indexes.assert_called_once_with(
+            self.mock_collection, {"index_1"}
+        )
+        self.assertIn("1 indexes created, 1 indexes dropped", out.getvalue())
+        self.assertIn("Index index_2: 1.00 MB", out.getvalue())
+
+    def test_update_mongo_indexes_dry_run_does_not_update_indexes(self):
+        """test_update_mongo_indexes_dry_run_does_not_update_indexes
+
+        Returns:
+
+        """
+        out = StringIO()
+        call_command("update_mongo_indexes", "--dry-run", stdout=out)
+        self.mock_collection.drop_index.assert_not_called()
+        self.mock_create_indexes.assert_not_called()
+        self.assertIn("Create index: index_1", out.getvalue())
+        self.assertIn("Drop index: index_3", out.getvalue())
+
+    @patch(
+        "core_main_app.utils.databases.mongo.indexes.get_unused_index_names"
+    )
+    def test_update_mongo_indexes_drops_unused_indexes(
+        self, mock_get_unused_index_names
+    ):
+        """test_update_mongo_indexes_drops_unused_indexes
+
+        Args:
+            mock_get_unused_index_names:
+
+        Returns:
+
+        """
+        mock_get_unused_index_names.return_value = {"index_2"}
+        out = StringIO()
+        call_command("update_mongo_indexes", "--drop-unused", "30", stdout=out)
+        mock_get_unused_index_names.assert_called_once_with(
+            self.mock_collection, 30
+        )
+        self.assertEqual(
+            {
+                call.args[0]
+                for call in self.mock_collection.drop_index.call_args_list
+            },
+            {"index_2", "index_3"},
+        )
+        self.assertIn("Index index_2 not used for 30 days", out.getvalue())
+
+    def test_update_mongo_indexes_raises_error_if_creation_fails(self):
+        """test_update_mongo_indexes_raises_error_if_creation_fails
+
+        Returns:
+
+        """
+        self.mock_create_indexes.side_effect = Exception("error")
+        with self.assertRaises(CommandError):
+            call_command("update_mongo_indexes", stdout=StringIO())
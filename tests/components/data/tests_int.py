@@ -942,6 +942,127 @@ class TestGetAllByWorkspace(IntegrationBaseTestCase):
         )
 
 
+class TestDataProject(IntegrationBaseTestCase):
+    """Test Data Project"""
+
+    fixture = fixture_data
+
+    def test_project_defers_large_fields_by_default(self):
+        """test_project_defers_large_fields_by_default
+
+        Returns:
+
+        """
+        # Act
+        data_list = list(data_api.project(Data.objects.all()))
+
+        # Assert
+        self.assertEqual(len(data_list), 3)
+        for data in data_list:
+            self.assertEqual(
+                data.get_deferred_fields(),
+                {"dict_content", "file_history", "vector_column"},
+            )
+
+    def test_project_only_loads_fields(self):
+        """test_project_only_loads_fields
+
+        Returns:
+
+        """
+        # Act
+        data = data_api.project(
+            Data.objects.all(), ["title", "template", "content"]
+        ).first()
+
+        # Assert
+        self.assertNotIn("title", data.get_deferred_fields())
+        self.assertNotIn("template", data.get_deferred_fields())
+        self.assertNotIn("file", data.get_deferred_fields())
+        self.assertIn("dict_content", data.get_deferred_fields())
+        self.assertIn("user_id", data.get_deferred_fields())
+
+    def test_project_returns_same_content(self):
+        """test_project_returns_same_content
+
+        Returns:
+
+        """
+        # Arrange
+        data = Data(template=self.fixture.template, user_id="1", title="data")
+        data.content = "<tag>value</tag>"
+        data.convert_and_save()
+
+        # Act
+        projected_data = data_api.project(
+            Data.objects.filter(pk=data.pk), ["content"]
+        ).first()
+
+        # Assert
+        self.assertEqual(projected_data.content, "<tag>value</tag>")
+
+    def test_project_list_returns_list(self):
+        """test_project_list_returns_list
+
+        Returns:
+
+        """
+        # Arrange
+        data_list = [self.fixture.data_1]
+
+        # Act # Assert
+        self.assertEqual(data_api.project(data_list), data_list)
+
+
+class TestDataContentFromStorage(IntegrationBaseTestCase):
+    """Test Data Content From Storage"""
+
+    fixture = fixture_data
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        data = Data(template=self.fixture.template, user_id="1", title="data")
+        data.content = "<tag>été</tag>"
+        data.convert_and_save()
+        self.data = Data.objects.get(pk=data.pk)
+
+    def test_content_is_read_from_storage(self):
+        """test_content_is_read_from_storage
+
+        Returns:
+
+        """
+        self.assertFalse(self.data.content_loaded)
+        self.assertEqual(self.data.content, "<tag>été</tag>")
+        self.assertTrue(self.data.content_loaded)
+
+    def test_open_content_returns_file_content(self):
+        """test_open_content_returns_file_content
+
+        Returns:
+
+        """
+        with self.data.open_content() as file:
+            self.assertEqual(file.read(), "<tag>été</tag>".encode("utf-8"))
+        self.assertFalse(self.data.content_loaded)
+
+    def test_checksum_from_storage_is_checksum_of_content(self):
+        """test_checksum_from_storage_is_checksum_of_content
+
+        Returns:
+
+        """
+        checksum = self.data.checksum
+        self.data.checksum = None
+        self.assertEqual(self.data.compute_content_checksum(), checksum)
+        self.assertFalse(self.data.content_loaded)
+
+
 class TestGetByIdList(IntegrationBaseTestCase):
     """TestGetByIdList"""
 
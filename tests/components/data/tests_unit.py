@@ -1,14 +1,18 @@
 """Unit Test Data"""
 
 import json
+import sys
 from collections import OrderedDict
 from json import JSONDecodeError
 from time import sleep
 from unittest.case import TestCase
 from unittest.mock import patch, MagicMock
 
+from celery.exceptions import Ignore, Retry
 from django.contrib import admin
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import override_settings
 from django.urls import reverse, resolve
 from django.utils.safestring import SafeString
 from rest_framework import status
@@ -19,13 +23,24 @@ from core_main_app.commons.exceptions import CoreError, DoesNotExist
 from core_main_app.components.abstract_data.models import AbstractData
 from core_main_app.components.blob.models import Blob
 from core_main_app.components.data import api as data_api
-from core_main_app.components.data.admin_site import CustomDataAdmin
+from core_main_app.components.data.admin_site import (
+    CustomDataAdmin,
+    DataChangeList,
+)
+from core_main_app.components.data import tasks as data_tasks
 from core_main_app.components.data.models import Data
+from core_main_app.components.mongo import models as mongo_models
 from core_main_app.components.template.models import Template
+from core_main_app.settings import (
+    SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+    XML_FORCE_LIST,
+    XML_POST_PROCESSOR,
+)
 from core_main_app.utils.datetime import datetime_now, datetime_timedelta
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
 from core_main_app.utils.tests_tools.RequestMock import create_mock_request
+from core_main_app.utils.xml import build_xml_data_tree, raw_xml_to_dict
 
 
 class TestDataGetById(TestCase):
@@ -833,6 +848,81 @@ class TestDataCheckXmlFileIsValid(TestCase):
         self.assertEqual(result, True)
 
 
+class TestDataSingleParse(TestCase):
+    """TestDataSingleParse"""
+
+    @patch.object(Data, "save")
+    def test_data_upsert_parses_xml_content_once(self, mock_save):
+        """test_data_upsert_parses_xml_content_once
+
+        Args:
+            mock_save:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_request = create_mock_request(user=create_mock_user("3"))
+        data = _create_data(
+            _get_template(), user_id="3", title="title", content="<tag>1</tag>"
+        )
+        # Act
+        with patch(
+            "core_main_app.components.abstract_data.models.build_xml_data_tree",
+            wraps=build_xml_data_tree,
+        ) as mock_build_xml_data_tree:
+            data_api.upsert(data, mock_request)
+        # Assert
+        self.assertEqual(mock_build_xml_data_tree.call_count, 1)
+        self.assertEqual(
+            data.dict_content,
+            raw_xml_to_dict(
+                "<tag>1</tag>",
+                postprocessor=XML_POST_PROCESSOR,
+                force_list=XML_FORCE_LIST,
+                list_limit=SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+            ),
+        )
+        self.assertIsNone(data._xml_tree)
+
+    def test_set_content_resets_parsed_content(self):
+        """test_set_content_resets_parsed_content
+
+        Returns:
+
+        """
+        # Arrange
+        data = _create_data(
+            _get_template(), user_id="3", title="title", content="<tag>1</tag>"
+        )
+        data.get_xml_tree()
+        # Act
+        data.content = "<tag>2</tag>"
+        # Assert
+        self.assertEqual(data.encode_content(), b"<tag>2</tag>")
+        self.assertEqual(data.get_xml_tree().getroot().text, "2")
+
+    @patch(
+        "core_main_app.components.abstract_data.models.CHECKSUM_ALGORITHM",
+        "SHA256",
+    )
+    def test_checksum_of_encoded_content_is_checksum_of_content(self):
+        """test_checksum_of_encoded_content_is_checksum_of_content
+
+        Returns:
+
+        """
+        # Arrange
+        data = _create_data(
+            _get_template(), user_id="3", title="title", content="<tag>é</tag>"
+        )
+        expected_checksum = data.compute_content_checksum()
+        # Act
+        data.encode_content()
+        # Assert
+        self.assertEqual(data.compute_content_checksum(), expected_checksum)
+
+
 class TestDataCheckJsonFileIsValid(TestCase):
     """TestDataCheckJsonFileIsValid"""
 
@@ -1274,6 +1364,100 @@ class TestAbstractData(TestCase):
             abs_data.convert_to_file()
 
 
+class TestDataSaveObjectSearchVector(TestCase):
+    """TestDataSaveObjectSearchVector"""
+
+    @patch("core_main_app.components.abstract_data.models.settings")
+    @patch(
+        "core_main_app.components.abstract_data.models.uses_postgresql_backend"
+    )
+    @patch.object(Data, "update_search_vector")
+    @patch.object(Data, "save")
+    def test_save_object_updates_search_vector_with_postgresql(
+        self, mock_save, mock_update, mock_postgresql, mock_settings
+    ):
+        """test_save_object_updates_search_vector_with_postgresql
+
+        Args:
+            mock_save:
+            mock_update:
+            mock_postgresql:
+            mock_settings:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_postgresql.return_value = True
+        mock_settings.MONGODB_INDEXING = False
+        data = _create_data(
+            _get_template(), user_id="3", title="title", content="<tag></tag>"
+        )
+        # Act
+        data.save_object()
+        # Assert
+        mock_update.assert_called_once()
+
+    @patch("core_main_app.components.abstract_data.models.settings")
+    @patch(
+        "core_main_app.components.abstract_data.models.uses_postgresql_backend"
+    )
+    @patch.object(Data, "update_search_vector")
+    @patch.object(Data, "save")
+    def test_save_object_does_not_update_search_vector_with_mongodb(
+        self, mock_save, mock_update, mock_postgresql, mock_settings
+    ):
+        """test_save_object_does_not_update_search_vector_with_mongodb
+
+        Args:
+            mock_save:
+            mock_update:
+            mock_postgresql:
+            mock_settings:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_postgresql.return_value = True
+        mock_settings.MONGODB_INDEXING = True
+        data = _create_data(
+            _get_template(), user_id="3", title="title", content="<tag></tag>"
+        )
+        # Act
+        data.save_object()
+        # Assert
+        mock_update.assert_not_called()
+
+    @patch(
+        "core_main_app.components.abstract_data.models.uses_postgresql_backend"
+    )
+    @patch.object(Data, "update_search_vector")
+    @patch.object(Data, "save")
+    def test_save_object_does_not_update_search_vector_without_postgresql(
+        self, mock_save, mock_update, mock_postgresql
+    ):
+        """test_save_object_does_not_update_search_vector_without_postgresql
+
+        Args:
+            mock_save:
+            mock_update:
+            mock_postgresql:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_postgresql.return_value = False
+        data = _create_data(
+            _get_template(), user_id="3", title="title", content="<tag></tag>"
+        )
+        # Act
+        data.save_object()
+        # Assert
+        mock_update.assert_not_called()
+
+
 class TestCustomDataAdminViews(TestCase):
     """Test Custom Data Admin Views"""
 
@@ -1626,3 +1810,790 @@ def _create_blob(user_id, filename="test", content=b"test"):
             content=content,
         ),
     )
+
+
+class TestDataChangeList(TestCase):
+    """Test Data Change List"""
+
+    def test_custom_data_admin_uses_data_change_list(self):
+        """test_custom_data_admin_uses_data_change_list
+
+        Returns:
+
+        """
+        model_admin = CustomDataAdmin(Data, admin.site)
+        self.assertEqual(
+            model_admin.get_changelist(create_mock_request()), DataChangeList
+        )
+
+    @patch("core_main_app.components.data.admin_site.user_api.set_owner_names")
+    @patch("django.contrib.admin.views.main.ChangeList.get_results")
+    def test_get_results_sets_owner_names_of_page(
+        self, mock_get_results, mock_set_owner_names
+    ):
+        """test_get_results_sets_owner_names_of_page
+
+        Args:
+            mock_get_results:
+            mock_set_owner_names:
+
+        Returns:
+
+        """
+        # Arrange
+        change_list = DataChangeList.__new__(DataChangeList)
+        change_list.result_list = [Data(user_id="1"), Data(user_id="2")]
+
+        # Act
+        change_list.get_results(create_mock_request())
+
+        # Assert
+        mock_get_results.assert_called_once()
+        mock_set_owner_names.assert_called_once_with(change_list.result_list)
+
+
+class TestMongoDataBulkTasks(TestCase):
+    """TestMongoDataBulkTasks"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.mock_mongo_data = MagicMock()
+        mock_module = MagicMock()
+        mock_module.MongoData = self.mock_mongo_data
+        patcher = patch.dict(
+            sys.modules,
+            {"core_main_app.components.mongo.models": mock_module},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("core_main_app.components.data.tasks.MONGODB_BULK_BATCH_SIZE", 2)
+    @patch("core_main_app.system.api.get_all_data_by_id_list")
+    def test_index_mongo_data_list_indexes_data_in_batches(
+        self, mock_get_all_data_by_id_list
+    ):
+        """test_index_mongo_data_list_indexes_data_in_batches
+
+        Args:
+            mock_get_all_data_by_id_list:
+
+        Returns:
+
+        """
+        # Act
+        data_tasks.index_mongo_data_list([1, 2, 3])
+
+        # Assert
+        self.assertEqual(
+            [
+                call.args[0]
+                for call in mock_get_all_data_by_id_list.call_args_list
+            ],
+            [[1, 2], [3]],
+        )
+        self.assertEqual(self.mock_mongo_data.bulk_upsert.call_count, 2)
+
+    def test_update_mongo_data_user_updates_all_data_at_once(self):
+        """test_update_mongo_data_user_updates_all_data_at_once
+
+        Returns:
+
+        """
+        # Act
+        data_tasks.update_mongo_data_user([1, 2, 3], "4")
+
+        # Assert
+        self.mock_mongo_data.bulk_update_fields.assert_called_once_with(
+            [1, 2, 3], user_id="4"
+        )
+        self.mock_mongo_data.objects.get.assert_not_called()
+
+    def test_update_mongo_data_workspace_updates_all_data_at_once(self):
+        """test_update_mongo_data_workspace_updates_all_data_at_once
+
+        Returns:
+
+        """
+        # Act
+        data_tasks.update_mongo_data_workspace([1, 2, 3], 5)
+
+        # Assert
+        self.mock_mongo_data.bulk_update_fields.assert_called_once_with(
+            [1, 2, 3], _workspace_id=5
+        )
+
+
+class TestWarmRenderedHtmlCacheTask(TestCase):
+    """TestWarmRenderedHtmlCacheTask"""
+
+    @patch("core_main_app.components.data.tasks.RENDERED_HTML_CACHE_TTL", 60)
+    @patch(
+        "core_main_app.templatetags.xsl_transform_tag.render_xml_as_html_detail"
+    )
+    @patch("core_main_app.components.template_html_rendering.api.render_many")
+    @patch(
+        "core_main_app.components.template_html_rendering.api.get_by_template_id"
+    )
+    @patch("core_main_app.system.api.get_all_data_by_id_list")
+    def test_warm_rendered_html_cache_renders_data(
+        self,
+        mock_get_all_data_by_id_list,
+        mock_get_by_template_id,
+        mock_render_many,
+        mock_render_xml_as_html_detail,
+    ):
+        """test_warm_rendered_html_cache_renders_data
+
+        Args:
+            mock_get_all_data_by_id_list:
+            mock_get_by_template_id:
+            mock_render_many:
+            mock_render_xml_as_html_detail:
+
+        Returns:
+
+        """
+        # Arrange
+        template_html_rendering = MagicMock(
+            list_rendering="<p>list</p>", detail_rendering=""
+        )
+        mock_get_by_template_id.return_value = template_html_rendering
+        data_list = [
+            MagicMock(template_id=1, template=MagicMock(format=Template.XSD))
+            for _ in range(2)
+        ]
+        mock_get_all_data_by_id_list.return_value = data_list
+
+        # Act
+        data_tasks.warm_rendered_html_cache([1, 2])
+
+        # Assert
+        mock_get_by_template_id.assert_called_once_with(1)
+        mock_render_many.assert_called_once_with(
+            template_html_rendering, data_list, "list_rendering"
+        )
+        self.assertEqual(mock_render_xml_as_html_detail.call_count, 2)
+
+    @patch("core_main_app.components.data.tasks.RENDERED_HTML_CACHE_TTL", 60)
+    @patch(
+        "core_main_app.templatetags.xsl_transform_tag.render_xml_as_html_detail"
+    )
+    @patch(
+        "core_main_app.components.template_html_rendering.api.get_by_template_id"
+    )
+    @patch("core_main_app.system.api.get_all_data_by_id_list")
+    def test_warm_rendered_html_cache_continues_if_data_fails_to_render(
+        self,
+        mock_get_all_data_by_id_list,
+        mock_get_by_template_id,
+        mock_render_xml_as_html_detail,
+    ):
+        """test_warm_rendered_html_cache_continues_if_data_fails_to_render
+
+        Args:
+            mock_get_all_data_by_id_list:
+            mock_get_by_template_id:
+            mock_render_xml_as_html_detail:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_by_template_id.side_effect = DoesNotExist("error")
+        data_list = [
+            MagicMock(template_id=1, template=MagicMock(format=Template.XSD))
+            for _ in range(2)
+        ]
+        mock_get_all_data_by_id_list.return_value = data_list
+        mock_render_xml_as_html_detail.side_effect = [Exception("error"), ""]
+
+        # Act
+        data_tasks.warm_rendered_html_cache([1, 2])
+
+        # Assert
+        self.assertEqual(mock_render_xml_as_html_detail.call_count, 2)
+        self.assertEqual(
+            mock_render_xml_as_html_detail.call_args.kwargs["data"],
+            data_list[1],
+        )
+
+    @patch("core_main_app.components.data.tasks.RENDERED_HTML_CACHE_TTL", 0)
+    @patch("core_main_app.system.api.get_all_data_by_id_list")
+    def test_warm_rendered_html_cache_does_nothing_if_cache_disabled(
+        self, mock_get_all_data_by_id_list
+    ):
+        """test_warm_rendered_html_cache_does_nothing_if_cache_disabled
+
+        Args:
+            mock_get_all_data_by_id_list:
+
+        Returns:
+
+        """
+        # Act
+        data_tasks.warm_rendered_html_cache([1, 2])
+
+        # Assert
+        mock_get_all_data_by_id_list.assert_not_called()
+
+
+class TestDataMigrationChunkTasks(TestCase):
+    """TestDataMigrationChunkTasks"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.target_template = MagicMock(format=Template.XSD)
+        self.data_list = [MagicMock(id=data_id) for data_id in range(1, 6)]
+
+    @patch("core_main_app.components.data.tasks.DATA_MIGRATION_CHUNK_SIZE", 2)
+    @patch("core_main_app.components.data_migration.api.get_or_create")
+    @patch("core_main_app.system.api.get_template_by_id")
+    @patch("core_main_app.components.user.api.get_user_by_id")
+    def test_async_migration_task_fans_out_chunks_in_worker(
+        self,
+        mock_get_user_by_id,
+        mock_get_template_by_id,
+        mock_get_or_create,
+    ):
+        """test_async_migration_task_fans_out_chunks_in_worker
+
+        Args:
+            mock_get_user_by_id:
+            mock_get_template_by_id:
+            mock_get_or_create:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_user_by_id.return_value = create_mock_user(1, is_staff=True)
+        task = data_tasks.async_migration_task
+        task.push_request(id="task_id", called_directly=False)
+
+        # Act
+        try:
+            with patch.object(
+                task, "replace", side_effect=Ignore
+            ) as mock_replace, patch.object(
+                task, "update_state"
+            ) as mock_update_state:
+                with self.assertRaises(Ignore):
+                    task.run(["1", "2", "3", "4", "5"], None, "1", 1, False)
+        finally:
+            task.pop_request()
+
+        # Assert
+        mock_get_or_create.assert_called_once_with(
+            "task_id", 1, mock_get_template_by_id.return_value.id, False
+        )
+        chunk_tasks = mock_replace.call_args.args[0].tasks
+        self.assertEqual(
+            [chunk_task.kwargs["data_ids"] for chunk_task in chunk_tasks],
+            [["1", "2"], ["3", "4"], ["5"]],
+        )
+        self.assertTrue(
+            all(
+                chunk_task.kwargs["parent_task_id"] == "task_id"
+                for chunk_task in chunk_tasks
+            )
+        )
+        meta = mock_update_state.call_args.kwargs["meta"]
+        self.assertEqual(
+            meta["chunks"],
+            [
+                [chunk_task.id, len(chunk_task.kwargs["data_ids"]), None]
+                for chunk_task in chunk_tasks
+            ],
+        )
+
+    @patch("core_main_app.components.data.tasks.DATA_MIGRATION_CHUNK_SIZE", 2)
+    @patch("core_main_app.components.data.api.check_xml_file_is_valid")
+    @patch("core_main_app.components.data.api.get_by_id")
+    @patch("core_main_app.system.api.get_template_by_id")
+    @patch("core_main_app.components.user.api.get_user_by_id")
+    def test_async_migration_task_called_directly_migrates_all_data(
+        self,
+        mock_get_user_by_id,
+        mock_get_template_by_id,
+        mock_get_by_id,
+        mock_check_xml_file_is_valid,
+    ):
+        """test_async_migration_task_called_directly_migrates_all_data
+
+        Args:
+            mock_get_user_by_id:
+            mock_get_template_by_id:
+            mock_get_by_id:
+            mock_check_xml_file_is_valid:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_user_by_id.return_value = create_mock_user(1, is_staff=True)
+        mock_get_template_by_id.return_value = self.target_template
+        mock_get_by_id.side_effect = self.data_list
+        mock_check_xml_file_is_valid.side_effect = [
+            True,
+            exceptions.XMLError("error"),
+            True,
+            True,
+            True,
+        ]
+
+        # Act
+        result = data_tasks.async_migration_task(
+            ["1", "2", "3", "4", "5"], None, "1", 1, False
+        )
+
+        # Assert
+        self.assertEqual(
+            result, {"valid": ["1", "3", "4", "5"], "wrong": ["2"]}
+        )
+
+    @patch("core_main_app.components.data.api.check_xml_file_is_valid")
+    @patch("core_main_app.components.data.api.get_by_id")
+    @patch("core_main_app.system.api.get_template_by_id")
+    @patch("core_main_app.components.user.api.get_user_by_id")
+    def test_migrate_data_chunk_task_retries_with_remaining_data(
+        self,
+        mock_get_user_by_id,
+        mock_get_template_by_id,
+        mock_get_by_id,
+        mock_check_xml_file_is_valid,
+    ):
+        """test_migrate_data_chunk_task_retries_with_remaining_data
+
+        Args:
+            mock_get_user_by_id:
+            mock_get_template_by_id:
+            mock_get_by_id:
+            mock_check_xml_file_is_valid:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_user_by_id.return_value = create_mock_user(1, is_staff=True)
+        mock_get_template_by_id.return_value = self.target_template
+        mock_get_by_id.side_effect = [self.data_list[0], Exception("error")]
+        task = data_tasks.migrate_data_chunk_task
+
+        # Act
+        with patch.object(task, "retry", side_effect=Retry) as mock_retry:
+            with self.assertRaises(Retry):
+                task(
+                    data_ids=["1", "2", "3"],
+                    xslt_id=None,
+                    template_id="1",
+                    user_id=1,
+                    migrate=False,
+                )
+
+        # Assert
+        self.assertEqual(
+            mock_retry.call_args.kwargs["kwargs"]["results"],
+            {"valid": ["1"], "wrong": []},
+        )
+
+    @patch("core_main_app.components.data.api.check_xml_file_is_valid")
+    @patch("core_main_app.components.data.api.get_by_id")
+    @patch("core_main_app.system.api.get_template_by_id")
+    @patch("core_main_app.components.user.api.get_user_by_id")
+    def test_migrate_data_chunk_task_resumes_from_previous_results(
+        self,
+        mock_get_user_by_id,
+        mock_get_template_by_id,
+        mock_get_by_id,
+        mock_check_xml_file_is_valid,
+    ):
+        """test_migrate_data_chunk_task_resumes_from_previous_results
+
+        Args:
+            mock_get_user_by_id:
+            mock_get_template_by_id:
+            mock_get_by_id:
+            mock_check_xml_file_is_valid:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_user_by_id.return_value = create_mock_user(1, is_staff=True)
+        mock_get_template_by_id.return_value = self.target_template
+        mock_get_by_id.side_effect = self.data_list[1:3]
+
+        # Act
+        result = data_tasks.migrate_data_chunk_task(
+            data_ids=["1", "2", "3"],
+            xslt_id=None,
+            template_id="1",
+            user_id=1,
+            migrate=False,
+            results={"valid": [], "wrong": ["1"]},
+        )
+
+        # Assert
+        self.assertEqual(
+            [call.args[0] for call in mock_get_by_id.call_args_list],
+            ["2", "3"],
+        )
+        self.assertEqual(result, {"valid": ["2", "3"], "wrong": ["1"]})
+
+    @patch("core_main_app.components.data.tasks.is_task_cancelled")
+    @patch("core_main_app.components.data_migration.api.get_by_task_id")
+    @patch("core_main_app.components.data.api.get_by_id")
+    def test_migrate_data_chunk_task_stops_when_migration_cancelled(
+        self, mock_get_by_id, mock_get_by_task_id, mock_is_task_cancelled
+    ):
+        """test_migrate_data_chunk_task_stops_when_migration_cancelled
+
+        Args:
+            mock_get_by_id:
+            mock_get_by_task_id:
+            mock_is_task_cancelled:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_by_task_id.side_effect = DoesNotExist("error")
+        mock_is_task_cancelled.return_value = True
+
+        # Act
+        result = data_tasks.migrate_data_chunk_task(
+            data_ids=["1", "2"],
+            xslt_id=None,
+            template_id="1",
+            user_id=1,
+            migrate=False,
+            parent_task_id="task_id",
+        )
+
+        # Assert
+        mock_is_task_cancelled.assert_called_with("task_id")
+        mock_get_by_id.assert_not_called()
+        self.assertEqual(result, {"valid": [], "wrong": []})
+
+    @patch("core_main_app.components.data.tasks.is_task_cancelled")
+    def test_merge_migration_results_merges_chunk_results(
+        self, mock_is_task_cancelled
+    ):
+        """test_merge_migration_results_merges_chunk_results
+
+        Args:
+            mock_is_task_cancelled:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_is_task_cancelled.return_value = False
+
+        # Act
+        result = data_tasks.merge_migration_results(
+            [
+                {"valid": ["1"], "wrong": ["2"]},
+                {"valid": ["3", "4"], "wrong": []},
+            ]
+        )
+
+        # Assert
+        self.assertEqual(result, {"valid": ["1", "3", "4"], "wrong": ["2"]})
+
+    @patch("core_main_app.components.data.tasks.AsyncResult")
+    def test_get_task_progress_aggregates_chunk_progress(
+        self, mock_async_result
+    ):
+        """test_get_task_progress_aggregates_chunk_progress
+
+        Args:
+            mock_async_result:
+
+        Returns:
+
+        """
+        # Arrange
+        results = {
+            "task_id": MagicMock(
+                state="PROGRESS",
+                info={
+                    "current": 0,
+                    "total": 5,
+                    "chunks": [
+                        ["chunk_1", 2, None],
+                        ["chunk_2", 2, None],
+                        ["chunk_3", 1, None],
+                    ],
+                },
+            ),
+            "chunk_1": MagicMock(
+                state="SUCCESS", result={"valid": ["1"], "wrong": ["2"]}
+            ),
+            "chunk_2": MagicMock(
+                state="PROGRESS", info={"current": 1, "total": 2}
+            ),
+            "chunk_3": MagicMock(state="PENDING", info=None),
+        }
+        mock_async_result.side_effect = results.get
+
+        # Act
+        result = data_tasks.get_task_progress("task_id")
+
+        # Assert
+        self.assertEqual(
+            result,
+            {"state": "PROGRESS", "details": {"current": 3, "total": 5}},
+        )
+
+    @patch("core_main_app.components.data.tasks.AsyncResult")
+    def test_get_task_progress_aggregates_template_progress(
+        self, mock_async_result
+    ):
+        """test_get_task_progress_aggregates_template_progress
+
+        Args:
+            mock_async_result:
+
+        Returns:
+
+        """
+        # Arrange
+        results = {
+            "task_id": MagicMock(
+                state="PROGRESS",
+                info={
+                    "template_current": -1,
+                    "template_total": 3,
+                    "data_current": 0,
+                    "data_total": 5,
+                    "chunks": [
+                        ["chunk_1", 2, 0],
+                        ["chunk_2", 2, 1],
+                        ["chunk_3", 1, 1],
+                    ],
+                },
+            ),
+            "chunk_1": MagicMock(
+                state="SUCCESS", result={"valid": ["1", "2"], "wrong": []}
+            ),
+            "chunk_2": MagicMock(
+                state="PROGRESS", info={"current": 1, "total": 2}
+            ),
+            "chunk_3": MagicMock(state="PENDING", info=None),
+        }
+        mock_async_result.side_effect = results.get
+
+        # Act
+        result = data_tasks.get_task_progress("task_id")
+
+        # Assert
+        self.assertEqual(
+            result["details"],
+            {
+                "template_current": 2,
+                "template_total": 3,
+                "data_current": 1,
+                "data_total": 3,
+            },
+        )
+
+    @patch("core_main_app.components.data.tasks.AsyncResult")
+    def test_cancel_task_revokes_task_and_chunks(self, mock_async_result):
+        """test_cancel_task_revokes_task_and_chunks
+
+        Args:
+            mock_async_result:
+
+        Returns:
+
+        """
+        # Arrange
+        result = mock_async_result.return_value
+        result.state = "PROGRESS"
+        result.info = {
+            "current": 0,
+            "total": 3,
+            "chunks": [["chunk_1", 2, None], ["chunk_2", 1, None]],
+        }
+
+        # Act
+        data_tasks.cancel_task("task_id")
+
+        # Assert
+        result.app.control.revoke.assert_called_once_with(
+            ["task_id", "chunk_1", "chunk_2"]
+        )
+        result.backend.mark_as_revoked.assert_called_once_with(
+            "task_id", reason="cancelled"
+        )
+
+    @patch("core_main_app.components.data.tasks.AsyncResult")
+    def test_cancel_task_does_nothing_if_task_finished(
+        self, mock_async_result
+    ):
+        """test_cancel_task_does_nothing_if_task_finished
+
+        Args:
+            mock_async_result:
+
+        Returns:
+
+        """
+        # Arrange
+        result = mock_async_result.return_value
+        result.state = "SUCCESS"
+
+        # Act
+        data_tasks.cancel_task("task_id")
+
+        # Assert
+        result.backend.mark_as_revoked.assert_not_called()
+
+
+class TestDataGetDictContents(TestCase):
+    """TestDataGetDictContents"""
+
+    @override_settings(MONGODB_INDEXING=False)
+    def test_get_dict_contents_returns_dict_contents_in_order(self):
+        """test_get_dict_contents_returns_dict_contents_in_order
+
+        Returns:
+
+        """
+        # Arrange
+        data_list = [
+            Data(id=2, dict_content={"root": "b"}),
+            Data(id=1, dict_content={"root": "a"}),
+        ]
+
+        # Act
+        result = Data.get_dict_contents(data_list)
+
+        # Assert
+        self.assertEqual(result, [{"root": "b"}, {"root": "a"}])
+
+    @override_settings(MONGODB_INDEXING=True)
+    def test_get_dict_contents_fetches_mongo_data_at_once(self):
+        """test_get_dict_contents_fetches_mongo_data_at_once
+
+        Returns:
+
+        """
+        # Arrange
+        mock_module = MagicMock()
+        mock_module.MongoData.objects.return_value.only.return_value = [
+            MagicMock(pk=1, dict_content={"root": "a"}),
+        ]
+        data_list = [Data(id=2), Data(id=1)]
+
+        # Act
+        with patch.dict(
+            sys.modules,
+            {"core_main_app.components.mongo.models": mock_module},
+        ):
+            result = Data.get_dict_contents(data_list)
+
+        # Assert
+        mock_module.MongoData.objects.assert_called_once_with(pk__in=[2, 1])
+        self.assertEqual(result, [None, {"root": "a"}])
+
+    @override_settings(MONGODB_INDEXING=True)
+    def test_get_dict_contents_does_not_fetch_mongo_data_again(self):
+        """test_get_dict_contents_does_not_fetch_mongo_data_again
+
+        Returns:
+
+        """
+        # Arrange
+        mock_module = MagicMock()
+        mongo_data = MagicMock()
+        mongo_data.get_dict_content.return_value = {"root": "a"}
+
+        # Act
+        with patch.dict(
+            sys.modules,
+            {"core_main_app.components.mongo.models": mock_module},
+        ):
+            result = Data.get_dict_contents([mongo_data])
+
+        # Assert
+        mock_module.MongoData.objects.assert_not_called()
+        self.assertEqual(result, [{"root": "a"}])
+
+
+class TestMongoDataIndexingBatch(TestCase):
+    """TestMongoDataIndexingBatch"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        patcher = patch(
+            "core_main_app.components.mongo.models.index_mongo_data_list"
+        )
+        self.mock_index_mongo_data_list = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(mongo_models.end_indexing_batch, None)
+
+    def test_data_saved_outside_of_request_are_indexed_right_away(self):
+        """test_data_saved_outside_of_request_are_indexed_right_away
+
+        Returns:
+
+        """
+        # Act
+        mongo_models._schedule_indexing(1)
+
+        # Assert
+        self.mock_index_mongo_data_list.apply_async.assert_called_once_with(
+            ([1],)
+        )
+
+    def test_data_saved_during_request_are_indexed_in_a_single_task(self):
+        """test_data_saved_during_request_are_indexed_in_a_single_task
+
+        Returns:
+
+        """
+        # Act
+        mongo_models.start_indexing_batch(None)
+        for data_id in [1, 2, 1]:
+            mongo_models._schedule_indexing(data_id)
+        self.mock_index_mongo_data_list.apply_async.assert_not_called()
+        mongo_models.end_indexing_batch(None)
+
+        # Assert
+        self.mock_index_mongo_data_list.apply_async.assert_called_once_with(
+            ([1, 2],)
+        )
+
+    def test_data_of_rolled_back_transaction_are_not_indexed(self):
+        """test_data_of_rolled_back_transaction_are_not_indexed
+
+        Returns:
+
+        """
+        # Act
+        mongo_models.start_indexing_batch(None)
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                mongo_models._schedule_indexing(1)
+                raise ValueError()
+        mongo_models._schedule_indexing(2)
+        mongo_models.end_indexing_batch(None)
+
+        # Assert
+        self.mock_index_mongo_data_list.apply_async.assert_called_once_with(
+            ([2],)
+        )
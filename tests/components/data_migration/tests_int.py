@@ -0,0 +1,172 @@
+"""Data migration integration tests"""
+
+from unittest.mock import patch
+
+from tests.components.data.fixtures.fixtures import DataFixtures
+
+from core_main_app.commons import exceptions
+from core_main_app.components.data import tasks as data_tasks
+from core_main_app.components.data_migration import (
+    api as data_migration_api,
+)
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+fixture_data = DataFixtures()
+
+
+class TestMigrationRunResults(IntegrationBaseTestCase):
+    """TestMigrationRunResults"""
+
+    fixture = fixture_data
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        self.migration_run = data_migration_api.get_or_create(
+            "task_id", 1, self.fixture.template.id, False
+        )
+        data_migration_api.add_results(
+            self.migration_run,
+            [
+                ("1", True, None),
+                ("2", False, "Element 'root': No matching declaration."),
+                ("3", False, "Element 'tag': not expected."),
+            ],
+        )
+
+    def test_get_or_create_returns_existing_migration_run(self):
+        """test_get_or_create_returns_existing_migration_run
+
+        Returns:
+
+        """
+        # Act
+        migration_run = data_migration_api.get_or_create(
+            "task_id", 2, None, True
+        )
+
+        # Assert
+        self.assertEqual(migration_run.pk, self.migration_run.pk)
+        self.assertFalse(migration_run.migrate)
+
+    def test_get_by_task_id_raises_does_not_exist(self):
+        """test_get_by_task_id_raises_does_not_exist
+
+        Returns:
+
+        """
+        # Act # Assert
+        with self.assertRaises(exceptions.DoesNotExist):
+            data_migration_api.get_by_task_id("unknown")
+
+    def test_get_summary_returns_counts(self):
+        """test_get_summary_returns_counts
+
+        Returns:
+
+        """
+        # Act
+        summary = self.migration_run.get_summary()
+
+        # Assert
+        self.assertEqual(summary, {"valid_count": 1, "wrong_count": 2})
+
+    def test_get_results_filters_results(self):
+        """test_get_results_filters_results
+
+        Returns:
+
+        """
+        # Act
+        wrong_results = data_migration_api.get_results(
+            self.migration_run, valid=False
+        )
+        error_results = data_migration_api.get_results(
+            self.migration_run, error="no matching"
+        )
+
+        # Assert
+        self.assertEqual(
+            [result.data_id for result in wrong_results], ["2", "3"]
+        )
+        self.assertEqual([result.data_id for result in error_results], ["2"])
+
+    @patch("core_main_app.components.data.tasks.AsyncResult")
+    def test_get_task_result_returns_saved_results(self, mock_async_result):
+        """test_get_task_result_returns_saved_results
+
+        Args:
+            mock_async_result:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_async_result.return_value.result = (
+            self.migration_run.get_summary()
+        )
+
+        # Act
+        result = data_tasks.get_task_result("task_id")
+
+        # Assert
+        self.assertEqual(result, {"valid": ["1"], "wrong": ["2", "3"]})
+
+
+class TestMigrateDataChunkTaskSavesResults(IntegrationBaseTestCase):
+    """TestMigrateDataChunkTaskSavesResults"""
+
+    fixture = fixture_data
+
+    @patch("core_main_app.components.data.tasks.is_task_cancelled")
+    @patch("core_main_app.components.user.api.get_user_by_id")
+    def test_migrate_data_chunk_task_saves_results_with_errors(
+        self, mock_get_user_by_id, mock_is_task_cancelled
+    ):
+        """test_migrate_data_chunk_task_saves_results_with_errors
+
+        Args:
+            mock_get_user_by_id:
+            mock_is_task_cancelled:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_user_by_id.return_value = create_mock_user(
+            "1", is_superuser=True
+        )
+        mock_is_task_cancelled.return_value = False
+        migration_run = data_migration_api.get_or_create(
+            "task_id", 1, self.fixture.template.id, False
+        )
+        data_ids = [str(data.id) for data in self.fixture.data_collection]
+
+        # Act
+        result = data_tasks.migrate_data_chunk_task(
+            data_ids=data_ids,
+            xslt_id=None,
+            template_id=self.fixture.template.id,
+            user_id=1,
+            migrate=False,
+            parent_task_id="task_id",
+            check_access=False,
+        )
+
+        # Assert
+        self.assertEqual(result, {"valid_count": 0, "wrong_count": 3})
+        wrong_results = list(
+            data_migration_api.get_results(migration_run, valid=False)
+        )
+        self.assertEqual(
+            sorted(result.data_id for result in wrong_results),
+            sorted(data_ids),
+        )
+        self.assertTrue(all(result.error for result in wrong_results))
@@ -1,6 +1,9 @@
 """Int Test Lock"""
 
 from core_main_app.commons.exceptions import LockError
+from core_main_app.components.lock.models import DatabaseLockObject
+from core_main_app.settings import LOCK_OBJECT_TTL
+from core_main_app.utils.datetime import datetime_now, datetime_timedelta
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 
 from tests.components.data.fixtures.fixtures import DataFixtures
@@ -102,6 +105,91 @@ class TestLockSetLock(IntegrationBaseTestCase):
         with self.assertRaises(LockError):
             lock_api.set_lock_object(self.fixture.data_1, self.user2)
 
+    def test_set_lock_takes_over_expired_lock_of_another_user(self):
+        """test set lock takes over expired lock of another user
+
+        Returns:
+
+        """
+        # Arrange
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        _expire_locks()
+
+        # Act
+        lock_api.set_lock_object(self.fixture.data_1, self.user2)
+
+        # Assert
+        self.assertEqual(
+            lock_api.is_object_locked(self.fixture.data_1, self.user1), True
+        )
+        self.assertEqual(DatabaseLockObject.objects.count(), 1)
+
+    def test_set_lock_renews_expired_lock_of_same_user(self):
+        """test set lock renews expired lock of same user
+
+        Returns:
+
+        """
+        # Arrange
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        _expire_locks()
+
+        # Act
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+
+        # Assert
+        self.assertEqual(
+            lock_api.is_object_locked(self.fixture.data_1, self.user2), True
+        )
+        with self.assertRaises(LockError):
+            lock_api.set_lock_object(self.fixture.data_1, self.user2)
+        self.assertEqual(DatabaseLockObject.objects.count(), 1)
+
+
+class TestLockDeleteExpiredLocks(IntegrationBaseTestCase):
+    """Test Delete Expired Locks"""
+
+    fixture = fixture_data
+    user1 = create_mock_user("1")
+    user2 = create_mock_user("2")
+
+    def test_expired_lock_does_not_lock_object(self):
+        """test expired lock does not lock object
+
+        Returns:
+
+        """
+        # Arrange
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        _expire_locks()
+
+        # Act
+        result = lock_api.is_object_locked(self.fixture.data_1, self.user2)
+
+        # Assert
+        self.assertEqual(result, False)
+
+    def test_delete_expired_locks_deletes_only_expired_locks(self):
+        """test delete expired locks deletes only expired locks
+
+        Returns:
+
+        """
+        # Arrange
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        _expire_locks()
+        lock_api.set_lock_object(self.fixture.data_2, self.user1)
+
+        # Act
+        result = lock_api.delete_expired_locks()
+
+        # Assert
+        self.assertEqual(result, 1)
+        self.assertEqual(
+            lock_api.is_object_locked(self.fixture.data_2, self.user2), True
+        )
+        self.assertEqual(DatabaseLockObject.objects.count(), 1)
+
 
 class TestLockRemoveLockOnObject(IntegrationBaseTestCase):
     """Test Remove Lock On Object"""
@@ -157,3 +245,15 @@ class TestLockRemoveLockOnObject(IntegrationBaseTestCase):
         self.assertEqual(
             lock_api.is_object_locked(self.fixture.data_1, self.user2), True
         )
+
+
+def _expire_locks():
+    """Move the date of all existing locks past their expiration
+
+    Returns:
+
+    """
+    DatabaseLockObject.objects.update(
+        lock_date=datetime_now()
+        - datetime_timedelta(seconds=2 * LOCK_OBJECT_TTL)
+    )
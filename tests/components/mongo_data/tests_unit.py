@@ -2,7 +2,7 @@
 
 import json
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from django.test import tag
 from tests.components.data.tests_unit import (
@@ -14,6 +14,8 @@ from tests.components.data.tests_unit import (
 
 from core_main_app.commons.exceptions import ModelError
 from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+from core_main_app.components.workspace.models import Workspace
 
 
 class TestMongoDataBlob(TestCase):
@@ -216,3 +218,83 @@ class TestInitMongoData(TestCase):
 
         # Assert
         self.assertFalse(mock_raw_xml_to_dict.called)
+
+
+class TestMongoDataPrefetchRelated(TestCase):
+    @tag("mongodb")
+    @patch.object(Workspace.objects, "in_bulk")
+    @patch.object(Template.objects, "in_bulk")
+    @patch.object(Data.objects, "select_related")
+    def test_prefetch_related_loads_related_objects_at_once(
+        self,
+        mock_select_related,
+        mock_template_in_bulk,
+        mock_workspace_in_bulk,
+    ):
+        """test_prefetch_related_loads_related_objects_at_once
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import (
+            MongoData,
+        )
+
+        # Arrange
+        mongo_data_list = [
+            MongoData(data_id=1, _template_id=3, _workspace_id=None),
+            MongoData(data_id=2, _template_id=3, _workspace_id=5),
+        ]
+        mock_select_related.return_value.in_bulk.return_value = {
+            1: Mock(content="<a/>"),
+            2: Mock(content="<b/>"),
+        }
+        mock_template_in_bulk.return_value = {3: "template"}
+        mock_workspace_in_bulk.return_value = {5: "workspace"}
+
+        # Act
+        MongoData.prefetch_related(mongo_data_list)
+
+        # Assert
+        with patch.object(Data, "get_by_id") as mock_get_by_id:
+            self.assertEqual(
+                [mongo_data.content for mongo_data in mongo_data_list],
+                ["<a/>", "<b/>"],
+            )
+            self.assertEqual(
+                [mongo_data.template for mongo_data in mongo_data_list],
+                ["template", "template"],
+            )
+            self.assertEqual(
+                [mongo_data.workspace for mongo_data in mongo_data_list],
+                [None, "workspace"],
+            )
+            mock_get_by_id.assert_not_called()
+        mock_select_related.return_value.in_bulk.assert_called_once_with(
+            [1, 2]
+        )
+        mock_template_in_bulk.assert_called_once_with({3})
+        mock_workspace_in_bulk.assert_called_once_with({5})
+
+    @tag("mongodb")
+    @patch.object(Data, "get_by_id")
+    def test_content_is_read_from_data_if_not_prefetched(self, mock_get_by_id):
+        """test_content_is_read_from_data_if_not_prefetched
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import (
+            MongoData,
+        )
+
+        # Arrange
+        mock_get_by_id.return_value = Mock(content="<a/>")
+        mongo_data = MongoData(data_id=1)
+
+        # Act
+        content = mongo_data.content
+
+        # Assert
+        self.assertEqual(content, "<a/>")
+        mock_get_by_id.assert_called_once_with(1)
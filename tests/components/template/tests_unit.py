@@ -16,6 +16,7 @@ from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.components.template import api as template_api
 from core_main_app.components.template.admin_site import CustomTemplateAdmin
 from core_main_app.components.template.models import Template
+from core_main_app.utils import xml as main_xml_utils
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
 from core_main_app.utils.tests_tools.RequestMock import create_mock_request
@@ -187,6 +188,7 @@ class TestTemplateUpsert(TestCase):
             template_api.upsert(template, request=mock_request)
 
     @patch("core_main_app.utils.json_utils.is_schema_valid")
+    @patch("core_main_app.components.template.api._clear_xml_schema_cache")
     @patch(
         "core_main_app.components.template.api._register_local_dependencies"
     )
@@ -199,6 +201,7 @@ class TestTemplateUpsert(TestCase):
         mock_is_xml_schema_valid,
         mock_get_hash,
         mock_register_local_dependencies,
+        mock_clear_xml_schema_cache,
         mock_is_json_schema_valid,
     ):
         """test_xsd_template_upsert_calls_xml_functions
@@ -208,6 +211,7 @@ class TestTemplateUpsert(TestCase):
             mock_is_xml_schema_valid:
             mock_get_hash:
             mock_register_local_dependencies:
+            mock_clear_xml_schema_cache:
             mock_is_json_schema_valid:
 
         Returns:
@@ -222,6 +226,7 @@ class TestTemplateUpsert(TestCase):
         self.assertTrue(mock_is_xml_schema_valid.called)
         self.assertTrue(mock_get_hash.called)
         self.assertTrue(mock_register_local_dependencies.called)
+        self.assertTrue(mock_clear_xml_schema_cache.called)
         self.assertFalse(mock_is_json_schema_valid.called)
 
     @patch("core_main_app.utils.json_utils.is_schema_valid")
@@ -263,6 +268,156 @@ class TestTemplateUpsert(TestCase):
         self.assertTrue(mock_is_json_schema_valid.called)
 
 
+class TestTemplateGetXmlSchema(TestCase):
+    """TestTemplateGetXmlSchema"""
+
+    def setUp(self):
+        """setUp"""
+        main_xml_utils.xml_schema_cache.clear()
+        self.template = _create_template(
+            filename="name.xsd",
+            content=(
+                "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+                "<xs:element name='tag'/></xs:schema>"
+            ),
+        )
+        self.template.hash = "hash"
+
+    def test_get_xml_schema_compiles_schema_once(self):
+        """test get xml schema compiles schema once
+
+        Returns:
+
+        """
+        with patch.object(
+            main_xml_utils,
+            "build_xml_schema",
+            wraps=main_xml_utils.build_xml_schema,
+        ) as mock_build_xml_schema:
+            schema_1 = template_api.get_xml_schema(self.template)
+            schema_2 = template_api.get_xml_schema(self.template)
+
+        self.assertIs(schema_1, schema_2)
+        self.assertEqual(mock_build_xml_schema.call_count, 1)
+
+    def test_get_xml_schema_compiles_schema_again_if_hash_changed(self):
+        """test get xml schema compiles schema again if hash changed
+
+        Returns:
+
+        """
+        schema_1 = template_api.get_xml_schema(self.template)
+        self.template.hash = "new_hash"
+        schema_2 = template_api.get_xml_schema(self.template)
+
+        self.assertIsNot(schema_1, schema_2)
+
+    def test_get_xml_schema_does_not_cache_unsaved_template(self):
+        """test get xml schema does not cache unsaved template
+
+        Returns:
+
+        """
+        self.template.id = None
+
+        template_api.get_xml_schema(self.template)
+
+        self.assertEqual(len(main_xml_utils.xml_schema_cache), 0)
+
+    def test_get_xml_schema_invalid_xsd_raises_xsd_error(self):
+        """test get xml schema invalid xsd raises xsd error
+
+        Returns:
+
+        """
+        self.template.content += "<"
+
+        with self.assertRaises(exceptions.XSDError):
+            template_api.get_xml_schema(self.template)
+
+    @patch.object(Template, "get_all_dependent_id_list")
+    @patch.object(Template, "delete")
+    def test_delete_removes_template_and_dependents_from_cache(
+        self, mock_delete, mock_get_all_dependent_id_list
+    ):
+        """test delete removes template and dependents from cache
+
+        Args:
+            mock_delete:
+            mock_get_all_dependent_id_list:
+
+        Returns:
+
+        """
+        mock_user = create_mock_user("1", is_superuser=True)
+        mock_request = create_mock_request(mock_user)
+        main_xml_utils.xml_schema_cache.set((2, "hash_2"), MagicMock())
+        main_xml_utils.xml_schema_cache.set((3, "hash_3"), MagicMock())
+        template_api.get_xml_schema(self.template)
+        mock_get_all_dependent_id_list.return_value = {2}
+
+        template_api.delete(self.template, request=mock_request)
+
+        self.assertNotIn((1, "hash", None), main_xml_utils.xml_schema_cache)
+        self.assertNotIn((2, "hash_2"), main_xml_utils.xml_schema_cache)
+        self.assertIn((3, "hash_3"), main_xml_utils.xml_schema_cache)
+
+    def test_get_xml_schema_without_dependencies_is_shared_by_users(self):
+        """test get xml schema without dependencies is shared by users
+
+        Returns:
+
+        """
+        with patch.object(
+            main_xml_utils,
+            "build_xml_schema",
+            wraps=main_xml_utils.build_xml_schema,
+        ) as mock_build_xml_schema:
+            for user_id in ["1", "2"]:
+                template_api.get_xml_schema(
+                    self.template,
+                    request=create_mock_request(create_mock_user(user_id)),
+                )
+
+        self.assertEqual(mock_build_xml_schema.call_count, 1)
+
+    @patch.object(main_xml_utils, "build_xml_schema")
+    def test_get_xml_schema_with_dependencies_is_cached_by_user(
+        self, mock_build_xml_schema
+    ):
+        """test get xml schema with dependencies is cached by user
+
+        Args:
+            mock_build_xml_schema:
+
+        Returns:
+
+        """
+        self.template.content = (
+            "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+            "<xs:include schemaLocation='http://example.com/include.xsd'/>"
+            "</xs:schema>"
+        )
+        mock_build_xml_schema.side_effect = lambda *args, **kwargs: Mock()
+        user_1_request = create_mock_request(create_mock_user("1"))
+        user_2_request = create_mock_request(create_mock_user("2"))
+
+        schema_1 = template_api.get_xml_schema(
+            self.template, request=user_1_request
+        )
+        schema_2 = template_api.get_xml_schema(
+            self.template, request=user_2_request
+        )
+
+        self.assertIsNot(schema_1, schema_2)
+        self.assertIs(
+            template_api.get_xml_schema(self.template, request=user_1_request),
+            schema_1,
+        )
+        self.assertIsNot(template_api.get_xml_schema(self.template), schema_1)
+        self.assertEqual(mock_build_xml_schema.call_count, 3)
+
+
 class TestTemplateHash(TestCase):
     """TestTemplateHash"""
 
@@ -3,9 +3,11 @@
 from unittest.case import TestCase
 from unittest.mock import Mock, patch
 
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 
 from core_main_app.commons import exceptions
+from core_main_app.components.data.models import Data
 from core_main_app.components.template.models import Template
 from core_main_app.components.template_html_rendering import (
     api as template_html_rendering_api,
@@ -13,6 +15,7 @@ from core_main_app.components.template_html_rendering import (
 from core_main_app.components.template_html_rendering.models import (
     TemplateHtmlRendering,
 )
+from core_main_app.utils import rendering_cache
 
 
 class TestTemplateHtmlRenderingGetByTemplateId(TestCase):
@@ -354,6 +357,203 @@ class TestTemplateHtmlRenderingDelete(TestCase):
         )
 
 
+class TestTemplateHtmlRenderingRenderData(TestCase):
+    """TestTemplateHtmlRenderingRenderData"""
+
+    def setUp(self):
+        """setUp"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_render_data_renders_dict_content(self):
+        """test_render_data_renders_dict_content"""
+
+        # Arrange
+        template_html_rendering = Mock(
+            template_id=1, detail_rendering="<p>{{ dict_content.root }}</p>"
+        )
+        data = Mock(id=1, checksum="checksum")
+        data.get_dict_content.return_value = {"root": "value"}
+
+        # Act
+        result = template_html_rendering_api.render_data(
+            template_html_rendering, data, "detail_rendering"
+        )
+
+        # Assert
+        self.assertEqual(result, "<p>value</p>")
+
+    @patch.object(rendering_cache, "RENDERED_HTML_CACHE_TTL", 60)
+    def test_render_data_uses_cached_rendering(self):
+        """test_render_data_uses_cached_rendering"""
+
+        # Arrange
+        template_html_rendering = Mock(
+            template_id=1, detail_rendering="<p>{{ dict_content.root }}</p>"
+        )
+        data = Mock(id=1, checksum="checksum")
+        data.get_dict_content.return_value = {"root": "value"}
+
+        # Act
+        for _ in range(2):
+            result = template_html_rendering_api.render_data(
+                template_html_rendering, data, "detail_rendering"
+            )
+
+        # Assert
+        self.assertEqual(result, "<p>value</p>")
+        data.get_dict_content.assert_called_once()
+
+
+class TestTemplateHtmlRenderingRenderMany(TestCase):
+    """TestTemplateHtmlRenderingRenderMany"""
+
+    def setUp(self):
+        """setUp"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @patch.object(Data, "get_dict_contents")
+    def test_render_many_fetches_dict_contents_at_once(
+        self, mock_get_dict_contents
+    ):
+        """test_render_many_fetches_dict_contents_at_once"""
+
+        # Arrange
+        template_html_rendering = Mock(
+            id=1,
+            template_id=1,
+            list_rendering="<p>{{ dict_content.root }}</p>",
+        )
+        data_list = [Mock(id=1, checksum="1"), Mock(id=2, checksum="2")]
+        mock_get_dict_contents.return_value = [{"root": "a"}, {"root": "b"}]
+
+        # Act
+        result = template_html_rendering_api.render_many(
+            template_html_rendering, data_list, "list_rendering"
+        )
+
+        # Assert
+        self.assertEqual(result, ["<p>a</p>", "<p>b</p>"])
+        mock_get_dict_contents.assert_called_once_with(data_list)
+
+    @patch.object(rendering_cache, "RENDERED_HTML_CACHE_TTL", 60)
+    @patch.object(Data, "get_dict_contents")
+    def test_render_many_only_renders_data_not_cached(
+        self, mock_get_dict_contents
+    ):
+        """test_render_many_only_renders_data_not_cached"""
+
+        # Arrange
+        template_html_rendering = Mock(
+            id=1,
+            template_id=1,
+            list_rendering="<p>{{ dict_content.root }}</p>",
+        )
+        data_list = [Mock(id=1, checksum="1"), Mock(id=2, checksum="2")]
+        mock_get_dict_contents.side_effect = [[{"root": "a"}], [{"root": "b"}]]
+        template_html_rendering_api.render_many(
+            template_html_rendering, data_list[:1], "list_rendering"
+        )
+
+        # Act
+        result = template_html_rendering_api.render_many(
+            template_html_rendering, data_list, "list_rendering"
+        )
+
+        # Assert
+        self.assertEqual(result, ["<p>a</p>", "<p>b</p>"])
+        self.assertEqual(
+            mock_get_dict_contents.call_args.args[0], data_list[1:]
+        )
+
+    @patch.object(rendering_cache, "RENDERED_HTML_CACHE_TTL", 60)
+    @patch.object(Data, "get_dict_contents")
+    def test_render_many_continues_if_data_fails_to_render(
+        self, mock_get_dict_contents
+    ):
+        """test_render_many_continues_if_data_fails_to_render"""
+
+        class InvalidContent:
+            """Content raising an error when rendered"""
+
+            @property
+            def root(self):
+                """root"""
+                raise ValueError("error")
+
+        # Arrange
+        template_html_rendering = Mock(
+            id=1,
+            template_id=1,
+            list_rendering="<p>{{ dict_content.root }}</p>",
+        )
+        data_list = [Mock(id=1, checksum="1"), Mock(id=2, checksum="2")]
+        mock_get_dict_contents.return_value = [InvalidContent(), {"root": "b"}]
+
+        # Act
+        result = template_html_rendering_api.render_many(
+            template_html_rendering, data_list, "list_rendering"
+        )
+
+        # Assert
+        self.assertEqual(result, [None, "<p>b</p>"])
+
+
+class TestTemplateHtmlRenderingGetDjangoTemplate(TestCase):
+    """TestTemplateHtmlRenderingGetDjangoTemplate"""
+
+    def setUp(self):
+        """setUp"""
+        template_html_rendering_api.html_rendering_cache.clear()
+
+    @patch(
+        "core_main_app.components.template_html_rendering.api.DjangoTemplate"
+    )
+    def test_get_django_template_compiles_template_once(
+        self, mock_django_template
+    ):
+        """test_get_django_template_compiles_template_once"""
+
+        # Arrange
+        template_html_rendering = Mock(id=1, detail_rendering="<p></p>")
+
+        # Act
+        for _ in range(2):
+            template_html_rendering_api.get_django_template(
+                template_html_rendering, "detail_rendering"
+            )
+
+        # Assert
+        mock_django_template.assert_called_once_with("<p></p>")
+
+    @patch.object(TemplateHtmlRendering, "save")
+    @patch(
+        "core_main_app.components.template_html_rendering.api.DjangoTemplate"
+    )
+    def test_upsert_clears_compiled_template(
+        self, mock_django_template, mock_save
+    ):
+        """test_upsert_clears_compiled_template"""
+
+        # Arrange
+        template_html_rendering = TemplateHtmlRendering(
+            id=1, detail_rendering="<p></p>"
+        )
+        template_html_rendering_api.get_django_template(
+            template_html_rendering, "detail_rendering"
+        )
+
+        # Act
+        template_html_rendering_api.upsert(template_html_rendering)
+        template_html_rendering_api.get_django_template(
+            template_html_rendering, "detail_rendering"
+        )
+
+        # Assert
+        self.assertEqual(mock_django_template.call_count, 2)
+
+
 class TestTemplateHtmlRenderingStr(TestCase):
     """TestTemplateHtmlRenderingStr"""
 
@@ -4,6 +4,7 @@ from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from tests.components.user.fixtures.fixtures import UserFixtures
 
+from core_main_app.components.blob.models import Blob
 from core_main_app.components.user import api as user_api
 from core_main_app.utils.integration_tests.integration_base_transaction_test_case import (
     IntegrationTransactionTestCase,
@@ -329,3 +330,42 @@ class TestUserPasswords(IntegrationTransactionTestCase):
         self.assertFalse(user.check_password(""))
         # no input password is invalid
         self.assertFalse(user.check_password(None))
+
+
+class TestUserSetOwnerNames(IntegrationTransactionTestCase):
+    """Test User Set Owner Names"""
+
+    def test_set_owner_names_sets_owner_names_with_one_query(self):
+        """test set owner names sets owner names with one query
+
+        Returns:
+
+        """
+        user_1 = UserFixtures().create_user(username="user_1")
+        user_2 = UserFixtures().create_user(username="user_2")
+        blob_list = [
+            Blob(user_id=str(user_1.id)),
+            Blob(user_id=str(user_2.id)),
+            Blob(user_id=str(user_1.id)),
+        ]
+        # Act
+        with self.assertNumQueries(1):
+            user_api.set_owner_names(blob_list)
+        # Assert
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [blob.owner_name for blob in blob_list],
+                ["user_1", "user_2", "user_1"],
+            )
+
+    def test_set_owner_names_ignores_unknown_users(self):
+        """test set owner names ignores unknown users
+
+        Returns:
+
+        """
+        blob_list = [Blob(user_id="999"), Blob(user_id="anonymous")]
+        # Act
+        user_api.set_owner_names(blob_list)
+        # Assert
+        self.assertTrue(all(blob._owner_name is None for blob in blob_list))
@@ -1,5 +1,9 @@
 """Integration Test for Workspace API"""
 
+from unittest.mock import patch
+
+from django.core.cache import cache
+
 from tests.components.user.fixtures.fixtures import UserFixtures
 from tests.components.workspace.fixtures.fixtures import WorkspaceFixtures
 
@@ -7,6 +11,7 @@ from core_main_app.commons import exceptions
 from core_main_app.components.data.models import Data
 from core_main_app.components.template.models import Template
 from core_main_app.components.workspace import api as workspace_api
+from core_main_app.permissions import api as permissions_api
 from core_main_app.utils.integration_tests.integration_base_transaction_test_case import (
     IntegrationTransactionTestCase,
 )
@@ -85,6 +90,36 @@ class TestCreateWorkspace(IntegrationTransactionTestCase):
         self.assertEqual(workspace.title, TITLE_1)
         self.assertIsNone(workspace.owner)
 
+    @patch.object(permissions_api, "WORKSPACE_PERMISSIONS_CACHE_TTL", 60)
+    def test_create_workspace_invalidates_cached_superuser_permissions(self):
+        """test create workspace invalidates cached superuser permissions
+
+        Returns:
+
+        """
+        # Context
+        cache.clear()
+        superuser = UserFixtures().create_super_user()
+        permissions_api.get_all_workspace_permissions_user_can_read(superuser)
+        permissions_api.get_all_workspace_permissions_user_can_write(superuser)
+        # Act
+        workspace = workspace_api.create_and_save(TITLE_1)
+        # Assert
+        # new user object for the same user, as in a new request
+        superuser = UserFixtures().create_super_user(username="superuser2")
+        self.assertIn(
+            workspace.read_perm_id,
+            permissions_api.get_all_workspace_permissions_user_can_read(
+                superuser
+            ),
+        )
+        self.assertIn(
+            workspace.write_perm_id,
+            permissions_api.get_all_workspace_permissions_user_can_write(
+                superuser
+            ),
+        )
+
 
 class TestIsWorkspaceGlobal(IntegrationTransactionTestCase):
     """Test Is Workspace Global"""
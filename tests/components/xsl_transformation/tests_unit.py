@@ -20,6 +20,7 @@ from core_main_app.components.xsl_transformation.admin_site import (
 from core_main_app.components.xsl_transformation.models import (
     XslTransformation,
 )
+from core_main_app.utils import xml
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
 from xml_utils.html_tree.parser import html_diff as htmldiff
@@ -550,6 +551,123 @@ class TestXslTransformationAdminViews(TestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+class TestXslTransformationGetXsltTransform(TestCase):
+    """TestXslTransformationGetXsltTransform"""
+
+    def setUp(self):
+        """setUp"""
+        xml.xslt_cache.clear()
+        self.mock_xslt = _create_mock_xsl_transformation(
+            name="mock_xslt",
+            filename="mock_xslt.xsl",
+            content=(
+                "<xsl:stylesheet xmlns:xsl='http://www.w3.org/1999/XSL/Transform' version='1.0'>"
+                "<xsl:template match='/'><out/></xsl:template></xsl:stylesheet>"
+            ),
+        )
+        self.mock_xslt.id = 1
+        self.mock_xslt.checksum = "checksum"
+
+    @patch.object(xml, "build_xslt_transform")
+    def test_get_xslt_transform_compiles_xslt_once(
+        self, mock_build_xslt_transform
+    ):
+        """test get xslt transform compiles xslt once
+
+        Args:
+            mock_build_xslt_transform:
+
+        Returns:
+
+        """
+        # Act
+        xsl_transformation_api.get_xslt_transform(self.mock_xslt)
+        xsl_transformation_api.get_xslt_transform(self.mock_xslt)
+
+        # Assert
+        self.assertEqual(mock_build_xslt_transform.call_count, 1)
+        self.assertEqual(xml.xslt_cache.hits, 1)
+
+    @patch.object(xml, "build_xslt_transform")
+    def test_get_xslt_transform_compiles_xslt_again_if_checksum_changed(
+        self, mock_build_xslt_transform
+    ):
+        """test get xslt transform compiles xslt again if checksum changed
+
+        Args:
+            mock_build_xslt_transform:
+
+        Returns:
+
+        """
+        # Act
+        xsl_transformation_api.get_xslt_transform(self.mock_xslt)
+        self.mock_xslt.checksum = "new_checksum"
+        xsl_transformation_api.get_xslt_transform(self.mock_xslt)
+
+        # Assert
+        self.assertEqual(mock_build_xslt_transform.call_count, 2)
+
+    def test_get_xslt_transform_without_checksum_uses_content(self):
+        """test get xslt transform without checksum uses content
+
+        Returns:
+
+        """
+        # Arrange
+        self.mock_xslt.checksum = None
+
+        # Act
+        result = xsl_transformation_api.get_xslt_transform(self.mock_xslt)
+
+        # Assert
+        self.assertIs(result, xml.get_xslt_transform(self.mock_xslt.content))
+
+    @patch.object(XslTransformation, "delete")
+    def test_delete_removes_xslt_from_cache(self, mock_delete):
+        """test delete removes xslt from cache
+
+        Args:
+            mock_delete:
+
+        Returns:
+
+        """
+        # Arrange
+        xsl_transformation_api.get_xslt_transform(self.mock_xslt)
+
+        # Act
+        xsl_transformation_api.delete(self.mock_xslt)
+
+        # Assert
+        self.assertEqual(len(xml.xslt_cache), 0)
+
+    @patch.object(XslTransformation, "save")
+    def test_upsert_removes_xslt_from_cache(self, mock_save):
+        """test upsert removes xslt from cache
+
+        Args:
+            mock_save:
+
+        Returns:
+
+        """
+        # Arrange
+        xslt = _create_xsl_transformation(
+            name="xslt_name",
+            filename="xslt_filename",
+            content=self.mock_xslt.content,
+        )
+        xslt.id = 1
+        xsl_transformation_api.get_xslt_transform(self.mock_xslt)
+
+        # Act
+        xsl_transformation_api.upsert(xslt)
+
+        # Assert
+        self.assertNotIn(("xsl_transformation", 1, "checksum"), xml.xslt_cache)
+
+
 class TestXslTransform(TestCase):
     """TestXslTransform"""
 
@@ -0,0 +1,132 @@
+"""Unit tests for permissions api"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+
+from core_main_app.permissions import api as permissions_api
+from core_main_app.permissions import signals as permissions_signals
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+
+class TestGetAllWorkspacePermissionsUserCanRead(TestCase):
+    """Test get_all_workspace_permissions_user_can_read"""
+
+    def setUp(self):
+        """setUp"""
+        self.user = create_mock_user(user_id="1")
+        cache.clear()
+
+    @patch.object(
+        permissions_api, "_query_workspace_permissions_user_can_read"
+    )
+    def test_permissions_are_memoized_on_user(self, mock_query):
+        """test_permissions_are_memoized_on_user
+
+        Args:
+            mock_query:
+
+        Returns:
+
+        """
+        mock_query.return_value = ["1", "2"]
+
+        permissions_api.get_all_workspace_permissions_user_can_read(self.user)
+        result = permissions_api.get_all_workspace_permissions_user_can_read(
+            self.user
+        )
+
+        self.assertEqual(result, ["1", "2"])
+        mock_query.assert_called_once_with(self.user)
+
+    @patch.object(
+        permissions_api, "_query_workspace_permissions_user_can_read"
+    )
+    def test_permissions_are_not_shared_between_users(self, mock_query):
+        """test_permissions_are_not_shared_between_users
+
+        Args:
+            mock_query:
+
+        Returns:
+
+        """
+        mock_query.return_value = ["1"]
+
+        permissions_api.get_all_workspace_permissions_user_can_read(self.user)
+        permissions_api.get_all_workspace_permissions_user_can_read(
+            create_mock_user(user_id="2")
+        )
+
+        self.assertEqual(mock_query.call_count, 2)
+
+    @patch.object(
+        permissions_api, "_query_workspace_permissions_user_can_read"
+    )
+    def test_clear_cache_invalidates_memoized_permissions(self, mock_query):
+        """test_clear_cache_invalidates_memoized_permissions
+
+        Args:
+            mock_query:
+
+        Returns:
+
+        """
+        mock_query.return_value = ["1"]
+
+        permissions_api.get_all_workspace_permissions_user_can_read(self.user)
+        permissions_api.clear_workspace_permissions_cache()
+        permissions_api.get_all_workspace_permissions_user_can_read(self.user)
+
+        self.assertEqual(mock_query.call_count, 2)
+
+    @patch.object(permissions_api, "WORKSPACE_PERMISSIONS_CACHE_TTL", 60)
+    @patch.object(
+        permissions_api, "_query_workspace_permissions_user_can_read"
+    )
+    def test_permissions_are_cached_across_requests(self, mock_query):
+        """test_permissions_are_cached_across_requests
+
+        Args:
+            mock_query:
+
+        Returns:
+
+        """
+        mock_query.return_value = ["1"]
+
+        permissions_api.get_all_workspace_permissions_user_can_read(self.user)
+        # new user object for the same user, as in a new request
+        result = permissions_api.get_all_workspace_permissions_user_can_read(
+            create_mock_user(user_id="1")
+        )
+
+        self.assertEqual(result, ["1"])
+        mock_query.assert_called_once()
+
+    @patch.object(permissions_api, "WORKSPACE_PERMISSIONS_CACHE_TTL", 60)
+    @patch.object(
+        permissions_api, "_query_workspace_permissions_user_can_read"
+    )
+    def test_group_membership_change_invalidates_cache(self, mock_query):
+        """test_group_membership_change_invalidates_cache
+
+        Args:
+            mock_query:
+
+        Returns:
+
+        """
+        mock_query.return_value = ["1"]
+
+        permissions_api.get_all_workspace_permissions_user_can_read(self.user)
+        permissions_signals.m2m_changed_permissions(
+            sender=Group.user_set.through, action="post_add"
+        )
+        permissions_api.get_all_workspace_permissions_user_can_read(
+            create_mock_user(user_id="1")
+        )
+
+        self.assertEqual(mock_query.call_count, 2)
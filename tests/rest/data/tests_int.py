@@ -1,13 +1,19 @@
 """Integration Test for Data Rest API"""
 
+import io
 import json
+import zipfile
 from copy import copy
 from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
 
 from rest_framework import status
 
 from core_main_app.components.data import api as data_api
 from core_main_app.components.data.models import Data
+from core_main_app.components.data_migration import (
+    api as data_migration_api,
+)
 from core_main_app.components.template.models import Template
 from core_main_app.components.workspace import api as workspace_api
 from core_main_app.components.workspace.models import Workspace
@@ -19,6 +25,7 @@ from core_main_app.utils.integration_tests.integration_base_transaction_test_cas
     IntegrationTransactionTestCase,
 )
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.QueryCount import QueryCountTestMixin
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
 from core_main_app.utils.xml import raw_xml_to_dict
 from tests.components.data.fixtures.fixtures import (
@@ -349,6 +356,336 @@ class TestDataList(IntegrationBaseTestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_fields_returns_only_fields(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_fields_returns_only_fields
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"fields": "id,title"},
+        )
+
+        # Assert
+        self.assertEqual(len(response.data["results"]), 2)
+        for result in response.data["results"]:
+            self.assertEqual(set(result), {"id", "title"})
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_invalid_fields_returns_http_400(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_invalid_fields_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"fields": "id,dict_content"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestDataListCursorPagination(IntegrationBaseTestCase):
+    """TestDataListCursorPagination"""
+
+    fixture = fixture_data
+
+    @patch(
+        "core_main_app.utils.pagination.rest_framework_paginator.pagination.DataCursorPagination.page_size",
+        1,
+    )
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_cursor_returns_all_data_page_by_page(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_cursor_returns_all_data_page_by_page
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        first_page = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(), user, data={"cursor": ""}
+        )
+        cursor = parse_qs(urlparse(first_page.data["next"]).query)["cursor"][0]
+        second_page = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(), user, data={"cursor": cursor}
+        )
+
+        # Assert
+        self.assertEqual(len(first_page.data["results"]), 1)
+        self.assertEqual(len(second_page.data["results"]), 1)
+        self.assertNotEqual(
+            first_page.data["results"][0]["id"],
+            second_page.data["results"][0]["id"],
+        )
+        self.assertIsNone(second_page.data["next"])
+        self.assertIsNone(second_page.data["count"])
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_cursor_and_exact_count_returns_count(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_cursor_and_exact_count_returns_count
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"cursor": "", "count": "exact"},
+        )
+
+        # Assert
+        self.assertEqual(response.data["count"], 2)
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_invalid_cursor_returns_http_400(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_invalid_cursor_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"cursor": "invalid"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_invalid_count_returns_http_400(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_invalid_count_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"cursor": "", "count": "invalid"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch(
+        "core_main_app.utils.pagination.rest_framework_paginator.pagination.DATA_SORTING_FIELDS",
+        ["+template", "-title"],
+    )
+    @patch(
+        "core_main_app.utils.pagination.rest_framework_paginator.pagination.DataCursorPagination.page_size",
+        1,
+    )
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_cursor_sorted_by_foreign_key_and_fields_returns_all_data(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_cursor_sorted_by_foreign_key_and_fields_returns_all_data
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        first_page = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"cursor": "", "fields": "id"},
+        )
+        cursor = parse_qs(urlparse(first_page.data["next"]).query)["cursor"][0]
+        second_page = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"cursor": cursor, "fields": "id"},
+        )
+
+        # Assert
+        self.assertEqual(first_page.status_code, status.HTTP_200_OK)
+        self.assertEqual(second_page.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(
+            first_page.data["results"][0]["id"],
+            second_page.data["results"][0]["id"],
+        )
+        self.assertIsNone(second_page.data["next"])
+
+    @patch(
+        "core_main_app.utils.pagination.rest_framework_paginator.pagination.DATA_SORTING_FIELDS",
+        ["-workspace"],
+    )
+    @patch(
+        "core_main_app.utils.pagination.rest_framework_paginator.pagination.DataCursorPagination.page_size",
+        1,
+    )
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_cursor_sorted_by_null_values_returns_all_data(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_cursor_sorted_by_null_values_returns_all_data
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        first_page = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(), user, data={"cursor": ""}
+        )
+        cursor = parse_qs(urlparse(first_page.data["next"]).query)["cursor"][0]
+        second_page = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(), user, data={"cursor": cursor}
+        )
+
+        # Assert
+        self.assertIsNone(first_page.data["results"][0]["workspace"])
+        self.assertEqual(second_page.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(second_page.data["results"]), 1)
+        self.assertNotEqual(
+            first_page.data["results"][0]["id"],
+            second_page.data["results"][0]["id"],
+        )
+        self.assertIsNone(second_page.data["next"])
+
+
+class TestDataListByWorkspaceCursorPagination(IntegrationBaseTestCase):
+    """TestDataListByWorkspaceCursorPagination"""
+
+    fixture = fixture_data
+
+    def test_get_with_invalid_cursor_returns_http_400(self):
+        """test_get_with_invalid_cursor_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user(1, is_superuser=True)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataListByWorkspace.as_view(),
+            user,
+            data={"cursor": "invalid"},
+            param={"workspace_id": 1},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestDataListQueryCount(QueryCountTestMixin, IntegrationBaseTestCase):
+    """TestDataListQueryCount"""
+
+    fixture = fixture_data
+
+    def _create_data(self, count):
+        """Create data
+
+        Args:
+            count:
+
+        Returns:
+
+        """
+        for _ in range(count):
+            Data(
+                template=self.fixture.template,
+                user_id="1",
+                title="title",
+                xml_content="<root></root>",
+            ).save()
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_executes_constant_number_of_queries(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_executes_constant_number_of_queries
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act # Assert
+        self.assertConstantQueryCount(
+            self._create_data,
+            lambda: RequestMock.do_request_get(
+                data_rest_views.DataList.as_view(), user
+            ),
+        )
+
 
 class TestAdminDataList(IntegrationBaseTestCase):
     """TestDataList"""
@@ -702,6 +1039,35 @@ class TestDataDownload(IntegrationBaseTestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_get_streams_saved_content(self):
+        """test_get_streams_saved_content
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user(1)
+        data = Data(template=self.fixture.template, user_id="1", title="data")
+        data.content = "<tag>value</tag>"
+        data.convert_and_save()
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataDownload.as_view(),
+            user,
+            param={"pk": data.id},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            b"".join(response.streaming_content), b"<tag>value</tag>"
+        )
+        self.assertEqual(
+            response["Content-Disposition"], "attachment; filename=data.xml"
+        )
+
     def test_get_wrong_id_returns_http_404(self):
         """test_get_wrong_id_returns_http_404
 
@@ -1069,6 +1435,139 @@ class TestExecuteLocalQueryView(IntegrationBaseTestCase):
         self.assertEqual(len(response.data), 1)
 
 
+class TestExportLocalQueryView(IntegrationBaseTestCase):
+    """TestExportLocalQueryView"""
+
+    fixture = fixture_data_query
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        # create user with superuser access to skip access control
+        self.user = create_mock_user(1, is_superuser=True)
+
+    def test_post_query_streams_ndjson(self):
+        """test_post_query_streams_ndjson
+
+        Returns:
+
+        """
+        # Arrange
+        data = {
+            "query": '{"$or": [{"root.element": "value"}, {"root.element":"value2"}]}'
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExportLocalQueryView.as_view(),
+            self.user,
+            data=data,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            {json.loads(line)["title"] for line in lines},
+            {self.fixture.data_1.title, self.fixture.data_2.title},
+        )
+
+    def test_post_query_streams_zip_of_files(self):
+        """test_post_query_streams_zip_of_files
+
+        Returns:
+
+        """
+        # Arrange
+        data = {"query": '{"root.element": "value"}', "format": "zip"}
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExportLocalQueryView.as_view(),
+            self.user,
+            data=data,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        zip_file = zipfile.ZipFile(
+            io.BytesIO(b"".join(response.streaming_content))
+        )
+        self.assertEqual(len(zip_file.namelist()), 1)
+        self.assertTrue(zip_file.namelist()[0].endswith(".xml"))
+
+    def test_post_query_zip_entries_stay_in_archive_root(self):
+        """test_post_query_zip_entries_stay_in_archive_root
+
+        Returns:
+
+        """
+        # Arrange
+        self.fixture.data_1.title = "../../../x"
+        self.fixture.data_1.save()
+        data = {"query": '{"root.element": "value"}', "format": "zip"}
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExportLocalQueryView.as_view(),
+            self.user,
+            data=data,
+        )
+
+        # Assert
+        zip_file = zipfile.ZipFile(
+            io.BytesIO(b"".join(response.streaming_content))
+        )
+        self.assertEqual(len(zip_file.namelist()), 1)
+        file_name = zip_file.namelist()[0]
+        self.assertNotIn("/", file_name)
+        self.assertNotIn("..", file_name)
+        self.assertTrue(file_name.startswith(f"{self.fixture.data_1.id}_"))
+
+    def test_post_query_zip_with_xpath_returns_http_400(self):
+        """test_post_query_zip_with_xpath_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        data = {"query": "{}", "format": "zip", "xpath": "/root"}
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExportLocalQueryView.as_view(),
+            self.user,
+            data=data,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_post_unsupported_format_returns_http_400(self):
+        """test_post_unsupported_format_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        data = {"query": "{}", "format": "csv"}
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExportLocalQueryView.as_view(),
+            self.user,
+            data=data,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class TestExecuteLocalQueryViewWorkspaceCase(IntegrationTransactionTestCase):
     """TestExecuteLocalQueryViewWorkspaceCase"""
 
@@ -2201,3 +2700,118 @@ class TestGetDataHtmlRender(IntegrationBaseTestCase):
         self.assertEqual(
             response.rendered_content.decode("utf-8"), '"<b>Title:<b/>CDCS"'
         )
+
+
+class TestMigrationResults(IntegrationBaseTestCase):
+    """TestMigrationResults"""
+
+    fixture = fixture_data
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        self.user = create_mock_user("1", is_staff=True)
+        self.migration_run = data_migration_api.get_or_create(
+            "task_id", 1, self.fixture.template.id, False
+        )
+        data_migration_api.add_results(
+            self.migration_run,
+            [(str(index), index % 2 == 0, "error") for index in range(15)],
+        )
+
+    def test_get_summary_returns_counts(self):
+        """test_get_summary_returns_counts
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationRunSummary.as_view(),
+            self.user,
+            param={"task_id": "task_id"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["task_id"], "task_id")
+        self.assertEqual(response.data["valid_count"], 8)
+        self.assertEqual(response.data["wrong_count"], 7)
+
+    def test_get_summary_returns_404_when_migration_not_found(self):
+        """test_get_summary_returns_404_when_migration_not_found
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationRunSummary.as_view(),
+            self.user,
+            param={"task_id": "unknown"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_results_returns_page(self):
+        """test_get_results_returns_page
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationResultList.as_view(),
+            self.user,
+            param={"task_id": "task_id"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 15)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_get_results_filters_wrong_data(self):
+        """test_get_results_filters_wrong_data
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationResultList.as_view(),
+            self.user,
+            data={"valid": "false"},
+            param={"task_id": "task_id"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 7)
+        self.assertEqual(
+            response.data["results"][0],
+            {"data_id": "1", "valid": False, "error": "error"},
+        )
+
+    def test_get_results_with_invalid_filter_returns_400(self):
+        """test_get_results_with_invalid_filter_returns_400
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationResultList.as_view(),
+            self.user,
+            data={"valid": "maybe"},
+            param={"task_id": "task_id"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -6,6 +6,7 @@ from django.test import SimpleTestCase
 from rest_framework import status
 from tests.mocks import MockQuerySet
 
+from core_main_app.commons import exceptions
 from core_main_app.components.data import api as data_api
 from core_main_app.components.data.models import Data
 from core_main_app.components.workspace import api as workspace_api
@@ -1290,6 +1291,221 @@ class TestGetTaskProgressPermission(SimpleTestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+class TestCancelTaskPermission(SimpleTestCase):
+    """TestCancelTaskPermission"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.task_id = "123"
+
+    def test_anonymous_cancel_task_returns_http_403(self):
+        """test_anonymous_cancel_task_returns_http_403
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1, is_anonymous=True)
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.CancelTask.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_user_cancel_task_returns_http_403(self):
+        """test_user_cancel_task_returns_http_403
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.CancelTask.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("core_main_app.components.data.tasks.get_task_progress")
+    @patch("core_main_app.components.data.tasks.cancel_task")
+    def test_admin_cancel_task_returns_http_200(
+        self, mock_cancel_task, mock_get_task_progress
+    ):
+        """test_admin_cancel_task_returns_http_200
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1, is_staff=True)
+        mock_get_task_progress.return_value = {
+            "state": "REVOKED",
+            "details": "cancelled",
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.CancelTask.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_cancel_task.assert_called_once_with(self.task_id)
+
+
+class TestMigrationRunSummaryPermission(SimpleTestCase):
+    """TestMigrationRunSummaryPermission"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.task_id = "123"
+
+    def test_anonymous_get_migration_summary_returns_http_403(self):
+        """test_anonymous_get_migration_summary_returns_http_403
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1, is_anonymous=True)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationRunSummary.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_user_get_migration_summary_returns_http_403(self):
+        """test_user_get_migration_summary_returns_http_403
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationRunSummary.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("core_main_app.components.data_migration.api.get_by_task_id")
+    def test_admin_get_migration_summary_returns_http_404_if_not_found(
+        self, mock_get_by_task_id
+    ):
+        """test_admin_get_migration_summary_returns_http_404_if_not_found
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1, is_staff=True)
+        mock_get_by_task_id.side_effect = exceptions.DoesNotExist("error")
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationRunSummary.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestMigrationResultListPermission(SimpleTestCase):
+    """TestMigrationResultListPermission"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.task_id = "123"
+
+    def test_anonymous_get_migration_results_returns_http_403(self):
+        """test_anonymous_get_migration_results_returns_http_403
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1, is_anonymous=True)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationResultList.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_user_get_migration_results_returns_http_403(self):
+        """test_user_get_migration_results_returns_http_403
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationResultList.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch("core_main_app.components.data_migration.api.get_by_task_id")
+    def test_admin_get_migration_results_returns_http_404_if_not_found(
+        self, mock_get_by_task_id
+    ):
+        """test_admin_get_migration_results_returns_http_404_if_not_found
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user(1, is_staff=True)
+        mock_get_by_task_id.side_effect = exceptions.DoesNotExist("error")
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.MigrationResultList.as_view(),
+            mock_user,
+            param={"task_id": self.task_id},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
 class TestGetTaskResultPermission(SimpleTestCase):
     """TestGetTaskResultPermission"""
 
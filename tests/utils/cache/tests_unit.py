@@ -0,0 +1,110 @@
+"""Unit tests for `core_main_app.utils.cache` package."""
+
+from unittest import TestCase
+
+from core_main_app.utils.cache import LRUCache
+
+
+class TestLRUCache(TestCase):
+    """Unit tests for `LRUCache` class."""
+
+    def test_get_returns_value_set(self):
+        """test_get_returns_value_set"""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+
+        self.assertEqual(cache.get("a"), 1)
+
+    def test_get_returns_default_when_key_not_found(self):
+        """test_get_returns_default_when_key_not_found"""
+        cache = LRUCache(max_size=2)
+
+        self.assertEqual(cache.get("a", "default"), "default")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """test_least_recently_used_entry_is_evicted"""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_hits_and_misses_are_counted(self):
+        """test_hits_and_misses_are_counted"""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        self.assertEqual(
+            cache.stats(),
+            {
+                "size": 1,
+                "max_size": 2,
+                "weight": 1,
+                "max_weight": None,
+                "hits": 2,
+                "misses": 1,
+            },
+        )
+
+    def test_cache_disabled_when_max_size_is_zero(self):
+        """test_cache_disabled_when_max_size_is_zero"""
+        cache = LRUCache(max_size=0)
+        cache.set("a", 1)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_delete_if_removes_matching_keys(self):
+        """test_delete_if_removes_matching_keys"""
+        cache = LRUCache(max_size=3)
+        cache.set(("x", 1), 1)
+        cache.set(("x", 2), 2)
+        cache.set(("y", 1), 3)
+
+        cache.delete_if(lambda key: key[0] == "x")
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn(("y", 1), cache)
+
+    def test_clear_removes_entries_and_resets_counters(self):
+        """test_clear_removes_entries_and_resets_counters"""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.get("a")
+
+        cache.clear()
+
+        self.assertEqual(
+            cache.stats(),
+            {
+                "size": 0,
+                "max_size": 2,
+                "weight": 0,
+                "max_weight": None,
+                "hits": 0,
+                "misses": 0,
+            },
+        )
+
+    def test_entries_are_evicted_when_max_weight_is_exceeded(self):
+        """test_entries_are_evicted_when_max_weight_is_exceeded"""
+        cache = LRUCache(max_size=10, max_weight=10)
+        cache.set("a", 1, weight=6)
+        cache.set("b", 2, weight=6)
+
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertEqual(cache.stats()["weight"], 6)
+
+    def test_entry_heavier_than_max_weight_is_not_cached(self):
+        """test_entry_heavier_than_max_weight_is_not_cached"""
+        cache = LRUCache(max_size=10, max_weight=10)
+        cache.set("a", 1, weight=11)
+
+        self.assertNotIn("a", cache)
@@ -42,3 +42,15 @@ class TestComputeChecksum(TestCase):
             checksum = compute_checksum(file, "MD5")
             # MD5 (expand.png) = f767652a18f716db2f0f4f5cd74b5067
             self.assertEqual(checksum, "f767652a18f716db2f0f4f5cd74b5067")
+
+    def test_compute_string_checksum_returns_bytes_checksum(self):
+        """test compute string checksum returns bytes checksum
+
+        Returns:
+
+        """
+        content = "<root>été</root>" * 1000
+        self.assertEqual(
+            compute_checksum(content, "SHA256", block_size=7),
+            compute_checksum(content.encode(), "SHA256"),
+        )
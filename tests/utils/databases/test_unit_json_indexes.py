@@ -0,0 +1,159 @@
+"""JSON indexes unit test class"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_main_app.components.data.models import Data
+from core_main_app.utils.databases import json_indexes
+
+
+class TestGetIndexDefinitions(TestCase):
+    """TestGetIndexDefinitions"""
+
+    @patch.object(json_indexes, "DATA_CONTENT_GIN_INDEX", False)
+    @patch.object(
+        json_indexes,
+        "DATA_INDEXED_PATHS",
+        {1: {"root.a": "numeric"}, 2: {"root.a": "text", "root": "text"}},
+    )
+    def test_get_index_definitions_returns_index_by_path_and_type(self):
+        """test_get_index_definitions_returns_index_by_path_and_type
+
+        Returns:
+
+        """
+        definitions = json_indexes.get_index_definitions('"data"', '"dict"')
+        self.assertEqual(
+            definitions[json_indexes.get_index_name("root.a", "numeric")],
+            (
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"{json_indexes.get_index_name('root.a', 'numeric')} "
+                'ON "data" (("dict" #> %s))',
+                [["root", "a"]],
+            ),
+        )
+        self.assertEqual(
+            definitions[json_indexes.get_index_name("root.a", "text")],
+            (
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"{json_indexes.get_index_name('root.a', 'text')} "
+                'ON "data" (("dict" #>> %s) text_pattern_ops)',
+                [["root", "a"]],
+            ),
+        )
+        self.assertEqual(
+            definitions[json_indexes.get_index_name("root", "text")],
+            (
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"{json_indexes.get_index_name('root', 'text')} "
+                'ON "data" (("dict" ->> %s) text_pattern_ops)',
+                ["root"],
+            ),
+        )
+        self.assertEqual(len(definitions), 3)
+
+    @patch.object(json_indexes, "DATA_CONTENT_GIN_INDEX", True)
+    @patch.object(json_indexes, "DATA_INDEXED_PATHS", {})
+    def test_get_index_definitions_returns_gin_index(self):
+        """test_get_index_definitions_returns_gin_index
+
+        Returns:
+
+        """
+        definitions = json_indexes.get_index_definitions('"data"', '"dict"')
+        self.assertEqual(
+            definitions,
+            {
+                json_indexes.GIN_INDEX_NAME: (
+                    "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                    f"{json_indexes.GIN_INDEX_NAME} "
+                    'ON "data" USING GIN ("dict" jsonb_path_ops)',
+                    [],
+                )
+            },
+        )
+
+    @patch.object(json_indexes, "DATA_INDEXED_PATHS", {1: {"root.a": "date"}})
+    def test_get_index_definitions_with_unsupported_type_raises_error(self):
+        """test_get_index_definitions_with_unsupported_type_raises_error
+
+        Returns:
+
+        """
+        with self.assertRaises(ValueError):
+            json_indexes.get_index_definitions('"data"', '"dict"')
+
+
+class TestUpdateIndexes(TestCase):
+    """TestUpdateIndexes"""
+
+    @patch.object(json_indexes, "DATA_CONTENT_GIN_INDEX", False)
+    @patch.object(
+        json_indexes,
+        "DATA_INDEXED_PATHS",
+        {1: {"root.a": "numeric", "root.b": "numeric"}},
+    )
+    @patch.object(json_indexes, "get_existing_indexes")
+    @patch.object(json_indexes, "connection")
+    def test_update_indexes_creates_missing_and_drops_obsolete_indexes(
+        self, mock_connection, mock_get_existing_indexes
+    ):
+        """test_update_indexes_creates_missing_and_drops_obsolete_indexes
+
+        Args:
+            mock_connection:
+            mock_get_existing_indexes:
+
+        Returns:
+
+        """
+        mock_connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+        index_a = json_indexes.get_index_name("root.a", "numeric")
+        index_b = json_indexes.get_index_name("root.b", "numeric")
+        obsolete_index = json_indexes.get_index_name("root.c", "numeric")
+        mock_get_existing_indexes.return_value = {
+            index_a: True,
+            index_b: False,
+            obsolete_index: True,
+        }
+
+        statements = json_indexes.update_indexes(Data, "dict_content")
+
+        self.assertEqual(
+            [sql.split(" ON ")[0] for sql, _ in statements],
+            [
+                f"DROP INDEX CONCURRENTLY IF EXISTS {index_b}",
+                f"DROP INDEX CONCURRENTLY IF EXISTS {obsolete_index}",
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_b}",
+            ],
+        )
+        mock_cursor = (
+            mock_connection.cursor.return_value.__enter__.return_value
+        )
+        self.assertEqual(mock_cursor.execute.call_count, 3)
+
+    @patch.object(json_indexes, "DATA_CONTENT_GIN_INDEX", True)
+    @patch.object(json_indexes, "DATA_INDEXED_PATHS", {})
+    @patch.object(json_indexes, "get_existing_indexes")
+    @patch.object(json_indexes, "connection")
+    def test_update_indexes_dry_run_does_not_execute_statements(
+        self, mock_connection, mock_get_existing_indexes
+    ):
+        """test_update_indexes_dry_run_does_not_execute_statements
+
+        Args:
+            mock_connection:
+            mock_get_existing_indexes:
+
+        Returns:
+
+        """
+        mock_connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+        mock_get_existing_indexes.return_value = {}
+
+        statements = json_indexes.update_indexes(
+            Data, "dict_content", dry_run=True
+        )
+
+        self.assertEqual(len(statements), 1)
+        mock_connection.cursor.assert_not_called()
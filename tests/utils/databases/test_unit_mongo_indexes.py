@@ -0,0 +1,180 @@
+"""MongoDB indexes unit test class"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pymongo import ASCENDING, DESCENDING
+
+from core_main_app.utils.databases.mongo import indexes
+
+
+class TestGetIndexModels(TestCase):
+    """TestGetIndexModels"""
+
+    @patch.object(
+        indexes,
+        "MONGODB_INDEXED_PATHS",
+        {1: [{"fields": ["root.name", "-root.value"]}]},
+    )
+    def test_get_index_models_returns_partial_index(self):
+        """test_get_index_models_returns_partial_index
+
+        Returns:
+
+        """
+        index_models = indexes.get_index_models()
+        self.assertEqual(len(index_models), 1)
+        index_name, index_model = list(index_models.items())[0]
+        self.assertTrue(index_name.startswith("core_dict_content_1_"))
+        self.assertEqual(
+            list(index_model.document["key"].items()),
+            [
+                ("dict_content.root.name", ASCENDING),
+                ("dict_content.root.value", DESCENDING),
+            ],
+        )
+        self.assertEqual(
+            index_model.document["partialFilterExpression"], {"template": 1}
+        )
+
+    @patch.object(
+        indexes,
+        "MONGODB_INDEXED_PATHS",
+        {1: [{"fields": ["root.name"], "partial": False}]},
+    )
+    def test_get_index_models_returns_compound_index(self):
+        """test_get_index_models_returns_compound_index
+
+        Returns:
+
+        """
+        index_model = list(indexes.get_index_models().values())[0]
+        self.assertEqual(
+            list(index_model.document["key"].items()),
+            [("template", ASCENDING), ("dict_content.root.name", ASCENDING)],
+        )
+        self.assertNotIn("partialFilterExpression", index_model.document)
+
+    def test_get_index_models_returns_different_names(self):
+        """test_get_index_models_returns_different_names
+
+        Returns:
+
+        """
+        with patch.object(
+            indexes,
+            "MONGODB_INDEXED_PATHS",
+            {
+                1: [
+                    {"fields": ["root.name"]},
+                    {"fields": ["root.name"], "partial": False},
+                    {"fields": ["-root.name"]},
+                ],
+                2: [{"fields": ["root.name"]}],
+            },
+        ):
+            self.assertEqual(len(indexes.get_index_models()), 4)
+
+
+class TestCreateIndexes(TestCase):
+    """TestCreateIndexes"""
+
+    @patch.object(
+        indexes,
+        "MONGODB_INDEXED_PATHS",
+        {1: [{"fields": ["root.name"]}, {"fields": ["root.value"]}]},
+    )
+    def test_create_indexes_only_creates_selected_indexes(self):
+        """test_create_indexes_only_creates_selected_indexes
+
+        Returns:
+
+        """
+        index_name = list(indexes.get_index_models())[0]
+        collection = MagicMock()
+        indexes.create_indexes(collection, {index_name})
+        index_models = collection.create_indexes.call_args.args[0]
+        self.assertEqual(
+            [index_model.document["name"] for index_model in index_models],
+            [index_name],
+        )
+
+    @patch.object(indexes, "MONGODB_INDEXED_PATHS", {})
+    def test_create_indexes_without_settings_does_nothing(self):
+        """test_create_indexes_without_settings_does_nothing
+
+        Returns:
+
+        """
+        collection = MagicMock()
+        self.assertEqual(indexes.create_indexes(collection), [])
+        collection.create_indexes.assert_not_called()
+
+
+class TestGetIndexBuilds(TestCase):
+    """TestGetIndexBuilds"""
+
+    def test_get_index_builds_returns_progress(self):
+        """test_get_index_builds_returns_progress
+
+        Returns:
+
+        """
+        collection = MagicMock()
+        collection.database.client.admin.aggregate.return_value = [
+            {"msg": "Index Build", "progress": {"done": 5, "total": 10}}
+        ]
+        self.assertEqual(
+            indexes.get_index_builds(collection),
+            [{"message": "Index Build", "done": 5, "total": 10}],
+        )
+
+    def test_get_index_builds_returns_empty_list_on_error(self):
+        """test_get_index_builds_returns_empty_list_on_error
+
+        Returns:
+
+        """
+        collection = MagicMock()
+        collection.database.client.admin.aggregate.side_effect = Exception(
+            "not authorized"
+        )
+        self.assertEqual(indexes.get_index_builds(collection), [])
+
+
+class TestGetUnusedIndexNames(TestCase):
+    """TestGetUnusedIndexNames"""
+
+    def test_get_unused_index_names_returns_managed_unused_indexes(self):
+        """test_get_unused_index_names_returns_managed_unused_indexes
+
+        Returns:
+
+        """
+        old_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            days=60
+        )
+        recent_date = datetime.now(timezone.utc).replace(
+            tzinfo=None
+        ) - timedelta(days=1)
+        collection = MagicMock()
+        collection.aggregate.return_value = [
+            {"name": "_id_", "accesses": {"ops": 0, "since": old_date}},
+            {
+                "name": "core_dict_content_1_unused",
+                "accesses": {"ops": 0, "since": old_date},
+            },
+            {
+                "name": "core_dict_content_1_used",
+                "accesses": {"ops": 3, "since": old_date},
+            },
+            {
+                "name": "core_dict_content_1_restarted",
+                "accesses": {"ops": 0, "since": recent_date},
+            },
+        ]
+        self.assertEqual(
+            indexes.get_unused_index_names(collection, 30),
+            {"core_dict_content_1_unused"},
+        )
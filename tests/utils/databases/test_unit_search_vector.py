@@ -0,0 +1,139 @@
+"""Search vector unit test class"""
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from core_main_app.components.data.models import Data
+from core_main_app.utils.databases import search_vector
+
+
+class TestGetSearchVectorWeights(TestCase):
+    """TestGetSearchVectorWeights"""
+
+    @patch.object(search_vector, "SEARCH_VECTOR_TEMPLATE_WEIGHTS", {})
+    @patch.object(
+        search_vector, "SEARCH_VECTOR_WEIGHTS", {"title": "A", "content": "B"}
+    )
+    def test_get_search_vector_weights_returns_default_weights(self):
+        """test_get_search_vector_weights_returns_default_weights
+
+        Returns:
+
+        """
+        self.assertEqual(
+            search_vector.get_search_vector_weights(1), ("A", "B")
+        )
+
+    @patch.object(
+        search_vector,
+        "SEARCH_VECTOR_TEMPLATE_WEIGHTS",
+        {1: {"content": "C"}},
+    )
+    @patch.object(
+        search_vector, "SEARCH_VECTOR_WEIGHTS", {"title": "A", "content": "B"}
+    )
+    def test_get_search_vector_weights_returns_template_weights(self):
+        """test_get_search_vector_weights_returns_template_weights
+
+        Returns:
+
+        """
+        self.assertEqual(
+            search_vector.get_search_vector_weights(1), ("A", "C")
+        )
+        self.assertEqual(
+            search_vector.get_search_vector_weights(2), ("A", "B")
+        )
+
+
+class TestUpdateSearchVectors(TestCase):
+    """TestUpdateSearchVectors"""
+
+    def _update_search_vectors(self):
+        """Run update_search_vectors with a mock connection
+
+        Returns:
+            (updated ids, executed sql, params)
+
+        """
+        with patch.object(search_vector, "connection") as mock_connection:
+            mock_connection.ops.quote_name.side_effect = lambda name: (
+                f'"{name}"'
+            )
+            mock_cursor = (
+                mock_connection.cursor.return_value.__enter__.return_value
+            )
+            mock_cursor.fetchall.return_value = [(3,), (4,)]
+            data_ids = search_vector.update_search_vectors(Data, 2, 10)
+            sql, params = mock_cursor.execute.call_args.args
+        return data_ids, sql, params
+
+    @patch.object(search_vector, "SEARCH_VECTOR_TEMPLATE_WEIGHTS", {})
+    def test_update_search_vectors_returns_updated_ids(self):
+        """test_update_search_vectors_returns_updated_ids
+
+        Returns:
+
+        """
+        data_ids, _, _ = self._update_search_vectors()
+        self.assertEqual(data_ids, [3, 4])
+
+    @patch.object(search_vector, "SEARCH_VECTOR_TEMPLATE_WEIGHTS", {})
+    @patch.object(
+        search_vector, "SEARCH_VECTOR_WEIGHTS", {"title": "A", "content": "B"}
+    )
+    def test_update_search_vectors_updates_chunk_from_single_statement(self):
+        """test_update_search_vectors_updates_chunk_from_single_statement
+
+        Returns:
+
+        """
+        _, sql, params = self._update_search_vectors()
+        self.assertIn('UPDATE "core_main_app_data" AS data', sql)
+        self.assertIn("FROM (", sql)
+        self.assertIn("(NULL::bigint, NULL::text, NULL::text)", sql)
+        self.assertEqual(params, ["A", "B", 2, 10])
+
+    @patch.object(
+        search_vector,
+        "SEARCH_VECTOR_TEMPLATE_WEIGHTS",
+        {1: {"title": "B"}, 2: {"content": "D"}},
+    )
+    @patch.object(
+        search_vector, "SEARCH_VECTOR_WEIGHTS", {"title": "A", "content": "B"}
+    )
+    def test_update_search_vectors_joins_template_weights(self):
+        """test_update_search_vectors_joins_template_weights
+
+        Returns:
+
+        """
+        _, sql, params = self._update_search_vectors()
+        self.assertIn(
+            "(%s::bigint, %s::text, %s::text), (%s::bigint, %s::text, %s::text)",
+            sql,
+        )
+        self.assertEqual(params, ["A", "B", 1, "B", "B", 2, "A", "D", 2, 10])
+
+
+class TestJSONValuesSearchVector(TestCase):
+    """TestJSONValuesSearchVector"""
+
+    def test_json_values_search_vector_sets_weight(self):
+        """test_json_values_search_vector_sets_weight
+
+        Returns:
+
+        """
+        compiler = MagicMock()
+        compiler.compile.side_effect = lambda expression: (
+            ("%s", [expression.value])
+            if hasattr(expression, "value")
+            else ('"dict_content"', [])
+        )
+        vector = search_vector.JSONValuesSearchVector(
+            "dict_content", weight="C"
+        )
+        sql, params = vector.as_sql(compiler, MagicMock())
+        self.assertTrue(sql.startswith("setweight(jsonb_to_tsvector("))
+        self.assertEqual(list(params), ["C"])
@@ -2,7 +2,14 @@
 
 from unittest import TestCase
 
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
 from core_main_app.utils.drf.authentication import BearerTokenAuthentication
+from core_main_app.utils.drf.serializers import (
+    FieldsSerializerMixin,
+    parse_fields,
+)
 
 
 class TestBearerTokenAuthentication(TestCase):
@@ -11,3 +18,62 @@ class TestBearerTokenAuthentication(TestCase):
     def test_bearer_token_authentication_class_uses_bearer_keyword(self):
         bearer_token_class = BearerTokenAuthentication()
         self.assertEqual(bearer_token_class.keyword, "Bearer")
+
+
+class TestParseFields(TestCase):
+    """Unit tests for `parse_fields` function."""
+
+    def test_parse_fields_returns_none_if_no_fields(self):
+        self.assertIsNone(parse_fields(None))
+        self.assertIsNone(parse_fields(""))
+
+    def test_parse_fields_splits_string(self):
+        self.assertEqual(parse_fields("id, title,"), ["id", "title"])
+
+    def test_parse_fields_returns_list(self):
+        self.assertEqual(parse_fields(["id", "title"]), ["id", "title"])
+
+
+class TestFieldsSerializerMixin(TestCase):
+    """Unit tests for `FieldsSerializerMixin` class."""
+
+    def test_serializer_returns_requested_fields(self):
+        serializer = MockFieldsSerializer(
+            {"id": 1, "title": "title", "content": "content"},
+            fields=["id", "title"],
+        )
+        self.assertEqual(serializer.data, {"id": 1, "title": "title"})
+
+    def test_serializer_returns_all_fields_by_default(self):
+        serializer = MockFieldsSerializer(
+            {"id": 1, "title": "title", "content": "content"}
+        )
+        self.assertEqual(len(serializer.data), 3)
+
+    def test_list_serializer_returns_requested_fields(self):
+        serializer = MockFieldsSerializer(
+            [{"id": 1, "title": "title", "content": "content"}],
+            many=True,
+            fields=["title"],
+        )
+        self.assertEqual(serializer.data, [{"title": "title"}])
+
+    def test_serializer_with_unknown_field_raises_validation_error(self):
+        with self.assertRaises(ValidationError):
+            MockFieldsSerializer({}, fields=["id", "unknown"])
+
+    def test_check_fields_with_unknown_field_raises_validation_error(self):
+        with self.assertRaises(ValidationError):
+            MockFieldsSerializer.check_fields(["unknown"])
+
+    def test_check_fields_with_known_fields_does_not_raise(self):
+        MockFieldsSerializer.check_fields(["id", "content"])
+        MockFieldsSerializer.check_fields(None)
+
+
+class MockFieldsSerializer(FieldsSerializerMixin, serializers.Serializer):
+    """Mock serializer"""
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    content = serializers.CharField()
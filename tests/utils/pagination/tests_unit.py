@@ -0,0 +1,226 @@
+"""Unit tests for pagination utils"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+
+from core_main_app.components.data.models import Data
+from core_main_app.utils.datetime import datetime_now
+from core_main_app.utils.pagination.rest_framework_paginator import (
+    pagination,
+)
+
+
+class TestParseOrdering(TestCase):
+    """Test _parse_ordering"""
+
+    def test_parse_ordering_adds_pk_tiebreaker(self):
+        """test_parse_ordering_adds_pk_tiebreaker
+
+        Returns:
+
+        """
+        self.assertEqual(
+            pagination._parse_ordering(["-title", "+last_modification_date"]),
+            [
+                ("title", True),
+                ("last_modification_date", False),
+                ("pk", False),
+            ],
+        )
+
+    def test_parse_empty_ordering_returns_pk(self):
+        """test_parse_empty_ordering_returns_pk
+
+        Returns:
+
+        """
+        self.assertEqual(pagination._parse_ordering([]), [("pk", False)])
+
+
+class TestGetKeysetFilter(TestCase):
+    """Test _get_keyset_filter"""
+
+    def test_get_keyset_filter_builds_lexicographic_condition(self):
+        """test_get_keyset_filter_builds_lexicographic_condition
+
+        Returns:
+
+        """
+        result = pagination._get_keyset_filter(
+            Q, [("title", True), ("pk", False)], ["a", 2]
+        )
+
+        self.assertEqual(
+            result, Q(title__lt="a") | (Q(pk__gt=2) & Q(title="a"))
+        )
+
+    def test_get_keyset_filter_selects_null_values_after_other_values(self):
+        """test_get_keyset_filter_selects_null_values_after_other_values
+
+        Returns:
+
+        """
+        result = pagination._get_keyset_filter(
+            Q, [("workspace", False), ("pk", False)], [1, 2], {"workspace"}
+        )
+
+        self.assertEqual(
+            result,
+            (Q(workspace__gt=1) | Q(workspace=None))
+            | (Q(pk__gt=2) & Q(workspace=1)),
+        )
+
+    def test_get_keyset_filter_with_null_value_selects_next_null_values(
+        self,
+    ):
+        """test_get_keyset_filter_with_null_value_selects_next_null_values
+
+        Returns:
+
+        """
+        result = pagination._get_keyset_filter(
+            Q, [("workspace", True), ("pk", False)], [None, 2], {"workspace"}
+        )
+
+        self.assertEqual(result, Q(pk__gt=2) & Q(workspace=None))
+
+    def test_get_keyset_filter_with_nulls_first_selects_not_null_values(
+        self,
+    ):
+        """test_get_keyset_filter_with_nulls_first_selects_not_null_values
+
+        Returns:
+
+        """
+        result = pagination._get_keyset_filter(
+            Q,
+            [("title", False), ("pk", False)],
+            [None, 2],
+            {"title"},
+            nulls_last=False,
+        )
+
+        self.assertEqual(
+            result, Q(title__ne=None) | (Q(pk__gt=2) & Q(title=None))
+        )
+
+
+class TestCursor(TestCase):
+    """Test cursor encoding"""
+
+    def test_decode_encoded_cursor_returns_values(self):
+        """test_decode_encoded_cursor_returns_values
+
+        Returns:
+
+        """
+        values = ["title", datetime_now(), 3]
+
+        result = pagination._decode_cursor(
+            pagination._encode_cursor(values), 3
+        )
+
+        self.assertEqual(result, values)
+
+    def test_decode_invalid_cursor_raises_validation_error(self):
+        """test_decode_invalid_cursor_raises_validation_error
+
+        Returns:
+
+        """
+        with self.assertRaises(ValidationError):
+            pagination._decode_cursor("invalid", 1)
+
+    def test_decode_cursor_with_wrong_number_of_values_raises_validation_error(
+        self,
+    ):
+        """test_decode_cursor_with_wrong_number_of_values_raises_validation_error
+
+        Returns:
+
+        """
+        with self.assertRaises(ValidationError):
+            pagination._decode_cursor(pagination._encode_cursor([1]), 2)
+
+
+class TestGetAttributeNames(TestCase):
+    """Test _get_attribute_names"""
+
+    def test_get_attribute_names_returns_id_of_foreign_keys(self):
+        """test_get_attribute_names_returns_id_of_foreign_keys
+
+        Returns:
+
+        """
+        self.assertEqual(
+            pagination._get_attribute_names(
+                Data.objects.all(),
+                [("template", False), ("title", True), ("pk", False)],
+            ),
+            ["template_id", "title", "pk"],
+        )
+
+
+class TestLoadSortingFields(TestCase):
+    """Test _load_sorting_fields"""
+
+    def test_load_sorting_fields_adds_sorting_fields_to_projection(self):
+        """test_load_sorting_fields_adds_sorting_fields_to_projection
+
+        Returns:
+
+        """
+        queryset = pagination._load_sorting_fields(
+            Data.objects.only("title"),
+            [("template", False), ("pk", False)],
+        )
+
+        self.assertEqual(
+            queryset.query.deferred_loading,
+            ({"title", "template"}, False),
+        )
+
+    def test_load_sorting_fields_removes_sorting_fields_from_deferred_fields(
+        self,
+    ):
+        """test_load_sorting_fields_removes_sorting_fields_from_deferred_fields
+
+        Returns:
+
+        """
+        queryset = pagination._load_sorting_fields(
+            Data.objects.defer("title", "xml_file"),
+            [("title", False), ("pk", False)],
+        )
+
+        self.assertEqual(queryset.query.deferred_loading, ({"xml_file"}, True))
+
+
+class TestGetEstimatedCount(TestCase):
+    """Test _get_estimated_count"""
+
+    @patch.object(QuerySet, "count", return_value=1)
+    @patch.object(pagination, "connections")
+    def test_get_estimated_count_of_filtered_queryset_returns_exact_count(
+        self, mock_connections, mock_count
+    ):
+        """test_get_estimated_count_of_filtered_queryset_returns_exact_count
+
+        Args:
+            mock_connections:
+            mock_count:
+
+        Returns:
+
+        """
+        mock_connections.__getitem__.return_value.vendor = "postgresql"
+
+        result = pagination._get_estimated_count(
+            Data.objects.filter(title="title")
+        )
+
+        self.assertEqual(result, 1)
+        mock_connections.__getitem__.return_value.cursor.assert_not_called()
@@ -3,16 +3,23 @@
 import copy
 import re
 from unittest import TestCase
+from unittest.mock import patch
 
+from django.db.models.fields.json import KT
+from django.db.models.lookups import Exact
 from django.test import override_settings
 
 from core_main_app.commons.exceptions import QueryError
+from core_main_app.utils.databases import json_indexes
+from core_main_app.utils.query.mongo import prepare
 from core_main_app.utils.query.mongo.prepare import (
     _compile_regex,
     _add_sub_document_root,
     sanitize_number,
     sanitize_value,
     convert_to_django,
+    get_query_plan,
+    prepare_query,
 )
 
 
@@ -231,6 +238,260 @@ class TestAddSubDocumentRoot(TestCase):
         self.assertEqual(query, expected_query)
 
 
+class TestPrepareQueryCopy(TestCase):
+    """TestPrepareQueryCopy"""
+
+    def test_prepare_query_does_not_modify_query(self):
+        """test prepare query does not modify query
+
+        Returns:
+
+        """
+        # set query
+        query = {"a": "/regex/", "$or": [{"b": {"c": "/regex/"}}]}
+        expected_query = copy.deepcopy(query)
+        # prepare query
+        prepare_query(query, sub_document_root="dict_content")
+        # assert
+        self.assertEqual(query, expected_query)
+
+    def test_prepare_query_returns_same_query_as_compile_and_add_root(self):
+        """test prepare query returns same query as compile and add root
+
+        Returns:
+
+        """
+        # set query
+        query = {
+            "a": "/regex/",
+            "$or": [{"b": {"c": "/regex/"}}, {"d": 1, "$text": "test"}],
+            "e": [1, "/regex/"],
+        }
+        expected_query = copy.deepcopy(query)
+        _compile_regex(expected_query)
+        _add_sub_document_root(expected_query, "dict_content")
+        # prepare query
+        prepared_query = prepare_query(query, sub_document_root="dict_content")
+        # assert
+        self.assertEqual(repr(prepared_query), repr(expected_query))
+
+
+class TestGetQueryPlan(TestCase):
+    """TestGetQueryPlan"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        prepare.query_plan_cache.clear()
+        self.addCleanup(prepare.query_plan_cache.clear)
+
+    def test_get_query_plan_returns_filters_and_converted_query(self):
+        """test get query plan returns filters and converted query
+
+        Returns:
+
+        """
+        # set query
+        query = {"workspace": {"$in": [1, 2]}, "user_id": 3, "title": "test"}
+        # get query plan
+        workspace_filter, user_filter, django_query = get_query_plan(query)
+        # assert
+        self.assertEqual(workspace_filter, [1, 2])
+        self.assertEqual(user_filter, ["3"])
+        self.assertEqual(django_query, convert_to_django(query))
+
+    def test_get_query_plan_converts_same_query_once(self):
+        """test get query plan converts same query once
+
+        Returns:
+
+        """
+        with patch.object(
+            prepare, "convert_to_django", wraps=convert_to_django
+        ) as mock_convert:
+            get_query_plan(prepare_query({"title": "/test/"}))
+            get_query_plan(prepare_query({"title": "/test/"}))
+        # assert
+        self.assertEqual(mock_convert.call_count, 1)
+
+    def test_get_query_plan_converts_different_queries(self):
+        """test get query plan converts different queries
+
+        Returns:
+
+        """
+        with patch.object(
+            prepare, "convert_to_django", wraps=convert_to_django
+        ) as mock_convert:
+            get_query_plan({"a": 1, "$or": [{"b": 1}]})
+            get_query_plan({"$or": [{"b": 1}], "a": 1})
+            get_query_plan({"a": "1", "$or": [{"b": 1}]})
+        # assert
+        self.assertEqual(mock_convert.call_count, 3)
+
+    def test_get_query_plan_returns_copies_of_filters(self):
+        """test get query plan returns copies of filters
+
+        Returns:
+
+        """
+        # get query plan and modify filters
+        workspace_filter, _, _ = get_query_plan({"workspace": 1})
+        workspace_filter.append(2)
+        # assert
+        self.assertEqual(get_query_plan({"workspace": 1})[0], [1])
+
+    def test_get_query_plan_does_not_cache_invalid_query(self):
+        """test get query plan does not cache invalid query
+
+        Returns:
+
+        """
+        with self.assertRaises(QueryError):
+            get_query_plan({"a": {"$where": "1"}})
+        # assert
+        self.assertEqual(len(prepare.query_plan_cache), 0)
+
+
+class TestConvertToDjangoWhereOperator(TestCase):
+    """TestConvertToDjangoWhereOperator"""
+
+    def test_where_operator_in_sub_query_raises_error(self):
+        """test where operator in sub query raises error
+
+        Returns:
+
+        """
+        with self.assertRaises(QueryError):
+            convert_to_django({"$and": [{"a": {"$where": "true"}}]})
+
+    def test_where_operator_in_value_raises_error(self):
+        """test where operator in value raises error
+
+        Returns:
+
+        """
+        with self.assertRaises(QueryError):
+            convert_to_django({"workspace": "$where"})
+
+    def test_where_operator_in_regex_raises_error(self):
+        """test where operator in regex raises error
+
+        Returns:
+
+        """
+        with self.assertRaises(QueryError):
+            convert_to_django({"a": re.compile("$where")})
+
+
+class TestConvertToDjangoJsonIndexes(TestCase):
+    """TestConvertToDjangoJsonIndexes"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        for patcher in (
+            patch.object(
+                prepare, "uses_postgresql_backend", return_value=True
+            ),
+            patch.object(
+                json_indexes,
+                "DATA_INDEXED_PATHS",
+                {1: {"root.num": "numeric", "root.text": "text"}},
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_text_path_uses_text_lookup(self):
+        """test text path uses text lookup
+
+        Returns:
+
+        """
+        from django.db.models import Q
+
+        self.assertEqual(
+            convert_to_django({"dict_content.root.text": "value"}),
+            Q(Exact(KT("dict_content__root__text"), "value")),
+        )
+
+    def test_numeric_path_uses_default_lookup(self):
+        """test numeric path uses default lookup
+
+        Returns:
+
+        """
+        from django.db.models import Q
+
+        self.assertEqual(
+            convert_to_django({"dict_content.root.num": {"$gt": 1}}),
+            Q(dict_content__root__num__gt=1),
+        )
+
+    @patch.object(prepare, "DATA_CONTENT_GIN_INDEX", True)
+    def test_other_path_uses_containment_lookup_with_gin_index(self):
+        """test other path uses containment lookup with gin index
+
+        Returns:
+
+        """
+        from django.db.models import Q
+
+        self.assertEqual(
+            convert_to_django({"dict_content.root.other": 1}),
+            Q(dict_content__contains={"root": {"other": 1}}),
+        )
+
+    @patch.object(prepare, "DATA_CONTENT_GIN_INDEX", True)
+    def test_array_index_path_uses_default_lookup_with_gin_index(self):
+        """test array index path uses default lookup with gin index
+
+        Returns:
+
+        """
+        from django.db.models import Q
+
+        self.assertEqual(
+            convert_to_django({"dict_content.root.0": 1}),
+            Q(dict_content__root__0__exact=1),
+        )
+
+    @patch.object(prepare, "DATA_CONTENT_GIN_INDEX", True)
+    def test_negated_criteria_uses_default_lookup_with_gin_index(self):
+        """test negated criteria uses default lookup with gin index
+
+        Returns:
+
+        """
+        from django.db.models import Q
+
+        self.assertEqual(
+            convert_to_django({"dict_content.root.other": {"$ne": 1}}),
+            ~Q(dict_content__root__other__exact=1),
+        )
+
+    @patch.object(prepare, "DATA_CONTENT_GIN_INDEX", False)
+    def test_other_path_uses_default_lookup_without_gin_index(self):
+        """test other path uses default lookup without gin index
+
+        Returns:
+
+        """
+        from django.db.models import Q
+
+        self.assertEqual(
+            convert_to_django({"dict_content.root.other": 1}),
+            Q(dict_content__root__other__exact=1),
+        )
+
+
 class TestSanitizeNumber(TestCase):
     """TestSanitizeNumber"""
 
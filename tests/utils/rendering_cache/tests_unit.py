@@ -0,0 +1,163 @@
+"""Unit tests for `core_main_app.utils.rendering_cache` module."""
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+
+from core_main_app.utils import rendering_cache
+
+
+def _mock_data(data_id=1, checksum="checksum"):
+    """Return a mock data
+
+    Args:
+        data_id:
+        checksum:
+
+    Returns:
+
+    """
+    return MagicMock(id=data_id, checksum=checksum)
+
+
+@patch.object(rendering_cache, "RENDERED_HTML_CACHE_TTL", 60)
+class TestGetRenderedHtml(TestCase):
+    """Unit tests for `get_rendered_html` function."""
+
+    def setUp(self):
+        """setUp"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_rendering_is_cached(self):
+        """test_rendering_is_cached"""
+        render = MagicMock(return_value="<p>html</p>")
+        data = _mock_data()
+
+        for _ in range(2):
+            html = rendering_cache.get_rendered_html(data, "html:1", render)
+
+        self.assertEqual(html, "<p>html</p>")
+        render.assert_called_once()
+
+    def test_rendering_is_not_cached_without_data_id(self):
+        """test_rendering_is_not_cached_without_data_id"""
+        render = MagicMock(return_value="<p>html</p>")
+
+        for data in ({"content": "<root/>"}, _mock_data(data_id=None)):
+            rendering_cache.get_rendered_html(data, "html:1", render)
+            rendering_cache.get_rendered_html(data, "html:1", render)
+
+        self.assertEqual(render.call_count, 4)
+
+    def test_new_data_version_is_rendered(self):
+        """test_new_data_version_is_rendered"""
+        render = MagicMock(return_value="<p>html</p>")
+
+        rendering_cache.get_rendered_html(_mock_data(), "html:1", render)
+        rendering_cache.get_rendered_html(
+            _mock_data(checksum="new"), "html:1", render
+        )
+        rendering_cache.get_rendered_html(
+            _mock_data(), "html:1", render, rendering_version="new"
+        )
+
+        self.assertEqual(render.call_count, 3)
+
+    def test_clear_data_cache_invalidates_data_renderings(self):
+        """test_clear_data_cache_invalidates_data_renderings"""
+        render = MagicMock(return_value="<p>html</p>")
+
+        rendering_cache.get_rendered_html(_mock_data(1), "html:1", render)
+        rendering_cache.get_rendered_html(_mock_data(2), "html:1", render)
+        rendering_cache.clear_data_cache(1)
+        rendering_cache.get_rendered_html(_mock_data(1), "html:1", render)
+        rendering_cache.get_rendered_html(_mock_data(2), "html:1", render)
+
+        self.assertEqual(render.call_count, 3)
+
+    def test_clear_rendering_cache_invalidates_rendering(self):
+        """test_clear_rendering_cache_invalidates_rendering"""
+        render = MagicMock(return_value="<p>html</p>")
+
+        rendering_cache.get_rendered_html(_mock_data(), "html:1", render)
+        rendering_cache.get_rendered_html(_mock_data(), "xslt:1", render)
+        rendering_cache.clear_rendering_cache("html:1")
+        rendering_cache.get_rendered_html(_mock_data(), "html:1", render)
+        rendering_cache.get_rendered_html(_mock_data(), "xslt:1", render)
+
+        self.assertEqual(render.call_count, 3)
+
+    def test_failed_rendering_is_not_cached(self):
+        """test_failed_rendering_is_not_cached"""
+        render = MagicMock(side_effect=[Exception("error"), "<p>html</p>"])
+
+        with self.assertRaises(Exception):
+            rendering_cache.get_rendered_html(_mock_data(), "html:1", render)
+        html = rendering_cache.get_rendered_html(
+            _mock_data(), "html:1", render
+        )
+
+        self.assertEqual(html, "<p>html</p>")
+
+    def test_template_html_rendering_signal_invalidates_renderings(self):
+        """test_template_html_rendering_signal_invalidates_renderings"""
+        render = MagicMock(return_value="<p>html</p>")
+        rendering_key = rendering_cache.get_html_rendering_key(
+            3, "detail_rendering"
+        )
+
+        rendering_cache.get_rendered_html(_mock_data(), rendering_key, render)
+        rendering_cache.post_save_template_html_rendering(
+            None, MagicMock(template_id=3)
+        )
+        rendering_cache.get_rendered_html(_mock_data(), rendering_key, render)
+
+        self.assertEqual(render.call_count, 2)
+
+
+@patch.object(rendering_cache, "RENDERED_HTML_CACHE_TTL", 60)
+class TestGetManyRenderedHtml(TestCase):
+    """Unit tests for `get_many_rendered_html` function."""
+
+    def setUp(self):
+        """setUp"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_only_data_not_cached_are_rendered(self):
+        """test_only_data_not_cached_are_rendered"""
+        render_many = MagicMock(
+            side_effect=lambda data_list: [
+                f"<p>{data.id}</p>" for data in data_list
+            ]
+        )
+        rendering_cache.get_rendered_html(
+            _mock_data(2), "html:1", lambda: "<p>cached</p>"
+        )
+
+        html_list = rendering_cache.get_many_rendered_html(
+            [_mock_data(1), _mock_data(2), _mock_data(3)],
+            "html:1",
+            render_many,
+        )
+
+        self.assertEqual(html_list, ["<p>1</p>", "<p>cached</p>", "<p>3</p>"])
+        self.assertEqual(
+            [data.id for data in render_many.call_args.args[0]], [1, 3]
+        )
+
+
+class TestGetRenderedHtmlDisabled(TestCase):
+    """Unit tests for `get_rendered_html` function with cache disabled."""
+
+    @patch.object(rendering_cache, "RENDERED_HTML_CACHE_TTL", 0)
+    def test_rendering_is_not_cached(self):
+        """test_rendering_is_not_cached"""
+        render = MagicMock(return_value="<p>html</p>")
+
+        rendering_cache.get_rendered_html(_mock_data(), "html:1", render)
+        rendering_cache.get_rendered_html(_mock_data(), "html:1", render)
+
+        self.assertEqual(render.call_count, 2)
@@ -0,0 +1,153 @@
+"""HTTP cache unit tests"""
+
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_main_app.utils.requests_utils import http_cache
+
+
+def _get_response(status_code=200, content=b"<xs:schema/>", headers=None):
+    """Return a mock response
+
+    Args:
+        status_code:
+        content:
+        headers:
+
+    Returns:
+
+    """
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestGetDocumentContent(TestCase):
+    """Test Get Document Content"""
+
+    url = "https://example.com/dependency.xsd"
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        http_cache.http_cache.clear()
+
+    @patch.object(http_cache, "send_session_get_request")
+    def test_fresh_document_is_not_downloaded_again(self, mock_get):
+        """test_fresh_document_is_not_downloaded_again
+
+        Returns:
+
+        """
+        mock_get.return_value = _get_response(
+            headers={"Cache-Control": "max-age=3600"}
+        )
+
+        self.assertEqual(
+            http_cache.get_document_content(self.url), b"<xs:schema/>"
+        )
+        self.assertEqual(
+            http_cache.get_document_content(self.url), b"<xs:schema/>"
+        )
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch.object(http_cache, "send_session_get_request")
+    def test_document_with_etag_is_revalidated(self, mock_get):
+        """test_document_with_etag_is_revalidated
+
+        Returns:
+
+        """
+        mock_get.side_effect = [
+            _get_response(headers={"ETag": '"v1"'}),
+            _get_response(status_code=304, content=b""),
+        ]
+
+        http_cache.get_document_content(self.url)
+        content = http_cache.get_document_content(self.url)
+
+        self.assertEqual(content, b"<xs:schema/>")
+        self.assertEqual(
+            mock_get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+        )
+
+    @patch.object(http_cache, "send_session_get_request")
+    def test_modified_document_is_updated(self, mock_get):
+        """test_modified_document_is_updated
+
+        Returns:
+
+        """
+        mock_get.side_effect = [
+            _get_response(headers={"ETag": '"v1"'}),
+            _get_response(content=b"<v2/>", headers={"ETag": '"v2"'}),
+        ]
+
+        http_cache.get_document_content(self.url)
+
+        self.assertEqual(http_cache.get_document_content(self.url), b"<v2/>")
+        self.assertEqual(http_cache.http_cache.get(self.url).etag, '"v2"')
+
+    @patch.object(http_cache, "send_session_get_request")
+    def test_no_store_document_is_not_cached(self, mock_get):
+        """test_no_store_document_is_not_cached
+
+        Returns:
+
+        """
+        mock_get.return_value = _get_response(
+            headers={"Cache-Control": "no-store, max-age=3600", "ETag": '"v1"'}
+        )
+
+        http_cache.get_document_content(self.url)
+
+        self.assertIsNone(http_cache.http_cache.get(self.url))
+
+    @patch.object(http_cache, "send_session_get_request")
+    def test_no_cache_document_is_revalidated(self, mock_get):
+        """test_no_cache_document_is_revalidated
+
+        Returns:
+
+        """
+        mock_get.return_value = _get_response(
+            headers={"Cache-Control": "no-cache, max-age=3600", "ETag": '"v1"'}
+        )
+
+        http_cache.get_document_content(self.url)
+        http_cache.get_document_content(self.url)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(http_cache, "send_session_get_request")
+    def test_error_response_is_not_cached(self, mock_get):
+        """test_error_response_is_not_cached
+
+        Returns:
+
+        """
+        mock_get.return_value = _get_response(
+            status_code=500, headers={"Cache-Control": "max-age=3600"}
+        )
+
+        http_cache.get_document_content(self.url)
+
+        self.assertIsNone(http_cache.http_cache.get(self.url))
+
+    @patch.object(http_cache, "send_session_get_request")
+    def test_request_is_sent_without_cookies(self, mock_get):
+        """test_request_is_sent_without_cookies
+
+        Returns:
+
+        """
+        mock_get.return_value = _get_response()
+
+        http_cache.get_document_content(self.url)
+
+        self.assertNotIn("cookies", mock_get.call_args.kwargs)
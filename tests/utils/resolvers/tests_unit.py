@@ -0,0 +1,146 @@
+"""Cached requests resolver unit tests"""
+
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from django.urls import reverse
+
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.settings import SERVER_URI
+from core_main_app.utils.resolvers import cached_requests_resolver
+from core_main_app.utils.resolvers.cached_requests_resolver import (
+    CachedRequestsResolver,
+)
+from core_main_app.utils.urls import get_template_id_from_url
+
+
+def _get_template_url(template_id, server_uri=SERVER_URI):
+    """Return the download url of a template
+
+    Args:
+        template_id:
+        server_uri:
+
+    Returns:
+
+    """
+    return server_uri + reverse(
+        "core_main_app_rest_template_download", kwargs={"pk": template_id}
+    )
+
+
+class TestGetTemplateIdFromUrl(TestCase):
+    """Test Get Template Id From Url"""
+
+    def test_template_download_url_returns_id(self):
+        """test_template_download_url_returns_id
+
+        Returns:
+
+        """
+        self.assertEqual(get_template_id_from_url(_get_template_url(1)), "1")
+
+    def test_other_server_url_returns_none(self):
+        """test_other_server_url_returns_none
+
+        Returns:
+
+        """
+        self.assertIsNone(
+            get_template_id_from_url(
+                _get_template_url(1, server_uri="https://example.com")
+            )
+        )
+
+    def test_other_url_returns_none(self):
+        """test_other_url_returns_none
+
+        Returns:
+
+        """
+        self.assertIsNone(get_template_id_from_url(SERVER_URI + "/schema.xsd"))
+
+
+class TestCachedRequestsResolver(TestCase):
+    """Test Cached Requests Resolver"""
+
+    @patch.object(CachedRequestsResolver, "resolve_string")
+    @patch.object(cached_requests_resolver, "get_document_content")
+    @patch("core_main_app.components.template.api.get_by_id")
+    def test_local_template_is_read_from_database(
+        self, mock_get_by_id, mock_get_document_content, mock_resolve_string
+    ):
+        """test_local_template_is_read_from_database
+
+        Returns:
+
+        """
+        request = MagicMock()
+        mock_get_by_id.return_value = MagicMock(content="<xs:schema/>")
+
+        CachedRequestsResolver(request=request).resolve(
+            _get_template_url(1), None, None
+        )
+
+        mock_get_by_id.assert_called_with("1", request=request)
+        mock_get_document_content.assert_not_called()
+        mock_resolve_string.assert_called_with("<xs:schema/>", None)
+
+    @patch(
+        "core_main_app.components.template.access_control.check_can_read_template"
+    )
+    @patch("core_main_app.system.api.get_template_by_id")
+    def test_local_template_without_request_checks_anonymous_access(
+        self, mock_get_template_by_id, mock_check_can_read_template
+    ):
+        """test_local_template_without_request_checks_anonymous_access
+
+        Returns:
+
+        """
+        mock_check_can_read_template.side_effect = AccessControlError("error")
+
+        result = CachedRequestsResolver().resolve(
+            _get_template_url(1), None, None
+        )
+
+        self.assertIsNone(result)
+        self.assertTrue(
+            mock_check_can_read_template.call_args.args[1].is_anonymous
+        )
+
+    @patch.object(CachedRequestsResolver, "resolve_string")
+    @patch.object(cached_requests_resolver, "get_document_content")
+    def test_remote_url_is_downloaded_with_cache(
+        self, mock_get_document_content, mock_resolve_string
+    ):
+        """test_remote_url_is_downloaded_with_cache
+
+        Returns:
+
+        """
+        mock_get_document_content.return_value = b"<xs:schema/>"
+
+        CachedRequestsResolver().resolve(
+            "https://example.com/schema.xsd", None, None
+        )
+
+        mock_get_document_content.assert_called_with(
+            "https://example.com/schema.xsd"
+        )
+        mock_resolve_string.assert_called_with(b"<xs:schema/>", None)
+
+    @patch.object(cached_requests_resolver, "get_document_content")
+    def test_error_returns_none(self, mock_get_document_content):
+        """test_error_returns_none
+
+        Returns:
+
+        """
+        mock_get_document_content.side_effect = Exception("error")
+
+        self.assertIsNone(
+            CachedRequestsResolver().resolve(
+                "https://example.com/schema.xsd", None, None
+            )
+        )
@@ -0,0 +1,109 @@
+"""Storage utils unit test class"""
+
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, PropertyMock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from core_main_app.utils.storage import storage
+
+
+class TestReadFile(TestCase):
+    """TestReadFile"""
+
+    def test_read_file_from_filesystem_returns_decoded_content(self):
+        """test_read_file_from_filesystem_returns_decoded_content
+
+        Returns:
+
+        """
+        with tempfile.NamedTemporaryFile(suffix=".xml") as file:
+            file.write("<root>été</root>".encode("utf-8"))
+            file.flush()
+            file_field = _create_file_field(file.name)
+
+            self.assertEqual(storage.read_file(file_field), "<root>été</root>")
+            file_field.read.assert_not_called()
+
+    def test_read_empty_file_returns_empty_string(self):
+        """test_read_empty_file_returns_empty_string
+
+        Returns:
+
+        """
+        with tempfile.NamedTemporaryFile(suffix=".xml") as file:
+            file_field = _create_file_field(file.name)
+            file_field.read.return_value = b""
+
+            self.assertEqual(storage.read_file(file_field), "")
+
+    def test_read_file_without_local_path_reads_from_storage(self):
+        """test_read_file_without_local_path_reads_from_storage
+
+        Returns:
+
+        """
+        file_field = _create_file_field(None)
+        type(file_field).path = PropertyMock(side_effect=NotImplementedError)
+        file_field.read.return_value = b"<root/>"
+
+        self.assertEqual(storage.read_file(file_field), "<root/>")
+
+    def test_read_file_not_saved_reads_file(self):
+        """test_read_file_not_saved_reads_file
+
+        Returns:
+
+        """
+        file_field = SimpleUploadedFile(name="file.xml", content=b"<root/>")
+
+        self.assertEqual(storage.read_file(file_field), "<root/>")
+
+
+class TestIsFileSaved(TestCase):
+    """TestIsFileSaved"""
+
+    def test_is_file_saved_returns_true_if_committed(self):
+        """test_is_file_saved_returns_true_if_committed
+
+        Returns:
+
+        """
+        self.assertTrue(storage.is_file_saved(_create_file_field("path")))
+
+    def test_is_file_saved_returns_false_if_not_committed(self):
+        """test_is_file_saved_returns_false_if_not_committed
+
+        Returns:
+
+        """
+        file_field = _create_file_field("path")
+        file_field._committed = False
+        self.assertFalse(storage.is_file_saved(file_field))
+
+    def test_is_file_saved_returns_false_without_name(self):
+        """test_is_file_saved_returns_false_without_name
+
+        Returns:
+
+        """
+        file_field = _create_file_field("path")
+        file_field.name = ""
+        self.assertFalse(storage.is_file_saved(file_field))
+
+
+def _create_file_field(path):
+    """Create a mock file field saved at a path
+
+    Args:
+        path:
+
+    Returns:
+
+    """
+    file_field = MagicMock()
+    file_field.name = "file.xml"
+    file_field._committed = True
+    file_field.path = path
+    return file_field
@@ -134,6 +134,21 @@ class TestCheckSettings(TestCase):
         _check_settings()
         self.assertFalse(mock_logged_in_signals.connect.called)
 
+    @patch(
+        "core_main_app.utils.databases.json_indexes.DATA_INDEXED_PATHS",
+        {1: {"root.a": "date"}},
+    )
+    def test_check_settings_data_indexed_paths_improperly_set_raises_error(
+        self,
+    ):
+        """test_check_settings_data_indexed_paths_improperly_set_raises_error
+
+        Returns:
+
+        """
+        with self.assertRaises(CoreError):
+            _check_settings()
+
 
 class TestInitBlobProcessingModules(TestCase):
     """TestInitBlobProcessingModules"""
@@ -14,6 +14,7 @@ from core_main_app.utils.file import (
     get_data_file_extension_for_template_format,
     get_template_file_extension_for_template_format,
     get_file_http_response,
+    get_safe_file_name,
 )
 
 
@@ -156,6 +157,40 @@ class TestGetFileExtension(TestCase):
         self.assertEqual(result, "")
 
 
+class TestGetSafeFileName(TestCase):
+    """TestGetSafeFileName"""
+
+    def test_get_safe_file_name_replaces_path_separators_and_parent_directory(
+        self,
+    ):
+        """test_get_safe_file_name_replaces_path_separators_and_parent_directory
+
+        Returns:
+
+        """
+        result = get_safe_file_name("../..\\a/b")
+        self.assertNotIn("/", result)
+        self.assertNotIn("\\", result)
+        self.assertNotIn("..", result)
+
+    def test_get_safe_file_name_keeps_valid_file_name(self):
+        """test_get_safe_file_name_keeps_valid_file_name
+
+        Returns:
+
+        """
+        self.assertEqual(get_safe_file_name("1_title.xml"), "1_title.xml")
+
+    def test_get_safe_file_name_returns_default_if_empty(self):
+        """test_get_safe_file_name_returns_default_if_empty
+
+        Returns:
+
+        """
+        self.assertEqual(get_safe_file_name(".."), "_")
+        self.assertEqual(get_safe_file_name(" . "), "file")
+
+
 class TestGetFileInfoFromConstants(TestCase):
     """TestGetFileInfoFromConstants"""
 
@@ -116,6 +116,211 @@ class TestRawXmlToDict(TestCase):
             xml_utils.raw_xml_to_dict(raw_xml, postprocessor=1)
 
 
+class TestRawXmlToDictWithListLimit(TestCase):
+    """Unit tests for `raw_xml_to_dict` function with a list limit."""
+
+    def _assert_same_as_remove_lists(self, raw_xml, list_limit, **kwargs):
+        """Assert that lists removed while parsing give the same dict as
+        remove_lists_from_xml_dict
+
+        Args:
+            raw_xml:
+            list_limit:
+            kwargs:
+
+        Returns:
+
+        """
+        expected_dict = xml_utils.raw_xml_to_dict(raw_xml, **kwargs)
+        xml_utils.remove_lists_from_xml_dict(expected_dict, list_limit)
+        xml_dict = xml_utils.raw_xml_to_dict(
+            raw_xml, list_limit=list_limit, **kwargs
+        )
+        self.assertEqual(expected_dict, xml_dict)
+        return xml_dict
+
+    def test_raw_to_dict_removes_lists_exceeding_limit(self):
+        """Test lists exceeding the limit are removed"""
+        # Arrange
+        raw_xml = "<root><a>1</a><a>2</a><a>3</a><b>4</b><b>5</b></root>"
+
+        # Act
+        xml_dict = self._assert_same_as_remove_lists(raw_xml, 2)
+
+        # Assert
+        self.assertEqual(xml_dict, {"root": {"b": ["4", "5"]}})
+
+    def test_raw_to_dict_keeps_empty_parent_of_removed_list(self):
+        """Test parent of a removed list is an empty dict"""
+        # Arrange
+        raw_xml = "<root><list><a>1</a><a>2</a></list></root>"
+
+        # Act
+        xml_dict = self._assert_same_as_remove_lists(raw_xml, 1)
+
+        # Assert
+        self.assertEqual(xml_dict, {"root": {"list": {}}})
+
+    def test_raw_to_dict_does_not_remove_lists_inside_lists(self):
+        """Test lists inside lists are not removed"""
+        # Arrange
+        raw_xml = (
+            "<root><item><a>1</a><a>2</a></item>"
+            "<item><a>3</a><a>4</a></item></root>"
+        )
+
+        # Act
+        xml_dict = self._assert_same_as_remove_lists(raw_xml, 2)
+
+        # Assert
+        self.assertEqual(
+            xml_dict,
+            {"root": {"item": [{"a": ["1", "2"]}, {"a": ["3", "4"]}]}},
+        )
+
+    def test_raw_to_dict_with_forced_lists(self):
+        """Test with force list"""
+        # Arrange
+        raw_xml = "<root><item><a>1</a><a>2</a></item><b>3</b></root>"
+
+        # Act # Assert
+        self._assert_same_as_remove_lists(raw_xml, 1, force_list=("item", "b"))
+
+    def test_raw_to_dict_with_post_processor(self):
+        """Test with post processor"""
+        # Arrange
+        raw_xml = (
+            '<root><a x="1">1</a><a>2.5</a><a>a</a><b><c>1</c></b></root>'
+        )
+
+        # Act
+        xml_dict = self._assert_same_as_remove_lists(
+            raw_xml, 2, postprocessor="NUMERIC"
+        )
+
+        # Assert
+        self.assertEqual(xml_dict, {"root": {"b": {"c": 1}}})
+
+    def test_raw_to_dict_with_custom_post_processor(self):
+        """Test with a custom post processor renaming keys"""
+        # Arrange
+        raw_xml = "<root><a>1</a><a>2</a><a>3</a><c>4</c></root>"
+
+        # Act # Assert
+        self._assert_same_as_remove_lists(
+            raw_xml,
+            2,
+            postprocessor=lambda path, key, value: (
+                ("b", value) if key == "a" and value == "3" else (key, value)
+            ),
+        )
+
+    def test_raw_to_dict_skips_elements_of_removed_lists(self):
+        """Test elements of removed lists are not parsed"""
+        # Arrange
+        raw_xml = "<root>" + "<a><b>1</b></a>" * 5 + "</root>"
+        postprocessor = MagicMock(
+            side_effect=lambda path, key, value: (key, value)
+        )
+
+        # Act
+        with patch.object(
+            xml_utils,
+            "XML_POST_PROCESSORS",
+            {"MOCK": postprocessor},
+        ):
+            xml_dict = xml_utils.raw_xml_to_dict(
+                raw_xml, postprocessor="MOCK", list_limit=2
+            )
+
+        # Assert
+        self.assertEqual(xml_dict, {"root": {}})
+        # 3 a elements and their b element, then root
+        self.assertEqual(postprocessor.call_count, 7)
+
+    def test_raw_to_dict_throws_exception_when_invalid_xml(self):
+        """Test invalid xml"""
+        # Arrange
+        raw_xml = "<root><test>Hello</test?</root>"
+
+        # Act # Assert
+        with self.assertRaises(exceptions.XMLError):
+            xml_utils.raw_xml_to_dict(raw_xml, list_limit=2)
+
+
+class TestRawXmlToDictWithTree(TestCase):
+    """Unit tests for `raw_xml_to_dict` function with a parsed xml."""
+
+    def _assert_same_as_raw_xml(self, raw_xml, **kwargs):
+        """Assert that the parsed xml gives the same dict as the raw xml
+
+        Args:
+            raw_xml:
+            kwargs:
+
+        Returns:
+
+        """
+        expected_dict = xml_utils.raw_xml_to_dict(raw_xml, **kwargs)
+        xml_tree = xml_utils.build_xml_data_tree(raw_xml)
+        with patch.object(xml_utils.xmltodict, "parse") as mock_parse:
+            xml_dict = xml_utils.raw_xml_to_dict(
+                raw_xml, xml_tree=xml_tree, **kwargs
+            )
+        self.assertEqual(expected_dict, xml_dict)
+        return mock_parse
+
+    def test_tree_with_namespaces_is_converted_without_parsing(self):
+        """test_tree_with_namespaces_is_converted_without_parsing"""
+        mock_parse = self._assert_same_as_raw_xml(
+            '<root xmlns="urn:d" xmlns:a="urn:a" a:x="1" y="2" xml:lang="en">'
+            '<a:b xmlns:c="urn:c">b</a:b><c xmlns:c="urn:c" c:x="1"/></root>'
+        )
+        mock_parse.assert_not_called()
+
+    def test_tree_with_mixed_content_is_converted(self):
+        """test_tree_with_mixed_content_is_converted"""
+        self._assert_same_as_raw_xml(
+            "<root>a<!-- c -->b<?pi v?>c<b/> <c/>d <![CDATA[e]]>&amp;</root>"
+        )
+
+    def test_tree_is_converted_with_post_processor_and_list_limit(self):
+        """test_tree_is_converted_with_post_processor_and_list_limit"""
+        self._assert_same_as_raw_xml(
+            "<root><a>1</a><a>2</a><a>3</a><b><c>4</c><c>5</c></b>"
+            "<b><c>6</c></b></root>",
+            postprocessor="NUMERIC",
+            force_list=["d"],
+            list_limit=1,
+        )
+
+    def test_tree_with_doctype_converts_raw_xml(self):
+        """test_tree_with_doctype_converts_raw_xml"""
+        raw_xml = '<!DOCTYPE root [<!ATTLIST root a CDATA "1">]><root/>'
+        xml_tree = xml_utils.build_xml_data_tree(raw_xml)
+
+        self.assertEqual(
+            xml_utils.raw_xml_to_dict(raw_xml, xml_tree=xml_tree),
+            xml_utils.raw_xml_to_dict(raw_xml),
+        )
+
+    def test_attribute_with_ambiguous_prefix_converts_raw_xml(self):
+        """test_attribute_with_ambiguous_prefix_converts_raw_xml"""
+        raw_xml = '<root xmlns:a="urn:a" xmlns:b="urn:a" b:x="1"/>'
+        xml_tree = xml_utils.build_xml_data_tree(raw_xml)
+
+        self.assertEqual(
+            xml_utils.raw_xml_to_dict(raw_xml, xml_tree=xml_tree),
+            {
+                "root": {
+                    "@xmlns:a": "urn:a",
+                    "@xmlns:b": "urn:a",
+                    "@b:x": "1",
+                }
+            },
+        )
+
+
 class TestRemoveListsFromXmlDict(TestCase):
     """Test remove_lists_from_xml_dict"""
 
@@ -515,3 +720,123 @@ class TestUpdateDependencies(TestCase):
             xml_utils.update_dependencies(**self.mock_kwargs),
             self.mock_xsd_built_tree,
         )
+
+
+class TestGetXsltTransform(TestCase):
+    """Unit tests for `get_xslt_transform` function."""
+
+    xslt_string = (
+        '<xsl:stylesheet version="1.0" '
+        'xmlns:xsl="http://www.w3.org/1999/XSL/Transform">'
+        '<xsl:template match="/"><out><xsl:value-of select="root"/></out>'
+        "</xsl:template></xsl:stylesheet>"
+    )
+
+    def setUp(self):
+        """setUp"""
+        xml_utils.xslt_cache.clear()
+
+    def test_same_xslt_is_compiled_once(self):
+        """test_same_xslt_is_compiled_once"""
+        with patch.object(
+            xml_utils,
+            "build_xslt_transform",
+            wraps=xml_utils.build_xslt_transform,
+        ) as mock_build_xslt_transform:
+            transform_1 = xml_utils.get_xslt_transform(self.xslt_string)
+            transform_2 = xml_utils.get_xslt_transform(self.xslt_string)
+
+        self.assertIs(transform_1, transform_2)
+        self.assertEqual(mock_build_xslt_transform.call_count, 1)
+        self.assertEqual(xml_utils.xslt_cache.hits, 1)
+        self.assertEqual(xml_utils.xslt_cache.misses, 1)
+
+    def test_xsl_transform_uses_cached_xslt(self):
+        """test_xsl_transform_uses_cached_xslt"""
+        xml_utils.xsl_transform("<root>a</root>", self.xslt_string)
+        result = xml_utils.xsl_transform("<root>b</root>", self.xslt_string)
+
+        self.assertIn("<out>b</out>", result)
+        self.assertEqual(xml_utils.xslt_cache.hits, 1)
+
+    def test_xsl_transform_with_invalid_xslt_raises_core_error(self):
+        """test_xsl_transform_with_invalid_xslt_raises_core_error"""
+        with self.assertRaises(exceptions.CoreError):
+            xml_utils.xsl_transform("<root>a</root>", "<xsl/")
+
+
+class TestSchemaUploadPipeline(TestCase):
+    """Unit tests for the schema upload steps sharing a single parse."""
+
+    xsd_string = (
+        '<?xml version="1.0"?><!-- comment -->'
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        "<!-- comment --><?pi value?>"
+        '<xs:include schemaLocation="http://127.0.0.1:8000'
+        '/rest/template/1/download/"/>'
+        '<xs:element name="root"><xs:annotation><xs:documentation>'
+        "doc</xs:documentation></xs:annotation></xs:element>"
+        "</xs:schema>"
+    )
+
+    @patch.object(xml_utils, "validate_xml_schema")
+    def test_is_schema_valid_parses_schema_once(
+        self, mock_validate_xml_schema
+    ):
+        """test_is_schema_valid_parses_schema_once"""
+        mock_validate_xml_schema.return_value = None
+        with patch.object(
+            xml_utils.XSDTree,
+            "build_tree",
+            wraps=xml_utils.XSDTree.build_tree,
+        ) as mock_build_tree:
+            xsd_tree = xml_utils.is_schema_valid(self.xsd_string)
+            xml_utils.get_hash(self.xsd_string, xml_tree=xsd_tree)
+            xml_utils.get_local_dependencies(
+                self.xsd_string, xsd_tree=xsd_tree
+            )
+
+        self.assertEqual(mock_build_tree.call_count, 1)
+        mock_validate_xml_schema.assert_called_with(xsd_tree)
+
+    def test_is_schema_valid_with_invalid_xml_raises_xml_error(self):
+        """test_is_schema_valid_with_invalid_xml_raises_xml_error"""
+        with self.assertRaises(exceptions.XMLError):
+            xml_utils.is_schema_valid("<xs:schema")
+
+    def test_is_schema_valid_with_unsupported_include_raises_core_error(self):
+        """test_is_schema_valid_with_unsupported_include_raises_core_error"""
+        with self.assertRaises(exceptions.CoreError):
+            xml_utils.is_schema_valid(
+                '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+                "<xs:include/></xs:schema>"
+            )
+
+    def test_get_hash_with_tree_returns_same_hash(self):
+        """test_get_hash_with_tree_returns_same_hash"""
+        xsd_tree = xml_utils.XSDTree.build_tree(self.xsd_string)
+
+        self.assertEqual(
+            xml_utils.get_hash(self.xsd_string, xml_tree=xsd_tree),
+            xml_utils.get_hash(self.xsd_string),
+        )
+
+    def test_get_hash_with_tree_does_not_modify_tree(self):
+        """test_get_hash_with_tree_does_not_modify_tree"""
+        xsd_tree = xml_utils.XSDTree.build_tree(self.xsd_string)
+        xsd_string = xml_utils.XSDTree.tostring(xsd_tree)
+
+        xml_utils.get_hash(self.xsd_string, xml_tree=xsd_tree)
+
+        self.assertEqual(xml_utils.XSDTree.tostring(xsd_tree), xsd_string)
+
+    def test_get_local_dependencies_with_tree(self):
+        """test_get_local_dependencies_with_tree"""
+        xsd_tree = xml_utils.XSDTree.build_tree(self.xsd_string)
+
+        self.assertEqual(
+            xml_utils.get_local_dependencies(
+                self.xsd_string, xsd_tree=xsd_tree
+            ),
+            ["1"],
+        )